@@ -0,0 +1,90 @@
+"""A microbenchmark of the client-side overhead of `OpenAICall.call`.
+
+Compares calling the OpenAI client directly against calling it through an `OpenAICall`
+with the same arguments. Both run against an httpx mock transport, so the difference is
+the time Mirascope spends building messages and keyword arguments and wrapping the
+response. The best of several rounds is reported to reduce noise.
+
+Usage: python examples/benchmarks/call_overhead.py
+"""
+import time
+from typing import Any, Callable
+
+import httpx
+from openai import OpenAI
+from openai.types.chat import ChatCompletion, ChatCompletionMessage
+from openai.types.chat.chat_completion import Choice
+
+from mirascope.openai import OpenAICall, OpenAICallParams
+
+ITERATIONS = 200
+ROUNDS = 5
+
+COMPLETION = ChatCompletion(
+    id="test",
+    choices=[
+        Choice(
+            finish_reason="stop",
+            index=0,
+            message=ChatCompletionMessage(content="Hello!", role="assistant"),
+        )
+    ],
+    created=0,
+    model="gpt-4",
+    object="chat.completion",
+)
+
+transport = httpx.MockTransport(
+    lambda request: httpx.Response(
+        200,
+        content=COMPLETION.model_dump_json(),
+        headers={"content-type": "application/json"},
+    )
+)
+client = OpenAI(api_key="test", http_client=httpx.Client(transport=transport))
+
+
+def wrap(_: OpenAI) -> OpenAI:
+    """Returns the client with the mock transport."""
+    return client
+
+
+class Greeting(OpenAICall):
+    prompt_template = """
+    SYSTEM: You are a friendly assistant.
+    USER: Say hello to {name}.
+    """
+
+    name: str
+
+    api_key = "test"
+    call_params = OpenAICallParams(model="gpt-4", wrapper=wrap)
+
+
+def best(fn: Callable[[], Any]) -> float:
+    """Returns the best average seconds per call of `fn` over several rounds."""
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            fn()
+        timings.append((time.perf_counter() - start) / ITERATIONS)
+    return min(timings)
+
+
+def main() -> None:
+    """Prints the time per request of both approaches and the overhead."""
+    greeting = Greeting(name="Ada")
+    messages = greeting.messages()
+    direct = best(
+        lambda: client.chat.completions.create(
+            model="gpt-4", messages=messages, stream=False, seed=1
+        )
+    )
+    call = best(lambda: greeting.call(seed=1))
+    print(f"{'direct (us)':>12} {'call (us)':>10} {'overhead (us)':>14}")
+    print(f"{direct * 1e6:>12.1f} {call * 1e6:>10.1f} {(call - direct) * 1e6:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""A microbenchmark of the time taken to import `mirascope`.
+
+Compares a plain `import mirascope`, which defers importing its integrations and their
+SDKs until they are first accessed, against importing it and then every integration.
+Each measurement runs in a fresh interpreter and the best of several rounds is reported.
+
+Usage: python examples/benchmarks/import_time.py
+"""
+import subprocess
+import sys
+
+ROUNDS = 5
+
+LAZY = "import mirascope"
+EAGER = "import mirascope; [getattr(mirascope, name) for name in mirascope.__all__]"
+
+
+def best(code: str) -> float:
+    """Returns the best seconds taken to run `code` in a fresh interpreter."""
+    timer = (
+        "import time; start = time.perf_counter(); "
+        f"{code}; print(time.perf_counter() - start)"
+    )
+    return min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", timer],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+        )
+        for _ in range(ROUNDS)
+    )
+
+
+def main() -> None:
+    """Prints the import time of `mirascope` alone and with every integration."""
+    print(f"{'lazy (ms)':>10} {'eager (ms)':>11}")
+    print(f"{best(LAZY) * 1000:>10.1f} {best(EAGER) * 1000:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""A microbenchmark of `BasePrompt` rendering throughput.
+
+Compares rendering with the compiled template caches warm against rendering with the
+caches cleared before every render, which is equivalent to re-parsing the template on
+every call as was done before templates were compiled.
+
+Usage: python examples/benchmarks/prompt_rendering.py
+"""
+import timeit
+
+from mirascope.base import BasePrompt
+from mirascope.base.prompts import _compile_sections, _compile_template
+
+
+class BookRecommendationPrompt(BasePrompt):
+    prompt_template = """
+    SYSTEM:
+    You are the world's greatest librarian. You have read every {genre} book ever
+    written and always recommend books that match the reader's taste.
+
+    USER:
+    I've recently read the following books: {previous_books}.
+    Please recommend a {genre} book that I would enjoy.
+
+    ASSISTANT:
+    Happy to help! Do you have any other preferences?
+
+    USER:
+    I prefer books published after {year}.
+    """
+
+    genre: str
+    previous_books: list[str]
+    year: int
+
+
+def clear_caches() -> None:
+    """Clears the compiled template caches."""
+    _compile_template.cache_clear()
+    _compile_sections.cache_clear()
+
+
+def main(number: int = 20_000) -> None:
+    """Prints the render throughput with and without compiled templates."""
+    prompt = BookRecommendationPrompt(
+        genre="fantasy", previous_books=["The Name of the Wind", "Mistborn"], year=2000
+    )
+
+    def render_uncompiled() -> None:
+        clear_caches()
+        prompt.messages()
+
+    uncompiled = timeit.timeit(render_uncompiled, number=number)
+    compiled = timeit.timeit(prompt.messages, number=number)
+    print(f"uncompiled: {number / uncompiled:>10,.0f} renders/s")
+    print(f"compiled:   {number / compiled:>10,.0f} renders/s")
+    print(f"speedup:    {uncompiled / compiled:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
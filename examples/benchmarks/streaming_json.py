@@ -0,0 +1,56 @@
+"""A microbenchmark of parsing streamed tool arguments.
+
+Compares re-parsing the accumulated arguments with `from_json(..., allow_partial=True)`
+on every chunk (as was done before) against feeding each chunk to an
+`IncrementalJSONParser`. The former grows quadratically with the size of the arguments
+while the latter grows linearly.
+
+Usage: python examples/benchmarks/streaming_json.py
+"""
+import json
+import time
+
+from pydantic_core import from_json
+
+from mirascope.base import IncrementalJSONParser
+
+CHUNK_SIZE = 4
+
+
+def make_arguments(size: int) -> str:
+    """Returns JSON tool arguments of roughly `size` characters."""
+    book = {"title": "The Name of the Wind", "author": "Patrick Rothfuss", "year": 2007}
+    books = [book] * (size // len(json.dumps(book)))
+    return json.dumps({"summary": "A list of books.", "books": books})
+
+
+def reparse(arguments: str) -> float:
+    """Returns the seconds taken to re-parse the buffer on every chunk."""
+    start, buffer = time.perf_counter(), ""
+    for i in range(0, len(arguments), CHUNK_SIZE):
+        buffer += arguments[i : i + CHUNK_SIZE]
+        from_json(buffer, allow_partial=True)
+    return time.perf_counter() - start
+
+
+def incremental(arguments: str) -> float:
+    """Returns the seconds taken to incrementally parse every chunk."""
+    start, parser = time.perf_counter(), IncrementalJSONParser()
+    for i in range(0, len(arguments), CHUNK_SIZE):
+        parser.feed(arguments[i : i + CHUNK_SIZE])
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Prints the time taken by both approaches for increasing argument sizes."""
+    print(f"{'size':>8} {'reparse (ms)':>14} {'incremental (ms)':>18}")
+    for size in [1_000, 2_000, 4_000, 8_000, 16_000, 32_000]:
+        arguments = make_arguments(size)
+        print(
+            f"{len(arguments):>8} {reparse(arguments) * 1000:>14.1f} "
+            f"{incremental(arguments) * 1000:>18.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
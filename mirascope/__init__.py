@@ -1,44 +1,62 @@
-"""mirascope package."""
+"""mirascope package.
+
+Integration subpackages (e.g. `mirascope.openai`) are imported lazily on first access
+(PEP 562), so `import mirascope` only pays for the integrations that are actually used.
+"""
+import importlib
 import importlib.metadata
-from contextlib import suppress
+from typing import TYPE_CHECKING, Any
 
 from .base import BaseCallParams, BasePrompt, Message, tags
 
-with suppress(ImportError):
-    from . import anthropic
-
-with suppress(ImportError):
-    from . import chroma
-
-with suppress(ImportError):
-    from . import cohere
-
-with suppress(ImportError):
-    from . import gemini
-
-with suppress(ImportError):
-    from . import groq
+if TYPE_CHECKING:
+    from . import (
+        anthropic,
+        chroma,
+        cohere,
+        gemini,
+        groq,
+        langfuse,
+        logfire,
+        local,
+        mistral,
+        openai,
+        pinecone,
+        wandb,
+    )
 
-with suppress(ImportError):
-    from . import logfire
-
-with suppress(ImportError):
-    from . import langfuse
-
-with suppress(ImportError):
-    from . import mistral
+_SUBPACKAGES = {
+    "anthropic",
+    "chroma",
+    "cohere",
+    "gemini",
+    "groq",
+    "langfuse",
+    "logfire",
+    "local",
+    "mistral",
+    "openai",
+    "pinecone",
+    "wandb",
+}
 
-with suppress(ImportError):
-    from . import openai
 
-with suppress(ImportError):
-    from . import pinecone
+def __getattr__(name: str) -> Any:
+    """Imports integration subpackages and `__version__` on first access."""
+    if name in _SUBPACKAGES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    if name == "__version__":
+        version = importlib.metadata.version("mirascope")
+        globals()[name] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-with suppress(ImportError):
-    from . import wandb
 
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBPACKAGES | {"__version__"})
 
-__version__ = importlib.metadata.version("mirascope")
 
 __all__ = [
     "__version__",
@@ -51,6 +69,7 @@ __all__ = [
     "groq",
     "langfuse",
     "logfire",
+    "local",
     "Message",
     "mistral",
     "openai",
@@ -1,5 +1,6 @@
 """A module for calling Anthropic's Claude API."""
 import datetime
+import re
 from typing import Any, AsyncGenerator, ClassVar, Generator, Optional, Type, Union
 
 from anthropic import Anthropic, AsyncAnthropic
@@ -7,6 +8,15 @@ from anthropic.types import MessageParam
 from tenacity import AsyncRetrying, Retrying
 
 from ..base import BaseCall, retry
+from ..base.caches import cached
+from ..base.clients import (
+    get_async_client,
+    get_client,
+    pooled_async_http_client,
+    pooled_http_client,
+)
+from ..base.rate_limiters import rate_limited
+from ..base.retries import RetryPolicy
 from ..enums import MessageRole
 from .tools import AnthropicTool
 from .types import (
@@ -16,6 +26,14 @@ from .types import (
 )
 from .utils import anthropic_api_calculate_cost
 
+PROMPT_CACHING_BETA = "prompt-caching-2024-07-31"
+TOOLS_BETA = "tools-2024-05-16"
+
+# The most cache breakpoints Anthropic accepts in a request
+MAX_CACHE_BREAKPOINTS = 4
+
+_EPHEMERAL = {"type": "ephemeral"}
+
 
 class AnthropicCall(
     BaseCall[AnthropicCallResponse, AnthropicCallResponseChunk, AnthropicTool]
@@ -42,6 +60,8 @@ class AnthropicCall(
 
     call_params: ClassVar[AnthropicCallParams] = AnthropicCallParams()
 
+    _supports_prefill: ClassVar[bool] = True
+
     def messages(self) -> list[MessageParam]:
         """Returns the template as a formatted list of messages."""
         return self._parse_messages(
@@ -49,8 +69,10 @@ class AnthropicCall(
         )  # type: ignore
 
     @retry
+    @cached
+    @rate_limited
     def call(
-        self, retries: Union[int, Retrying] = 0, **kwargs: Any
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
     ) -> AnthropicCallResponse:
         """Makes a call to the model using this `AnthropicCall` instance.
 
@@ -62,9 +84,7 @@ class AnthropicCall(
             A `AnthropicCallResponse` instance.
         """
         messages, kwargs, tool_types = self._setup_anthropic_kwargs(kwargs)
-        client = Anthropic(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.wrapper is not None:
-            client = self.call_params.wrapper(client)
+        client = self._client()
 
         create = client.messages.create
         if tool_types:
@@ -98,8 +118,10 @@ class AnthropicCall(
         )
 
     @retry
+    @cached
+    @rate_limited
     async def call_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> AnthropicCallResponse:
         """Makes an asynchronous call to the model using this `AnthropicCall` instance.
 
@@ -111,9 +133,7 @@ class AnthropicCall(
             A `AnthropicCallResponse` instance.
         """
         messages, kwargs, tool_types = self._setup_anthropic_kwargs(kwargs)
-        client = AsyncAnthropic(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.wrapper_async is not None:
-            client = self.call_params.wrapper_async(client)
+        client = self._async_client()
         create = client.messages.create
         if tool_types:
             create = client.beta.tools.messages.create  # type: ignore
@@ -146,8 +166,9 @@ class AnthropicCall(
         )
 
     @retry
+    @rate_limited
     def stream(
-        self, retries: Union[int, Retrying] = 0, **kwargs: Any
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
     ) -> Generator[AnthropicCallResponseChunk, None, None]:
         """Streams the response for a call using this `AnthropicCall`.
 
@@ -159,9 +180,7 @@ class AnthropicCall(
             An `AnthropicCallResponseChunk` for each chunk of the response.
         """
         messages, kwargs, tool_types = self._setup_anthropic_kwargs(kwargs)
-        client = Anthropic(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.wrapper is not None:
-            client = self.call_params.wrapper(client)
+        client = self._client()
         if self.call_params.logfire or self.call_params.langfuse:  # pragma: no cover
             stream = client.messages.stream
             if self.call_params.logfire:
@@ -193,8 +212,9 @@ class AnthropicCall(
                     )
 
     @retry
+    @rate_limited
     async def stream_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> AsyncGenerator[AnthropicCallResponseChunk, None]:
         """Streams the response for an asynchronous call using this `AnthropicCall`.
 
@@ -206,9 +226,7 @@ class AnthropicCall(
             An `AnthropicCallResponseChunk` for each chunk of the response.
         """
         messages, kwargs, tool_types = self._setup_anthropic_kwargs(kwargs)
-        client = AsyncAnthropic(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.wrapper_async is not None:
-            client = self.call_params.wrapper_async(client)
+        client = self._async_client()
         if (
             self.call_params.logfire_async or self.call_params.langfuse
         ):  # pragma: no cover
@@ -245,6 +263,42 @@ class AnthropicCall(
 
     ############################## PRIVATE METHODS ###################################
 
+    def _client(self) -> Anthropic:
+        """Returns a pooled `Anthropic` client for this call's configuration."""
+
+        def create() -> Anthropic:
+            client = Anthropic(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=pooled_http_client(),
+            )
+            if self.call_params.wrapper is not None:
+                client = self.call_params.wrapper(client)
+            return client
+
+        return get_client(
+            ("anthropic", self.api_key, self.base_url, self.call_params.wrapper),
+            create,
+        )
+
+    def _async_client(self) -> AsyncAnthropic:
+        """Returns a pooled `AsyncAnthropic` client for the running event loop."""
+
+        def create() -> AsyncAnthropic:
+            client = AsyncAnthropic(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=pooled_async_http_client(),
+            )
+            if self.call_params.wrapper_async is not None:
+                client = self.call_params.wrapper_async(client)
+            return client
+
+        return get_async_client(
+            ("anthropic", self.api_key, self.base_url, self.call_params.wrapper_async),
+            create,
+        )
+
     def _setup_anthropic_kwargs(
         self,
         kwargs: dict[str, Any],
@@ -287,5 +341,92 @@ class AnthropicCall(
                 )
         if system_message:
             kwargs["system"] = system_message
+        if self.call_params.prompt_caching:
+            messages = self._setup_prompt_caching(messages, kwargs, bool(tool_types))
 
         return messages, kwargs, tool_types
+
+    def _setup_prompt_caching(
+        self, messages: list[MessageParam], kwargs: dict[str, Any], tools_beta: bool
+    ) -> list[MessageParam]:
+        """Places the cache breakpoints listed in `call_params.prompt_caching`.
+
+        Text that contains a breakpoint is split into text blocks so that the block
+        ending at the breakpoint can be marked as cacheable. Anthropic accepts at most
+        `MAX_CACHE_BREAKPOINTS` breakpoints, so only the last ones are kept: a cache hit
+        on a later breakpoint covers everything before it anyway.
+        """
+        names = set(self.call_params.prompt_caching or [])
+        values = [
+            value
+            for name in names - {"tools", "system"}
+            if (value := self._format_template(f"{{{name}}}"))
+        ]
+        breakpoints: list[dict[str, Any]] = []
+        if "tools" in names and kwargs.get("tools"):
+            tools = list(kwargs["tools"])
+            tools[-1] = {**tools[-1], "cache_control": _EPHEMERAL}
+            breakpoints.append(tools[-1])
+            kwargs["tools"] = tools
+        if "system" in kwargs:
+            blocks = _text_blocks(kwargs["system"], values)
+            if "system" in names:
+                blocks[-1]["cache_control"] = _EPHEMERAL
+            if any("cache_control" in block for block in blocks):
+                kwargs["system"] = blocks
+                breakpoints.extend(
+                    block for block in blocks if "cache_control" in block
+                )
+        cached_messages: list[MessageParam] = []
+        for message in messages:
+            content = message["content"]
+            if isinstance(content, str):
+                blocks = _text_blocks(content, values)
+                if any("cache_control" in block for block in blocks):
+                    message = {**message, "content": blocks}  # type: ignore
+                    breakpoints.extend(
+                        block for block in blocks if "cache_control" in block
+                    )
+            cached_messages.append(message)
+        for block in breakpoints[:-MAX_CACHE_BREAKPOINTS]:
+            del block["cache_control"]
+        betas = (
+            [TOOLS_BETA, PROMPT_CACHING_BETA] if tools_beta else [PROMPT_CACHING_BETA]
+        )
+        kwargs["extra_headers"] = _with_betas(kwargs.get("extra_headers"), betas)
+        return cached_messages
+
+
+def _with_betas(headers: Optional[dict[str, Any]], betas: list[str]) -> dict[str, Any]:
+    """Returns `headers` with `betas` appended to any `anthropic-beta` values."""
+    headers = dict(headers or {})
+    key = next(
+        (key for key in headers if key.lower() == "anthropic-beta"), "anthropic-beta"
+    )
+    values = [value.strip() for value in str(headers.get(key) or "").split(",")]
+    headers[key] = ",".join(dict.fromkeys(value for value in values + betas if value))
+    return headers
+
+
+def _text_blocks(text: str, values: list[str]) -> list[dict[str, Any]]:
+    """Splits `text` into text blocks, marking the blocks that end with a value.
+
+    Every occurrence of each value in `text` ends a block.
+    """
+    ends = sorted(
+        {
+            match.end()
+            for value in values
+            for match in re.finditer(re.escape(value), text)
+        }
+    )
+    blocks: list[dict[str, Any]] = []
+    start = 0
+    for end in ends:
+        blocks.append(
+            {"type": "text", "text": text[start:end], "cache_control": _EPHEMERAL}
+        )
+        start = end
+    if start < len(text) or not blocks:
+        blocks.append({"type": "text", "text": text[start:]})
+    return blocks
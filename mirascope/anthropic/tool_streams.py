@@ -3,11 +3,11 @@
 NOTE: this feature is not officially supported by Anthropic. We're forcing it to output
 JSON so that we can stream tools.
 """
+from copy import deepcopy
 from typing import AsyncGenerator, Generator, Literal, Optional, Type, overload
 
 from anthropic.types.beta.tools import ToolUseBlock
-from pydantic_core import from_json
-
+from ..base.partial_json import IncrementalJSONParser
 from ..base.tool_streams import BaseToolStream
 from ..partial import partial
 from .tools import AnthropicTool
@@ -15,24 +15,28 @@ from .types import AnthropicCallResponseChunk
 
 
 def _handle_chunk(
-    buffer: str,
+    parser: IncrementalJSONParser,
     chunk: AnthropicCallResponseChunk,
     current_tool_call: ToolUseBlock,
     current_tool_type: Optional[Type[AnthropicTool]],
     allow_partial: bool,
     num_open_parens: int,
 ) -> tuple[
-    str,
+    IncrementalJSONParser,
     Optional[AnthropicTool],
     ToolUseBlock,
     Optional[Type[AnthropicTool]],
     int,
     bool,
 ]:
-    """Handles a chunk of the stream."""
+    """Handles a chunk of the stream.
+
+    The `parser` incrementally parses the current tool's JSON so that each partial tool
+    only costs parsing the new chunk rather than everything streamed so far.
+    """
     if not chunk.tool_types:
         return (
-            buffer,
+            parser,
             None,
             current_tool_call,
             current_tool_type,
@@ -53,11 +57,15 @@ def _handle_chunk(
             if char == "}":
                 num_open_parens -= 1
                 if num_open_parens == 0:
-                    buffer += chunk_content[: i + 1] if i < len(chunk_content) else ""
+                    parser.feed(chunk_content[: i + 1])
                     chunk_content = chunk_content[i + 1 :]
                     num_open_parens += chunk_content.count("{")
                     num_open_parens -= chunk_content.count("}")
-                    current_tool_call.input = from_json(buffer)
+                    if not parser.done:
+                        raise ValueError("Invalid JSON: incomplete tool.")
+                    current_tool_call.input = dict(parser.value)
+                    parser = IncrementalJSONParser()
+                    parser.feed(chunk_content)
                     # we have to type ignore since `input` is of type `object`
                     if "tool_name" not in current_tool_call.input:  # type: ignore
                         raise RuntimeError("No `tool_name` field for tool.")
@@ -69,17 +77,18 @@ def _handle_chunk(
                     if current_tool_type is None:
                         raise RuntimeError("Unknown tool returned.")
                     return (
-                        chunk_content,
+                        parser,
                         current_tool_type.from_tool_call(current_tool_call),
                         current_tool_call,
                         None,
                         num_open_parens,
                         True,
                     )
-        buffer += chunk_content
+        parser.feed(chunk_content)
 
         if allow_partial:
-            current_tool_call.input = from_json(buffer, allow_partial=True)
+            # the parser updates its value in place as more chunks are fed
+            current_tool_call.input = deepcopy(parser.value)
             # we have to type ignore since `input` is of type `object`
             if "tool_name" in current_tool_call.input:  # type: ignore
                 tool_name = current_tool_call.input.pop("tool_name")  # type: ignore
@@ -91,7 +100,7 @@ def _handle_chunk(
                     raise RuntimeError("Unknown tool returned.")
             if current_tool_type is not None:
                 return (
-                    buffer,
+                    parser,
                     partial(current_tool_type).from_tool_call(
                         ToolUseBlock(
                             id="id",
@@ -105,7 +114,7 @@ def _handle_chunk(
                     num_open_parens,
                     False,
                 )
-    return buffer, None, current_tool_call, current_tool_type, num_open_parens, False
+    return parser, None, current_tool_call, current_tool_type, num_open_parens, False
 
 
 class AnthropicToolStream(BaseToolStream[AnthropicCallResponseChunk, AnthropicTool]):
@@ -152,20 +161,21 @@ class AnthropicToolStream(BaseToolStream[AnthropicCallResponseChunk, AnthropicTo
         cls._check_version_for_partial(allow_partial)
         current_tool_call = ToolUseBlock(id="", input={}, name="", type="tool_use")
         current_tool_type = None
-        buffer, num_open_parens = "{", 1
+        parser, num_open_parens = IncrementalJSONParser(), 1
+        parser.feed("{")
         for chunk in stream:
             if chunk.type == "message_start":
                 current_tool_call.id = chunk.chunk.message.id
                 continue
             (
-                buffer,
+                parser,
                 tool,
                 current_tool_call,
                 current_tool_type,
                 num_open_parens,
                 starting_new,
             ) = _handle_chunk(
-                buffer,
+                parser,
                 chunk,
                 current_tool_call,
                 current_tool_type,
@@ -218,20 +228,21 @@ class AnthropicToolStream(BaseToolStream[AnthropicCallResponseChunk, AnthropicTo
         cls._check_version_for_partial(allow_partial)
         current_tool_call = ToolUseBlock(id="", input={}, name="", type="tool_use")
         current_tool_type = None
-        buffer, num_open_parens = "{", 1
+        parser, num_open_parens = IncrementalJSONParser(), 1
+        parser.feed("{")
         async for chunk in async_stream:
             if chunk.type == "message_start":
                 current_tool_call.id = chunk.chunk.message.id
                 continue
             (
-                buffer,
+                parser,
                 tool,
                 current_tool_call,
                 current_tool_type,
                 num_open_parens,
                 starting_new,
             ) = _handle_chunk(
-                buffer,
+                parser,
                 chunk,
                 current_tool_call,
                 current_tool_type,
@@ -7,7 +7,7 @@ from typing import Callable, Type
 from anthropic.types.beta.tools import ToolParam, ToolUseBlock
 from pydantic import BaseModel
 
-from ..base import BaseTool, BaseType
+from ..base import BaseTool, BaseType, cached_tool_schema
 from ..base.utils import (
     convert_base_model_to_tool,
     convert_base_type_to_tool,
@@ -61,6 +61,7 @@ class AnthropicTool(BaseTool[ToolUseBlock]):
     '''
 
     @classmethod
+    @cached_tool_schema
     def tool_schema(cls) -> ToolParam:
         """Constructs JSON tool schema for use with Anthropic's Claude API."""
         schema = super().tool_schema()
@@ -21,7 +21,7 @@ from .tools import AnthropicTool
 
 
 class AnthropicCallParams(BaseCallParams[AnthropicTool]):
-    """The parameters to use when calling d Claud API with a prompt.
+    '''The parameters to use when calling d Claud API with a prompt.
 
     Example:
 
@@ -36,7 +36,29 @@ class AnthropicCallParams(BaseCallParams[AnthropicTool]):
             model="anthropic-3-opus-20240229",
         )
     ```
-    """
+
+    Set `prompt_caching` to mark stable prompt prefixes as cacheable so that Anthropic
+    reuses them across calls. Each entry places a cache breakpoint: `"tools"` after the
+    tool definitions, `"system"` after the system prompt, and the name of a template
+    variable (e.g. a long document) right after each occurrence of the variable's value
+    in the prompt. Everything before a breakpoint is cached, so put stable content
+    first. Anthropic accepts at most four breakpoints per request, so only the last
+    four are kept.
+
+    ```python
+    class QuestionAnswerer(AnthropicCall):
+        prompt_template = """
+        SYSTEM: Answer questions about the following document.
+        {document}
+        USER: {question}
+        """
+
+        document: str
+        question: str
+
+        call_params = AnthropicCallParams(prompt_caching=["document"])
+    ```
+    '''
 
     max_tokens: int = 1000
     model: str = "claude-3-haiku-20240307"
@@ -52,6 +74,7 @@ class AnthropicCallParams(BaseCallParams[AnthropicTool]):
     timeout: Optional[Union[float, Timeout]] = 600
 
     response_format: Optional[Literal["json"]] = None
+    prompt_caching: Optional[list[str]] = None
 
     wrapper: Optional[Callable[[Anthropic], Anthropic]] = None
     wrapper_async: Optional[Callable[[AsyncAnthropic], AsyncAnthropic]] = None
@@ -62,11 +85,17 @@ class AnthropicCallParams(BaseCallParams[AnthropicTool]):
         self,
         tool_type: Optional[Type[AnthropicTool]] = None,
         exclude: Optional[set[str]] = None,
+        overrides: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
         """Returns the keyword argument call parameters."""
-        extra_exclude = {"response_format", "wrapper", "wrapper_async"}
+        extra_exclude = {
+            "prompt_caching",
+            "response_format",
+            "wrapper",
+            "wrapper_async",
+        }
         exclude = extra_exclude if exclude is None else exclude.union(extra_exclude)
-        return super().kwargs(tool_type, exclude)
+        return super().kwargs(tool_type, exclude, overrides)
 
 
 class AnthropicCallResponse(
@@ -165,6 +194,16 @@ class AnthropicCallResponse(
         """Returns the number of output tokens."""
         return self.usage.output_tokens
 
+    @property
+    def cache_creation_input_tokens(self) -> Optional[int]:
+        """Returns the number of input tokens written to the prompt cache."""
+        return getattr(self.usage, "cache_creation_input_tokens", None)
+
+    @property
+    def cache_read_input_tokens(self) -> Optional[int]:
+        """Returns the number of input tokens read from the prompt cache."""
+        return getattr(self.usage, "cache_read_input_tokens", None)
+
     def dump(self) -> dict[str, Any]:
         """Dumps the response to a dictionary."""
         return {
@@ -223,3 +262,16 @@ class AnthropicCallResponseChunk(
         if isinstance(self.chunk, ContentBlockDeltaEvent):
             return self.chunk.delta.text
         return ""
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _with_content(self, content: str) -> "AnthropicCallResponseChunk":
+        """Returns a copy of the chunk whose text block or delta has `content`."""
+        chunk = self.chunk
+        if isinstance(chunk, ContentBlockStartEvent):
+            block = chunk.content_block.model_copy(update={"text": content})
+            chunk = chunk.model_copy(update={"content_block": block})
+        elif isinstance(chunk, ContentBlockDeltaEvent):
+            delta = chunk.delta.model_copy(update={"text": content})
+            chunk = chunk.model_copy(update={"delta": delta})
+        return self.model_copy(update={"chunk": chunk})
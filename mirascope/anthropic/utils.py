@@ -17,6 +17,8 @@ def anthropic_api_calculate_cost(
     claude-3-haiku            $0.25 / 1M tokens   $1.25 / 1M tokens
     claude-3-sonnet           $3.00 / 1M tokens   $15.00 / 1M tokens
     claude-3-opus             $15.00 / 1M tokens   $75.00 / 1M tokens
+
+    Prompt caching writes cost 25% more than input tokens and reads cost 90% less.
     """
     pricing = {
         "claude-instant-1.2": {
@@ -51,6 +53,10 @@ def anthropic_api_calculate_cost(
         return None
 
     prompt_cost = usage.input_tokens * model_pricing["prompt"]
+    cache_write_tokens = getattr(usage, "cache_creation_input_tokens", None) or 0
+    cache_read_tokens = getattr(usage, "cache_read_input_tokens", None) or 0
+    prompt_cost += cache_write_tokens * model_pricing["prompt"] * 1.25
+    prompt_cost += cache_read_tokens * model_pricing["prompt"] * 0.1
     completion_cost = usage.output_tokens * model_pricing["completion"]
     total_cost = prompt_cost + completion_cost
 
@@ -1,9 +1,17 @@
 """Base modules for the Mirascope library."""
+from .caches import BaseCache, InMemoryCache, SQLiteCache
 from .calls import BaseCall
+from .clients import ClientPoolParams, clear_clients, configure_client_pool
+from .concurrency import map_async, run_many
 from .extractors import BaseExtractor, ExtractedType, ExtractionType
+from .fallbacks import FallbackCall, ProviderHealth
+from .hedging import HedgedCall, LatencyTracker
+from .partial_json import IncrementalJSONParser
 from .prompts import BasePrompt, tags
+from .rate_limiters import RateLimiter, estimate_tokens
+from .retries import RetryBudget, RetryPolicy, is_transient_error
 from .tool_streams import BaseToolStream
-from .tools import BaseTool, BaseType
+from .tools import BaseTool, BaseType, cached_tool_schema
 from .types import (
     BaseCallParams,
     BaseCallResponse,
@@ -19,10 +27,19 @@ from .utils import (
 )
 
 __all__ = [
+    "BaseCache",
     "BaseCall",
+    "ClientPoolParams",
+    "clear_clients",
+    "configure_client_pool",
     "BaseExtractor",
     "ExtractedType",
     "ExtractionType",
+    "FallbackCall",
+    "HedgedCall",
+    "IncrementalJSONParser",
+    "InMemoryCache",
+    "LatencyTracker",
     "BasePrompt",
     "BaseToolStream",
     "BaseTool",
@@ -31,9 +48,19 @@ __all__ = [
     "BaseCallResponse",
     "BaseCallResponseChunk",
     "Message",
+    "ProviderHealth",
+    "RateLimiter",
+    "RetryBudget",
+    "RetryPolicy",
+    "SQLiteCache",
+    "cached_tool_schema",
     "convert_base_model_to_tool",
     "convert_base_type_to_tool",
     "convert_function_to_tool",
+    "estimate_tokens",
+    "is_transient_error",
+    "map_async",
+    "run_many",
     "tool_fn",
     "retry",
 ]
@@ -0,0 +1,306 @@
+"""Response caches for LLM calls.
+
+Setting `cache` in a call's `call_params` makes `call` and `call_async` look up a
+stable hash of the rendered messages, the effective call parameters and the tool
+schemas before making a request. On a hit, the cached response is rehydrated into the
+call's response type (e.g. `OpenAICallResponse`) without contacting the provider.
+
+Example:
+
+```python
+from mirascope.base import InMemoryCache
+from mirascope.openai import OpenAICall, OpenAICallParams
+
+
+class Classifier(OpenAICall):
+    prompt_template = "Classify the sentiment of this review: {review}"
+
+    review: str
+
+    call_params = OpenAICallParams(temperature=0, cache=InMemoryCache(ttl=3600))
+
+
+response = Classifier(review="I loved it!").call()  # makes a request
+response = Classifier(review="I loved it!").call()  # served from the cache
+```
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Optional, TypeVar, cast
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from pydantic_core import to_json
+
+
+class BaseCache(BaseModel, ABC):
+    """The base class abstract interface for caching string values by key.
+
+    Attributes:
+        ttl: The number of seconds after which an entry expires. `None` means entries
+            never expire.
+        max_size: The maximum number of entries to keep, evicting the least recently
+            used entries first. `None` means the cache is unbounded.
+    """
+
+    ttl: Optional[float] = None
+    max_size: Optional[int] = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Returns the value stored for `key` or `None` if missing or expired."""
+        ...  # pragma: no cover
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """Stores `value` for `key`, evicting old entries if necessary."""
+        ...  # pragma: no cover
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Removes the entry for `key` if present."""
+        ...  # pragma: no cover
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        ...  # pragma: no cover
+
+    def _expires_at(self) -> Optional[float]:
+        """Returns the expiration timestamp for an entry set now."""
+        return time.time() + self.ttl if self.ttl is not None else None
+
+
+class InMemoryCache(BaseCache):
+    """A thread-safe, in-process LRU cache.
+
+    Example:
+
+    ```python
+    from mirascope.base import InMemoryCache
+
+    cache = InMemoryCache(max_size=1000, ttl=60)
+    cache.set("key", "value")
+    print(cache.get("key"))
+    #> value
+    ```
+    """
+
+    max_size: Optional[int] = 1024
+
+    _entries: OrderedDict[str, tuple[Optional[float], str]] = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the value stored for `key` or `None` if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """Stores `value` for `key`, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = (self._expires_at(), value)
+            self._entries.move_to_end(key)
+            if self.max_size is not None:
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Removes the entry for `key` if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(BaseCache):
+    """An on-disk LRU cache backed by a SQLite database.
+
+    Entries persist across processes, which makes this cache useful for offline
+    evaluation runs and batch jobs that repeatedly send the same prompts.
+
+    Example:
+
+    ```python
+    from mirascope.base import SQLiteCache
+
+    cache = SQLiteCache(path="mirascope_cache.db", max_size=100_000)
+    ```
+    """
+
+    path: str = "mirascope_cache.db"
+
+    _connection: Optional[sqlite3.Connection] = PrivateAttr(default=None)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the value stored for `key` or `None` if missing or expired."""
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            now = time.time()
+            if expires_at is not None and expires_at <= now:
+                connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+                connection.commit()
+                return None
+            connection.execute(
+                "UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            connection.commit()
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """Stores `value` for `key`, evicting the least recently used entries."""
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, self._expires_at(), time.time()),
+            )
+            if self.max_size is not None:
+                connection.execute(
+                    "DELETE FROM cache WHERE key IN (SELECT key FROM cache "
+                    "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_size,),
+                )
+            connection.commit()
+
+    def delete(self, key: str) -> None:
+        """Removes the entry for `key` if present."""
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+            connection.commit()
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM cache")
+            connection.commit()
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _connect(self) -> sqlite3.Connection:
+        """Returns the (lazily created) connection to the cache database."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT "
+                "NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)"
+            )
+        return self._connection
+
+
+def cache_key(*parts: Any) -> str:
+    """Returns a stable SHA-256 hex digest of the JSON encoding of `parts`.
+
+    Values that are not JSON serializable are encoded using their string form.
+    """
+    return hashlib.sha256(to_json(parts, fallback=str)).hexdigest()
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def cached(fn: F) -> F:
+    """Decorator for serving `BaseCall.call` and `call_async` responses from a cache.
+
+    The cache is read from the (possibly overridden) `call_params.cache`. When no cache
+    is set the decorated function is called directly.
+    """
+
+    def _setup(self: Any, kwargs: dict[str, Any]) -> tuple[Any, Optional[str], Any]:
+        """Returns the cache, the cache key and the tool types for the call."""
+        cache = kwargs.get("cache", self.call_params.cache)
+        if cache is None:
+            return None, None, None
+        response_type, tool_type = _response_and_tool_types(self)
+        call_kwargs, tool_types = self._setup(kwargs, tool_type)
+        key = cache_key(
+            response_type.__name__, self.base_url, self.messages(), call_kwargs
+        )
+        return cache, key, tool_types
+
+    def _load(self: Any, value: str, tool_types: Any) -> Any:
+        """Rehydrates a cached value into the call's response type."""
+        response_type, _ = _response_and_tool_types(self)
+        return response_type.model_validate(
+            {**json.loads(value), "tool_types": tool_types}
+        )
+
+    def _dump(response: BaseModel) -> str:
+        """Serializes a response for storage in the cache."""
+        return json.dumps(response.model_dump(mode="json", exclude={"tool_types"}))
+
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        """Wrapper for caching the response of a call."""
+        cache, key, tool_types = _setup(self, kwargs)
+        if cache is None:
+            return fn(self, *args, **kwargs)
+        value = cache.get(key)
+        if value is not None:
+            return _load(self, value, tool_types)
+        response = fn(self, *args, **kwargs)
+        cache.set(key, _dump(response))
+        return response
+
+    @wraps(fn)
+    async def wrapper_async(self, *args, **kwargs):
+        """Wrapper for caching the response of an asynchronous call."""
+        cache, key, tool_types = _setup(self, kwargs)
+        if cache is None:
+            return await fn(self, *args, **kwargs)
+        value = cache.get(key)
+        if value is not None:
+            return _load(self, value, tool_types)
+        response = await fn(self, *args, **kwargs)
+        cache.set(key, _dump(response))
+        return response
+
+    if inspect.iscoroutinefunction(fn):
+        return cast(F, wrapper_async)
+    return cast(F, wrapper)
+
+
+def _response_and_tool_types(call: Any) -> tuple[type[BaseModel], Any]:
+    """Returns the response and tool types a `BaseCall` subclass is parametrized by."""
+    for base in type(call).__mro__:
+        metadata = getattr(base, "__pydantic_generic_metadata__", None)
+        if metadata and len(metadata["args"]) == 3:
+            response_type, _, tool_type = metadata["args"]
+            return response_type, tool_type
+    raise TypeError(f"{type(call).__name__} is not a parametrized `BaseCall`.")
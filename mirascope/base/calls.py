@@ -5,24 +5,39 @@ from abc import ABC, abstractmethod
 from typing import (
     Any,
     AsyncGenerator,
+    AsyncIterable,
     ClassVar,
     Generator,
     Generic,
+    Iterable,
+    Literal,
     Optional,
     Type,
     TypeVar,
     Union,
+    overload,
 )
 
+from pydantic import PrivateAttr
 from tenacity import AsyncRetrying, Retrying
 
+from ..enums import MessageRole
+
+from .concurrency import DEFAULT_CONCURRENCY, map_async, run_many
 from .prompts import BasePrompt
+from .retries import RetryPolicy
 from .tools import BaseTool
-from .types import BaseCallParams, BaseCallResponse, BaseCallResponseChunk
+from .types import (
+    BaseCallParams,
+    BaseCallResponse,
+    BaseCallResponseChunk,
+    Message,
+)
 
 BaseCallResponseT = TypeVar("BaseCallResponseT", bound=BaseCallResponse)
 BaseCallResponseChunkT = TypeVar("BaseCallResponseChunkT", bound=BaseCallResponseChunk)
 BaseToolT = TypeVar("BaseToolT", bound=BaseTool)
+BaseCallT = TypeVar("BaseCallT", bound="BaseCall")
 
 
 class BaseCall(
@@ -38,9 +53,12 @@ class BaseCall(
         model="gpt-3.5-turbo-0125"
     )
 
+    _supports_prefill: ClassVar[bool] = False
+    _prefill: Optional[str] = PrivateAttr(default=None)
+
     @abstractmethod
     def call(
-        self, retries: Union[int, Retrying] = 0, **kwargs: Any
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
     ) -> BaseCallResponseT:
         """A call to an LLM.
 
@@ -52,7 +70,7 @@ class BaseCall(
 
     @abstractmethod
     async def call_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> BaseCallResponseT:
         """An asynchronous call to an LLM.
 
@@ -64,7 +82,7 @@ class BaseCall(
 
     @abstractmethod
     def stream(
-        self, retries: Union[int, Retrying] = 0, **kwargs: Any
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
     ) -> Generator[BaseCallResponseChunkT, None, None]:
         """A call to an LLM that streams the response in chunks.
 
@@ -76,7 +94,7 @@ class BaseCall(
 
     @abstractmethod
     async def stream_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> AsyncGenerator[BaseCallResponseChunkT, None]:
         """A asynchronous call to an LLM that streams the response in chunks.
 
@@ -85,8 +103,201 @@ class BaseCall(
         e.g. different model providers."""
         yield ...  # type: ignore # pragma: no cover
 
+    @classmethod
+    @overload
+    def run_many(
+        cls,
+        calls: Iterable[BaseCallT],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        return_exceptions: Literal[False] = False,
+        **kwargs: Any,
+    ) -> Generator[tuple[BaseCallT, BaseCallResponseT], None, None]:
+        ...  # pragma: no cover
+
+    @classmethod
+    @overload
+    def run_many(
+        cls,
+        calls: Iterable[BaseCallT],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> Generator[tuple[BaseCallT, Union[BaseCallResponseT, Exception]], None, None]:
+        ...  # pragma: no cover
+
+    @classmethod
+    def run_many(
+        cls,
+        calls,
+        concurrency=DEFAULT_CONCURRENCY,
+        ordered=True,
+        return_exceptions=False,
+        **kwargs,
+    ):
+        """Runs `call` for many calls in a pool of `concurrency` worker threads.
+
+        Calls are pulled lazily from `calls`, so at most `concurrency` of them are in
+        flight at any time.
+
+        Example:
+
+        ```python
+        from mirascope.openai import OpenAICall
+
+
+        class BookRecommender(OpenAICall):
+            prompt_template = "Please recommend a {genre} book"
+
+            genre: str
+
+
+        calls = (BookRecommender(genre=genre) for genre in ["fantasy", "mystery"])
+        for call, response in BookRecommender.run_many(calls, concurrency=8):
+            print(call.genre, response.content)
+        ```
+
+        Args:
+            calls: The (possibly lazy) iterable of calls to run.
+            concurrency: The maximum number of calls in flight at once.
+            ordered: Whether to yield responses in input order or as they complete.
+            return_exceptions: Whether to yield a call's exception in place of its
+                response instead of raising it.
+            **kwargs: Additional keyword arguments to pass to each `call`, e.g.
+                `retries`.
+
+        Yields:
+            A tuple of each call and its response.
+        """
+        yield from run_many(
+            lambda call: call.call(**kwargs),
+            calls,
+            concurrency,
+            ordered,
+            return_exceptions,
+        )
+
+    @classmethod
+    @overload
+    def map_async(
+        cls,
+        calls: Union[Iterable[BaseCallT], AsyncIterable[BaseCallT]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        return_exceptions: Literal[False] = False,
+        **kwargs: Any,
+    ) -> AsyncGenerator[tuple[BaseCallT, BaseCallResponseT], None]:
+        ...  # pragma: no cover
+
+    @classmethod
+    @overload
+    def map_async(
+        cls,
+        calls: Union[Iterable[BaseCallT], AsyncIterable[BaseCallT]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> AsyncGenerator[tuple[BaseCallT, Union[BaseCallResponseT, Exception]], None]:
+        ...  # pragma: no cover
+
+    @classmethod
+    async def map_async(
+        cls,
+        calls,
+        concurrency=DEFAULT_CONCURRENCY,
+        ordered=True,
+        return_exceptions=False,
+        **kwargs,
+    ):
+        """Runs `call_async` for many calls with at most `concurrency` at once.
+
+        Calls are pulled lazily from `calls`, so at most `concurrency` of them are in
+        flight at any time.
+
+        Example:
+
+        ```python
+        import asyncio
+
+        from mirascope.openai import OpenAICall
+
+
+        class BookRecommender(OpenAICall):
+            prompt_template = "Please recommend a {genre} book"
+
+            genre: str
+
+
+        async def recommend():
+            calls = (BookRecommender(genre=genre) for genre in ["fantasy", "mystery"])
+            async for call, response in BookRecommender.map_async(calls, ordered=False):
+                print(call.genre, response.content)
+
+
+        asyncio.run(recommend())
+        ```
+
+        Args:
+            calls: The (possibly lazy or asynchronous) iterable of calls to run.
+            concurrency: The maximum number of calls in flight at once.
+            ordered: Whether to yield responses in input order or as they complete.
+            return_exceptions: Whether to yield a call's exception in place of its
+                response instead of raising it (and cancelling all other calls).
+            **kwargs: Additional keyword arguments to pass to each `call_async`, e.g.
+                `retries`.
+
+        Yields:
+            A tuple of each call and its response.
+        """
+        async for call, response in map_async(
+            lambda call: call.call_async(**kwargs),
+            calls,
+            concurrency,
+            ordered,
+            return_exceptions,
+        ):
+            yield call, response
+
     ############################## PRIVATE METHODS ###################################
 
+    def _with_prefill(self: BaseCallT, content: str) -> BaseCallT:
+        """Returns a copy of the call that ends with an assistant message `content`.
+
+        Providers that support it (`_supports_prefill`) continue the assistant message
+        instead of starting a new one, which is used to resume an interrupted stream.
+
+        Raises:
+            ValueError: if the provider doesn't continue an assistant prefill.
+        """
+        if not self._supports_prefill:
+            raise ValueError(
+                f"{self.__class__.__name__} does not support prefilling an assistant "
+                "message."
+            )
+        call = self.model_copy()
+        call._prefill = content
+        return call
+
+    def _parse_messages(self, roles: list[str]) -> list[Message]:
+        """Returns the parsed messages, including the assistant prefill if any.
+
+        Raises:
+            ValueError: if the provider has no assistant role to prefill.
+        """
+        messages = super()._parse_messages(roles)
+        if self._prefill is None:
+            return messages
+        for role in (MessageRole.ASSISTANT, MessageRole.MODEL):
+            if role in roles:
+                messages.append({"role": role, "content": self._prefill})  # type: ignore
+                return messages
+        raise ValueError(
+            f"{self.__class__.__name__} does not support prefilling an assistant "
+            "message."
+        )
+
     def _setup(
         self,
         kwargs: dict[str, Any],
@@ -99,8 +310,7 @@ class BaseCall(
         instances if present in the response) as well as the actual schemas injected
         through kwargs. This function handles that setup.
         """
-        call_params = self.call_params.model_copy(update=kwargs)
-        kwargs = call_params.kwargs(tool_type=base_tool_type)
+        kwargs = self.call_params.kwargs(tool_type=base_tool_type, overrides=kwargs)
         tool_types = None
         if "tools" in kwargs and base_tool_type is not None:
             tool_types = kwargs.pop("tools")
@@ -0,0 +1,207 @@
+"""A process-wide registry of reusable provider clients.
+
+Constructing a new provider client for every call throws away the underlying httpx
+connection pool (and with it warm TCP connections and TLS sessions). The functions in
+this module cache fully configured clients keyed by the configuration that produced
+them so that subsequent calls reuse the same connection pool.
+
+Synchronous clients are shared across the whole process. Asynchronous clients are
+bound to the event loop in which their connection pool was created, so they are cached
+per running event loop and released once that loop is garbage collected.
+
+Since the key includes any `wrapper` (or other callable) that configured the client,
+wrappers must be stable callables, e.g. defined at module level. A wrapper created per
+call, such as a lambda in a call params object built for each call, never matches a
+cached client, so each call adds a new client to the registry.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Optional, TypeVar
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    import httpx
+
+ClientT = TypeVar("ClientT")
+
+
+class ClientPoolParams(BaseModel):
+    """The connection pool settings used for pooled provider http clients.
+
+    Attributes:
+        max_connections: The maximum number of concurrent connections per client.
+        max_keepalive_connections: The maximum number of idle connections to keep.
+        keepalive_expiry: The number of seconds an idle connection is kept alive.
+        http2: Whether to enable HTTP/2 (requires the `h2` package).
+    """
+
+    max_connections: Optional[int] = 1000
+    max_keepalive_connections: Optional[int] = 100
+    keepalive_expiry: Optional[float] = 30.0
+    http2: bool = False
+
+    def limits(self) -> httpx.Limits:
+        """Returns the `httpx.Limits` for these pool settings."""
+        import httpx
+
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+_pool_params = ClientPoolParams()
+_lock = threading.Lock()
+_clients: dict[Hashable, Any] = {}
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[Hashable, Any]
+] = weakref.WeakKeyDictionary()
+
+
+def configure_client_pool(**kwargs: Any) -> ClientPoolParams:
+    """Updates the connection pool settings used for newly created clients.
+
+    Clients that are already cached were built with the previous settings, so they are
+    closed and removed from the registry, and clients are lazily recreated on their
+    next use.
+
+    Args:
+        **kwargs: The `ClientPoolParams` fields to update.
+
+    Returns:
+        The updated `ClientPoolParams`.
+    """
+    global _pool_params
+    with _lock:
+        _pool_params = _pool_params.model_copy(update=kwargs)
+    clear_clients()
+    return _pool_params
+
+
+def clear_clients() -> None:
+    """Closes and removes all cached clients from the registry.
+
+    Async clients are closed in their event loop: they are scheduled to close if it is
+    running, and closed right away if it isn't. Clients whose event loop is closed (or
+    is blocked by another loop running in this thread) can't be closed, so they are
+    only removed.
+    """
+    with _lock:
+        clients = list(_clients.values())
+        async_clients = [
+            (loop, list(pool.values())) for loop, pool in _async_clients.items()
+        ]
+        _clients.clear()
+        _async_clients.clear()
+    for client in clients:
+        _close(client)
+    for loop, pool in async_clients:
+        for client in pool:
+            _close(client, loop)
+
+
+def pooled_http_client(**kwargs: Any) -> httpx.Client:
+    """Returns a new `httpx.Client` configured with the current pool settings.
+
+    Args:
+        **kwargs: Additional keyword arguments to pass to `httpx.Client`.
+    """
+    import httpx
+
+    return httpx.Client(
+        limits=_pool_params.limits(),
+        http2=_pool_params.http2,
+        follow_redirects=True,
+        **kwargs,
+    )
+
+
+def pooled_async_http_client(**kwargs: Any) -> httpx.AsyncClient:
+    """Returns a new `httpx.AsyncClient` configured with the current pool settings.
+
+    Args:
+        **kwargs: Additional keyword arguments to pass to `httpx.AsyncClient`.
+    """
+    import httpx
+
+    return httpx.AsyncClient(
+        limits=_pool_params.limits(),
+        http2=_pool_params.http2,
+        follow_redirects=True,
+        **kwargs,
+    )
+
+
+def get_client(key: Hashable, create: Callable[[], ClientT]) -> ClientT:
+    """Returns the cached client for `key`, creating it with `create` if missing.
+
+    Args:
+        key: A hashable key that uniquely identifies the client's configuration, e.g.
+            `(provider, api_key, base_url, wrapper)`. Any callables in the key must be
+            stable (see the module docstring).
+        create: A function that constructs a fully configured client.
+
+    Returns:
+        The cached client.
+    """
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = create()
+            _clients[key] = client
+    return client
+
+
+def get_async_client(key: Hashable, create: Callable[[], ClientT]) -> ClientT:
+    """Returns the cached async client for `key` in the running event loop.
+
+    If there is no running event loop the client is created without being cached since
+    its connection pool could not be safely shared with any future event loop.
+
+    Args:
+        key: A hashable key that uniquely identifies the client's configuration, e.g.
+            `(provider, api_key, base_url, wrapper_async)`. Any callables in the key
+            must be stable (see the module docstring).
+        create: A function that constructs a fully configured async client.
+
+    Returns:
+        The cached async client.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return create()
+    with _lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            client = create()
+            clients[key] = client
+    return client
+
+
+def _close(client: Any, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+    """Closes a client removed from the registry, in `loop` if it is asynchronous."""
+    close = getattr(client, "close", None)
+    if not callable(close):
+        return
+    result = close()
+    if not asyncio.iscoroutine(result):
+        return
+    if loop is not None and loop.is_running():
+        asyncio.run_coroutine_threadsafe(result, loop)
+        return
+    try:
+        if loop is None or loop.is_closed():
+            raise RuntimeError("The event loop of the client is closed.")
+        loop.run_until_complete(result)
+    except RuntimeError:
+        result.close()
@@ -0,0 +1,200 @@
+"""Fan-out helpers for running many calls with bounded concurrency.
+
+Both helpers consume their input lazily, so at most `concurrency` items are running at
+any time no matter how large (or infinite) the input iterator is. Results are yielded
+together with the item that produced them, either in input order (`ordered=True`) or as
+soon as they complete (`ordered=False`).
+
+With `ordered=True`, items keep starting while a slow item holds back the results behind
+it, and their results are buffered until it finishes. The buffer holds at most
+`concurrency` results, so at most `2 * concurrency` items are started but not yet
+yielded at once.
+"""
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+DEFAULT_CONCURRENCY = 16
+
+_EXHAUSTED = object()
+
+T = TypeVar("T")
+R = TypeVar("R")
+F = TypeVar("F")
+
+
+async def map_async(
+    fn: Callable[[T], Awaitable[R]],
+    items: Union[Iterable[T], AsyncIterable[T]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    ordered: bool = True,
+    return_exceptions: bool = False,
+) -> AsyncGenerator[tuple[T, Union[R, Exception]], None]:
+    """Awaits `fn(item)` for each item with at most `concurrency` running at once.
+
+    Args:
+        fn: The coroutine function to run for each item.
+        items: The (possibly lazy or asynchronous) iterable of items.
+        concurrency: The maximum number of items running at once.
+        ordered: Whether to yield results in input order or as they complete.
+        return_exceptions: Whether to yield an item's exception in place of its result
+            instead of raising it (and cancelling all other in-flight items).
+
+    Yields:
+        A tuple of each item and its result.
+
+    Raises:
+        ValueError: if `concurrency` is less than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("`concurrency` must be at least 1.")
+    iterator = _aiter(items)
+    tasks: deque[tuple[T, asyncio.Task]] = deque()
+    limit = 2 * concurrency if ordered else concurrency
+    exhausted = False
+
+    async def fill() -> None:
+        nonlocal exhausted
+        while not exhausted and len(tasks) < limit and _running(tasks) < concurrency:
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                exhausted = True
+                return
+            tasks.append((item, asyncio.ensure_future(fn(item))))
+
+    try:
+        await fill()
+        while tasks:
+            if ordered:
+                if not tasks[0][1].done():
+                    await asyncio.wait(
+                        _pending(tasks), return_when=asyncio.FIRST_COMPLETED
+                    )
+                    await fill()
+                    continue
+                item, task = tasks.popleft()
+            else:
+                done, _ = await asyncio.wait(
+                    [task for _, task in tasks], return_when=asyncio.FIRST_COMPLETED
+                )
+                item, task = _pop_done(tasks, done)
+            yield item, _result(task.exception(), task.result, return_exceptions)
+            await fill()
+    finally:
+        for _, task in tasks:
+            if task.done() and not task.cancelled():
+                task.exception()  # marks the exception as retrieved
+            task.cancel()
+        await iterator.aclose()
+
+
+def run_many(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    ordered: bool = True,
+    return_exceptions: bool = False,
+) -> Generator[tuple[T, Union[R, Exception]], None, None]:
+    """Runs `fn(item)` for each item in a pool of `concurrency` worker threads.
+
+    Args:
+        fn: The function to run for each item.
+        items: The (possibly lazy) iterable of items.
+        concurrency: The maximum number of items running at once.
+        ordered: Whether to yield results in input order or as they complete.
+        return_exceptions: Whether to yield an item's exception in place of its result
+            instead of raising it (and cancelling all items that haven't started).
+
+    Yields:
+        A tuple of each item and its result.
+
+    Raises:
+        ValueError: if `concurrency` is less than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("`concurrency` must be at least 1.")
+    iterator: Iterator[T] = iter(items)
+    futures: deque[tuple[T, Future]] = deque()
+    limit = 2 * concurrency if ordered else concurrency
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    def fill() -> None:
+        while len(futures) < limit and _running(futures) < concurrency:
+            item = next(iterator, _EXHAUSTED)
+            if item is _EXHAUSTED:
+                return
+            futures.append((item, executor.submit(fn, item)))  # type: ignore
+
+    try:
+        fill()
+        while futures:
+            if ordered:
+                if not futures[0][1].done():
+                    wait(_pending(futures), return_when=FIRST_COMPLETED)
+                    fill()
+                    continue
+                item, future = futures.popleft()
+            else:
+                done, _ = wait(
+                    [future for _, future in futures], return_when=FIRST_COMPLETED
+                )
+                item, future = _pop_done(futures, done)
+            yield item, _result(future.exception(), future.result, return_exceptions)
+            fill()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _aiter(
+    items: Union[Iterable[T], AsyncIterable[T]],
+) -> AsyncGenerator[T, None]:
+    """Returns an async iterator over a sync or async iterable."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _running(entries: deque[tuple[T, F]]) -> int:
+    """Returns the number of entries whose task or future is still running."""
+    return len(_pending(entries))
+
+
+def _pending(entries: deque[tuple[T, F]]) -> list[F]:
+    """Returns the tasks or futures of the entries that are still running."""
+    return [entry[1] for entry in entries if not entry[1].done()]  # type: ignore
+
+
+def _pop_done(entries: deque[tuple[T, F]], done: set) -> tuple[T, F]:
+    """Removes and returns the first entry whose task or future is done."""
+    for index, entry in enumerate(entries):
+        if entry[1] in done:
+            del entries[index]
+            return entry
+    raise RuntimeError("No finished entry.")  # pragma: no cover
+
+
+def _result(
+    exception: Optional[BaseException],
+    result: Callable[[], R],
+    return_exceptions: bool,
+) -> Union[R, Exception]:
+    """Returns the result or captured exception of a finished task or future."""
+    if isinstance(exception, Exception) and return_exceptions:
+        return exception
+    return result()
@@ -1,36 +1,50 @@
 """A base abstract interface for extracting structured information using LLMs."""
+import threading
 from abc import ABC, abstractmethod
-from contextlib import suppress
+from collections import OrderedDict
 from enum import Enum
+from functools import lru_cache
 from inspect import getmembers, isclass
 from typing import (
     Annotated,
     Any,
     AsyncGenerator,
+    AsyncIterable,
     Callable,
     ClassVar,
     Generator,
     Generic,
+    Iterable,
     Literal,
     Optional,
+    Sequence,
     Type,
     TypeVar,
     Union,
     get_origin,
+    overload,
 )
+from weakref import WeakKeyDictionary
 
-from pydantic import BaseModel, ConfigDict, ValidationError
-from tenacity import AsyncRetrying, RetryError, Retrying, stop_after_attempt
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    PrivateAttr,
+    TypeAdapter,
+    ValidationError,
+    create_model,
+    field_validator,
+)
+from tenacity import AsyncRetrying, RetryError, Retrying
 
 from ..partial import partial
 from .calls import BaseCall
+from .concurrency import DEFAULT_CONCURRENCY, map_async, run_many
 from .prompts import BasePrompt
+from .retries import RetryPolicy, async_retrying, retrying
 from .tool_streams import BaseToolStream
 from .tools import BaseTool, BaseType
-from .types import BaseCallParams
-
-with suppress(ImportError):
-    import logfire
+from .types import BaseCallParams, Message
 
 BaseModelT = TypeVar("BaseModelT", bound=BaseModel)
 BaseCallT = TypeVar("BaseCallT", bound=BaseCall)
@@ -39,6 +53,17 @@ BaseToolStreamT = TypeVar("BaseToolStreamT", bound=BaseToolStream)
 ExtractionType = Union[Type[BaseType], Type[BaseModel], Callable]
 ExtractedType = Union[BaseType, BaseModelT, BaseToolT]
 ExtractedTypeT = TypeVar("ExtractedTypeT", bound=ExtractedType)
+BaseExtractorT = TypeVar("BaseExtractorT", bound="BaseExtractor")
+
+# Errors raised when a response can't be extracted, which a `RetryPolicy` always retries
+_EXTRACTION_ERRORS = (AttributeError, ValueError, ValidationError)
+
+# The maximum number of `TempCall` classes cached per extractor class
+_MAX_TEMP_CALLS = 32
+_TEMP_CALLS: WeakKeyDictionary[
+    type, OrderedDict[tuple, Type[BaseCall]]
+] = WeakKeyDictionary()
+_TEMP_CALLS_LOCK = threading.Lock()
 
 
 def _is_base_type(type_: Any) -> bool:
@@ -51,6 +76,18 @@ def _is_base_type(type_: Any) -> bool:
     )
 
 
+def _delegate(name: str) -> property:
+    """Returns a `TempCall` property that gets `name` from the call's extractor."""
+    return property(lambda call: getattr(call._extractor, name))
+
+
+def _log_retry(error: Exception) -> None:  # pragma: no cover
+    """Logs a retried extraction to logfire, which is only imported once needed."""
+    import logfire
+
+    logfire.error(f"Retrying due to exception: {error}")
+
+
 class BaseExtractor(
     BasePrompt, Generic[BaseCallT, BaseToolT, BaseToolStreamT, ExtractedTypeT], ABC
 ):
@@ -89,13 +126,161 @@ class BaseExtractor(
     #     """Asynchronously streams extracted partial `extraction_schema` instances."""
     #     ...  # pragma: no cover
 
+    @classmethod
+    @overload
+    def run_many(
+        cls,
+        extractors: Iterable[BaseExtractorT],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        return_exceptions: Literal[False] = False,
+        **kwargs: Any,
+    ) -> Generator[tuple[BaseExtractorT, ExtractedTypeT], None, None]:
+        ...  # pragma: no cover
+
+    @classmethod
+    @overload
+    def run_many(
+        cls,
+        extractors: Iterable[BaseExtractorT],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> Generator[tuple[BaseExtractorT, Union[ExtractedTypeT, Exception]], None, None]:
+        ...  # pragma: no cover
+
+    @classmethod
+    def run_many(
+        cls,
+        extractors,
+        concurrency=DEFAULT_CONCURRENCY,
+        ordered=True,
+        return_exceptions=False,
+        **kwargs,
+    ):
+        """Runs `extract` for many extractors in a pool of `concurrency` threads.
+
+        Extractors are pulled lazily from `extractors`, so at most `concurrency` of
+        them are in flight at any time.
+
+        Args:
+            extractors: The (possibly lazy) iterable of extractors to run.
+            concurrency: The maximum number of extractions in flight at once.
+            ordered: Whether to yield extractions in input order or as they complete.
+            return_exceptions: Whether to yield an extraction's exception in place of
+                its result instead of raising it.
+            **kwargs: Additional keyword arguments to pass to each `extract`, e.g.
+                `retries`.
+
+        Yields:
+            A tuple of each extractor and its extracted `extract_schema` instance.
+        """
+        yield from run_many(
+            lambda extractor: extractor.extract(**kwargs),
+            extractors,
+            concurrency,
+            ordered,
+            return_exceptions,
+        )
+
+    @classmethod
+    @overload
+    def map_async(
+        cls,
+        extractors: Union[Iterable[BaseExtractorT], AsyncIterable[BaseExtractorT]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        return_exceptions: Literal[False] = False,
+        **kwargs: Any,
+    ) -> AsyncGenerator[tuple[BaseExtractorT, ExtractedTypeT], None]:
+        ...  # pragma: no cover
+
+    @classmethod
+    @overload
+    def map_async(
+        cls,
+        extractors: Union[Iterable[BaseExtractorT], AsyncIterable[BaseExtractorT]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> AsyncGenerator[tuple[BaseExtractorT, Union[ExtractedTypeT, Exception]], None]:
+        ...  # pragma: no cover
+
+    @classmethod
+    async def map_async(
+        cls,
+        extractors,
+        concurrency=DEFAULT_CONCURRENCY,
+        ordered=True,
+        return_exceptions=False,
+        **kwargs,
+    ):
+        """Runs `extract_async` for many extractors with at most `concurrency` at once.
+
+        Extractors are pulled lazily from `extractors`, so at most `concurrency` of
+        them are in flight at any time.
+
+        Example:
+
+        ```python
+        import asyncio
+        from typing import Type
+
+        from pydantic import BaseModel
+
+        from mirascope.openai import OpenAIExtractor
+
+
+        class TaskDetails(BaseModel):
+            title: str
+            priority: str
+
+
+        class TaskExtractor(OpenAIExtractor[TaskDetails]):
+            extract_schema: Type[TaskDetails] = TaskDetails
+            prompt_template = "Please extract the task details: {task}"
+
+            task: str
+
+
+        async def extract_all(tasks: list[str]):
+            extractors = (TaskExtractor(task=task) for task in tasks)
+            async for extractor, details in TaskExtractor.map_async(
+                extractors, concurrency=32, retries=3
+            ):
+                print(extractor.task, details)
+        ```
+
+        Args:
+            extractors: The (possibly lazy or asynchronous) iterable of extractors.
+            concurrency: The maximum number of extractions in flight at once.
+            ordered: Whether to yield extractions in input order or as they complete.
+            return_exceptions: Whether to yield an extraction's exception in place of
+                its result instead of raising it (and cancelling all others).
+            **kwargs: Additional keyword arguments to pass to each `extract_async`,
+                e.g. `retries`.
+
+        Yields:
+            A tuple of each extractor and its extracted `extract_schema` instance.
+        """
+        async for extractor, extraction in map_async(
+            lambda extractor: extractor.extract_async(**kwargs),
+            extractors,
+            concurrency,
+            ordered,
+            return_exceptions,
+        ):
+            yield extractor, extraction
+
     ############################## PRIVATE METHODS ###################################
 
     def _extract(
         self,
         call_type: Type[BaseCallT],
         tool_type: Type[BaseToolT],
-        retries: Union[int, Retrying] = 0,
+        retries: Union[int, Retrying, RetryPolicy] = 0,
         **kwargs: Any,
     ) -> ExtractedTypeT:
         """Extracts `extract_schema` from the call response.
@@ -132,10 +317,8 @@ class BaseExtractor(
         ) -> ExtractedTypeT:
             kwargs, return_tool = self._setup(tool_type, kwargs)
 
-            temp_call = self._generate_temp_call(call_type, error_messages)
-            response = temp_call(
-                **self.model_dump(exclude={"extract_schema"}),
-            ).call(**kwargs)
+            temp_call = self._temp_call(call_type, error_messages)
+            response = temp_call.call(**kwargs)
             try:
                 extracted_schema = self._extract_schema(
                     response.tool, self.extract_schema, return_tool, response=response
@@ -146,14 +329,12 @@ class BaseExtractor(
             except (AttributeError, ValueError, ValidationError):
                 raise
 
-        if isinstance(retries, int):
-            if retries > 0:
-                retries = Retrying(stop=stop_after_attempt(retries))
-            else:
-                return _extract_attempt(call_type, tool_type, {}, **kwargs)
+        attempts = retrying(retries, retryable=_EXTRACTION_ERRORS)
+        if attempts is None:
+            return _extract_attempt(call_type, tool_type, {}, **kwargs)
         try:
             error_messages: dict[str, Any] = {}
-            for attempt in retries:
+            for attempt in attempts:
                 with attempt:
                     try:
                         extraction = _extract_attempt(
@@ -164,7 +345,7 @@ class BaseExtractor(
                         if (
                             self.call_params.logfire or self.call_params.logfire_async
                         ):  # pragma: no cover
-                            logfire.error(f"Retrying due to exception: {e}")
+                            _log_retry(e)
                         raise
         except RetryError as e:
             raise e
@@ -174,7 +355,7 @@ class BaseExtractor(
         self,
         call_type: Type[BaseCallT],
         tool_type: Type[BaseToolT],
-        retries: Union[int, AsyncRetrying],
+        retries: Union[int, AsyncRetrying, RetryPolicy],
         **kwargs: Any,
     ) -> ExtractedTypeT:
         """Extracts `extract_schema` from the asynchronous call response.
@@ -211,11 +392,8 @@ class BaseExtractor(
         ) -> ExtractedTypeT:
             kwargs, return_tool = self._setup(tool_type, kwargs)
 
-            temp_call = self._generate_temp_call(call_type, error_messages)
-
-            response = await temp_call(
-                **self.model_dump(exclude={"extract_schema"})
-            ).call_async(**kwargs)
+            temp_call = self._temp_call(call_type, error_messages)
+            response = await temp_call.call_async(**kwargs)
             try:
                 extracted_schema = self._extract_schema(
                     response.tool, self.extract_schema, return_tool, response=response
@@ -226,14 +404,12 @@ class BaseExtractor(
             except (AttributeError, ValueError, ValidationError):
                 raise
 
-        if isinstance(retries, int):
-            if retries > 0:
-                retries = AsyncRetrying(stop=stop_after_attempt(retries))
-            else:
-                return await _extract_attempt_async(call_type, tool_type, {}, **kwargs)
+        attempts = async_retrying(retries, retryable=_EXTRACTION_ERRORS)
+        if attempts is None:
+            return await _extract_attempt_async(call_type, tool_type, {}, **kwargs)
         try:
             error_messages: dict[str, Any] = {}
-            async for attempt in retries:
+            async for attempt in attempts:
                 with attempt:
                     try:
                         extraction = await _extract_attempt_async(
@@ -244,18 +420,106 @@ class BaseExtractor(
                         if (
                             self.call_params.logfire or self.call_params.logfire_async
                         ):  # pragma: no cover
-                            logfire.error(f"Retrying due to exception: {e}")
+                            _log_retry(e)
                         raise
         except RetryError as e:
             raise e
         return extraction
 
+    @classmethod
+    def _extract_many(
+        cls,
+        call_type: Type[BaseCallT],
+        tool_type: Type[BaseToolT],
+        extractors: Sequence[BaseExtractorT],
+        retries: Union[int, Retrying, RetryPolicy] = 0,
+        **kwargs: Any,
+    ) -> list[ExtractedTypeT]:
+        """Extracts `extract_schema` for many extractors in a single call.
+
+        The records (i.e. the rendered prompts) of all extractors are packed into one
+        prompt, and a list of items tagged with the id of their record is extracted
+        through a single tool. Each item is validated on its own, and only the records
+        whose item is missing or invalid are re-asked on retries, along with their
+        errors.
+
+        Args:
+            call_type: The type of call to use for extraction.
+            tool_type: The type of tool to use for extraction.
+            extractors: The extractors to extract from. They must share the same
+                `extract_schema`, call params and system messages.
+            retries: The number of call attempts to make on `ValidationError` before
+                giving up and throwing the error to the user.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            The `extract_schema` instance extracted for each extractor, in order.
+
+        Raises:
+            ValueError: if the extractors don't share an `extract_schema` that's a
+                `BaseModel` or base type, or if records are missing or invalid.
+        """
+        extraction = _ManyExtraction(extractors, tool_type)
+        if not extractors:
+            return []
+        kwargs = extraction.kwargs(kwargs)
+        attempts = retrying(retries, retryable=_EXTRACTION_ERRORS)
+        if attempts is None:
+            return extraction.collect(extraction.call(call_type).call(**kwargs))
+        for attempt in attempts:
+            with attempt:
+                try:
+                    result = extraction.collect(
+                        extraction.call(call_type).call(**kwargs)
+                    )
+                except _EXTRACTION_ERRORS as e:
+                    if (
+                        cls.call_params.logfire or cls.call_params.logfire_async
+                    ):  # pragma: no cover
+                        _log_retry(e)
+                    raise
+        return result
+
+    @classmethod
+    async def _extract_many_async(
+        cls,
+        call_type: Type[BaseCallT],
+        tool_type: Type[BaseToolT],
+        extractors: Sequence[BaseExtractorT],
+        retries: Union[int, AsyncRetrying, RetryPolicy] = 0,
+        **kwargs: Any,
+    ) -> list[ExtractedTypeT]:
+        """Asynchronously extracts `extract_schema` for many extractors in one call.
+
+        See `_extract_many` for details.
+        """
+        extraction = _ManyExtraction(extractors, tool_type)
+        if not extractors:
+            return []
+        kwargs = extraction.kwargs(kwargs)
+        attempts = async_retrying(retries, retryable=_EXTRACTION_ERRORS)
+        if attempts is None:
+            response = await extraction.call(call_type).call_async(**kwargs)
+            return extraction.collect(response)
+        async for attempt in attempts:
+            with attempt:
+                try:
+                    response = await extraction.call(call_type).call_async(**kwargs)
+                    result = extraction.collect(response)
+                except _EXTRACTION_ERRORS as e:
+                    if (
+                        cls.call_params.logfire or cls.call_params.logfire_async
+                    ):  # pragma: no cover
+                        _log_retry(e)
+                    raise
+        return result
+
     def _stream(
         self,
         call_type: Type[BaseCallT],
         tool_type: Type[BaseToolT],
         tool_stream_type: Type[BaseToolStreamT],
-        retries: Union[int, Retrying],
+        retries: Union[int, Retrying, RetryPolicy],
         **kwargs: Any,
     ) -> Generator[ExtractedTypeT, None, None]:
         """Streams partial `extract_schema` instances from the streamed chunks.
@@ -298,11 +562,8 @@ class BaseExtractor(
         ) -> Generator[ExtractedTypeT, None, None]:
             kwargs, return_tool = self._setup(tool_type, kwargs)
 
-            temp_call = self._generate_temp_call(call_type, error_messages)
-
-            stream = temp_call(**self.model_dump(exclude={"extract_schema"})).stream(
-                **kwargs
-            )
+            temp_call = self._temp_call(call_type, error_messages)
+            stream = temp_call.stream(**kwargs)
             tool_stream = tool_stream_type.from_stream(stream, allow_partial=True)
             try:
                 yielded = False
@@ -320,22 +581,20 @@ class BaseExtractor(
             except (AttributeError, ValueError, ValidationError):
                 raise
 
-        if isinstance(retries, int):
-            if retries > 0:
-                retries = Retrying(stop=stop_after_attempt(retries))
-            else:
-                for partial_tool in _stream_attempt(
-                    call_type,
-                    tool_type,
-                    tool_stream_type,
-                    {},
-                    **kwargs,
-                ):
-                    yield partial_tool
-                return
+        attempts = retrying(retries, retryable=_EXTRACTION_ERRORS)
+        if attempts is None:
+            for partial_tool in _stream_attempt(
+                call_type,
+                tool_type,
+                tool_stream_type,
+                {},
+                **kwargs,
+            ):
+                yield partial_tool
+            return
         try:
             error_messages: dict[str, Any] = {}
-            for attempt in retries:
+            for attempt in attempts:
                 with attempt:
                     try:
                         for partial_tool in _stream_attempt(
@@ -351,7 +610,7 @@ class BaseExtractor(
                         if (
                             self.call_params.logfire or self.call_params.logfire_async
                         ):  # pragma: no cover
-                            logfire.error(f"Retrying due to exception: {e}")
+                            _log_retry(e)
                         raise
         except RetryError as e:
             raise e
@@ -361,7 +620,7 @@ class BaseExtractor(
         call_type: Type[BaseCallT],
         tool_type: Type[BaseToolT],
         tool_stream_type: Type[BaseToolStreamT],
-        retries: Union[int, AsyncRetrying],
+        retries: Union[int, AsyncRetrying, RetryPolicy],
         **kwargs: Any,
     ) -> AsyncGenerator[ExtractedTypeT, None]:
         """Asynchronously streams partial `extract_schema`s from streamed chunks.
@@ -404,11 +663,8 @@ class BaseExtractor(
         ) -> AsyncGenerator[ExtractedTypeT, None]:
             kwargs, return_tool = self._setup(tool_type, kwargs)
 
-            temp_call = self._generate_temp_call(call_type, error_messages)
-
-            stream = temp_call(
-                **self.model_dump(exclude={"extract_schema"})
-            ).stream_async(**kwargs)
+            temp_call = self._temp_call(call_type, error_messages)
+            stream = temp_call.stream_async(**kwargs)
             tool_stream = tool_stream_type.from_async_stream(stream, allow_partial=True)
             try:
                 yielded = False
@@ -426,18 +682,16 @@ class BaseExtractor(
             except (AttributeError, ValueError, ValidationError):
                 raise
 
-        if isinstance(retries, int):
-            if retries > 0:
-                retries = AsyncRetrying(stop=stop_after_attempt(retries))
-            else:
-                async for partial_tool in _stream_attempt_async(
-                    call_type, tool_type, tool_stream_type, {}, **kwargs
-                ):
-                    yield partial_tool
-                return
+        attempts = async_retrying(retries, retryable=_EXTRACTION_ERRORS)
+        if attempts is None:
+            async for partial_tool in _stream_attempt_async(
+                call_type, tool_type, tool_stream_type, {}, **kwargs
+            ):
+                yield partial_tool
+            return
         try:
             error_messages: dict[str, Any] = {}
-            async for attempt in retries:
+            async for attempt in attempts:
                 with attempt:
                     try:
                         async for partial_tool in _stream_attempt_async(
@@ -453,15 +707,233 @@ class BaseExtractor(
                         if (
                             self.call_params.logfire or self.call_params.logfire_async
                         ):  # pragma: no cover
-                            logfire.error(f"Retrying due to exception: {e}")
+                            _log_retry(e)
                         raise
         except RetryError as e:
             raise e
 
+    def _stream_items(
+        self,
+        call_type: Type[BaseCallT],
+        tool_type: Type[BaseToolT],
+        tool_stream_type: Type[BaseToolStreamT],
+        retries: Union[int, Retrying, RetryPolicy],
+        **kwargs: Any,
+    ) -> Generator[Any, None, None]:
+        """Streams each item of a `list[...]` `extract_schema` once it's complete.
+
+        An item is complete once the model has started generating the next item (or
+        the stream has ended), at which point it is validated and yielded, so items
+        can be processed while the rest of the list is still being generated.
+
+        Args:
+            call_type: The type of call to use for extraction. This enables shared code
+                across various model providers that have slight variations but the same
+                internal interfaces.
+            tool_type: The type of tool to use for extraction. This enables shared code
+                across various model providers that have slight variations but the same
+                internal interfaces.
+            tool_stream_type: The type of tool stream to use for streaming tools. This
+                enables shared code across various model providers that have slight
+                variations but the same internal interfaces.
+            retries: The number of call attempts to make on `ValidationError` before
+                giving up and throwing the error to the user. Only failures before the
+                first item is yielded are retried.
+            **kwargs: Additional keyword arguments.
+
+        Yields:
+            Each validated item of the extracted list, in order.
+
+        Raises:
+            AttributeError: if there is no tool in the call creation.
+            ValueError: if `extract_schema` isn't a `list[...]` type.
+            ValidationError: if an item cannot be instantiated from the completion.
+        """
+        tool, adapter = _items_tool(tool_type, self.extract_schema)  # type: ignore
+
+        def _stream_attempt(
+            error_messages: dict[str, Any],
+        ) -> Generator[Any, None, None]:
+            call_kwargs = self.call_params.kwargs(tool_type=tool_type, overrides=kwargs)
+            call_kwargs["tools"] = [tool]
+            stream = self._temp_call(call_type, error_messages).stream(**call_kwargs)
+            items = _StreamedItems(adapter)
+            for partial_tool in tool_stream_type.from_stream(
+                stream, allow_partial=True
+            ):
+                if partial_tool is None:
+                    break
+                yield from items.update(partial_tool)
+            yield from items.finish()
+
+        attempts = retrying(retries, retryable=_EXTRACTION_ERRORS)
+        if attempts is None:
+            yield from _stream_attempt({})
+            return
+        error_messages: dict[str, Any] = {}
+        error: Optional[Exception] = None
+        yielded = False
+        for attempt in attempts:
+            with attempt:
+                try:
+                    for item in _stream_attempt(error_messages):
+                        yielded = True
+                        yield item
+                except _EXTRACTION_ERRORS as e:
+                    if yielded:
+                        error = e
+                    else:
+                        error_messages[str(e)] = None
+                        if (
+                            self.call_params.logfire or self.call_params.logfire_async
+                        ):  # pragma: no cover
+                            _log_retry(e)
+                        raise
+        if error is not None:
+            raise error
+
+    async def _stream_items_async(
+        self,
+        call_type: Type[BaseCallT],
+        tool_type: Type[BaseToolT],
+        tool_stream_type: Type[BaseToolStreamT],
+        retries: Union[int, AsyncRetrying, RetryPolicy],
+        **kwargs: Any,
+    ) -> AsyncGenerator[Any, None]:
+        """Asynchronously streams each item of a `list[...]` `extract_schema`.
+
+        See `_stream_items` for details.
+
+        Args:
+            call_type: The type of call to use for extraction. This enables shared code
+                across various model providers that have slight variations but the same
+                internal interfaces.
+            tool_type: The type of tool to use for extraction. This enables shared code
+                across various model providers that have slight variations but the same
+                internal interfaces.
+            tool_stream_type: The type of tool stream to use for streaming tools. This
+                enables shared code across various model providers that have slight
+                variations but the same internal interfaces.
+            retries: The number of call attempts to make on `ValidationError` before
+                giving up and throwing the error to the user. Only failures before the
+                first item is yielded are retried.
+            **kwargs: Additional keyword arguments.
+
+        Yields:
+            Each validated item of the extracted list, in order.
+
+        Raises:
+            AttributeError: if there is no tool in the call creation.
+            ValueError: if `extract_schema` isn't a `list[...]` type.
+            ValidationError: if an item cannot be instantiated from the completion.
+        """
+        tool, adapter = _items_tool(tool_type, self.extract_schema)  # type: ignore
+
+        async def _stream_attempt_async(
+            error_messages: dict[str, Any],
+        ) -> AsyncGenerator[Any, None]:
+            call_kwargs = self.call_params.kwargs(tool_type=tool_type, overrides=kwargs)
+            call_kwargs["tools"] = [tool]
+            temp_call = self._temp_call(call_type, error_messages)
+            stream = temp_call.stream_async(**call_kwargs)
+            items = _StreamedItems(adapter)
+            async for partial_tool in tool_stream_type.from_async_stream(
+                stream, allow_partial=True
+            ):
+                if partial_tool is None:
+                    break
+                for item in items.update(partial_tool):
+                    yield item
+            for item in items.finish():
+                yield item
+
+        attempts = async_retrying(retries, retryable=_EXTRACTION_ERRORS)
+        if attempts is None:
+            async for item in _stream_attempt_async({}):
+                yield item
+            return
+        error_messages: dict[str, Any] = {}
+        error: Optional[Exception] = None
+        yielded = False
+        async for attempt in attempts:
+            with attempt:
+                try:
+                    async for item in _stream_attempt_async(error_messages):
+                        yielded = True
+                        yield item
+                except _EXTRACTION_ERRORS as e:
+                    if yielded:
+                        error = e
+                    else:
+                        error_messages[str(e)] = None
+                        if (
+                            self.call_params.logfire or self.call_params.logfire_async
+                        ):  # pragma: no cover
+                            _log_retry(e)
+                        raise
+        if error is not None:
+            raise error
+
+    def _prompt_fields(self) -> dict[str, Any]:
+        """Returns the extractor's fields (except `extract_schema`) for a `TempCall`.
+
+        The values are passed through as is instead of being dumped, so they render in
+        the prompt exactly as they do for the extractor itself.
+        """
+        fields = {
+            name: getattr(self, name)
+            for name in self.model_fields
+            if name != "extract_schema"
+        }
+        if self.model_extra:
+            fields.update(self.model_extra)
+        return fields
+
+    def _temp_call(
+        self,
+        call_type: Type[BaseCallT],
+        error_messages: dict[str, Any],
+        messages: Optional[list[Message]] = None,
+    ) -> BaseCallT:
+        """Returns a `TempCall` instance with this extractor's fields.
+
+        Args:
+            call_type: The type of call to generate the `TempCall` from.
+            error_messages: The errors of previous attempts to add to the prompt.
+            messages: The messages to send instead of the extractor's, if any.
+        """
+        call = self._generate_temp_call(call_type, error_messages)(
+            **self._prompt_fields()
+        )
+        call._extractor = self  # type: ignore
+        call._messages = messages  # type: ignore
+        return call
+
     def _generate_temp_call(
         self, call_type: Type[BaseCallT], error_messages: dict[str, Any]
     ) -> Type[BaseCallT]:
-        """Returns a `TempCall` generated using the extractors definition."""
+        """Returns a (cached) `TempCall` generated using the extractors definition.
+
+        Generating a pydantic model class is expensive, so the class is cached per
+        extractor class, call type and set of error messages. Instances of the class
+        must be linked to the extractor through `_extractor` (see `_temp_call`), which
+        the class delegates the extractor's properties and methods to.
+        """
+        key = (
+            call_type,
+            self.prompt_template,
+            self.base_url,
+            self.api_key,
+            id(self.call_params),
+            tuple(error_messages),
+        )
+        with _TEMP_CALLS_LOCK:
+            temp_calls = _TEMP_CALLS.setdefault(self.__class__, OrderedDict())
+            temp_call = temp_calls.get(key)
+            if temp_call is not None and temp_call.call_params is self.call_params:
+                temp_calls.move_to_end(key)
+                return temp_call  # type: ignore
+
         _prompt_template = self.prompt_template
         if error_messages:
             formatted_error_messages = [
@@ -484,13 +956,25 @@ class BaseExtractor(
 
             model_config = ConfigDict(extra="allow")
 
-        properties = getmembers(self)
-        for name, value in properties:
-            if not hasattr(TempCall, name) or (
-                name == "messages" and "messages" in self.__class__.__dict__
-            ):
-                setattr(TempCall, name, value)
+            _extractor: Any = PrivateAttr(default=None)
+            _messages: Optional[list[Message]] = PrivateAttr(default=None)
+
+            def messages(self) -> list[Message]:
+                if self._messages is not None:
+                    return self._messages
+                if custom_messages:
+                    return self._extractor.messages()
+                return super().messages()
 
+        custom_messages = "messages" in self.__class__.__dict__
+        for name, _ in getmembers(self.__class__):
+            if name not in self.model_fields and not hasattr(TempCall, name):
+                setattr(TempCall, name, _delegate(name))
+
+        with _TEMP_CALLS_LOCK:
+            temp_calls[key] = TempCall
+            if len(temp_calls) > _MAX_TEMP_CALLS:
+                temp_calls.popitem(last=False)
         return TempCall
 
     def _extract_schema(
@@ -525,8 +1009,7 @@ class BaseExtractor(
         self, tool_type: Type[BaseToolT], kwargs: dict[str, Any]
     ) -> tuple[dict[str, Any], bool]:
         """Returns the call params kwargs and whether to return the tool directly."""
-        call_params = self.call_params.model_copy(update=kwargs)
-        kwargs = call_params.kwargs(tool_type=tool_type)
+        kwargs = self.call_params.kwargs(tool_type=tool_type, overrides=kwargs)
         if _is_base_type(self.extract_schema):
             tool = tool_type.from_base_type(self.extract_schema)  # type: ignore
             return_tool = False
@@ -541,3 +1024,224 @@ class BaseExtractor(
             return_tool = True
         kwargs["tools"] = [tool]
         return kwargs, return_tool
+
+
+class _ManyExtraction:
+    """The state of extracting `extract_schema` for many extractors in one call.
+
+    Each extractor is a record whose id is its index in `extractors`. Records are
+    pending until an item with their id validates, and the errors of their last item
+    are sent along with them when they are re-asked.
+    """
+
+    def __init__(
+        self, extractors: Sequence[BaseExtractor], tool_type: Type[BaseTool]
+    ) -> None:
+        schemas = {extractor.extract_schema for extractor in extractors}
+        if len(schemas) > 1:
+            raise ValueError("All extractors must share the same `extract_schema`.")
+        self.extractors = extractors
+        self.results: dict[int, Any] = {}
+        self.errors: dict[int, list[str]] = {
+            index: [] for index in range(len(extractors))
+        }
+        if extractors:
+            self.schema = extractors[0].extract_schema
+            self.tool, self.validate = _many_tool(tool_type, self.schema)  # type: ignore
+
+    def kwargs(self, overrides: dict[str, Any]) -> dict[str, Any]:
+        """Returns the call kwargs with the list tool as the only tool."""
+        call_params = self.extractors[0].call_params
+        kwargs = call_params.kwargs(overrides=overrides)
+        kwargs["tools"] = [self.tool]
+        return kwargs
+
+    def call(self, call_type: Type[BaseCallT]) -> BaseCallT:
+        """Returns a call whose prompt packs all pending records."""
+        first = self.extractors[0]
+        system = [
+            message for message in first.messages() if message["role"] == "system"
+        ]
+        records = []
+        for index, errors in self.errors.items():
+            content = "\n\n".join(
+                str(message["content"])
+                for message in self.extractors[index].messages()
+                if message["role"] != "system"
+            )
+            if errors:
+                error_list = "\n".join(f"- {error}" for error in errors)
+                content = (
+                    f"{content}\n\n"
+                    f"Your previous item for this record had errors:\n{error_list}"
+                )
+            records.append(f'<record id="{index}">\n{content}\n</record>')
+        prompt = (
+            f"Extract one item from each of the following {len(records)} records, "
+            "setting each item's `record_id` to the id of its record.\n\n"
+            + "\n\n".join(records)
+        )
+        return first._temp_call(
+            call_type, {}, messages=[*system, {"role": "user", "content": prompt}]
+        )
+
+    def collect(self, response: Any) -> list[Any]:
+        """Validates the items of a response and returns all results once complete.
+
+        Raises:
+            ValueError: if any records are still missing or invalid.
+        """
+        tool = response.tool
+        items = getattr(tool, "items", None)
+        if not isinstance(items, list):
+            items = []
+        pending = self.errors
+        self.errors = {}
+        for item in items:
+            record_id = item.get("record_id") if isinstance(item, dict) else None
+            if (
+                not isinstance(record_id, int)
+                or record_id not in pending
+                or record_id in self.results
+            ):
+                continue
+            try:
+                result = self.validate(item)
+            except ValidationError as e:
+                self.errors[record_id] = [str(e)]
+                continue
+            if isinstance(result, BaseModel):
+                result._response = response  # type: ignore
+            self.results[record_id] = result
+        for index in pending:
+            if index not in self.results and index not in self.errors:
+                self.errors[index] = ["No item was extracted for this record."]
+        if self.errors:
+            raise ValueError(
+                f"Failed to extract records {sorted(self.errors)}: "
+                + "; ".join(errors[0] for errors in self.errors.values())
+            )
+        return [self.results[index] for index in range(len(self.extractors))]
+
+
+@lru_cache(maxsize=128)
+def _many_tool(
+    tool_type: Type[BaseTool], schema: Any
+) -> tuple[Type[BaseTool], Callable[[dict[str, Any]], Any]]:
+    """Returns the list tool for `schema` and a function validating one item.
+
+    The tool's `items` are left unvalidated so that each item can be validated on its
+    own instead of a single invalid item failing the whole list.
+    """
+    if _is_base_type(schema):
+        name = "Value"
+        item = create_model("Item", record_id=(int, ...), value=(schema, ...))  # type: ignore
+        adapter = TypeAdapter(schema)
+
+        def validate(raw: dict[str, Any]) -> Any:
+            return adapter.validate_python(raw.get("value"))
+
+    elif isclass(schema) and issubclass(schema, BaseModel):
+        if issubclass(schema, BaseTool):
+            raise ValueError("`extract_many` doesn't support tool schemas.")
+        name = schema.__name__
+        item = create_model(f"{name}Item", __base__=schema, record_id=(int, ...))  # type: ignore
+
+        def validate(raw: dict[str, Any]) -> Any:
+            fields = {key: value for key, value in raw.items() if key != "record_id"}
+            return schema.model_validate(fields)
+
+    else:
+        raise ValueError("`extract_many` doesn't support function schemas.")
+
+    items = create_model(
+        f"{name}List",
+        items=(list[item], ...),  # type: ignore
+        __doc__="The item extracted from each record, tagged with its `record_id`.",
+    )
+    tool = tool_type.from_model(items)
+
+    def raw_items(cls: Any, value: Any, handler: Any) -> Any:
+        return value
+
+    tool = create_model(
+        tool.__name__,
+        __base__=tool,
+        __doc__=tool.__doc__,
+        __validators__={
+            "raw_items": field_validator("items", mode="wrap")(raw_items)  # type: ignore
+        },
+    )
+    return tool, validate
+
+
+@lru_cache(maxsize=128)
+def _items_tool(
+    tool_type: Type[BaseTool], schema: Any
+) -> tuple[Type[BaseTool], TypeAdapter]:
+    """Returns the tool for a `list[...]` `schema` and an adapter validating one item.
+
+    The tool's `value` is left unvalidated so that items can be validated one at a time
+    as they complete, even though a partial item would fail to validate.
+
+    Raises:
+        ValueError: if `schema` isn't a `list[...]` type.
+    """
+    if get_origin(schema) is not list:
+        raise ValueError("Streaming items requires a `list[...]` `extract_schema`.")
+    tool = tool_type.from_base_type(schema)
+
+    def raw_value(cls: Any, value: Any, handler: Any) -> Any:
+        return value
+
+    tool = create_model(
+        tool.__name__,
+        __base__=tool,
+        __doc__=tool.__doc__,
+        __validators__={
+            "raw_value": field_validator("value", mode="wrap")(raw_value)  # type: ignore
+        },
+    )
+    (item_type,) = schema.__args__
+    return tool, TypeAdapter(item_type)
+
+
+class _StreamedItems:
+    """The items of a streamed list, tracking which have been validated so far."""
+
+    def __init__(self, adapter: TypeAdapter) -> None:
+        self.adapter = adapter
+        self.value: list[Any] = []
+        self.found = False
+        self.validated = 0
+
+    def update(self, tool: BaseTool) -> list[Any]:
+        """Returns the items of a partial tool that completed since the last update.
+
+        Every item but the last is complete, since the model has moved on to the next.
+        """
+        value = getattr(tool, "value", None)
+        self.value = value if isinstance(value, list) else []
+        self.found = True
+        return self._validate(len(self.value) - 1)
+
+    def finish(self) -> list[Any]:
+        """Returns the remaining items once the stream has ended.
+
+        Raises:
+            AttributeError: if no tool was streamed.
+        """
+        if not self.found:
+            raise AttributeError("No tool found in the completion.")
+        return self._validate(len(self.value))
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _validate(self, end: int) -> list[Any]:
+        """Validates the items before `end` that haven't been validated yet."""
+        items = [
+            self.adapter.validate_python(item)
+            for item in self.value[self.validated : end]
+        ]
+        self.validated = max(self.validated, end)
+        return items
@@ -0,0 +1,388 @@
+"""Provider fallback chains with health tracking and circuit breakers.
+
+A `FallbackCall` wraps an ordered list of call types that share the same prompt fields
+(e.g. the same prompt implemented as an `OpenAICall` and an `AnthropicCall`). Each
+request is routed to the healthiest provider and falls back to the next one on
+transient errors (see `is_transient_error`); other errors are raised immediately.
+
+Every call type has a `ProviderHealth` that tracks its error rate and latency over a
+rolling window. When the error rate reaches `failure_threshold`, the provider's circuit
+opens and it is skipped entirely for `cooldown` seconds, so requests don't each have to
+wait for a failing provider to time out before failing over. After the cooldown a
+single trial request is let through: if it succeeds the circuit closes again,
+otherwise it stays open for another cooldown.
+
+Example:
+
+```python
+from mirascope.anthropic import AnthropicCall
+from mirascope.base import FallbackCall
+from mirascope.openai import OpenAICall
+
+
+class OpenAIRecipe(OpenAICall):
+    prompt_template = "Recommend a {food} recipe."
+
+    food: str
+
+
+class AnthropicRecipe(AnthropicCall):
+    prompt_template = OpenAIRecipe.prompt_template
+
+    food: str
+
+
+recipes = FallbackCall(call_types=[OpenAIRecipe, AnthropicRecipe])
+response = recipes.call({"food": "pasta"})
+print(response.content)
+```
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import (
+    Any,
+    AsyncGenerator,
+    Generator,
+    Literal,
+    Optional,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from .calls import BaseCall
+from .prompts import BasePrompt
+from .retries import is_transient_error
+from .types import BaseCallResponse, BaseCallResponseChunk
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class ProviderHealth(BaseModel):
+    """The rolling health and circuit breaker state of a single provider.
+
+    Attributes:
+        window: The number of seconds of requests to keep.
+        min_requests: The number of requests in the window needed to open the circuit.
+        failure_threshold: The error rate at which the circuit opens.
+        cooldown: The number of seconds an open circuit stays open.
+    """
+
+    window: float = 60.0
+    min_requests: int = 5
+    failure_threshold: float = 0.5
+    cooldown: float = 30.0
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _events: deque[tuple[float, bool, float]] = PrivateAttr(default_factory=deque)
+    _opened_at: Optional[float] = PrivateAttr(default=None)
+    _trial: bool = PrivateAttr(default=False)
+
+    @property
+    def state(self) -> CircuitState:
+        """The state of the circuit breaker."""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.cooldown:
+            return "open"
+        return "half_open"
+
+    def error_rate(self) -> float:
+        """Returns the fraction of failed requests in the window."""
+        with self._lock:
+            self._expire(time.monotonic())
+            if not self._events:
+                return 0.0
+            return sum(not ok for _, ok, _ in self._events) / len(self._events)
+
+    def latency(self) -> Optional[float]:
+        """Returns the mean latency in seconds of successful requests in the window."""
+        with self._lock:
+            self._expire(time.monotonic())
+            latencies = [latency for _, ok, latency in self._events if ok]
+        return sum(latencies) / len(latencies) if latencies else None
+
+    def acquire(self) -> bool:
+        """Returns whether a request may be sent to the provider.
+
+        While the circuit is half open, only a single trial request is allowed.
+        """
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "open" or self._trial:
+                return False
+            self._trial = True
+            return True
+
+    def release(self) -> None:
+        """Releases a request without recording an outcome, e.g. if it's cancelled."""
+        with self._lock:
+            self._trial = False
+
+    def record(self, ok: bool, latency: float = 0.0) -> None:
+        """Records the outcome of a request, opening or closing the circuit."""
+        with self._lock:
+            now = time.monotonic()
+            if self._trial:
+                self._trial = False
+                if ok:
+                    self._opened_at = None
+                    self._events.clear()
+                else:
+                    self._opened_at = now
+                    return
+            self._events.append((now, ok, latency))
+            self._expire(now)
+            failures = sum(not ok for _, ok, _ in self._events)
+            if (
+                self._opened_at is None
+                and len(self._events) >= self.min_requests
+                and failures / len(self._events) >= self.failure_threshold
+            ):
+                self._opened_at = now
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _expire(self, now: float) -> None:
+        """Drops the events that are older than the window."""
+        while self._events and now - self._events[0][0] > self.window:
+            self._events.popleft()
+
+
+class FallbackCall(BaseModel):
+    """Routes calls to the healthiest provider, falling back on transient errors.
+
+    Providers are tried in order of health: providers with a closed circuit before
+    those being trialled after a cooldown, providers with an error rate below
+    `degraded_error_rate` (and a latency below `slow_latency`, if set) before the
+    rest, and otherwise in the order of `call_types`. Providers with an open circuit
+    are skipped.
+
+    Attributes:
+        call_types: The call types to route to, in order of preference. They must
+            share the prompt fields of the requests.
+        degraded_error_rate: The error rate at which a provider is tried after the
+            healthy ones.
+        slow_latency: The mean latency in seconds at which a provider is tried after
+            the healthy ones. `None` ignores latency.
+        health: The health of each call type, keyed by the call type. Providers
+            without an entry get a default `ProviderHealth`.
+    """
+
+    call_types: list[Type[BaseCall]] = Field(..., min_length=1)
+    degraded_error_rate: float = 0.1
+    slow_latency: Optional[float] = None
+    health: dict[Type[BaseCall], ProviderHealth] = Field(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Creates the health of each call type that doesn't have one."""
+        for call_type in self.call_types:
+            self.health.setdefault(call_type, ProviderHealth())
+
+    def route(self) -> list[Type[BaseCall]]:
+        """Returns the call types to try, in order, skipping open circuits."""
+
+        def key(index: int) -> tuple[bool, bool, int]:
+            health = self.health[self.call_types[index]]
+            latency = health.latency()
+            slow = (
+                self.slow_latency is not None
+                and latency is not None
+                and latency >= self.slow_latency
+            )
+            degraded = health.error_rate() >= self.degraded_error_rate or slow
+            return health.state != "closed", degraded, index
+
+        indices = [
+            index
+            for index, call_type in enumerate(self.call_types)
+            if self.health[call_type].state != "open"
+        ]
+        return [self.call_types[index] for index in sorted(indices, key=key)]
+
+    def call(
+        self, prompt: Union[BasePrompt, dict[str, Any]], **kwargs: Any
+    ) -> BaseCallResponse:
+        """Makes the call using the healthiest provider that responds.
+
+        Args:
+            prompt: The prompt whose fields to call with, or a dictionary of them.
+            **kwargs: Additional keyword arguments passed to the provider's `call`.
+
+        Raises:
+            RuntimeError: if every provider's circuit is open.
+            Exception: the provider's error if it isn't transient, or the last
+                provider's error if every provider fails.
+        """
+        error: Optional[Exception] = None
+        for call_type, health in self._candidates():
+            start = time.perf_counter()
+            try:
+                response = self._create(call_type, prompt).call(**kwargs)
+            except Exception as e:
+                error = self._failed(health, e, time.perf_counter() - start)
+                continue
+            except BaseException:
+                health.release()
+                raise
+            health.record(True, time.perf_counter() - start)
+            return response
+        raise self._exhausted(error)
+
+    async def call_async(
+        self, prompt: Union[BasePrompt, dict[str, Any]], **kwargs: Any
+    ) -> BaseCallResponse:
+        """Makes an asynchronous call using the healthiest provider that responds.
+
+        Args:
+            prompt: The prompt whose fields to call with, or a dictionary of them.
+            **kwargs: Additional keyword arguments passed to the provider's
+                `call_async`.
+
+        Raises:
+            RuntimeError: if every provider's circuit is open.
+            Exception: the provider's error if it isn't transient, or the last
+                provider's error if every provider fails.
+        """
+        error: Optional[Exception] = None
+        for call_type, health in self._candidates():
+            start = time.perf_counter()
+            try:
+                response = await self._create(call_type, prompt).call_async(**kwargs)
+            except Exception as e:
+                error = self._failed(health, e, time.perf_counter() - start)
+                continue
+            except BaseException:
+                health.release()
+                raise
+            health.record(True, time.perf_counter() - start)
+            return response
+        raise self._exhausted(error)
+
+    def stream(
+        self, prompt: Union[BasePrompt, dict[str, Any]], **kwargs: Any
+    ) -> Generator[BaseCallResponseChunk, None, None]:
+        """Streams the response of the healthiest provider that responds.
+
+        Falls back to the next provider only until the first chunk is yielded. The
+        recorded latency is the time to the first chunk.
+
+        Args:
+            prompt: The prompt whose fields to call with, or a dictionary of them.
+            **kwargs: Additional keyword arguments passed to the provider's `stream`.
+
+        Raises:
+            RuntimeError: if every provider's circuit is open.
+            Exception: the provider's error if it isn't transient or happens after
+                the first chunk, or the last provider's error if every provider fails.
+        """
+        error: Optional[Exception] = None
+        for call_type, health in self._candidates():
+            start, latency = time.perf_counter(), None
+            try:
+                for chunk in self._create(call_type, prompt).stream(**kwargs):
+                    if latency is None:
+                        latency = time.perf_counter() - start
+                    yield chunk
+            except Exception as e:
+                if latency is not None:
+                    health.record(False)
+                    raise
+                error = self._failed(health, e, time.perf_counter() - start)
+                continue
+            except BaseException:
+                health.release()
+                raise
+            health.record(
+                True, time.perf_counter() - start if latency is None else latency
+            )
+            return
+        raise self._exhausted(error)
+
+    async def stream_async(
+        self, prompt: Union[BasePrompt, dict[str, Any]], **kwargs: Any
+    ) -> AsyncGenerator[BaseCallResponseChunk, None]:
+        """Streams the response of the healthiest provider that responds.
+
+        Falls back to the next provider only until the first chunk is yielded. The
+        recorded latency is the time to the first chunk.
+
+        Args:
+            prompt: The prompt whose fields to call with, or a dictionary of them.
+            **kwargs: Additional keyword arguments passed to the provider's
+                `stream_async`.
+
+        Raises:
+            RuntimeError: if every provider's circuit is open.
+            Exception: the provider's error if it isn't transient or happens after
+                the first chunk, or the last provider's error if every provider fails.
+        """
+        error: Optional[Exception] = None
+        for call_type, health in self._candidates():
+            start, latency = time.perf_counter(), None
+            try:
+                stream = self._create(call_type, prompt).stream_async(**kwargs)
+                async for chunk in stream:
+                    if latency is None:
+                        latency = time.perf_counter() - start
+                    yield chunk
+            except Exception as e:
+                if latency is not None:
+                    health.record(False)
+                    raise
+                error = self._failed(health, e, time.perf_counter() - start)
+                continue
+            except BaseException:
+                health.release()
+                raise
+            health.record(
+                True, time.perf_counter() - start if latency is None else latency
+            )
+            return
+        raise self._exhausted(error)
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _candidates(
+        self,
+    ) -> Generator[tuple[Type[BaseCall], ProviderHealth], None, None]:
+        """Yields the routed call types whose circuit lets a request through."""
+        for call_type in self.route():
+            health = self.health[call_type]
+            if health.acquire():
+                yield call_type, health
+
+    def _create(
+        self, call_type: Type[BaseCall], prompt: Union[BasePrompt, dict[str, Any]]
+    ) -> BaseCall:
+        """Returns an instance of `call_type` with the fields of `prompt`."""
+        if isinstance(prompt, call_type):
+            return prompt
+        fields = prompt if isinstance(prompt, dict) else dict(prompt)
+        return call_type(**fields)
+
+    def _failed(
+        self, health: ProviderHealth, error: Exception, latency: float
+    ) -> Exception:
+        """Records a failed request, re-raising the error if it isn't transient.
+
+        A non-transient error (e.g. a bad request) means the provider is responding,
+        so it counts towards the provider's health as a success.
+        """
+        if not is_transient_error(error):
+            health.record(True, latency)
+            raise error
+        health.record(False)
+        return error
+
+    def _exhausted(self, error: Optional[Exception]) -> Exception:
+        """Returns the error to raise once no provider is left to fall back to."""
+        if error is not None:
+            return error
+        return RuntimeError("Every provider's circuit is open.")
@@ -0,0 +1,347 @@
+"""Hedged requests for reducing tail latency across providers.
+
+A `HedgedCall` sends a prompt to its primary call and, if no response (or, when
+streaming, no first chunk) has arrived by the hedging deadline, also sends it to the
+next backup call, e.g. the same prompt on another provider. Whichever finishes first
+wins and the others are cancelled. A call that fails launches the next backup right
+away instead of waiting for the deadline.
+
+By default the deadline is a percentile (p95) of the primary's recent latencies, so
+only the slowest few percent of requests are hedged.
+
+Example:
+
+```python
+from mirascope.anthropic import AnthropicCall
+from mirascope.base import HedgedCall
+from mirascope.openai import OpenAICall
+
+
+class OpenAIRecipe(OpenAICall):
+    prompt_template = "Recommend a {food} recipe."
+
+    food: str
+
+
+class AnthropicRecipe(AnthropicCall):
+    prompt_template = OpenAIRecipe.prompt_template
+
+    food: str
+
+
+hedged = HedgedCall(
+    calls=[OpenAIRecipe(food="pasta"), AnthropicRecipe(food="pasta")]
+)
+response = hedged.call()
+print(response.content)
+```
+
+Synchronous calls can't be interrupted, so a losing synchronous `call` runs to
+completion in a background thread (its result is discarded). Use `call_async` or the
+streaming methods for actual cancellation.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import closing
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Generator,
+    Optional,
+    TypeVar,
+)
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from .calls import BaseCall
+from .types import BaseCallResponse, BaseCallResponseChunk
+
+T = TypeVar("T")
+
+_EMPTY = object()
+
+
+class LatencyTracker(BaseModel):
+    """Tracks a sliding window of recent latencies.
+
+    Attributes:
+        window: The number of most recent latencies to keep.
+    """
+
+    window: int = 1000
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _latencies: deque[float] = PrivateAttr(default_factory=deque)
+
+    def __len__(self) -> int:
+        return len(self._latencies)
+
+    def record(self, latency: float) -> None:
+        """Records a latency in seconds."""
+        with self._lock:
+            self._latencies.append(latency)
+            if len(self._latencies) > self.window:
+                self._latencies.popleft()
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Returns the given percentile of the recorded latencies, if any."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if not latencies:
+            return None
+        index = round(percentile / 100 * (len(latencies) - 1))
+        return latencies[min(max(index, 0), len(latencies) - 1)]
+
+
+class HedgedCall(BaseModel):
+    """Hedges a call with backup calls to cut tail latency.
+
+    Attributes:
+        calls: The primary call followed by the backup calls, in the order in which
+            they are launched.
+        percentile: The percentile of the primary's recorded latencies to use as the
+            hedging deadline. `None` always uses `delay`.
+        delay: The hedging deadline in seconds while fewer than `min_samples`
+            latencies have been recorded (or always if `percentile` is `None`).
+        min_samples: The number of recorded latencies needed to use `percentile`.
+        latencies: The primary's latencies (to the full response for `call` or to the
+            first chunk for `stream`). Share a tracker across `HedgedCall` instances
+            that use the same primary model.
+    """
+
+    calls: list[BaseCall] = Field(..., min_length=1)
+    percentile: Optional[float] = 95.0
+    delay: float = 1.0
+    min_samples: int = 20
+    latencies: LatencyTracker = Field(default_factory=LatencyTracker)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def deadline(self) -> float:
+        """Returns the seconds to wait for a call before launching the next backup."""
+        if self.percentile is None or len(self.latencies) < self.min_samples:
+            return self.delay
+        deadline = self.latencies.percentile(self.percentile)
+        return self.delay if deadline is None else deadline
+
+    def call(self, **kwargs: Any) -> BaseCallResponse:
+        """Returns the response of whichever call finishes first.
+
+        Args:
+            **kwargs: Additional keyword arguments passed to each call's `call`.
+
+        Raises:
+            Exception: the primary's error if every call fails.
+        """
+        return self._hedge(lambda call: call.call(**kwargs))
+
+    async def call_async(self, **kwargs: Any) -> BaseCallResponse:
+        """Returns the response of whichever call finishes first, cancelling the rest.
+
+        Args:
+            **kwargs: Additional keyword arguments passed to each call's `call_async`.
+
+        Raises:
+            Exception: the primary's error if every call fails.
+        """
+        return await self._hedge_async(lambda call: call.call_async(**kwargs))
+
+    def stream(self, **kwargs: Any) -> Generator[BaseCallResponseChunk, None, None]:
+        """Streams the response of whichever call yields its first chunk first.
+
+        Args:
+            **kwargs: Additional keyword arguments passed to each call's `stream`.
+
+        Raises:
+            Exception: the primary's error if every call fails.
+        """
+
+        def first(call: BaseCall) -> tuple[Generator, Any]:
+            stream = call.stream(**kwargs)
+            return stream, next(stream, _EMPTY)
+
+        stream, chunk = self._hedge(first, discard=lambda result: result[0].close())
+        with closing(stream):
+            if chunk is not _EMPTY:
+                yield chunk
+                yield from stream
+
+    async def stream_async(
+        self, **kwargs: Any
+    ) -> AsyncGenerator[BaseCallResponseChunk, None]:
+        """Streams the response of whichever call yields its first chunk first.
+
+        Args:
+            **kwargs: Additional keyword arguments passed to each call's
+                `stream_async`.
+
+        Raises:
+            Exception: the primary's error if every call fails.
+        """
+
+        async def first(call: BaseCall) -> tuple[AsyncGenerator, Any]:
+            stream = call.stream_async(**kwargs)
+            try:
+                return stream, await stream.__anext__()
+            except StopAsyncIteration:
+                return stream, _EMPTY
+            except BaseException:
+                await stream.aclose()
+                raise
+
+        stream, chunk = await self._hedge_async(
+            first, discard=lambda result: result[0].aclose()
+        )
+        try:
+            if chunk is not _EMPTY:
+                yield chunk
+                async for chunk in stream:
+                    yield chunk
+        finally:
+            await stream.aclose()
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _hedge(
+        self,
+        start: Callable[[BaseCall], T],
+        discard: Optional[Callable[[T], Any]] = None,
+    ) -> T:
+        """Runs `start` on the calls in threads, hedging per the deadline."""
+        executor = ThreadPoolExecutor(max_workers=len(self.calls))
+        pending: dict[Future, int] = {}
+        errors: dict[int, BaseException] = {}
+        deadline, launched = self.deadline(), 0
+        started_at = time.perf_counter()
+
+        def launch() -> None:
+            nonlocal launched
+            pending[executor.submit(start, self.calls[launched])] = launched
+            launched += 1
+
+        try:
+            launch()
+            while pending:
+                done, _ = wait(
+                    pending,
+                    timeout=deadline if launched < len(self.calls) else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                if not done:
+                    launch()
+                    continue
+                winner, losers = self._winner(
+                    [(future, pending.pop(future)) for future in done],
+                    pending,
+                    started_at,
+                    errors,
+                )
+                if winner is not None:
+                    for loser in losers:
+                        if discard is not None:
+                            discard(loser.result())
+                    return winner.result()
+                if launched < len(self.calls):
+                    launch()
+            raise errors[min(errors)]
+        finally:
+            for future in pending:
+                if not future.cancel() and discard is not None:
+                    future.add_done_callback(_discard_result(discard))
+            executor.shutdown(wait=False)
+
+    async def _hedge_async(
+        self,
+        start: Callable[[BaseCall], Awaitable[T]],
+        discard: Optional[Callable[[T], Any]] = None,
+    ) -> T:
+        """Runs `start` on the calls as tasks, hedging per the deadline."""
+        pending: dict[asyncio.Future, int] = {}
+        errors: dict[int, BaseException] = {}
+        deadline, launched = self.deadline(), 0
+        started_at = time.perf_counter()
+
+        def launch() -> None:
+            nonlocal launched
+            pending[asyncio.ensure_future(start(self.calls[launched]))] = launched
+            launched += 1
+
+        try:
+            launch()
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=deadline if launched < len(self.calls) else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    launch()
+                    continue
+                winner, losers = self._winner(
+                    [(task, pending.pop(task)) for task in done],
+                    pending,
+                    started_at,
+                    errors,
+                )
+                if winner is not None:
+                    for loser in losers:
+                        if discard is not None:
+                            await discard(loser.result())
+                    return winner.result()
+                if launched < len(self.calls):
+                    launch()
+            raise errors[min(errors)]
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+            for task in pending:
+                if not task.cancelled() and task.exception() is None:
+                    if discard is not None:
+                        await discard(task.result())
+
+    def _winner(
+        self,
+        done: list[tuple[Any, int]],
+        pending: dict[Any, int],
+        started_at: float,
+        errors: dict[int, BaseException],
+    ) -> tuple[Any, list[Any]]:
+        """Returns the first successful finished future and the other successful ones.
+
+        Records the errors of failed futures and the primary's latency. If the primary
+        is still pending when another call wins, the time so far is recorded as a lower
+        bound of its latency so that hedging doesn't bias the recorded latencies.
+        """
+        successes = []
+        for future, index in sorted(done, key=lambda entry: entry[1]):
+            error = future.exception()
+            if error is not None:
+                errors[index] = error
+                continue
+            if index == 0:
+                self.latencies.record(time.perf_counter() - started_at)
+            successes.append(future)
+        if not successes:
+            return None, []
+        if 0 in pending.values():
+            self.latencies.record(time.perf_counter() - started_at)
+        return successes[0], successes[1:]
+
+
+def _discard_result(discard: Callable[[Any], Any]) -> Callable[[Future], None]:
+    """Returns a done callback that discards a losing future's result."""
+
+    def callback(future: Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            discard(future.result())
+
+    return callback
@@ -0,0 +1,260 @@
+"""An incremental parser for JSON that is streamed in chunks.
+
+Re-parsing the entire accumulated buffer with `from_json(..., allow_partial=True)` on
+every chunk makes streaming a tool's arguments quadratic in their length. The
+`IncrementalJSONParser` instead only scans the characters it has not seen yet and
+updates the partially parsed value in place, matching the partial semantics of
+`pydantic_core.from_json`:
+
+- containers are included as soon as they are opened;
+- strings, object keys and `true` / `false` / `null` are only included once complete;
+- a trailing number is included if it is valid so far (e.g. `12` but not `1.`).
+
+Example:
+
+```python
+from mirascope.base import IncrementalJSONParser
+
+parser = IncrementalJSONParser()
+parser.feed('{"name": "Pat')
+print(parser.value)
+#> {}
+parser.feed('rick", "tags": ["a')
+print(parser.value)
+#> {'name': 'Patrick', 'tags': []}
+parser.feed('", "b"]}')
+print(parser.value)
+#> {'name': 'Patrick', 'tags': ['a', 'b']}
+```
+"""
+import json
+import re
+from typing import Any, Optional, Union
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING_CHARS = re.compile(r'[^"\\]*')
+_ESCAPE = re.compile(r'\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})')
+_ESCAPE_PREFIX = re.compile(r"\\(?:u[0-9a-fA-F]{0,3})?")
+_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?")
+_NUMBER_CHARS = re.compile(r"[-+0-9.eE]*")
+_LITERALS = {"true": True, "false": False, "null": None}
+
+# The tokens the parser expects next.
+_VALUE = 0
+_VALUE_OR_END = 1  # right after `[`
+_KEY = 2  # right after `,` in an object
+_KEY_OR_END = 3  # right after `{`
+_COLON = 4
+_COMMA_OR_END = 5
+_DONE = 6
+
+
+class IncrementalJSONParser:
+    """Parses a JSON document incrementally as it is fed in chunks.
+
+    Each call to `feed` costs time proportional to the length of the chunk, so parsing
+    a document streamed in many small chunks is linear in its total length.
+
+    The parsed `value` is updated in place as more chunks are fed and must not be
+    mutated by the caller; copy it first if you need to modify it.
+    """
+
+    def __init__(self) -> None:
+        self._pending = ""
+        self._stack: list[Union[dict, list]] = []
+        self._keys: list[Optional[str]] = []
+        self._expect = _VALUE
+        self._root: Any = None
+        self._has_root = False
+        self._in_string = False
+        self._string_parts: list[str] = []
+        self._tentative = False
+
+    @property
+    def done(self) -> bool:
+        """Whether a complete JSON document has been parsed."""
+        return self._expect == _DONE
+
+    @property
+    def value(self) -> Any:
+        """The (partial) value parsed so far.
+
+        Raises:
+            ValueError: if no value has been started yet.
+        """
+        if not self._has_root:
+            raise ValueError("No JSON value has been parsed yet.")
+        return self._root
+
+    def feed(self, chunk: str) -> None:
+        """Parses the next chunk of the document.
+
+        Args:
+            chunk: The next chunk of the JSON document.
+
+        Raises:
+            ValueError: if the document is not valid JSON.
+        """
+        self._remove_tentative()
+        buffer = self._pending + chunk
+        position, end = 0, len(buffer)
+        while position < end:
+            if self._in_string:
+                position = self._scan_string(buffer, position)
+                if self._in_string:
+                    break
+                continue
+            position = _WHITESPACE.match(buffer, position).end()  # type: ignore
+            if position == end:
+                break
+            char, expect = buffer[position], self._expect
+            if expect == _COMMA_OR_END:
+                if char == ",":
+                    self._expect = _KEY if isinstance(self._stack[-1], dict) else _VALUE
+                elif char == ("}" if isinstance(self._stack[-1], dict) else "]"):
+                    self._close()
+                else:
+                    raise self._error(char)
+                position += 1
+            elif expect == _COLON:
+                if char != ":":
+                    raise self._error(char)
+                self._expect = _VALUE
+                position += 1
+            elif expect in (_KEY, _KEY_OR_END):
+                if char == '"':
+                    self._in_string = True
+                elif char == "}" and expect == _KEY_OR_END:
+                    self._close()
+                else:
+                    raise self._error(char)
+                position += 1
+            elif expect in (_VALUE, _VALUE_OR_END):
+                if char == "]" and expect == _VALUE_OR_END:
+                    self._close()
+                    position += 1
+                else:
+                    next_position = self._scan_value(buffer, position)
+                    if next_position is None:
+                        break
+                    position = next_position
+            else:
+                raise self._error(char)
+        self._pending = buffer[position:]
+        self._add_tentative()
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _error(self, char: str) -> ValueError:
+        """Returns the error for an unexpected character."""
+        return ValueError(f"Invalid JSON: unexpected character {char!r}.")
+
+    def _scan_string(self, buffer: str, position: int) -> int:
+        """Consumes string content, returning the position after what was consumed.
+
+        Scanning stops early at an escape sequence that is cut off by the buffer's end.
+        """
+        end = len(buffer)
+        while position < end:
+            match = _STRING_CHARS.match(buffer, position)
+            if match.end() > position:  # type: ignore
+                self._string_parts.append(match.group())  # type: ignore
+                position = match.end()  # type: ignore
+            if position == end:
+                break
+            if buffer[position] == '"':
+                self._in_string = False
+                raw = "".join(self._string_parts)
+                self._string_parts = []
+                string = json.loads(f'"{raw}"') if "\\" in raw else raw
+                if self._expect in (_KEY, _KEY_OR_END):
+                    self._keys[-1] = string
+                    self._expect = _COLON
+                else:
+                    self._add(string)
+                return position + 1
+            escape = _ESCAPE.match(buffer, position)
+            if escape:
+                self._string_parts.append(escape.group())
+                position = escape.end()
+            elif _ESCAPE_PREFIX.match(buffer, position).end() == end:  # type: ignore
+                break
+            else:
+                raise ValueError("Invalid JSON: invalid escape sequence in string.")
+        return position
+
+    def _scan_value(self, buffer: str, position: int) -> Optional[int]:
+        """Consumes a value, returning `None` if it's incomplete at the buffer's end."""
+        char = buffer[position]
+        if char == "{" or char == "[":
+            container: Union[dict, list] = {} if char == "{" else []
+            self._add(container)
+            self._stack.append(container)
+            self._keys.append(None)
+            self._expect = _KEY_OR_END if char == "{" else _VALUE_OR_END
+            return position + 1
+        if char == '"':
+            self._in_string = True
+            return position + 1
+        if char == "-" or char.isdigit():
+            end = _NUMBER_CHARS.match(buffer, position).end()  # type: ignore
+            if end == len(buffer):
+                return None
+            token = buffer[position:end]
+            if not _NUMBER.fullmatch(token):
+                raise ValueError(f"Invalid JSON: invalid number {token!r}.")
+            self._add(_parse_number(token))
+            return end
+        for literal, literal_value in _LITERALS.items():
+            if buffer.startswith(literal, position):
+                self._add(literal_value)
+                return position + len(literal)
+            if literal.startswith(buffer[position:]):
+                return None
+        raise self._error(char)
+
+    def _add(self, value: Any) -> None:
+        """Adds a completed (or newly opened) value to the current container."""
+        if not self._stack:
+            self._root, self._has_root = value, True
+            self._expect = _DONE
+            return
+        container = self._stack[-1]
+        if isinstance(container, dict):
+            container[self._keys[-1]] = value
+        else:
+            container.append(value)
+        self._expect = _COMMA_OR_END
+
+    def _close(self) -> None:
+        """Closes the current container."""
+        self._stack.pop()
+        self._keys.pop()
+        self._expect = _COMMA_OR_END if self._stack else _DONE
+
+    def _add_tentative(self) -> None:
+        """Adds a trailing number that may still continue in the next chunk."""
+        if self._in_string or not _NUMBER.fullmatch(self._pending):
+            return
+        expect = self._expect
+        self._add(_parse_number(self._pending))
+        self._expect, self._tentative = expect, True
+
+    def _remove_tentative(self) -> None:
+        """Removes the trailing number added by `_add_tentative`."""
+        if not self._tentative:
+            return
+        self._tentative = False
+        if not self._stack:
+            self._root, self._has_root = None, False
+        elif isinstance(self._stack[-1], dict):
+            del self._stack[-1][self._keys[-1]]
+        else:
+            self._stack[-1].pop()
+
+
+def _parse_number(token: str) -> Union[int, float]:
+    """Returns the `int` or `float` represented by a valid JSON number token."""
+    if "." in token or "e" in token or "E" in token:
+        return float(token)
+    return int(token)
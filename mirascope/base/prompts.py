@@ -1,5 +1,6 @@
 """A base class for writing prompts."""
 import re
+from functools import lru_cache
 from string import Formatter
 from textwrap import dedent
 from typing import Any, Callable, ClassVar, Type, TypeVar, Union
@@ -86,12 +87,7 @@ class BasePrompt(BaseModel):
 
     def _format_template(self, template: str):
         """Formats the given `template` with attributes matching template variables."""
-        dedented_template = dedent(template).strip()
-        template_vars = [
-            var
-            for _, var, _, _ in Formatter().parse(dedented_template)
-            if var is not None
-        ]
+        dedented_template, template_vars = _compile_template(template)
 
         values = {}
         for var in template_vars:
@@ -115,18 +111,9 @@ class BasePrompt(BaseModel):
             ValueError: if the template contains an unknown role.
         """
         messages = []
-        re_roles = "|".join([role.upper() for role in roles] + ["MESSAGES"])
-        for match in re.finditer(
-            rf"({re_roles}):((.|\n)+?)(?=({re_roles}):|\Z)",
-            self.prompt_template,
-        ):
-            role = match.group(1).lower()
+        for role, section in _compile_sections(self.prompt_template, tuple(roles)):
             if role == "messages":
-                template_var = [
-                    var
-                    for _, var, _, _ in Formatter().parse(match.group(2))
-                    if var is not None
-                ][0]
+                template_var = _compile_template(section)[1][0]
                 attribute = getattr(self, template_var)
                 if not attribute or not isinstance(attribute, list):
                     raise ValueError(
@@ -135,7 +122,7 @@ class BasePrompt(BaseModel):
                     )
                 messages += attribute
             else:
-                content = self._format_template(match.group(2))
+                content = self._format_template(section)
                 messages.append({"role": role, "content": content})
         if len(messages) == 0:
             messages.append(
@@ -147,6 +134,37 @@ class BasePrompt(BaseModel):
         return messages
 
 
+@lru_cache(maxsize=1024)
+def _compile_template(template: str) -> tuple[str, tuple[str, ...]]:
+    """Returns the dedented `template` and the template variables it contains.
+
+    Templates are class-level constants, so we cache the result to avoid re-parsing
+    the same template every time a prompt is rendered.
+    """
+    dedented_template = dedent(template).strip()
+    template_vars = tuple(
+        var for _, var, _, _ in Formatter().parse(dedented_template) if var is not None
+    )
+    return dedented_template, template_vars
+
+
+@lru_cache(maxsize=1024)
+def _compile_sections(
+    template: str, roles: tuple[str, ...]
+) -> tuple[tuple[str, str], ...]:
+    """Returns the `(role, section)` pairs of a template split by its role keywords.
+
+    The `role` of a section using the `MESSAGES` keyword is `"messages"`.
+    """
+    re_roles = "|".join([role.upper() for role in roles] + ["MESSAGES"])
+    return tuple(
+        (match.group(1).lower(), match.group(2))
+        for match in re.finditer(
+            rf"({re_roles}):((.|\n)+?)(?=({re_roles}):|\Z)", template
+        )
+    )
+
+
 BasePromptT = TypeVar("BasePromptT", bound=BasePrompt)
 
 
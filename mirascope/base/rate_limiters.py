@@ -0,0 +1,207 @@
+"""Client-side rate limiting for LLM calls and embedders.
+
+Setting `rate_limiter` in a call's `call_params` (or an embedder's `embedding_params`)
+paces requests before they are dispatched instead of relying on `429` errors and
+retries. A `RateLimiter` keeps a token bucket for requests per minute and another for
+tokens per minute. Before each request it reserves one request and an estimate of the
+tokens the request will use, and waits until both buckets can cover the reservation.
+Once a call's response reports its actual `input_tokens` and `output_tokens`, the
+difference from the estimate is reconciled against the token bucket.
+
+A single `RateLimiter` is safe to share across threads and asyncio tasks (e.g. across
+every call that shares an API key's quota).
+
+Example:
+
+```python
+from mirascope.base import RateLimiter
+from mirascope.openai import OpenAICall, OpenAICallParams
+
+limiter = RateLimiter(requests_per_minute=500, tokens_per_minute=200_000)
+
+
+class Summarizer(OpenAICall):
+    prompt_template = "Summarize this text: {text}"
+
+    text: str
+
+    call_params = OpenAICallParams(model="gpt-4o", rate_limiter=limiter)
+```
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Optional, TypeVar, cast
+
+from pydantic import BaseModel, PrivateAttr
+from pydantic_core import to_json
+
+CHARS_PER_TOKEN = 4
+
+
+class _TokenBucket:
+    """A token bucket that refills `capacity` tokens per minute.
+
+    The level may go negative, which represents reservations that must be paid back by
+    refilling before the next reservation can proceed.
+    """
+
+    def __init__(self, capacity: float) -> None:
+        self.capacity = capacity
+        self.rate = capacity / 60
+        self.level = capacity
+        self.updated_at = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Reserves `amount` and returns the seconds until the reservation is covered."""
+        self.level = min(
+            self.capacity, self.level + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+        self.level -= amount
+        return max(0.0, -self.level / self.rate)
+
+
+class RateLimiter(BaseModel):
+    """Paces requests to stay within requests and tokens per minute budgets.
+
+    Attributes:
+        requests_per_minute: The maximum number of requests per minute. `None` means
+            requests are not limited.
+        tokens_per_minute: The maximum number of tokens per minute. `None` means
+            tokens are not limited.
+    """
+
+    requests_per_minute: Optional[float] = None
+    tokens_per_minute: Optional[float] = None
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _requests: Optional[_TokenBucket] = PrivateAttr(default=None)
+    _tokens: Optional[_TokenBucket] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Creates the token buckets for the configured budgets."""
+        if self.requests_per_minute is not None:
+            self._requests = _TokenBucket(self.requests_per_minute)
+        if self.tokens_per_minute is not None:
+            self._tokens = _TokenBucket(self.tokens_per_minute)
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Blocks the current thread until a request using `tokens` may be sent."""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens: int = 0) -> None:
+        """Waits without blocking the event loop until the request may be sent."""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: float) -> None:
+        """Corrects the token budget once a request's actual usage is known."""
+        if self._tokens is not None:
+            with self._lock:
+                self._tokens.level -= actual_tokens - estimated_tokens
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _reserve(self, tokens: int) -> float:
+        """Reserves a request using `tokens` and returns the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            delay = 0.0
+            if self._requests is not None:
+                delay = self._requests.reserve(1, now)
+            if self._tokens is not None:
+                delay = max(delay, self._tokens.reserve(tokens, now))
+            return delay
+
+
+def estimate_tokens(value: Any) -> int:
+    """Returns a rough estimate of the number of tokens in `value`.
+
+    The estimate assumes about four characters per token of the JSON encoding of
+    `value`, which slightly overcounts the structure of a list of messages. It is only
+    used for pacing and is reconciled with actual usage when available.
+    """
+    return len(to_json(value, fallback=str)) // CHARS_PER_TOKEN
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def rate_limited(fn: F) -> F:
+    """Decorator for pacing `BaseCall` methods with `call_params.rate_limiter`.
+
+    The request's tokens are estimated from the rendered messages plus `max_tokens`
+    (if set), since providers typically count it against the tokens per minute budget.
+    Streams are paced using the estimate only.
+    """
+
+    def _setup(self: Any, kwargs: dict[str, Any]) -> tuple[Optional[RateLimiter], int]:
+        """Returns the rate limiter and the estimated tokens for the call."""
+        limiter = kwargs.get("rate_limiter", self.call_params.rate_limiter)
+        if limiter is None:
+            return None, 0
+        max_tokens = kwargs.get(
+            "max_tokens", getattr(self.call_params, "max_tokens", 0)
+        )
+        return limiter, estimate_tokens(self.messages()) + (max_tokens or 0)
+
+    def _reconcile(limiter: RateLimiter, tokens: int, response: Any) -> None:
+        """Reconciles the estimate with the usage reported by the response."""
+        input_tokens = response.input_tokens
+        if input_tokens is not None:
+            limiter.reconcile(tokens, input_tokens + (response.output_tokens or 0))
+
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        """Wrapper for pacing a call."""
+        limiter, tokens = _setup(self, kwargs)
+        if limiter is None:
+            return fn(self, *args, **kwargs)
+        limiter.acquire(tokens)
+        response = fn(self, *args, **kwargs)
+        _reconcile(limiter, tokens, response)
+        return response
+
+    @wraps(fn)
+    async def wrapper_async(self, *args, **kwargs):
+        """Wrapper for pacing an asynchronous call."""
+        limiter, tokens = _setup(self, kwargs)
+        if limiter is None:
+            return await fn(self, *args, **kwargs)
+        await limiter.acquire_async(tokens)
+        response = await fn(self, *args, **kwargs)
+        _reconcile(limiter, tokens, response)
+        return response
+
+    @wraps(fn)
+    def wrapper_generator(self, *args, **kwargs):
+        """Wrapper for pacing a stream."""
+        limiter, tokens = _setup(self, kwargs)
+        if limiter is not None:
+            limiter.acquire(tokens)
+        yield from fn(self, *args, **kwargs)
+
+    @wraps(fn)
+    async def wrapper_generator_async(self, *args, **kwargs):
+        """Wrapper for pacing an asynchronous stream."""
+        limiter, tokens = _setup(self, kwargs)
+        if limiter is not None:
+            await limiter.acquire_async(tokens)
+        async for value in fn(self, *args, **kwargs):
+            yield value
+
+    if inspect.isasyncgenfunction(fn):
+        return cast(F, wrapper_generator_async)
+    if inspect.isgeneratorfunction(fn):
+        return cast(F, wrapper_generator)
+    if inspect.iscoroutinefunction(fn):
+        return cast(F, wrapper_async)
+    return cast(F, wrapper)
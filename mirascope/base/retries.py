@@ -0,0 +1,433 @@
+"""Retry policies with backoff, `Retry-After` support and retry budgets.
+
+Passing an integer as `retries` retries any error immediately, which amplifies outages
+when a provider is overloaded. A `RetryPolicy` can be passed as `retries` to any
+`call`, `stream` or `extract` method instead:
+
+- attempts are spaced with exponential backoff and full jitter;
+- a provider's `Retry-After` (or `retry-after-ms`) header is waited out, and the error
+  is raised immediately if the provider asks to wait longer than `max_retry_after`;
+- only transient errors (connection errors, timeouts, `408`, `409`, `429` and `5xx`
+  responses) are retried, while fatal errors (e.g. `400`, `401` or an exhausted quota)
+  are raised immediately;
+- an optional `RetryBudget` shared across calls caps retries to a fraction of requests;
+- a retried `stream` can resume where it failed instead of replaying the chunks that
+  were already yielded (see `RetryPolicy.resume_streams`).
+
+Example:
+
+```python
+from mirascope.base import RetryBudget, RetryPolicy
+from mirascope.openai import OpenAICall
+
+policy = RetryPolicy(max_attempts=5, budget=RetryBudget(ratio=0.1))
+
+
+class Recipe(OpenAICall):
+    prompt_template = "Recommend a {food} recipe."
+
+    food: str
+
+
+response = Recipe(food="pasta").call(retries=policy)
+```
+"""
+from __future__ import annotations
+
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Generator,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+)
+
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+"""The non-`5xx` status codes of errors that are worth retrying."""
+
+FATAL_ERROR_CODES = frozenset({"insufficient_quota"})
+"""Error codes of otherwise retryable responses that won't succeed when retried."""
+
+TRANSIENT_ERRORS: dict[str, frozenset[str]] = {
+    "anthropic": frozenset({"APIConnectionError", "APITimeoutError"}),
+    "google": frozenset({"DeadlineExceeded", "RetryError", "ServiceUnavailable"}),
+    "groq": frozenset({"APIConnectionError", "APITimeoutError"}),
+    "httpx": frozenset({"TransportError"}),
+    "mistralai": frozenset({"MistralConnectionException"}),
+    "openai": frozenset({"APIConnectionError", "APITimeoutError"}),
+}
+"""The transient error types without a status code, by the package that raises them."""
+
+ChunkT = TypeVar("ChunkT", bound=Any)
+
+
+def status_code(error: BaseException) -> Optional[int]:
+    """Returns the HTTP status code of a provider's error, if it has one."""
+    for attribute in ("status_code", "http_status", "code"):
+        code = getattr(error, attribute, None)
+        if isinstance(code, int) and not isinstance(code, bool):
+            return code
+    return None
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Returns the seconds a provider's error asks to wait before retrying, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is None:
+        headers = getattr(error, "headers", None)
+    if not headers:
+        return None
+    headers = {str(key).lower(): value for key, value in dict(headers).items()}
+    try:
+        if "retry-after-ms" in headers:
+            return max(0.0, float(headers["retry-after-ms"]) / 1000)
+        if "retry-after" in headers:
+            value = headers["retry-after"]
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                date = parsedate_to_datetime(value)
+                return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Returns whether `error` is a transient provider error that is worth retrying.
+
+    Errors with a status code are retryable if the code is `408`, `409`, `429` or
+    `5xx` (unless the error code marks it as fatal, e.g. OpenAI's `insufficient_quota`
+    `429`). Errors without a status code are retryable if they are connection errors
+    or timeouts, including each provider SDK's own connection and timeout errors.
+    """
+    if getattr(error, "code", None) in FATAL_ERROR_CODES:
+        return False
+    code = status_code(error)
+    if code is not None:
+        return code >= 500 or code in RETRYABLE_STATUS_CODES
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    for error_type in type(error).__mro__:
+        package = error_type.__module__.split(".")[0]
+        if error_type.__name__ in TRANSIENT_ERRORS.get(package, ()):
+            return True
+    return False
+
+
+class RetryBudget(BaseModel):
+    """Caps retries to a fraction of requests to avoid retry storms.
+
+    Every request deposits `ratio` into the budget (up to `capacity`) and every retry
+    withdraws one. Once the budget is exhausted, errors are raised instead of retried
+    until enough requests have been made to refill it. Share a single budget across
+    all calls to the same provider.
+
+    Attributes:
+        ratio: The number of retries each request earns.
+        capacity: The maximum number of retries that can be saved up, which is also
+            the initial budget.
+    """
+
+    ratio: float = 0.1
+    capacity: float = 10
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _level: float = PrivateAttr(default=0)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Starts the budget at full capacity."""
+        self._level = self.capacity
+
+    @property
+    def remaining(self) -> float:
+        """The number of retries currently left in the budget."""
+        return self._level
+
+    def deposit(self) -> None:
+        """Records a request, earning `ratio` retries."""
+        with self._lock:
+            self._level = min(self.capacity, self._level + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Spends a retry from the budget, returning whether one was available."""
+        with self._lock:
+            if self._level < 1:
+                return False
+            self._level -= 1
+            return True
+
+
+class RetryPolicy(BaseModel):
+    """A retry policy with exponential backoff, jitter and error classification.
+
+    Attributes:
+        max_attempts: The maximum number of attempts, including the first.
+        initial_delay: The maximum delay in seconds before the first retry.
+        multiplier: The factor by which the maximum delay grows after each retry.
+        max_delay: The cap in seconds on the backoff delay.
+        jitter: Whether to wait a random delay between zero and the backoff delay
+            ("full jitter") instead of the backoff delay itself.
+        max_retry_after: The longest `Retry-After` in seconds to wait out. Errors that
+            ask to wait longer are raised immediately.
+        retry_on: Decides whether an error is retryable. Defaults to
+            `is_transient_error`.
+        budget: An optional retry budget that all retries must draw from.
+        resume_streams: How a retried `stream` resumes after content was already
+            yielded. `None` restarts the stream, yielding every chunk again.
+            `"prefill"` continues the response by prefilling an assistant message with
+            the content streamed so far, so only the remainder is generated (and
+            billed). This requires a provider that continues a trailing assistant
+            message, such as Anthropic, and raises a `ValueError` for other providers.
+            `"suppress"` regenerates the response and drops the already streamed
+            content, raising a `RuntimeError` if the regenerated response diverges from
+            it, so it is best used with `temperature=0`.
+    """
+
+    max_attempts: int = 3
+    initial_delay: float = 0.5
+    multiplier: float = 2.0
+    max_delay: float = 30.0
+    jitter: bool = True
+    max_retry_after: float = 60.0
+    retry_on: Callable[[BaseException], bool] = is_transient_error
+    budget: Optional[RetryBudget] = None
+    resume_streams: Optional[Literal["prefill", "suppress"]] = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def backoff(self, attempt_number: int) -> float:
+        """Returns the backoff delay in seconds after the given failed attempt."""
+        delay = min(
+            self.max_delay, self.initial_delay * self.multiplier ** (attempt_number - 1)
+        )
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def should_retry(
+        self,
+        error: BaseException,
+        retryable: tuple[type[BaseException], ...] = (),
+    ) -> bool:
+        """Returns whether `error` should be retried, withdrawing from the budget.
+
+        Args:
+            error: The error raised by the attempt.
+            retryable: Additional error types to retry regardless of `retry_on`, e.g.
+                validation errors when extracting.
+        """
+        if not isinstance(error, retryable) and not self.retry_on(error):
+            return False
+        wait = retry_after(error)
+        if wait is not None and wait > self.max_retry_after:
+            return False
+        return self.budget is None or self.budget.withdraw()
+
+    def retrying(self, retryable: tuple[type[BaseException], ...] = ()) -> Retrying:
+        """Returns a `tenacity.Retrying` instance that implements this policy.
+
+        Args:
+            retryable: Additional error types to retry regardless of `retry_on`.
+        """
+        return Retrying(**self._retrying_kwargs(retryable))
+
+    def async_retrying(
+        self, retryable: tuple[type[BaseException], ...] = ()
+    ) -> AsyncRetrying:
+        """Returns a `tenacity.AsyncRetrying` instance that implements this policy.
+
+        Args:
+            retryable: Additional error types to retry regardless of `retry_on`.
+        """
+        return AsyncRetrying(**self._retrying_kwargs(retryable))
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _retrying_kwargs(
+        self, retryable: tuple[type[BaseException], ...]
+    ) -> dict[str, Any]:
+        """Returns the keyword arguments for constructing a (async) `Retrying`."""
+
+        def before(retry_state: RetryCallState) -> None:
+            if retry_state.attempt_number == 1 and self.budget is not None:
+                self.budget.deposit()
+
+        def wait(retry_state: RetryCallState) -> float:
+            delay = self.backoff(retry_state.attempt_number)
+            outcome = retry_state.outcome
+            error = outcome.exception() if outcome is not None else None
+            if error is not None:
+                delay = max(delay, retry_after(error) or 0.0)
+            return delay
+
+        return {
+            "stop": stop_after_attempt(self.max_attempts),
+            "wait": wait,
+            "retry": retry_if_exception(
+                lambda error: self.should_retry(error, retryable)
+            ),
+            "before": before,
+            "reraise": True,
+        }
+
+
+def retrying(
+    retries: Union[int, Retrying, RetryPolicy],
+    retryable: tuple[type[BaseException], ...] = (),
+) -> Optional[Retrying]:
+    """Returns the `Retrying` instance for a `retries` argument.
+
+    Returns `None` if `retries` is an integer that is less than one.
+    """
+    if isinstance(retries, RetryPolicy):
+        return retries.retrying(retryable)
+    if isinstance(retries, int):
+        return Retrying(stop=stop_after_attempt(retries)) if retries > 0 else None
+    return retries
+
+
+def async_retrying(
+    retries: Union[int, AsyncRetrying, RetryPolicy],
+    retryable: tuple[type[BaseException], ...] = (),
+) -> Optional[AsyncRetrying]:
+    """Returns the `AsyncRetrying` instance for a `retries` argument.
+
+    Returns `None` if `retries` is an integer that is less than one.
+    """
+    if isinstance(retries, RetryPolicy):
+        return retries.async_retrying(retryable)
+    if isinstance(retries, int):
+        return AsyncRetrying(stop=stop_after_attempt(retries)) if retries > 0 else None
+    return retries
+
+
+def resume_stream(
+    fn: Callable[..., Generator[ChunkT, None, None]],
+    policy: RetryPolicy,
+    call: Any,
+    *args: Any,
+    **kwargs: Any,
+) -> Generator[ChunkT, None, None]:
+    """Streams `fn(call, ...)`, resuming it on retry per `policy.resume_streams`."""
+    resumption = _StreamResumption(policy, call)
+    for attempt in policy.retrying():
+        with attempt:
+            for chunk in fn(resumption.start(call), *args, **kwargs):
+                if (resumed := resumption.resume(chunk)) is not None:
+                    yield resumed
+            resumption.finish()
+
+
+async def resume_stream_async(
+    fn: Callable[..., AsyncGenerator[ChunkT, None]],
+    policy: RetryPolicy,
+    call: Any,
+    *args: Any,
+    **kwargs: Any,
+) -> AsyncGenerator[ChunkT, None]:
+    """Streams `fn(call, ...)`, resuming it on retry per `policy.resume_streams`."""
+    resumption = _StreamResumption(policy, call)
+    async for attempt in policy.async_retrying():
+        with attempt:
+            async for chunk in fn(resumption.start(call), *args, **kwargs):
+                if (resumed := resumption.resume(chunk)) is not None:
+                    yield resumed
+            resumption.finish()
+
+
+class _StreamResumption:
+    """Tracks the content a stream has yielded so that a retry can resume it.
+
+    A regenerated attempt drops as many chunks without content (e.g. a message start
+    event or tool call deltas) as were already yielded, since it replays them. A
+    prefilled attempt continues with a new response, so all its chunks without content
+    are new and are yielded.
+    """
+
+    def __init__(self, policy: RetryPolicy, call: Any) -> None:
+        """Initializes the resumption of streams of `call`.
+
+        Raises:
+            ValueError: if `policy` resumes with a prefill but the provider of `call`
+                can't continue an assistant prefill.
+        """
+        self.mode = policy.resume_streams
+        if self.mode == "prefill" and not call._supports_prefill:
+            raise ValueError(
+                f"{type(call).__name__} can't continue an assistant prefill, so its "
+                'streams can\'t resume with `resume_streams="prefill"`. Use '
+                '`"suppress"` instead.'
+            )
+        self.emitted = ""
+        self.blank = 0
+        self.resuming = False
+        self.skip = ""
+        self.skip_blank = 0
+        self.strict = True
+
+    def start(self, call: Any) -> Any:
+        """Returns the call to stream for the next attempt."""
+        # Trailing whitespace is left out of the prefill since some providers reject
+        # it, so the continuation will likely repeat it.
+        prefill = self.emitted.rstrip()
+        self.resuming = bool(self.emitted)
+        if self.mode == "suppress" or not prefill:
+            self.skip, self.skip_blank = self.emitted, self.blank
+            self.strict = self.mode == "suppress"
+            return call
+        self.skip, self.skip_blank = self.emitted[len(prefill) :], 0
+        self.strict = False
+        return call._with_prefill(prefill)
+
+    def resume(self, chunk: ChunkT) -> Optional[ChunkT]:
+        """Returns the part of `chunk` that hasn't been yielded yet, if any."""
+        content = chunk.content
+        if not content:
+            if self.skip_blank:
+                self.skip_blank -= 1
+                return None
+            self.blank += 1
+            return chunk
+        if self.resuming:
+            count = min(len(self.skip), len(content))
+            if content[:count] != self.skip[:count]:
+                if self.strict:
+                    raise RuntimeError(
+                        "The retried stream diverged from the content already streamed."
+                    )
+                count, self.skip = 0, ""
+            if count == len(content):
+                self.skip = self.skip[count:]
+                self.resuming = bool(self.skip)
+                return None
+            self.skip, self.resuming = "", False
+            if count:
+                chunk = chunk.skip_content(count)
+        self.emitted += chunk.content
+        return chunk
+
+    def finish(self) -> None:
+        """Checks that a suppressed stream regenerated all the streamed content.
+
+        Raises:
+            RuntimeError: if the regenerated stream ended before the streamed content.
+        """
+        if self.resuming and self.strict and self.skip:
+            raise RuntimeError(
+                "The retried stream ended before the content already streamed."
+            )
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from functools import wraps
 from typing import Any, Callable, Generic, Type, TypeVar, Union
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel, ConfigDict
 from pydantic.json_schema import SkipJsonSchema
@@ -25,6 +27,39 @@ BaseType = Union[
 ]
 
 ToolCallT = TypeVar("ToolCallT", bound=Any)
+SchemaT = TypeVar("SchemaT")
+
+
+def cached_tool_schema(
+    fn: Callable[[Any], SchemaT],
+) -> Callable[[Any], SchemaT]:
+    """Decorator for caching the result of a `tool_schema` classmethod per tool class.
+
+    Tool schemas only depend on the tool class, so we generate them once instead of
+    calling `model_json_schema` for every request. The cached schema is shared, so it
+    must not be mutated.
+
+    Usage:
+
+    ```python
+    @classmethod
+    @cached_tool_schema
+    def tool_schema(cls) -> ...:
+        ...
+    ```
+    """
+    schemas: WeakKeyDictionary[type, SchemaT] = WeakKeyDictionary()
+
+    @wraps(fn)
+    def wrapper(cls: Any) -> SchemaT:
+        """Returns the cached tool schema, generating it if necessary."""
+        try:
+            return schemas[cls]
+        except KeyError:
+            schema = schemas[cls] = fn(cls)
+            return schema
+
+    return wrapper
 
 
 class BaseTool(BaseModel, Generic[ToolCallT], ABC):
@@ -51,6 +86,7 @@ class BaseTool(BaseModel, Generic[ToolCallT], ABC):
         raise RuntimeError("Tool does not have an attached function.")
 
     @classmethod
+    @cached_tool_schema
     def tool_schema(cls) -> Any:
         """Constructs a JSON Schema tool schema from the `BaseModel` schema defined."""
         model_schema = cls.model_json_schema()
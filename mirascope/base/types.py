@@ -1,20 +1,24 @@
 """Base types and abstract interfaces for typing LLM calls."""
 from abc import ABC, abstractmethod
 from inspect import isclass
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
     Generic,
     Literal,
+    Mapping,
     Optional,
     Type,
     TypeVar,
     Union,
 )
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 from typing_extensions import Required, TypedDict
 
+from .caches import BaseCache
+from .rate_limiters import RateLimiter
 from .tools import BaseTool
 from .utils import convert_function_to_tool
 
@@ -85,10 +89,17 @@ Message = Union[SystemMessage, UserMessage, AssistantMessage, ToolMessage]
 ResponseT = TypeVar("ResponseT", bound=Any)
 BaseToolT = TypeVar("BaseToolT", bound=BaseTool)
 T = TypeVar("T")
+BaseCallParamsT = TypeVar("BaseCallParamsT", bound="BaseCallParams")
 
 
 class BaseCallParams(BaseModel, Generic[BaseToolT]):
-    """The parameters with which to make a call."""
+    """The parameters with which to make a call.
+
+    The keyword arguments computed by `kwargs` are snapshotted per instance so that
+    repeated calls only pay for a dictionary copy. The snapshot is refreshed whenever a
+    field is assigned, so call params should be updated through assignment (or
+    `model_copy`) rather than by mutating a field's value in place.
+    """
 
     model: str
     tools: Optional[list[Union[Callable, Type[BaseToolT]]]] = None
@@ -97,36 +108,95 @@ class BaseCallParams(BaseModel, Generic[BaseToolT]):
     # TODO: Improve typing for logfire params
     logfire: Optional[Callable[..., Callable]] = None
     logfire_async: Optional[Callable[..., Callable]] = None
+    cache: Optional[BaseCache] = None
+    rate_limiter: Optional[RateLimiter] = None
 
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
+    _kwargs_snapshots: dict[frozenset[str], Mapping[str, Any]] = PrivateAttr(
+        default_factory=dict
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._kwargs_snapshots = {}
+
+    def model_copy(
+        self: BaseCallParamsT,
+        *,
+        update: Optional[dict[str, Any]] = None,
+        deep: bool = False,
+    ) -> BaseCallParamsT:
+        """Returns a copy of the call params without the original's kwargs snapshots."""
+        copy = super().model_copy(update=update, deep=deep)
+        copy._kwargs_snapshots = {}
+        return copy
+
     def kwargs(
         self,
         tool_type: Optional[Type[BaseToolT]] = None,
         exclude: Optional[set[str]] = None,
+        overrides: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
-        """Returns all parameters for the call as a keyword arguments dictionary."""
-        extra_exclude = {
-            "tools",
-            "weave",
-            "logfire",
-            "logfire_async",
-            "langfuse",
-        }
-        exclude = extra_exclude if exclude is None else exclude.union(extra_exclude)
-        kwargs = {
-            key: value
-            for key, value in self.model_dump(exclude=exclude).items()
-            if value is not None
-        }
-        if not self.tools or tool_type is None:
+        """Returns all parameters for the call as a keyword arguments dictionary.
+
+        Args:
+            tool_type: The tool type to convert function tools into. `None` omits tools.
+            exclude: The fields to exclude from the keyword arguments.
+            overrides: Per-call parameters that take precedence over the fields, as if
+                they had been set through `model_copy(update=overrides)`.
+        """
+        exclude = _KWARGS_EXCLUDE if exclude is None else exclude.union(_KWARGS_EXCLUDE)
+        kwargs = dict(self._kwargs_snapshot(frozenset(exclude)))
+        tools = self.tools
+        for key, value in (overrides or {}).items():
+            if key == "tools":
+                tools = value
+            elif key in exclude:
+                continue
+            elif value is None:
+                kwargs.pop(key, None)
+            else:
+                kwargs[key] = (
+                    value.model_dump() if isinstance(value, BaseModel) else value
+                )
+        if not tools or tool_type is None:
             return kwargs
         kwargs["tools"] = [
             tool if isclass(tool) else convert_function_to_tool(tool, tool_type)
-            for tool in self.tools
+            for tool in tools
         ]
         return kwargs
 
+    ############################## PRIVATE METHODS ###################################
+
+    def _kwargs_snapshot(self, exclude: frozenset[str]) -> Mapping[str, Any]:
+        """Returns the frozen non-`None` fields that aren't excluded."""
+        snapshot = self._kwargs_snapshots.get(exclude)
+        if snapshot is None:
+            snapshot = MappingProxyType(
+                {
+                    key: value
+                    for key, value in self.model_dump(exclude=set(exclude)).items()
+                    if value is not None
+                }
+            )
+            # Snapshots are replaced rather than mutated since copies share them
+            self._kwargs_snapshots = {**self._kwargs_snapshots, exclude: snapshot}
+        return snapshot
+
+
+_KWARGS_EXCLUDE = {
+    "tools",
+    "weave",
+    "logfire",
+    "logfire_async",
+    "langfuse",
+    "cache",
+    "rate_limiter",
+}
+
 
 class BaseCallResponse(BaseModel, Generic[ResponseT, BaseToolT], ABC):
     """A base abstract interface for LLM call responses.
@@ -197,6 +267,9 @@ class BaseCallResponse(BaseModel, Generic[ResponseT, BaseToolT], ABC):
 
 
 ChunkT = TypeVar("ChunkT", bound=Any)
+BaseCallResponseChunkT = TypeVar(
+    "BaseCallResponseChunkT", bound="BaseCallResponseChunk"
+)
 
 
 class BaseCallResponseChunk(BaseModel, Generic[ChunkT, BaseToolT], ABC):
@@ -211,6 +284,16 @@ class BaseCallResponseChunk(BaseModel, Generic[ChunkT, BaseToolT], ABC):
 
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
+    def skip_content(
+        self: BaseCallResponseChunkT, count: int
+    ) -> BaseCallResponseChunkT:
+        """Returns a copy of the chunk whose content skips its first `count` chars.
+
+        The copy wraps a copy of the provider's chunk with the text replaced, so a
+        resumed stream can yield the part of a chunk that wasn't yielded yet.
+        """
+        return self._with_content(self.content[count:])
+
     @property
     @abstractmethod
     def content(self) -> str:
@@ -223,3 +306,17 @@ class BaseCallResponseChunk(BaseModel, Generic[ChunkT, BaseToolT], ABC):
         the empty string.
         """
         ...  # pragma: no cover
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _with_content(
+        self: BaseCallResponseChunkT, content: str
+    ) -> BaseCallResponseChunkT:
+        """Returns a copy of the chunk whose content is `content`.
+
+        Raises:
+            NotImplementedError: if the provider's chunks don't support it.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support replacing its content."
+        )
@@ -13,15 +13,65 @@ from typing import (
     get_origin,
     get_type_hints,
 )
+from weakref import WeakKeyDictionary
 
 from docstring_parser import parse
 from pydantic import BaseModel, create_model
 from pydantic.fields import FieldInfo
-from tenacity import AsyncRetrying, RetryError, Retrying, stop_after_attempt
-
+from tenacity import RetryError
+
+from .retries import (
+    RetryPolicy,
+    async_retrying,
+    resume_stream,
+    resume_stream_async,
+    retrying,
+)
 from .tools import DEFAULT_TOOL_DOCSTRING, BaseTool, BaseType
 
 BaseToolT = TypeVar("BaseToolT", bound=BaseTool)
+ConvertFn = TypeVar("ConvertFn", bound=Callable[[Any, Any], Any])
+
+
+# Converted tools are stored on their source object itself rather than in a weakly keyed
+# mapping since a function's tool strongly references the function through its `fn`
+# property, which would keep any mapping entry alive forever.
+_TOOLS_ATTR = "__mirascope_tools__"
+
+
+def _cached_conversion(fn: ConvertFn) -> ConvertFn:
+    """Decorator for caching tool conversions by source object and base.
+
+    Converting a function, model or type into a tool creates a new pydantic model
+    class, which is expensive and leaks memory when repeated for every request. The
+    converted tool types are cached on the source object, so they are collected along
+    with it. Sources that don't accept attributes (e.g. builtin types and generic
+    aliases) are cached in a weakly keyed mapping instead, and bound methods are never
+    cached since their tool must call the method bound to that instance.
+    """
+    fallback: WeakKeyDictionary[Any, dict[type, type]] = WeakKeyDictionary()
+
+    @wraps(fn)
+    def wrapper(source: Any, base: type) -> type:
+        """Returns the cached tool type, converting `source` if necessary."""
+        if inspect.ismethod(source):
+            return fn(source, base)
+        tools = getattr(source, "__dict__", {}).get(_TOOLS_ATTR)
+        if tools is None:
+            tools = {}
+            try:
+                setattr(source, _TOOLS_ATTR, tools)
+            except (AttributeError, TypeError):
+                try:
+                    tools = fallback.setdefault(source, tools)
+                except TypeError:  # `source` cannot be weakly referenced
+                    return fn(source, base)
+        tool = tools.get(base)
+        if tool is None:
+            tool = tools[base] = fn(source, base)
+        return tool
+
+    return cast(ConvertFn, wrapper)
 
 
 def tool_fn(fn: Callable) -> Callable[[Type[BaseToolT]], Type[BaseToolT]]:
@@ -46,6 +96,7 @@ def tool_fn(fn: Callable) -> Callable[[Type[BaseToolT]], Type[BaseToolT]]:
     return decorator
 
 
+@_cached_conversion
 def convert_function_to_tool(fn: Callable, base: Type[BaseToolT]) -> Type[BaseToolT]:
     """Constructs a `BaseToolT` type from the given function.
 
@@ -128,6 +179,7 @@ def convert_function_to_tool(fn: Callable, base: Type[BaseToolT]) -> Type[BaseTo
     return tool_fn(fn)(model)
 
 
+@_cached_conversion
 def convert_base_model_to_tool(
     schema: Type[BaseModel], base: Type[BaseToolT]
 ) -> Type[BaseToolT]:
@@ -155,6 +207,7 @@ def convert_base_model_to_tool(
     )
 
 
+@_cached_conversion
 def convert_base_type_to_tool(
     schema: Type[BaseType], base: Type[BaseToolT]
 ) -> Type[BaseToolT]:
@@ -173,17 +226,18 @@ F = TypeVar("F", bound=Callable[..., Any])
 
 
 def retry(fn: F) -> F:
-    """Decorator for retrying a function."""
+    """Decorator for retrying a function.
+
+    The `retries` keyword argument may be an integer number of attempts, a
+    `tenacity.Retrying` (or `AsyncRetrying`) instance, or a `RetryPolicy`.
+    """
 
     @wraps(fn)
     def wrapper(*args, **kwargs):
         """Wrapper for retrying a function."""
-        retries = kwargs.pop("retries", 0)
-        if isinstance(retries, int):
-            if retries > 0:
-                retries = Retrying(stop=stop_after_attempt(retries))
-            else:
-                return fn(*args, **kwargs)
+        retries = retrying(kwargs.pop("retries", 0))
+        if retries is None:
+            return fn(*args, **kwargs)
         try:
             for attempt in retries:
                 with attempt:
@@ -200,12 +254,9 @@ def retry(fn: F) -> F:
     @wraps(fn)
     async def wrapper_async(*args, **kwargs):
         """Wrapper for retrying an async function."""
-        retries = kwargs.pop("retries", 0)
-        if isinstance(retries, int):
-            if retries > 0:
-                retries = AsyncRetrying(stop=stop_after_attempt(retries))
-            else:
-                return await fn(*args, **kwargs)
+        retries = async_retrying(kwargs.pop("retries", 0))
+        if retries is None:
+            return await fn(*args, **kwargs)
         try:
             async for attempt in retries:
                 with attempt:
@@ -223,13 +274,14 @@ def retry(fn: F) -> F:
     def wrapper_generator(*args, **kwargs):
         """Wrapper for retrying a generator function."""
         retries = kwargs.pop("retries", 0)
-        if isinstance(retries, int):
-            if retries > 0:
-                retries = Retrying(stop=stop_after_attempt(retries))
-            else:
-                for value in fn(*args, **kwargs):
-                    yield value
-                return
+        if isinstance(retries, RetryPolicy) and retries.resume_streams:
+            yield from resume_stream(fn, retries, *args, **kwargs)
+            return
+        retries = retrying(retries)
+        if retries is None:
+            for value in fn(*args, **kwargs):
+                yield value
+            return
         try:
             for attempt in retries:
                 with attempt:
@@ -242,13 +294,15 @@ def retry(fn: F) -> F:
     async def wrapper_generator_async(*args, **kwargs):
         """Wrapper for retrying an async generator function."""
         retries = kwargs.pop("retries", 0)
-        if isinstance(retries, int):
-            if retries > 0:
-                retries = AsyncRetrying(stop=stop_after_attempt(retries))
-            else:
-                async for value in fn(*args, **kwargs):
-                    yield value
-                return
+        if isinstance(retries, RetryPolicy) and retries.resume_streams:
+            async for value in resume_stream_async(fn, retries, *args, **kwargs):
+                yield value
+            return
+        retries = async_retrying(retries)
+        if retries is None:
+            async for value in fn(*args, **kwargs):
+                yield value
+            return
         try:
             async for attempt in retries:
                 with attempt:
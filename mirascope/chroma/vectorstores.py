@@ -1,7 +1,7 @@
 """A module for calling Chroma's Client and Collection."""
 from contextlib import suppress
 from functools import cached_property
-from typing import Any, ClassVar, Optional, Union
+from typing import Any, ClassVar, Optional, Sequence, Union
 
 with suppress(ImportError):
     import weave
@@ -55,8 +55,17 @@ class ChromaVectorStore(BaseVectorStore):
 
         return ChromaQueryResult.model_validate(query_result)
 
-    def add(self, text: Union[str, list[Document]], **kwargs: Any) -> None:
-        """Takes unstructured data and upserts into vectorstore"""
+    def add(
+        self,
+        text: Union[str, list[Document]],
+        source: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Takes unstructured data and upserts into vectorstore
+
+        If `source` is set, only the new or changed chunks of `source` are upserted and
+        the chunks of a previous version of `source` that are gone are deleted.
+        """
         documents: list[Document]
         if isinstance(text, str):
             chunk = self.chunker.chunk
@@ -67,13 +76,43 @@ class ChromaVectorStore(BaseVectorStore):
             documents = chunk(text)
         else:
             documents = text
-
-        return self._index.upsert(
+        stale: list[str] = []
+        if source is not None:
+            documents, stale = self._diff(documents, source)
+
+        if documents:
+            self._upsert(documents, **kwargs)
+        if stale:
+            self.delete(stale)
+
+    def delete(self, ids: list[str]) -> None:
+        """Deletes the documents with the given ids from the vectorstore."""
+        self._index.delete(ids=ids)
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _upsert(
+        self,
+        documents: list[Document],
+        embeddings: Optional[Sequence[Sequence[float]]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Upserts documents, embedding them with the collection if no embeddings."""
+        metadatas = [document.metadata for document in documents]
+        if all(metadatas):
+            kwargs["metadatas"] = metadatas
+        if embeddings is not None:
+            kwargs["embeddings"] = [list(embedding) for embedding in embeddings]
+        self._index.upsert(
             ids=[document.id for document in documents],
             documents=[document.text for document in documents],
             **kwargs,
         )
 
+    def _source_ids(self, source: str) -> list[str]:
+        """Returns the ids of the documents added from `source`."""
+        return self._index.get(where={"source": source}, include=[])["ids"]
+
     ############################# PRIVATE PROPERTIES #################################
 
     @cached_property
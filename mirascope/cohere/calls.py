@@ -7,11 +7,22 @@ from cohere.types import ChatMessage
 from tenacity import AsyncRetrying, Retrying
 
 from ..base import BaseCall, retry
+from ..base.clients import (
+    get_async_client,
+    get_client,
+    pooled_async_http_client,
+    pooled_http_client,
+)
+from ..base.rate_limiters import rate_limited
+from ..base.retries import RetryPolicy
 from ..enums import MessageRole
 from .tools import CohereTool
 from .types import CohereCallParams, CohereCallResponse, CohereCallResponseChunk
 from .utils import cohere_api_calculate_cost
 
+# The Cohere SDK only applies its default timeout when it creates the client itself.
+COHERE_DEFAULT_TIMEOUT = 300
+
 
 class CohereCall(BaseCall[CohereCallResponse, CohereCallResponseChunk, CohereTool]):
     """A base class for calling Cohere's chat models.
@@ -45,8 +56,9 @@ class CohereCall(BaseCall[CohereCallResponse, CohereCallResponseChunk, CohereToo
         ]
 
     @retry
+    @rate_limited
     def call(
-        self, retries: Union[int, Retrying] = 0, **kwargs: Any
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
     ) -> CohereCallResponse:
         """Makes a call to the model using this `CohereCall` instance.
 
@@ -58,9 +70,7 @@ class CohereCall(BaseCall[CohereCallResponse, CohereCallResponseChunk, CohereToo
             A `CohereCallResponse` instance.
         """
         message, kwargs, tool_types = self._setup_cohere_kwargs(kwargs)
-        co = Client(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.wrapper is not None:
-            co = self.call_params.wrapper(co)
+        co = self._client()
         chat = co.chat
         if self.call_params.weave is not None:
             chat = self.call_params.weave(chat)  # pragma: no cover
@@ -91,8 +101,9 @@ class CohereCall(BaseCall[CohereCallResponse, CohereCallResponseChunk, CohereToo
         )
 
     @retry
+    @rate_limited
     async def call_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> CohereCallResponse:
         """Makes an asynchronous call to the model using this `CohereCall`.
 
@@ -104,9 +115,7 @@ class CohereCall(BaseCall[CohereCallResponse, CohereCallResponseChunk, CohereToo
             An `CohereCallResponse` instance.
         """
         message, kwargs, tool_types = self._setup_cohere_kwargs(kwargs)
-        co = AsyncClient(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.wrapper_async is not None:
-            co = self.call_params.wrapper_async(co)
+        co = self._async_client()
         chat = co.chat
         if self.call_params.weave is not None:
             chat = self.call_params.weave(chat)  # pragma: no cover
@@ -137,8 +146,9 @@ class CohereCall(BaseCall[CohereCallResponse, CohereCallResponseChunk, CohereToo
         )
 
     @retry
+    @rate_limited
     def stream(
-        self, retries: Union[int, Retrying] = 0, **kwargs: Any
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
     ) -> Generator[CohereCallResponseChunk, None, None]:
         """Streams the response for a call using this `CohereCall`.
 
@@ -150,9 +160,7 @@ class CohereCall(BaseCall[CohereCallResponse, CohereCallResponseChunk, CohereToo
             A `CohereCallResponseChunk` for each chunk of the response.
         """
         message, kwargs, tool_types = self._setup_cohere_kwargs(kwargs)
-        co = Client(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.wrapper is not None:
-            co = self.call_params.wrapper(co)
+        co = self._client()
         chat_stream = co.chat_stream
         if self.call_params.weave is not None:
             chat_stream = self.call_params.weave(chat_stream)  # pragma: no cover
@@ -168,8 +176,9 @@ class CohereCall(BaseCall[CohereCallResponse, CohereCallResponseChunk, CohereToo
             yield CohereCallResponseChunk(chunk=event, tool_types=tool_types)
 
     @retry
+    @rate_limited
     async def stream_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> AsyncGenerator[CohereCallResponseChunk, None]:
         """Streams the response for an asynchronous call using this `CohereCall`.
 
@@ -181,9 +190,7 @@ class CohereCall(BaseCall[CohereCallResponse, CohereCallResponseChunk, CohereToo
             A `CohereCallResponseChunk` for each chunk of the response.
         """
         message, kwargs, tool_types = self._setup_cohere_kwargs(kwargs)
-        co = AsyncClient(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.wrapper_async is not None:
-            co = self.call_params.wrapper_async(co)
+        co = self._async_client()
         chat_stream = co.chat_stream
         if self.call_params.weave is not None:
             chat_stream = self.call_params.weave(chat_stream)  # pragma: no cover
@@ -203,6 +210,42 @@ class CohereCall(BaseCall[CohereCallResponse, CohereCallResponseChunk, CohereToo
 
     ############################## PRIVATE METHODS ###################################
 
+    def _client(self) -> Client:
+        """Returns a pooled Cohere `Client` for this call's configuration."""
+
+        def create() -> Client:
+            client = Client(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                httpx_client=pooled_http_client(timeout=COHERE_DEFAULT_TIMEOUT),
+            )
+            if self.call_params.wrapper is not None:
+                client = self.call_params.wrapper(client)
+            return client
+
+        return get_client(
+            ("cohere", self.api_key, self.base_url, self.call_params.wrapper),
+            create,
+        )
+
+    def _async_client(self) -> AsyncClient:
+        """Returns a pooled Cohere `AsyncClient` for the running event loop."""
+
+        def create() -> AsyncClient:
+            client = AsyncClient(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                httpx_client=pooled_async_http_client(timeout=COHERE_DEFAULT_TIMEOUT),
+            )
+            if self.call_params.wrapper_async is not None:
+                client = self.call_params.wrapper_async(client)
+            return client
+
+        return get_async_client(
+            ("cohere", self.api_key, self.base_url, self.call_params.wrapper_async),
+            create,
+        )
+
     def _setup_cohere_kwargs(
         self, kwargs: dict[str, Any]
     ) -> tuple[str, dict[str, Any], Optional[list[Type[CohereTool]]]]:
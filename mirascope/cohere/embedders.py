@@ -1,10 +1,25 @@
 """A module for calling OpenAI's Embeddings models."""
 import datetime
-from typing import ClassVar, Optional, Union
+import uuid
+from typing import Any, ClassVar, Optional, Union
 
 from cohere import AsyncClient, Client
+from cohere.types import (
+    EmbedByTypeResponseEmbeddings,
+    EmbedResponse,
+    EmbedResponse_EmbeddingsByType,
+    EmbedResponse_EmbeddingsFloats,
+)
 
+from ..base.clients import (
+    get_async_client,
+    get_client,
+    pooled_async_http_client,
+    pooled_http_client,
+)
+from ..base.rate_limiters import estimate_tokens
 from ..rag import BaseEmbedder
+from .calls import COHERE_DEFAULT_TIMEOUT
 from .types import CohereEmbeddingParams, CohereEmbeddingResponse
 
 
@@ -41,7 +56,55 @@ class CohereEmbedder(BaseEmbedder[CohereEmbeddingResponse]):
 
     def embed(self, inputs: list[str]) -> CohereEmbeddingResponse:
         """Call the embedder with multiple inputs"""
-        co = Client(api_key=self.api_key, base_url=self.base_url)
+        if self.embedding_params.cache is None:
+            return self._embed(inputs)
+        misses, embeddings = self._cached_embeddings(inputs)
+        response = self._embed(misses) if misses else None
+        if response is not None and response.embeddings is None:
+            return response
+        return self._cached_response(
+            inputs,
+            self._fill_embeddings(inputs, embeddings, misses, response),
+            response,
+        )
+
+    async def embed_async(self, inputs: list[str]) -> CohereEmbeddingResponse:
+        """Asynchronously call the embedder with multiple inputs"""
+        if self.embedding_params.cache is None:
+            return await self._embed_async(inputs)
+        misses, embeddings = self._cached_embeddings(inputs)
+        response = await self._embed_async(misses) if misses else None
+        if response is not None and response.embeddings is None:
+            return response
+        return self._cached_response(
+            inputs,
+            self._fill_embeddings(inputs, embeddings, misses, response),
+            response,
+        )
+
+    def __call__(
+        self, input: list[str]
+    ) -> Optional[Union[list[list[float]], list[list[int]]]]:
+        """Call the embedder with a input
+
+        Chroma expects parameter to be `input`.
+        """
+        response = self.embed(input)
+        embeddings = response.embeddings
+        return embeddings
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _embed(self, inputs: list[str]) -> CohereEmbeddingResponse:
+        """Call the embedder with multiple inputs, bypassing the cache"""
+        co = get_client(
+            ("cohere", self.api_key, self.base_url, None),
+            lambda: Client(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                httpx_client=pooled_http_client(timeout=COHERE_DEFAULT_TIMEOUT),
+            ),
+        )
         embedding_type = (
             self.embedding_params.embedding_types[0]
             if self.embedding_params.embedding_types
@@ -57,6 +120,8 @@ class CohereEmbedder(BaseEmbedder[CohereEmbeddingResponse]):
             embed = self.embedding_params.langfuse(
                 embed, "cohere", response_type=CohereEmbeddingResponse
             )
+        if (limiter := self.embedding_params.rate_limiter) is not None:
+            limiter.acquire(estimate_tokens(inputs))
         response = embed(texts=inputs, **self.embedding_params.kwargs())
         return CohereEmbeddingResponse(
             response=response,
@@ -65,9 +130,16 @@ class CohereEmbedder(BaseEmbedder[CohereEmbeddingResponse]):
             embedding_type=embedding_type,
         )
 
-    async def embed_async(self, inputs: list[str]) -> CohereEmbeddingResponse:
-        """Asynchronously call the embedder with multiple inputs"""
-        co = AsyncClient(api_key=self.api_key, base_url=self.base_url)
+    async def _embed_async(self, inputs: list[str]) -> CohereEmbeddingResponse:
+        """Asynchronously call the embedder with multiple inputs, bypassing the cache"""
+        co = get_async_client(
+            ("cohere", self.api_key, self.base_url, None),
+            lambda: AsyncClient(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                httpx_client=pooled_async_http_client(timeout=COHERE_DEFAULT_TIMEOUT),
+            ),
+        )
         embedding_type = (
             self.embedding_params.embedding_types[0]
             if self.embedding_params.embedding_types
@@ -85,6 +157,8 @@ class CohereEmbedder(BaseEmbedder[CohereEmbeddingResponse]):
             embed = self.embedding_params.langfuse(
                 embed, "cohere", is_async=True, response_type=None
             )
+        if (limiter := self.embedding_params.rate_limiter) is not None:
+            await limiter.acquire_async(estimate_tokens(inputs))
         response = await embed(texts=inputs, **self.embedding_params.kwargs())
         return CohereEmbeddingResponse(
             response=response,
@@ -93,13 +167,41 @@ class CohereEmbedder(BaseEmbedder[CohereEmbeddingResponse]):
             embedding_type=embedding_type,
         )
 
-    def __call__(
-        self, input: list[str]
-    ) -> Optional[Union[list[list[float]], list[list[int]]]]:
-        """Call the embedder with a input
-
-        Chroma expects parameter to be `input`.
-        """
-        response = self.embed(input)
-        embeddings = response.embeddings
-        return embeddings
+    def _cached_response(
+        self,
+        inputs: list[str],
+        embeddings: list[list[Any]],
+        response: Optional[CohereEmbeddingResponse],
+    ) -> CohereEmbeddingResponse:
+        """Returns a response with `embeddings`, the cached ones included."""
+        embedding_type = (
+            self.embedding_params.embedding_types[0]
+            if self.embedding_params.embedding_types
+            else None
+        )
+        cohere_response: EmbedResponse
+        if embedding_type is None:
+            cohere_response = EmbedResponse_EmbeddingsFloats(
+                id=response.response.id if response else str(uuid.uuid4()),
+                embeddings=embeddings,
+                texts=inputs,
+                response_type="embeddings_floats",
+            )
+        else:
+            cohere_response = EmbedResponse_EmbeddingsByType(
+                id=response.response.id if response else str(uuid.uuid4()),
+                embeddings=EmbedByTypeResponseEmbeddings.parse_obj(
+                    {embedding_type: embeddings}
+                ),
+                texts=inputs,
+                response_type="embeddings_by_type",
+            )
+        if response is None:
+            now = datetime.datetime.now().timestamp() * 1000
+            return CohereEmbeddingResponse(
+                response=cohere_response,
+                start_time=now,
+                end_time=now,
+                embedding_type=embedding_type,
+            )
+        return response.model_copy(update={"response": cohere_response})
@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, ClassVar, Generic, TypeVar, Union
+from typing import Any, ClassVar, Generic, Sequence, TypeVar, Union
 
 from tenacity import AsyncRetrying, Retrying
 
 from ..base import BaseExtractor, ExtractedType
+from ..base.retries import RetryPolicy
 from .calls import CohereCall
 from .tools import CohereTool
 from .types import CohereCallParams
@@ -55,7 +56,9 @@ class CohereExtractor(BaseExtractor[CohereCall, CohereTool, Any, T], Generic[T])
 
     call_params: ClassVar[CohereCallParams] = CohereCallParams()
 
-    def extract(self, retries: Union[int, Retrying] = 0, **kwargs: Any) -> T:
+    def extract(
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
+    ) -> T:
         """Extracts `extract_schema` from the Cohere call response.
 
         The `extract_schema` is converted into an `CohereTool`, complete with a
@@ -79,7 +82,7 @@ class CohereExtractor(BaseExtractor[CohereCall, CohereTool, Any, T], Generic[T])
         return self._extract(CohereCall, CohereTool, retries, **kwargs)
 
     async def extract_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> T:
         """Asynchronously extracts `extract_schema` from the Cohere call response.
 
@@ -102,3 +105,64 @@ class CohereExtractor(BaseExtractor[CohereCall, CohereTool, Any, T], Generic[T])
             ValidationError: if the schema cannot be instantiated from the completion.
         """
         return await self._extract_async(CohereCall, CohereTool, retries, **kwargs)
+
+    @classmethod
+    def extract_many(
+        cls,
+        extractors: Sequence[CohereExtractor[T]],
+        retries: Union[int, Retrying, RetryPolicy] = 0,
+        **kwargs: Any,
+    ) -> list[T]:
+        """Extracts `extract_schema` for many extractors in a single Cohere call.
+
+        The rendered prompts of the extractors are packed as records into a single
+        prompt, amortizing the system prompt and schema tokens across all of them. Each
+        extracted item is validated on its own, and only the records whose item is
+        missing or invalid are re-asked on retries.
+
+        Args:
+            extractors: The extractors to extract from. They must share the same
+                `extract_schema` (a `BaseModel` or base type), call params and system
+                messages.
+            retries: The maximum number of times to retry the query on validation error.
+            **kwargs: Additional keyword arguments parameters to pass to the call. These
+                will override any existing arguments in `call_params`.
+
+        Returns:
+            The `extract_schema` instance extracted for each extractor, in order.
+
+        Raises:
+            ValueError: if the extractors' `extract_schema` isn't supported, or if any
+                records are missing or invalid.
+        """
+        return cls._extract_many(CohereCall, CohereTool, extractors, retries, **kwargs)
+
+    @classmethod
+    async def extract_many_async(
+        cls,
+        extractors: Sequence[CohereExtractor[T]],
+        retries: Union[int, AsyncRetrying, RetryPolicy] = 0,
+        **kwargs: Any,
+    ) -> list[T]:
+        """Asynchronously extracts `extract_schema` for many extractors in one call.
+
+        See `extract_many` for details.
+
+        Args:
+            extractors: The extractors to extract from. They must share the same
+                `extract_schema` (a `BaseModel` or base type), call params and system
+                messages.
+            retries: The maximum number of times to retry the query on validation error.
+            **kwargs: Additional keyword arguments parameters to pass to the call. These
+                will override any existing arguments in `call_params`.
+
+        Returns:
+            The `extract_schema` instance extracted for each extractor, in order.
+
+        Raises:
+            ValueError: if the extractors' `extract_schema` isn't supported, or if any
+                records are missing or invalid.
+        """
+        return await cls._extract_many_async(
+            CohereCall, CohereTool, extractors, retries, **kwargs
+        )
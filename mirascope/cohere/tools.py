@@ -7,7 +7,7 @@ from cohere.types import Tool, ToolCall, ToolParameterDefinitionsValue
 from pydantic import BaseModel, SkipValidation
 from pydantic.json_schema import SkipJsonSchema
 
-from ..base import BaseTool, BaseType
+from ..base import BaseTool, BaseType, cached_tool_schema
 from ..base.utils import (
     convert_base_model_to_tool,
     convert_base_type_to_tool,
@@ -63,6 +63,7 @@ class CohereTool(BaseTool[ToolCall]):
     tool_call: SkipJsonSchema[SkipValidation[ToolCall]]
 
     @classmethod
+    @cached_tool_schema
     def tool_schema(cls) -> Tool:
         """Constructs a tool schema for use with the Cohere chat client.
 
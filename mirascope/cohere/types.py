@@ -78,11 +78,12 @@ class CohereCallParams(BaseCallParams[CohereTool]):
         self,
         tool_type: Optional[Type[CohereTool]] = CohereTool,
         exclude: Optional[set[str]] = None,
+        overrides: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
         """Returns the keyword argument call parameters."""
         extra_exclude = {"wrapper", "wrapper_async"}
         exclude = extra_exclude if exclude is None else exclude.union(extra_exclude)
-        return super().kwargs(tool_type, exclude)
+        return super().kwargs(tool_type, exclude, overrides)
 
 
 class CohereCallResponse(BaseCallResponse[NonStreamedChatResponse, CohereTool]):
@@ -314,6 +315,15 @@ class CohereCallResponseChunk(BaseCallResponseChunk[StreamedChatResponse, Cohere
             return self.chunk.tool_calls
         return None
 
+    ############################## PRIVATE METHODS ###################################
+
+    def _with_content(self, content: str) -> "CohereCallResponseChunk":
+        """Returns a copy of the chunk whose text generation has `content`."""
+        chunk = self.chunk
+        if isinstance(chunk, StreamedChatResponse_TextGeneration):
+            chunk = StreamedChatResponse_TextGeneration(text=content)
+        return self.model_copy(update={"chunk": chunk})
+
 
 class CohereEmbeddingResponse(BaseEmbeddingResponse[SkipValidation[EmbedResponse]]):
     """A convenience wrapper around the Cohere `EmbedResponse` response."""
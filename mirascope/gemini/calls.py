@@ -14,6 +14,8 @@ from google.generativeai.types import ContentsType  # type: ignore
 from tenacity import AsyncRetrying, Retrying
 
 from ..base import BaseCall, retry
+from ..base.rate_limiters import rate_limited
+from ..base.retries import RetryPolicy
 from ..enums import MessageRole
 from .tools import GeminiTool
 from .types import (
@@ -70,8 +72,9 @@ class GeminiCall(BaseCall[GeminiCallResponse, GeminiCallResponseChunk, GeminiToo
         ]
 
     @retry
+    @rate_limited
     def call(
-        self, retries: Union[int, Retrying] = 0, **kwargs: Any
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
     ) -> GeminiCallResponse:
         """Makes an call to the model using this `GeminiCall` instance.
 
@@ -122,8 +125,9 @@ class GeminiCall(BaseCall[GeminiCallResponse, GeminiCallResponseChunk, GeminiToo
         )
 
     @retry
+    @rate_limited
     async def call_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> GeminiCallResponse:
         """Makes an asynchronous call to the model using this `GeminiCall` instance.
 
@@ -167,8 +171,9 @@ class GeminiCall(BaseCall[GeminiCallResponse, GeminiCallResponseChunk, GeminiToo
         )
 
     @retry
+    @rate_limited
     def stream(
-        self, retries: Union[int, Retrying] = 0, **kwargs: Any
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
     ) -> Generator[GeminiCallResponseChunk, None, None]:
         """Streams the response for a call using this `GeminiCall`.
 
@@ -198,8 +203,9 @@ class GeminiCall(BaseCall[GeminiCallResponse, GeminiCallResponseChunk, GeminiToo
             yield GeminiCallResponseChunk(chunk=chunk, tool_types=tool_types)
 
     @retry
+    @rate_limited
     async def stream_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> AsyncGenerator[GeminiCallResponseChunk, None]:
         """Streams the response asynchronously for a call using this `GeminiCall`.
 
@@ -1,9 +1,10 @@
 import logging
-from typing import Any, ClassVar, Generic, TypeVar, Union
+from typing import Any, ClassVar, Generic, Sequence, TypeVar, Union
 
 from tenacity import AsyncRetrying, Retrying
 
 from ..base import BaseExtractor, ExtractedType
+from ..base.retries import RetryPolicy
 from .calls import GeminiCall
 from .tools import GeminiTool
 from .types import GeminiCallParams
@@ -49,7 +50,9 @@ class GeminiExtractor(BaseExtractor[GeminiCall, GeminiTool, Any, T], Generic[T])
 
     call_params: ClassVar[GeminiCallParams] = GeminiCallParams()
 
-    def extract(self, retries: Union[int, Retrying] = 0, **kwargs: Any) -> T:
+    def extract(
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
+    ) -> T:
         """Extracts `extract_schema` from the Gemini call response.
 
         The `extract_schema` is converted into a `GeminiTool`, complete with a
@@ -74,7 +77,7 @@ class GeminiExtractor(BaseExtractor[GeminiCall, GeminiTool, Any, T], Generic[T])
         return self._extract(GeminiCall, GeminiTool, retries, **kwargs)
 
     async def extract_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> T:
         """Asynchronously extracts `extract_schema` from the Gemini call response.
 
@@ -98,3 +101,66 @@ class GeminiExtractor(BaseExtractor[GeminiCall, GeminiTool, Any, T], Generic[T])
             GeminiError: raises any Gemini errors.
         """
         return await self._extract_async(GeminiCall, GeminiTool, retries, **kwargs)
+
+    @classmethod
+    def extract_many(
+        cls,
+        extractors: Sequence["GeminiExtractor[T]"],
+        retries: Union[int, Retrying, RetryPolicy] = 0,
+        **kwargs: Any,
+    ) -> list[T]:
+        """Extracts `extract_schema` for many extractors in a single Gemini call.
+
+        The rendered prompts of the extractors are packed as records into a single
+        prompt, amortizing the system prompt and schema tokens across all of them. Each
+        extracted item is validated on its own, and only the records whose item is
+        missing or invalid are re-asked on retries.
+
+        Args:
+            extractors: The extractors to extract from. They must share the same
+                `extract_schema` (a `BaseModel` or base type), call params and system
+                messages.
+            retries: The maximum number of times to retry the query on validation error.
+            **kwargs: Additional keyword arguments parameters to pass to the call. These
+                will override any existing arguments in `call_params`.
+
+        Returns:
+            The `extract_schema` instance extracted for each extractor, in order.
+
+        Raises:
+            ValueError: if the extractors' `extract_schema` isn't supported, or if any
+                records are missing or invalid.
+            GeminiError: raises any Gemini errors.
+        """
+        return cls._extract_many(GeminiCall, GeminiTool, extractors, retries, **kwargs)
+
+    @classmethod
+    async def extract_many_async(
+        cls,
+        extractors: Sequence["GeminiExtractor[T]"],
+        retries: Union[int, AsyncRetrying, RetryPolicy] = 0,
+        **kwargs: Any,
+    ) -> list[T]:
+        """Asynchronously extracts `extract_schema` for many extractors in one call.
+
+        See `extract_many` for details.
+
+        Args:
+            extractors: The extractors to extract from. They must share the same
+                `extract_schema` (a `BaseModel` or base type), call params and system
+                messages.
+            retries: The maximum number of times to retry the query on validation error.
+            **kwargs: Additional keyword arguments parameters to pass to the call. These
+                will override any existing arguments in `call_params`.
+
+        Returns:
+            The `extract_schema` instance extracted for each extractor, in order.
+
+        Raises:
+            ValueError: if the extractors' `extract_schema` isn't supported, or if any
+                records are missing or invalid.
+            GeminiError: raises any Gemini errors.
+        """
+        return await cls._extract_many_async(
+            GeminiCall, GeminiTool, extractors, retries, **kwargs
+        )
@@ -13,6 +13,7 @@ from pydantic import BaseModel, ConfigDict
 from ..base import (
     BaseTool,
     BaseType,
+    cached_tool_schema,
     convert_base_model_to_tool,
     convert_base_type_to_tool,
     convert_function_to_tool,
@@ -59,6 +60,7 @@ class GeminiTool(BaseTool[FunctionCall]):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     @classmethod
+    @cached_tool_schema
     def tool_schema(cls) -> Tool:
         """Constructs a tool schema for use with the Gemini API.
 
@@ -75,11 +77,17 @@ class GeminiTool(BaseTool[FunctionCall]):
                     "Unfortunately Google's Gemini API cannot handle nested structures "
                     "with $defs."
                 )
-            tool_schema["parameters"]["properties"] = {
+            # Note: we copy instead of updating in place since the base schema is cached
+            parameters = tool_schema["parameters"]
+            properties = {
                 prop: {
                     key: value for key, value in prop_schema.items() if key != "title"
                 }
-                for prop, prop_schema in tool_schema["parameters"]["properties"].items()
+                for prop, prop_schema in parameters["properties"].items()
+            }
+            tool_schema = {
+                **tool_schema,
+                "parameters": {**parameters, "properties": properties},
             }
         return Tool(function_declarations=[FunctionDeclaration(**tool_schema)])
 
@@ -1,4 +1,5 @@
 """Types for interacting with Google's Gemini models using Mirascope."""
+from copy import deepcopy
 from typing import Any, Optional, TypeVar, Union
 
 from google.generativeai.types import (  # type: ignore
@@ -189,3 +190,11 @@ class GeminiCallResponseChunk(
     def content(self) -> str:
         """Returns the chunk content for the 0th choice."""
         return self.chunk.candidates[0].content.parts[0].text
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _with_content(self, content: str) -> "GeminiCallResponseChunk":
+        """Returns a copy of the chunk whose 0th candidate's first part has `content`."""
+        chunk = deepcopy(self.chunk)
+        chunk.candidates[0].content.parts[0].text = content
+        return self.model_copy(update={"chunk": chunk})
@@ -8,6 +8,15 @@ from groq.types.chat.completion_create_params import Message, ResponseFormat
 from tenacity import AsyncRetrying, Retrying
 
 from ..base import BaseCall, retry
+from ..base.caches import cached
+from ..base.clients import (
+    get_async_client,
+    get_client,
+    pooled_async_http_client,
+    pooled_http_client,
+)
+from ..base.rate_limiters import rate_limited
+from ..base.retries import RetryPolicy
 from ..enums import MessageRole
 from .tools import GroqTool
 from .types import GroqCallParams, GroqCallResponse, GroqCallResponseChunk
@@ -59,8 +68,10 @@ class GroqCall(BaseCall[GroqCallResponse, GroqCallResponseChunk, GroqTool]):
         ]
 
     @retry
+    @cached
+    @rate_limited
     def call(
-        self, retries: Union[int, Retrying] = 0, **kwargs: Any
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
     ) -> GroqCallResponse:
         """Makes a call to the model using this `GroqCall` instance.
 
@@ -72,9 +83,7 @@ class GroqCall(BaseCall[GroqCallResponse, GroqCallResponseChunk, GroqTool]):
             A `GroqCallResponse` instance.
         """
         kwargs, tool_types = self._setup_groq_kwargs(kwargs)
-        client = Groq(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.wrapper is not None:
-            client = self.call_params.wrapper(client)
+        client = self._client()
         create = client.chat.completions.create
         if self.call_params.weave is not None:
             create = self.call_params.weave(
@@ -101,8 +110,10 @@ class GroqCall(BaseCall[GroqCallResponse, GroqCallResponseChunk, GroqTool]):
         )
 
     @retry
+    @cached
+    @rate_limited
     async def call_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> GroqCallResponse:
         """Makes an asynchronous call to the model using this `GroqCall`.
 
@@ -114,9 +125,7 @@ class GroqCall(BaseCall[GroqCallResponse, GroqCallResponseChunk, GroqTool]):
             An `GroqCallResponse` instance.
         """
         kwargs, tool_types = self._setup_groq_kwargs(kwargs)
-        client = AsyncGroq(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.wrapper_async is not None:
-            client = self.call_params.wrapper_async(client)
+        client = self._async_client()
         create = client.chat.completions.create
         if self.call_params.weave is not None:
             create = self.call_params.weave(
@@ -143,8 +152,9 @@ class GroqCall(BaseCall[GroqCallResponse, GroqCallResponseChunk, GroqTool]):
         )
 
     @retry
+    @rate_limited
     def stream(
-        self, retries: Union[int, Retrying] = 0, **kwargs: Any
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
     ) -> Generator[GroqCallResponseChunk, None, None]:
         """Streams the response for a call using this `GroqCall`.
 
@@ -156,9 +166,7 @@ class GroqCall(BaseCall[GroqCallResponse, GroqCallResponseChunk, GroqTool]):
             A `GroqCallResponseChunk` for each chunk of the response.
         """
         kwargs, tool_types = self._setup_groq_kwargs(kwargs)
-        client = Groq(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.wrapper is not None:
-            client = self.call_params.wrapper(client)
+        client = self._client()
         messages = self._update_messages_if_json(self.messages(), tool_types)
         create = client.chat.completions.create
         if self.call_params.logfire:
@@ -178,8 +186,9 @@ class GroqCall(BaseCall[GroqCallResponse, GroqCallResponseChunk, GroqTool]):
             )
 
     @retry
+    @rate_limited
     async def stream_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> AsyncGenerator[GroqCallResponseChunk, None]:
         """Streams the response for an asynchronous call using this `GroqCall`.
 
@@ -191,9 +200,7 @@ class GroqCall(BaseCall[GroqCallResponse, GroqCallResponseChunk, GroqTool]):
             A `GroqCallResponseChunk` for each chunk of the response.
         """
         kwargs, tool_types = self._setup_groq_kwargs(kwargs)
-        client = AsyncGroq(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.wrapper_async is not None:
-            client = self.call_params.wrapper_async(client)
+        client = self._async_client()
         messages = self._update_messages_if_json(self.messages(), tool_types)
         create = client.chat.completions.create
         if self.call_params.logfire_async:  # pragma: no cover
@@ -219,6 +226,42 @@ class GroqCall(BaseCall[GroqCallResponse, GroqCallResponseChunk, GroqTool]):
 
     ############################## PRIVATE METHODS ###################################
 
+    def _client(self) -> Groq:
+        """Returns a pooled `Groq` client for this call's configuration."""
+
+        def create() -> Groq:
+            client = Groq(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=pooled_http_client(),
+            )
+            if self.call_params.wrapper is not None:
+                client = self.call_params.wrapper(client)
+            return client
+
+        return get_client(
+            ("groq", self.api_key, self.base_url, self.call_params.wrapper),
+            create,
+        )
+
+    def _async_client(self) -> AsyncGroq:
+        """Returns a pooled `AsyncGroq` client for the running event loop."""
+
+        def create() -> AsyncGroq:
+            client = AsyncGroq(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=pooled_async_http_client(),
+            )
+            if self.call_params.wrapper_async is not None:
+                client = self.call_params.wrapper_async(client)
+            return client
+
+        return get_async_client(
+            ("groq", self.api_key, self.base_url, self.call_params.wrapper_async),
+            create,
+        )
+
     def _setup_groq_kwargs(
         self,
         kwargs: dict[str, Any],
@@ -1,10 +1,11 @@
 """A module for extracting structured information using Groq's Cloud API."""
 import logging
-from typing import Any, ClassVar, Generic, TypeVar, Union
+from typing import Any, ClassVar, Generic, Sequence, TypeVar, Union
 
 from tenacity import AsyncRetrying, Retrying
 
 from ..base import BaseExtractor, ExtractedType
+from ..base.retries import RetryPolicy
 from .calls import GroqCall
 from .tools import GroqTool
 from .types import GroqCallParams
@@ -47,7 +48,9 @@ class GroqExtractor(BaseExtractor[GroqCall, GroqTool, Any, T], Generic[T]):
 
     call_params: ClassVar[GroqCallParams] = GroqCallParams()
 
-    def extract(self, retries: Union[int, Retrying] = 0, **kwargs: Any) -> T:
+    def extract(
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
+    ) -> T:
         """Extracts `extract_schema` from the Groq call response.
 
         The `extract_schema` is converted into an `GroqTool`, complete with a
@@ -71,7 +74,7 @@ class GroqExtractor(BaseExtractor[GroqCall, GroqTool, Any, T], Generic[T]):
         return self._extract(GroqCall, GroqTool, retries, **kwargs)
 
     async def extract_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> T:
         """Asynchronously extracts `extract_schema` from the Groq call response.
 
@@ -94,3 +97,64 @@ class GroqExtractor(BaseExtractor[GroqCall, GroqTool, Any, T], Generic[T]):
             ValidationError: if the schema cannot be instantiated from the completion.
         """
         return await self._extract_async(GroqCall, GroqTool, retries, **kwargs)
+
+    @classmethod
+    def extract_many(
+        cls,
+        extractors: Sequence["GroqExtractor[T]"],
+        retries: Union[int, Retrying, RetryPolicy] = 0,
+        **kwargs: Any,
+    ) -> list[T]:
+        """Extracts `extract_schema` for many extractors in a single Groq call.
+
+        The rendered prompts of the extractors are packed as records into a single
+        prompt, amortizing the system prompt and schema tokens across all of them. Each
+        extracted item is validated on its own, and only the records whose item is
+        missing or invalid are re-asked on retries.
+
+        Args:
+            extractors: The extractors to extract from. They must share the same
+                `extract_schema` (a `BaseModel` or base type), call params and system
+                messages.
+            retries: The maximum number of times to retry the query on validation error.
+            **kwargs: Additional keyword arguments parameters to pass to the call. These
+                will override any existing arguments in `call_params`.
+
+        Returns:
+            The `extract_schema` instance extracted for each extractor, in order.
+
+        Raises:
+            ValueError: if the extractors' `extract_schema` isn't supported, or if any
+                records are missing or invalid.
+        """
+        return cls._extract_many(GroqCall, GroqTool, extractors, retries, **kwargs)
+
+    @classmethod
+    async def extract_many_async(
+        cls,
+        extractors: Sequence["GroqExtractor[T]"],
+        retries: Union[int, AsyncRetrying, RetryPolicy] = 0,
+        **kwargs: Any,
+    ) -> list[T]:
+        """Asynchronously extracts `extract_schema` for many extractors in one call.
+
+        See `extract_many` for details.
+
+        Args:
+            extractors: The extractors to extract from. They must share the same
+                `extract_schema` (a `BaseModel` or base type), call params and system
+                messages.
+            retries: The maximum number of times to retry the query on validation error.
+            **kwargs: Additional keyword arguments parameters to pass to the call. These
+                will override any existing arguments in `call_params`.
+
+        Returns:
+            The `extract_schema` instance extracted for each extractor, in order.
+
+        Raises:
+            ValueError: if the extractors' `extract_schema` isn't supported, or if any
+                records are missing or invalid.
+        """
+        return await cls._extract_many_async(
+            GroqCall, GroqTool, extractors, retries, **kwargs
+        )
@@ -7,7 +7,7 @@ from typing import Any, Callable, Type
 from groq.types.chat.chat_completion import ChoiceMessageToolCall
 from pydantic import BaseModel
 
-from ..base import BaseTool, BaseType
+from ..base import BaseTool, BaseType, cached_tool_schema
 from ..base.utils import (
     convert_base_model_to_tool,
     convert_base_type_to_tool,
@@ -69,6 +69,7 @@ class GroqTool(BaseTool[ChoiceMessageToolCall]):
     '''
 
     @classmethod
+    @cached_tool_schema
     def tool_schema(cls) -> dict[str, Any]:
         """Constructs a tool schema for use with the Groq Cloud API.
 
@@ -60,11 +60,12 @@ class GroqCallParams(BaseCallParams[GroqTool]):
         self,
         tool_type: Optional[Type[GroqTool]] = GroqTool,
         exclude: Optional[set[str]] = None,
+        overrides: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
         """Returns the keyword argument call parameters."""
         extra_exclude = {"wrapper", "wrapper_async"}
         exclude = extra_exclude if exclude is None else exclude.union(extra_exclude)
-        return super().kwargs(tool_type, exclude)
+        return super().kwargs(tool_type, exclude, overrides)
 
 
 class GroqCallResponse(BaseCallResponse[ChatCompletion, GroqTool]):
@@ -280,3 +281,14 @@ class GroqCallResponseChunk(BaseCallResponseChunk[ChatCompletionChunk, GroqTool]
         `list[ChoiceDeltaToolCall]` will be None indicating end of stream.
         """
         return self.delta.tool_calls
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _with_content(self, content: str) -> "GroqCallResponseChunk":
+        """Returns a copy of the chunk whose 0th choice delta has `content`."""
+        choices = list(self.chunk.choices)
+        delta = choices[0].delta.model_copy(update={"content": content})
+        choices[0] = choices[0].model_copy(update={"delta": delta})
+        return self.model_copy(
+            update={"chunk": self.chunk.model_copy(update={"choices": choices})}
+        )
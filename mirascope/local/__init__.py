@@ -0,0 +1,12 @@
+"""A module for storing and searching embeddings locally with NumPy."""
+from .indexes import VectorIndex
+from .types import LocalParams, LocalQueryResult, LocalSettings
+from .vectorstores import LocalVectorStore
+
+__all__ = [
+    "LocalParams",
+    "LocalQueryResult",
+    "LocalSettings",
+    "LocalVectorStore",
+    "VectorIndex",
+]
@@ -0,0 +1,301 @@
+"""A NumPy-backed vector index with exact and IVF (inverted file) search."""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Iterable, Optional, Sequence
+
+import numpy as np
+
+from ..rag.types import Document
+from .types import LocalParams, LocalQueryResult
+
+# The number of k-means iterations used to train the clusters of an IVF index
+_KMEANS_ITERATIONS = 10
+
+_VECTORS_FILE = "vectors.npy"
+_RECORDS_FILE = "records.json"
+
+
+class VectorIndex:
+    """An index of embeddings stored in a contiguous float32 matrix.
+
+    Searches are batched matrix products followed by a vectorized top-k selection, so
+    a batch of queries costs a single pass over the matrix. With `index="ivf"`, the
+    vectors are clustered with k-means and each query only scores the vectors in its
+    `n_probe` closest clusters. Clusters are trained lazily on the first search and
+    retrained once the index has doubled in size; vectors added in between are
+    assigned to their closest existing cluster.
+
+    If `path` is set, `flush` saves the index to that directory and the index is loaded
+    as a read-only memory map, so opening a large index doesn't read it into memory up
+    front. Upserts and deletes only change the index in memory, so a batch of them
+    costs a single write when flushed.
+    """
+
+    def __init__(self, params: LocalParams, path: Optional[str] = None) -> None:
+        self.params = params
+        self.path = path
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._version = self._saved_version = 0
+        self._buffer: np.ndarray = np.empty((0, 0), dtype=np.float32)
+        self._size = 0
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._documents: list[str] = []
+        self._metadatas: list[Optional[dict[str, Any]]] = []
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments: np.ndarray = np.empty(0, dtype=np.int64)
+        self._trained_size = 0
+        if path is not None and os.path.exists(os.path.join(path, _RECORDS_FILE)):
+            self._load()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def ids(self) -> list[str]:
+        """The ids of the documents in the index, in row order."""
+        return list(self._ids)
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """The `(len(self), dimensions)` matrix of (normalized, for cosine) vectors."""
+        return self._buffer[: self._size]
+
+    def upsert(
+        self, documents: Sequence[Document], embeddings: Sequence[Sequence[float]]
+    ) -> None:
+        """Inserts the documents and their embeddings, replacing any with the same id.
+
+        Raises:
+            ValueError: if the number of documents and embeddings differ, or if the
+                embeddings' dimensions don't match the index.
+        """
+        vectors = self._prepare(embeddings)
+        if len(vectors) != len(documents):
+            raise ValueError(
+                f"Got {len(documents)} documents but {len(vectors)} embeddings."
+            )
+        if not len(documents):
+            return
+        with self._lock:
+            if self._size and vectors.shape[1] != self._buffer.shape[1]:
+                raise ValueError(
+                    f"Expected embeddings with {self._buffer.shape[1]} dimensions but "
+                    f"got {vectors.shape[1]}."
+                )
+            rows = np.empty(len(documents), dtype=np.int64)
+            for position, document in enumerate(documents):
+                row = self._rows.get(document.id)
+                if row is None:
+                    row = self._rows[document.id] = len(self._ids)
+                    self._ids.append(document.id)
+                    self._documents.append(document.text)
+                    self._metadatas.append(document.metadata)
+                else:
+                    self._documents[row] = document.text
+                    self._metadatas[row] = document.metadata
+                rows[position] = row
+            self._reserve(len(self._ids), vectors.shape[1])
+            self._buffer[rows] = vectors
+            self._size = len(self._ids)
+            if self._centroids is not None:
+                assignments = np.zeros(self._size, dtype=np.int64)
+                assignments[: len(self._assignments)] = self._assignments
+                assignments[rows] = self._assign(vectors, self._centroids)
+                self._assignments = assignments
+            self._version += 1
+
+    def delete(self, ids: Iterable[str]) -> None:
+        """Deletes the documents with the given ids, ignoring ids not in the index."""
+        with self._lock:
+            rows = [self._rows[id] for id in ids if id in self._rows]
+            if not rows:
+                return
+            keep = np.ones(self._size, dtype=bool)
+            keep[rows] = False
+            kept = np.flatnonzero(keep)
+            self._buffer = np.array(self.vectors[kept])
+            self._ids = [self._ids[row] for row in kept]
+            self._documents = [self._documents[row] for row in kept]
+            self._metadatas = [self._metadatas[row] for row in kept]
+            self._rows = {id: row for row, id in enumerate(self._ids)}
+            self._size = len(self._ids)
+            if self._centroids is not None:
+                self._assignments = self._assignments[kept]
+            self._version += 1
+
+    def flush(self) -> None:
+        """Saves the index to `path` if it changed since it was last saved.
+
+        The index is only locked while it is copied, so queries aren't blocked while it
+        is written.
+        """
+        if self.path is None:
+            return
+        with self._save_lock:
+            with self._lock:
+                version = self._version
+                if version == self._saved_version:
+                    return
+                vectors = np.array(self.vectors)
+                records = {
+                    "metric": self.params.metric,
+                    "ids": list(self._ids),
+                    "documents": list(self._documents),
+                    "metadatas": list(self._metadatas),
+                }
+            self._save(vectors, records)
+            self._saved_version = version
+
+    def query(
+        self, embeddings: Sequence[Sequence[float]], top_k: int = 8
+    ) -> LocalQueryResult:
+        """Returns the `top_k` most similar documents for each query embedding.
+
+        Raises:
+            ValueError: if the embeddings' dimensions don't match the index.
+        """
+        queries = self._prepare(embeddings)
+        with self._lock:
+            if self._size and queries.shape[1] != self._buffer.shape[1]:
+                raise ValueError(
+                    f"Expected embeddings with {self._buffer.shape[1]} dimensions but "
+                    f"got {queries.shape[1]}."
+                )
+            if not self._size or top_k < 1:
+                matches = [(np.empty(0, dtype=np.int64), np.empty(0))] * len(queries)
+            elif self.params.index == "ivf" and self._size >= self.params.min_ivf_size:
+                matches = self._search_ivf(queries, top_k)
+            else:
+                rows, scores = _top_k(queries @ self.vectors.T, top_k)
+                matches = list(zip(rows, scores))
+            return LocalQueryResult(
+                ids=[[self._ids[row] for row in rows] for rows, _ in matches],
+                documents=[
+                    [self._documents[row] for row in rows] for rows, _ in matches
+                ],
+                scores=[scores.tolist() for _, scores in matches],
+                metadatas=[
+                    [self._metadatas[row] for row in rows] for rows, _ in matches
+                ],
+            )
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _prepare(self, embeddings: Sequence[Sequence[float]]) -> np.ndarray:
+        """Returns the embeddings as a float32 matrix, normalized for cosine."""
+        vectors = np.array(embeddings, dtype=np.float32, ndmin=2)
+        if vectors.ndim != 2:
+            raise ValueError("Embeddings must be a list of vectors.")
+        if self.params.metric == "cosine":
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            norms[norms == 0] = 1
+            vectors /= norms
+        return vectors
+
+    def _reserve(self, size: int, dimensions: int) -> None:
+        """Grows the buffer to fit `size` vectors, doubling its capacity as needed.
+
+        A buffer that is memory-mapped (and so read-only) is copied into memory.
+        """
+        capacity = len(self._buffer)
+        if capacity >= size and self._buffer.flags.writeable:
+            return
+        capacity = max(size, 2 * capacity) if capacity < size else capacity
+        buffer = np.empty((capacity, dimensions), dtype=np.float32)
+        if self._size:
+            buffer[: self._size] = self.vectors
+        self._buffer = buffer
+
+    def _search_ivf(
+        self, queries: np.ndarray, top_k: int
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Searches only the vectors in the clusters closest to each query."""
+        if self._centroids is None or self._size >= 2 * self._trained_size:
+            self._train()
+        centroids: np.ndarray = self._centroids  # type: ignore
+        probes, _ = _top_k(queries @ centroids.T, self.params.n_probe)
+        matches = []
+        for query, probe in zip(queries, probes):
+            candidates = np.flatnonzero(np.isin(self._assignments, probe))
+            rows, scores = _top_k((self.vectors[candidates] @ query)[None], top_k)
+            matches.append((candidates[rows[0]], scores[0]))
+        return matches
+
+    def _train(self) -> None:
+        """Clusters the vectors with spherical k-means."""
+        vectors = self.vectors
+        generator = np.random.default_rng(self.params.seed)
+        n_lists = min(self.params.n_lists, self._size)
+        centroids = vectors[generator.choice(self._size, n_lists, replace=False)]
+        centroids = _normalize(centroids)
+        for _ in range(_KMEANS_ITERATIONS):
+            assignments = self._assign(vectors, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, vectors)
+            counts = np.bincount(assignments, minlength=n_lists)
+            nonempty = counts > 0
+            centroids[nonempty] = _normalize(sums[nonempty])
+        self._centroids = centroids
+        self._assignments = self._assign(vectors, centroids)
+        self._trained_size = self._size
+
+    def _assign(self, vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Returns the index of the closest centroid of each vector."""
+        return np.argmax(vectors @ centroids.T, axis=1)
+
+    def _save(self, vectors: np.ndarray, records: dict[str, Any]) -> None:
+        """Atomically writes the vectors and records to `path`."""
+        path: str = self.path  # type: ignore
+        os.makedirs(path, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path, delete=False) as file:
+            np.save(file, vectors)
+        os.replace(file.name, os.path.join(path, _VECTORS_FILE))
+        with tempfile.NamedTemporaryFile("w", dir=path, delete=False) as records_file:
+            json.dump(records, records_file)
+        os.replace(records_file.name, os.path.join(path, _RECORDS_FILE))
+
+    def _load(self) -> None:
+        """Loads the records and memory-maps the vectors saved at `path`.
+
+        Raises:
+            ValueError: if the index was saved with a different metric.
+        """
+        path: str = self.path  # type: ignore
+        with open(os.path.join(path, _RECORDS_FILE)) as file:
+            records = json.load(file)
+        if records["metric"] != self.params.metric:
+            raise ValueError(
+                f"The index at {path} uses the {records['metric']} metric, not "
+                f"{self.params.metric}."
+            )
+        self._buffer = np.load(os.path.join(path, _VECTORS_FILE), mmap_mode="r")
+        self._ids = records["ids"]
+        self._documents = records["documents"]
+        self._metadatas = records["metadatas"]
+        self._rows = {id: row for row, id in enumerate(self._ids)}
+        self._size = len(self._ids)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Returns the rows of `vectors` scaled to unit length."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
+
+
+def _top_k(scores: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the columns and values of the `k` highest scores of each row, sorted."""
+    k = min(k, scores.shape[1])
+    columns = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(scores, columns, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind="stable")
+    return (
+        np.take_along_axis(columns, order, axis=1),
+        np.take_along_axis(top_scores, order, axis=1),
+    )
@@ -0,0 +1,75 @@
+"""Types for interacting with the local NumPy vectorstore using Mirascope."""
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel
+
+from ..rag.types import BaseVectorStoreParams
+
+
+class LocalParams(BaseVectorStoreParams):
+    """The parameters for a local vector index.
+
+    Attributes:
+        metric: The similarity to search by. Cosine similarity normalizes vectors when
+            they are added, so both metrics cost a single matrix product per search.
+        index: `"flat"` searches every vector exactly. `"ivf"` clusters the vectors
+            with k-means and only searches the `n_probe` clusters closest to each
+            query, trading some recall for speed on large corpora.
+        n_lists: The number of clusters of an `"ivf"` index.
+        n_probe: The number of clusters an `"ivf"` index searches per query.
+        min_ivf_size: The number of vectors below which an `"ivf"` index still searches
+            exactly, since clustering doesn't pay off for small corpora.
+        seed: The seed for initializing the k-means clusters.
+    """
+
+    metric: Literal["cosine", "dot"] = "cosine"
+    index: Literal["flat", "ivf"] = "flat"
+    n_lists: int = 64
+    n_probe: int = 8
+    min_ivf_size: int = 4096
+    seed: int = 0
+
+
+class LocalSettings(BaseModel):
+    """Settings for the storage of a local vector index.
+
+    Attributes:
+        path: The directory in which to persist each index, which is memory-mapped when
+            loaded. `None` keeps the index in memory only.
+    """
+
+    path: Optional[str] = None
+
+    def kwargs(self) -> dict[str, Any]:
+        """Returns all parameters for the index as a keyword arguments dictionary."""
+        kwargs = {
+            key: value for key, value in self.model_dump().items() if value is not None
+        }
+        return kwargs
+
+
+class LocalQueryResult(BaseModel):
+    """The result of a local index query, with one list of matches per query.
+
+    Example:
+
+    ```python
+    from mirascope.local import LocalVectorStore
+    from mirascope.openai import OpenAIEmbedder
+
+
+    class MyStore(LocalVectorStore):
+        embedder = OpenAIEmbedder()
+        index_name = "my-store-0001"
+
+    my_store = MyStore()
+    my_store.add("my answer")
+    print(my_store.retrieve("my question"))
+    #> ids=[['0']] documents=[['my answer']] scores=[[0.83]] metadatas=[[None]]
+    ```
+    """
+
+    ids: list[list[str]]
+    documents: list[list[str]]
+    scores: list[list[float]]
+    metadatas: list[list[Optional[dict[str, Any]]]]
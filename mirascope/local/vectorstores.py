@@ -0,0 +1,160 @@
+"""A module for storing and searching embeddings in process with NumPy."""
+import os
+from contextlib import suppress
+from functools import cached_property
+from typing import Any, ClassVar, Optional, Sequence, Union
+
+with suppress(ImportError):
+    import weave
+
+from ..rag.types import BaseEmbeddingResponse, Document
+from ..rag.vectorstores import BaseVectorStore
+from .indexes import VectorIndex
+from .types import LocalParams, LocalQueryResult, LocalSettings
+
+
+class LocalVectorStore(BaseVectorStore):
+    """A vectorstore that keeps its embeddings in a NumPy matrix in process.
+
+    Example:
+
+    ```python
+    from mirascope.local import LocalParams, LocalSettings, LocalVectorStore
+    from mirascope.openai import OpenAIEmbedder
+    from mirascope.rag import TextChunker
+
+
+    class MyStore(LocalVectorStore):
+        embedder = OpenAIEmbedder()
+        chunker = TextChunker(chunk_size=1000, chunk_overlap=200)
+        index_name = "my-store-0001"
+        vectorstore_params = LocalParams(index="ivf")
+        client_settings = LocalSettings(path=".mirascope")
+
+    my_store = MyStore()
+    with open(f"{PATH_TO_FILE}") as file:
+        data = file.read()
+        my_store.add(data)
+    documents = my_store.retrieve("my question").documents
+    print(documents)
+    ```
+    """
+
+    vectorstore_params: ClassVar[LocalParams] = LocalParams()
+    client_settings: ClassVar[LocalSettings] = LocalSettings()
+
+    def retrieve(
+        self,
+        text: Optional[Union[str, list[str]]] = None,
+        top_k: int = 8,
+        embeddings: Optional[Sequence[Sequence[float]]] = None,
+        **kwargs: Any,
+    ) -> LocalQueryResult:
+        """Queries the vectorstore for the `top_k` closest matches of each query.
+
+        Args:
+            text: The query or batch of queries to embed and search for.
+            top_k: The number of matches to return per query.
+            embeddings: Precomputed query embeddings, used if `text` is not set.
+
+        Returns:
+            The matches of each query, most similar first.
+
+        Raises:
+            ValueError: if neither `text` nor `embeddings` is set, or if the embedder
+                returns no embeddings.
+        """
+        if text:
+            if isinstance(text, str):
+                text = [text]
+            embeddings = self._embed(text)
+        if embeddings is None:
+            raise ValueError("Either `text` or `embeddings` must be provided.")
+        return self._index.query(embeddings, top_k=top_k)
+
+    def add(
+        self,
+        text: Union[str, list[Document]],
+        source: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Takes unstructured data and upserts into vectorstore
+
+        If `source` is set, only the new or changed chunks of `source` are embedded and
+        upserted, and the chunks of a previous version of `source` that are gone are
+        deleted.
+        """
+        documents: list[Document]
+        if isinstance(text, str):
+            chunk = self.chunker.chunk
+            if self.vectorstore_params.weave and not isinstance(self.chunker, weave.Op):
+                chunk = self.vectorstore_params.weave(
+                    self.chunker.chunk
+                )  # pragma: no cover
+            documents = chunk(text)
+        else:
+            documents = text
+        stale: list[str] = []
+        if source is not None:
+            documents, stale = self._diff(documents, source)
+        if documents:
+            self._upsert(
+                documents, self._embed([document.text for document in documents])
+            )
+        if stale:
+            self._index.delete(stale)
+        self._flush()
+
+    def delete(self, ids: list[str]) -> None:
+        """Deletes the documents with the given ids from the vectorstore."""
+        self._index.delete(ids)
+        self._flush()
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _upsert(
+        self,
+        documents: list[Document],
+        embeddings: Sequence[Sequence[float]],
+        **kwargs: Any,
+    ) -> None:
+        """Upserts documents with precomputed embeddings into the vectorstore.
+
+        The index is only saved by `_flush`, so that upserting many batches doesn't
+        rewrite it after each one.
+        """
+        self._index.upsert(documents, embeddings)
+
+    def _flush(self) -> None:
+        """Saves the index to `client_settings.path`, if set."""
+        self._index.flush()
+
+    def _source_ids(self, source: str) -> list[str]:
+        """Returns the ids of the documents added from `source`."""
+        prefix = f"{source}#"
+        return [id for id in self._index.ids if id.startswith(prefix)]
+
+    def _embed(self, inputs: list[str]) -> Sequence[Sequence[float]]:
+        """Returns the embeddings of `inputs`."""
+        embed = self.embedder.embed
+        if self.vectorstore_params.weave is not None and not isinstance(
+            self.embedder, weave.Op
+        ):
+            embed = self.vectorstore_params.weave(
+                self.embedder.embed
+            )  # pragma: no cover
+        if self.vectorstore_params.logfire:
+            embed = self.vectorstore_params.logfire(embed)  # pragma: no cover
+        embedding_response: BaseEmbeddingResponse = embed(inputs)
+        if embedding_response.embeddings is None:
+            raise ValueError("Embedding is None")
+        return embedding_response.embeddings
+
+    ############################# PRIVATE PROPERTIES #################################
+
+    @cached_property
+    def _index(self) -> VectorIndex:
+        path = None
+        if self.client_settings.path is not None:
+            path = os.path.join(self.client_settings.path, self.index_name or "default")
+        return VectorIndex(self.vectorstore_params, path)
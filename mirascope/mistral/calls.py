@@ -8,6 +8,10 @@ from mistralai.constants import ENDPOINT
 from tenacity import AsyncRetrying, Retrying
 
 from ..base import BaseCall, retry
+from ..base.caches import cached
+from ..base.clients import get_async_client, get_client
+from ..base.rate_limiters import rate_limited
+from ..base.retries import RetryPolicy
 from ..base.types import Message
 from ..enums import MessageRole
 from .tools import MistralTool
@@ -43,8 +47,10 @@ class MistralCall(BaseCall[MistralCallResponse, MistralCallResponseChunk, Mistra
         )
 
     @retry
+    @cached
+    @rate_limited
     def call(
-        self, retries: Union[int, Retrying] = 0, **kwargs: Any
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
     ) -> MistralCallResponse:
         """Makes a call to the model using this `MistralCall` instance.
 
@@ -60,10 +66,7 @@ class MistralCall(BaseCall[MistralCallResponse, MistralCallResponseChunk, Mistra
                 https://github.com/mistralai/client-python/blob/main/src/mistralai/exceptions.py
         """
         kwargs, tool_types = self._setup(kwargs, MistralTool)
-        client = MistralClient(
-            api_key=self.api_key,
-            endpoint=self.base_url if self.base_url else ENDPOINT,
-        )
+        client = self._client()
         chat = client.chat
         if self.call_params.weave:
             chat = self.call_params.weave(chat)  # pragma: no cover
@@ -85,8 +88,10 @@ class MistralCall(BaseCall[MistralCallResponse, MistralCallResponseChunk, Mistra
         )
 
     @retry
+    @cached
+    @rate_limited
     async def call_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> MistralCallResponse:
         """Makes an asynchronous call to the model using this `MistralCall` instance.
 
@@ -102,10 +107,7 @@ class MistralCall(BaseCall[MistralCallResponse, MistralCallResponseChunk, Mistra
                 https://github.com/mistralai/client-python/blob/main/src/mistralai/exceptions.py
         """
         kwargs, tool_types = self._setup(kwargs, MistralTool)
-        client = MistralAsyncClient(
-            api_key=self.api_key,
-            endpoint=self.base_url if self.base_url else ENDPOINT,
-        )
+        client = self._async_client()
         chat = client.chat
         if self.call_params.weave:
             chat = self.call_params.weave(chat)  # pragma: no cover
@@ -128,8 +130,9 @@ class MistralCall(BaseCall[MistralCallResponse, MistralCallResponseChunk, Mistra
         )
 
     @retry
+    @rate_limited
     def stream(
-        self, retries: Union[int, Retrying] = 0, **kwargs: Any
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
     ) -> Generator[MistralCallResponseChunk, None, None]:
         """Streams the response for a call using this `MistralCall` instance.
 
@@ -145,10 +148,7 @@ class MistralCall(BaseCall[MistralCallResponse, MistralCallResponseChunk, Mistra
                 https://github.com/mistralai/client-python/blob/main/src/mistralai/exceptions.py
         """
         kwargs, tool_types = self._setup(kwargs, MistralTool)
-        client = MistralClient(
-            api_key=self.api_key,
-            endpoint=self.base_url if self.base_url else ENDPOINT,
-        )
+        client = self._client()
         chat_stream = client.chat_stream
         if self.call_params.logfire:
             chat_stream = self.call_params.logfire(
@@ -160,8 +160,9 @@ class MistralCall(BaseCall[MistralCallResponse, MistralCallResponseChunk, Mistra
             yield MistralCallResponseChunk(chunk=chunk, tool_types=tool_types)
 
     @retry
+    @rate_limited
     async def stream_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> AsyncGenerator[MistralCallResponseChunk, None]:
         """Streams the response for an asynchronous call using this `MistralCall`.
 
@@ -177,10 +178,7 @@ class MistralCall(BaseCall[MistralCallResponse, MistralCallResponseChunk, Mistra
                 https://github.com/mistralai/client-python/blob/main/src/mistralai/exceptions.py
         """
         kwargs, tool_types = self._setup(kwargs, MistralTool)
-        client = MistralAsyncClient(
-            api_key=self.api_key,
-            endpoint=self.base_url if self.base_url else ENDPOINT,
-        )
+        client = self._async_client()
         chat_stream = client.chat_stream
         if self.call_params.logfire_async:
             chat_stream = self.call_params.logfire_async(
@@ -189,3 +187,25 @@ class MistralCall(BaseCall[MistralCallResponse, MistralCallResponseChunk, Mistra
         stream = chat_stream(messages=self.messages(), **kwargs)
         async for chunk in stream:
             yield MistralCallResponseChunk(chunk=chunk, tool_types=tool_types)
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _client(self) -> MistralClient:
+        """Returns a pooled `MistralClient` for this call's configuration."""
+        return get_client(
+            ("mistral", self.api_key, self.base_url),
+            lambda: MistralClient(
+                api_key=self.api_key,
+                endpoint=self.base_url if self.base_url else ENDPOINT,
+            ),
+        )
+
+    def _async_client(self) -> MistralAsyncClient:
+        """Returns a pooled `MistralAsyncClient` for the running event loop."""
+        return get_async_client(
+            ("mistral", self.api_key, self.base_url),
+            lambda: MistralAsyncClient(
+                api_key=self.api_key,
+                endpoint=self.base_url if self.base_url else ENDPOINT,
+            ),
+        )
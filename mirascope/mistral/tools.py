@@ -7,7 +7,7 @@ from typing import Any, Callable, Type
 from mistralai.models.chat_completion import ToolCall
 from pydantic import BaseModel
 
-from ..base import BaseTool, BaseType
+from ..base import BaseTool, BaseType, cached_tool_schema
 from ..base.utils import (
     convert_base_model_to_tool,
     convert_base_type_to_tool,
@@ -68,6 +68,7 @@ class MistralTool(BaseTool[ToolCall]):
     '''
 
     @classmethod
+    @cached_tool_schema
     def tool_schema(cls) -> dict[str, Any]:
         """Constructs a tool schema for use with the Mistral Chat client.
 
@@ -217,3 +217,14 @@ class MistralCallResponseChunk(
     def tool_calls(self) -> Optional[list[ToolCall]]:
         """Returns the partial tool calls for the 0th choice message."""
         return self.delta.tool_calls
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _with_content(self, content: str) -> "MistralCallResponseChunk":
+        """Returns a copy of the chunk whose 0th choice delta has `content`."""
+        choices = list(self.chunk.choices)
+        delta = choices[0].delta.model_copy(update={"content": content})
+        choices[0] = choices[0].model_copy(update={"delta": delta})
+        return self.model_copy(
+            update={"chunk": self.chunk.model_copy(update={"choices": choices})}
+        )
@@ -1,10 +1,12 @@
 """A module for interacting with OpenAI models."""
+from .batches import OpenAIBatch
 from .calls import OpenAICall
 from .embedders import OpenAIEmbedder
 from .extractors import OpenAIExtractor
 from .tool_streams import OpenAIToolStream
 from .tools import OpenAITool
 from .types import (
+    JSONSchemaResponseFormat,
     OpenAICallParams,
     OpenAICallResponse,
     OpenAICallResponseChunk,
@@ -14,6 +16,8 @@ from .types import (
 from .utils import openai_api_calculate_cost
 
 __all__ = [
+    "JSONSchemaResponseFormat",
+    "OpenAIBatch",
     "OpenAICall",
     "OpenAIEmbedder",
     "OpenAIExtractor",
@@ -0,0 +1,433 @@
+"""Running many OpenAI calls and extractions through OpenAI's Batch API.
+
+The Batch API processes requests asynchronously within a completion window at half the
+cost of synchronous requests and without counting against the synchronous rate limits,
+which makes it a good fit for large offline jobs.
+
+Example:
+
+```python
+from typing import Type
+
+from pydantic import BaseModel
+
+from mirascope.openai import OpenAIBatch, OpenAIExtractor
+
+
+class Sentiment(BaseModel):
+    label: str
+
+
+class SentimentExtractor(OpenAIExtractor[Sentiment]):
+    extract_schema: Type[Sentiment] = Sentiment
+    prompt_template = "What is the sentiment of this review? {review}"
+
+    review: str
+
+
+reviews = ["I loved it!", "It was terrible."]
+batch = OpenAIBatch(items=[SentimentExtractor(review=review) for review in reviews])
+print(batch.run())
+#> [Sentiment(label='positive'), Sentiment(label='negative')]
+```
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any, Literal, Optional, Union
+
+from openai.types import Batch
+from openai.types.chat import ChatCompletion
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError
+
+from .calls import OpenAICall
+from .extractors import OpenAIExtractor
+from .tools import OpenAITool
+from .types import OpenAICallResponse
+from .utils import openai_api_calculate_cost
+
+BATCH_DISCOUNT = 0.5
+BATCH_ENDPOINT: Literal["/v1/chat/completions"] = "/v1/chat/completions"
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+_CLIENT_OPTIONS = ("extra_headers", "extra_query", "timeout")
+
+
+class _BatchRequest(BaseModel):
+    """A prepared request for a single item in the batch."""
+
+    call: OpenAICall
+    body: dict[str, Any]
+    tool_types: Optional[list[type[OpenAITool]]]
+    extractor: Optional[OpenAIExtractor] = None
+    return_tool: bool = False
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class OpenAIBatch(BaseModel):
+    """Runs `OpenAICall` and `OpenAIExtractor` instances using OpenAI's Batch API.
+
+    Each item is serialized into a line of the batch input file using the same messages
+    and call parameters that `call` / `extract` would send. Once the batch finishes,
+    results are mapped back to `OpenAICallResponse` instances (for calls) or extracted
+    schema instances (for extractors) in the original order of `items`. Costs reflect
+    the Batch API's 50% discount.
+
+    Example:
+
+    ```python
+    from mirascope.openai import OpenAIBatch, OpenAICall
+
+
+    class BookRecommender(OpenAICall):
+        prompt_template = "Please recommend a {genre} book"
+
+        genre: str
+
+
+    batch = OpenAIBatch(
+        items=[BookRecommender(genre=genre) for genre in ["fantasy", "mystery"]]
+    )
+    batch.submit()
+    # ...later, possibly after a restart of the polling loop
+    batch.wait(timeout=24 * 60 * 60)
+    for response in batch.results():
+        print(response.content)
+    ```
+
+    Attributes:
+        items: The calls and extractors to run. All items must share the same
+            `api_key` and `base_url`.
+        completion_window: The time frame within which the batch should be processed.
+        metadata: Optional custom metadata for the batch.
+        poll_interval: The number of seconds to wait between status checks in `wait`.
+        batch: The submitted `Batch`, updated with the latest status by `wait`.
+    """
+
+    items: list[Union[OpenAICall, OpenAIExtractor]]
+    completion_window: Literal["24h"] = "24h"
+    metadata: Optional[dict[str, str]] = None
+    poll_interval: float = 30.0
+    batch: Optional[Batch] = None
+
+    _requests: Optional[list[_BatchRequest]] = PrivateAttr(default=None)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def to_jsonl(self) -> str:
+        """Returns the batch input file contents for `items` in JSONL format."""
+        return "\n".join(
+            json.dumps(
+                {
+                    "custom_id": str(index),
+                    "method": "POST",
+                    "url": BATCH_ENDPOINT,
+                    "body": request.body,
+                }
+            )
+            for index, request in enumerate(self._prepare())
+        )
+
+    def submit(self) -> Batch:
+        """Uploads the batch input file and creates the batch.
+
+        Returns:
+            The created `Batch`.
+
+        Raises:
+            ValueError: if there are no items or they don't share a client config.
+            OpenAIError: raises any OpenAI errors, see:
+                https://platform.openai.com/docs/guides/error-codes/api-errors
+        """
+        client = self._prepare()[0].call._client()
+        input_file = client.files.create(
+            file=("batch.jsonl", self.to_jsonl().encode()),
+            purpose="batch",  # type: ignore
+        )
+        self.batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=self.completion_window,
+            **self._metadata(),
+        )
+        return self.batch
+
+    async def submit_async(self) -> Batch:
+        """Asynchronously uploads the batch input file and creates the batch.
+
+        Returns:
+            The created `Batch`.
+
+        Raises:
+            ValueError: if there are no items or they don't share a client config.
+            OpenAIError: raises any OpenAI errors, see:
+                https://platform.openai.com/docs/guides/error-codes/api-errors
+        """
+        client = self._prepare()[0].call._async_client()
+        input_file = await client.files.create(
+            file=("batch.jsonl", self.to_jsonl().encode()),
+            purpose="batch",  # type: ignore
+        )
+        self.batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=self.completion_window,
+            **self._metadata(),
+        )
+        return self.batch
+
+    def wait(self, timeout: Optional[float] = None) -> Batch:
+        """Polls the batch every `poll_interval` seconds until it's finished.
+
+        Args:
+            timeout: The maximum number of seconds to wait. `None` waits indefinitely.
+
+        Returns:
+            The finished `Batch`.
+
+        Raises:
+            RuntimeError: if the batch has not been submitted.
+            TimeoutError: if the batch did not finish within `timeout` seconds.
+        """
+        batch = self._submitted()
+        client = self._prepare()[0].call._client()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while batch.status not in TERMINAL_STATUSES:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Batch {batch.id} is still {batch.status}.")
+            time.sleep(self.poll_interval)
+            batch = self.batch = client.batches.retrieve(batch.id)
+        return batch
+
+    async def wait_async(self, timeout: Optional[float] = None) -> Batch:
+        """Asynchronously polls the batch until it's finished.
+
+        Args:
+            timeout: The maximum number of seconds to wait. `None` waits indefinitely.
+
+        Returns:
+            The finished `Batch`.
+
+        Raises:
+            RuntimeError: if the batch has not been submitted.
+            TimeoutError: if the batch did not finish within `timeout` seconds.
+        """
+        batch = self._submitted()
+        client = self._prepare()[0].call._async_client()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while batch.status not in TERMINAL_STATUSES:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Batch {batch.id} is still {batch.status}.")
+            await asyncio.sleep(self.poll_interval)
+            batch = self.batch = await client.batches.retrieve(batch.id)
+        return batch
+
+    def results(self, return_exceptions: bool = False) -> list[Any]:
+        """Returns the result for each item in the original order of `items`.
+
+        Args:
+            return_exceptions: Whether to return the exception of a failed item in its
+                place instead of raising it. This mirrors `asyncio.gather` and lets
+                large jobs keep every successful result.
+
+        Returns:
+            An `OpenAICallResponse` for each `OpenAICall` and an `extract_schema`
+            instance for each `OpenAIExtractor`.
+
+        Raises:
+            RuntimeError: if the batch is not finished, failed, or an item failed.
+            ValidationError: if an extractor's schema cannot be instantiated.
+        """
+        batch = self._finished()
+        client = self._prepare()[0].call._client()
+        contents = [
+            client.files.content(file_id).text
+            for file_id in (batch.output_file_id, batch.error_file_id)
+            if file_id
+        ]
+        return self._results(batch, contents, return_exceptions)
+
+    async def results_async(self, return_exceptions: bool = False) -> list[Any]:
+        """Asynchronously returns the result for each item in order of `items`.
+
+        Args:
+            return_exceptions: Whether to return the exception of a failed item in its
+                place instead of raising it.
+
+        Returns:
+            An `OpenAICallResponse` for each `OpenAICall` and an `extract_schema`
+            instance for each `OpenAIExtractor`.
+
+        Raises:
+            RuntimeError: if the batch is not finished, failed, or an item failed.
+            ValidationError: if an extractor's schema cannot be instantiated.
+        """
+        batch = self._finished()
+        client = self._prepare()[0].call._async_client()
+        contents = [
+            (await client.files.content(file_id)).text
+            for file_id in (batch.output_file_id, batch.error_file_id)
+            if file_id
+        ]
+        return self._results(batch, contents, return_exceptions)
+
+    def run(
+        self, timeout: Optional[float] = None, return_exceptions: bool = False
+    ) -> list[Any]:
+        """Submits the batch, waits for it to finish and returns the results.
+
+        Args:
+            timeout: The maximum number of seconds to wait for the batch to finish.
+            return_exceptions: Whether to return the exception of a failed item in its
+                place instead of raising it.
+
+        Returns:
+            The results in the original order of `items`, see `results`.
+        """
+        self.submit()
+        self.wait(timeout)
+        return self.results(return_exceptions)
+
+    async def run_async(
+        self, timeout: Optional[float] = None, return_exceptions: bool = False
+    ) -> list[Any]:
+        """Asynchronously submits the batch, waits for it and returns the results.
+
+        Args:
+            timeout: The maximum number of seconds to wait for the batch to finish.
+            return_exceptions: Whether to return the exception of a failed item in its
+                place instead of raising it.
+
+        Returns:
+            The results in the original order of `items`, see `results`.
+        """
+        await self.submit_async()
+        await self.wait_async(timeout)
+        return await self.results_async(return_exceptions)
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _prepare(self) -> list[_BatchRequest]:
+        """Returns the (cached) prepared request for each item."""
+        if self._requests is not None:
+            return self._requests
+        if not self.items:
+            raise ValueError("A batch must contain at least one item.")
+        requests = []
+        for item in self.items:
+            if isinstance(item, OpenAIExtractor):
+                kwargs, return_tool = item._setup(OpenAITool, {})
+                call = item._temp_call(OpenAICall, {})
+                request = _request(call, kwargs)
+                request.extractor, request.return_tool = item, return_tool
+            else:
+                request = _request(item, {})
+            requests.append(request)
+        configs = {
+            (request.call.api_key, request.call.base_url) for request in requests
+        }
+        if len(configs) > 1:
+            raise ValueError("All batch items must share an `api_key` and `base_url`.")
+        self._requests = requests
+        return requests
+
+    def _metadata(self) -> dict[str, Any]:
+        """Returns the metadata keyword argument for creating the batch."""
+        return {"metadata": self.metadata} if self.metadata else {}
+
+    def _submitted(self) -> Batch:
+        """Returns the submitted batch."""
+        if self.batch is None:
+            raise RuntimeError("The batch has not been submitted.")
+        return self.batch
+
+    def _finished(self) -> Batch:
+        """Returns the submitted batch if it's finished and didn't fail."""
+        batch = self._submitted()
+        if batch.status not in TERMINAL_STATUSES:
+            raise RuntimeError(f"Batch {batch.id} is still {batch.status}.")
+        if batch.status == "failed":
+            errors = batch.errors.data if batch.errors else None
+            raise RuntimeError(f"Batch {batch.id} failed: {errors}")
+        return batch
+
+    def _results(
+        self, batch: Batch, contents: list[str], return_exceptions: bool
+    ) -> list[Any]:
+        """Maps the output and error file contents back to the batch items."""
+        requests = self._prepare()
+        outputs: dict[str, Any] = {}
+        for content in contents:
+            for line in content.splitlines():
+                if line.strip():
+                    output = json.loads(line)
+                    outputs[output["custom_id"]] = output
+        results: list[Any] = []
+        for index, request in enumerate(requests):
+            output = outputs.get(str(index))
+            if output is None:
+                result: Any = RuntimeError(
+                    f"No result for batch request {index} ({batch.status})."
+                )
+            else:
+                result = _result(batch, request, output)
+            if isinstance(result, Exception) and not return_exceptions:
+                raise result
+            results.append(result)
+        return results
+
+
+def _request(call: OpenAICall, kwargs: dict[str, Any]) -> _BatchRequest:
+    """Returns the prepared request for `call` with `kwargs` overriding call params.
+
+    Options that only configure the HTTP request (`extra_headers`, `extra_query` and
+    `timeout`) don't apply to the lines of a batch and are dropped, while `extra_body`
+    is merged into the body as the client would.
+    """
+    kwargs, tool_types = call._setup_openai_kwargs(kwargs)
+    for option in _CLIENT_OPTIONS:
+        kwargs.pop(option, None)
+    extra_body = kwargs.pop("extra_body", None) or {}
+    messages = call._update_messages_if_json(call.messages(), tool_types)
+    return _BatchRequest(
+        call=call,
+        body={"messages": messages, **kwargs, **extra_body},
+        tool_types=tool_types,
+    )
+
+
+def _result(batch: Batch, request: _BatchRequest, output: dict[str, Any]) -> Any:
+    """Returns the result (or exception) for a single line of the batch output."""
+    response = output.get("response")
+    if output.get("error") or not response or response.get("status_code") != 200:
+        error = output.get("error") or (response or {}).get("body")
+        return RuntimeError(f"Batch request {output['custom_id']} failed: {error}")
+    completion = ChatCompletion.model_validate(response["body"])
+    cost = openai_api_calculate_cost(completion.usage, completion.model)
+    finished_at = batch.completed_at or batch.expired_at or batch.cancelled_at
+    call_response = OpenAICallResponse(
+        response=completion,
+        tool_types=request.tool_types,
+        start_time=batch.created_at * 1000,
+        end_time=(finished_at or batch.created_at) * 1000,
+        cost=cost * BATCH_DISCOUNT if cost is not None else None,
+        response_format=request.call.call_params.response_format,
+    )
+    extractor = request.extractor
+    if extractor is None:
+        return call_response
+    try:
+        extracted = extractor._extract_schema(
+            call_response.tool,
+            extractor.extract_schema,
+            request.return_tool,
+            response=call_response,
+        )
+    except (AttributeError, RuntimeError, ValueError, ValidationError) as e:
+        return e
+    if extracted is None:
+        return AttributeError("No tool found in the completion.")
+    return extracted
@@ -10,6 +10,7 @@ from typing import (
     Type,
     Union,
 )
+from weakref import WeakKeyDictionary
 
 from openai import AsyncOpenAI, OpenAI
 from openai.types.chat import (
@@ -23,11 +24,25 @@ from openai.types.chat.completion_create_params import ResponseFormat
 from tenacity import AsyncRetrying, Retrying
 
 from ..base import BaseCall
+from ..base.caches import cached
+from ..base.clients import (
+    get_async_client,
+    get_client,
+    pooled_async_http_client,
+    pooled_http_client,
+)
+from ..base.rate_limiters import rate_limited
+from ..base.retries import RetryPolicy
 from ..base.utils import retry
 from ..enums import MessageRole
 from .tools import OpenAITool
-from .types import OpenAICallParams, OpenAICallResponse, OpenAICallResponseChunk
-from .utils import openai_api_calculate_cost
+from .types import (
+    JSONSchemaResponseFormat,
+    OpenAICallParams,
+    OpenAICallResponse,
+    OpenAICallResponseChunk,
+)
+from .utils import is_json_mode, openai_api_calculate_cost
 
 JSON_MODE_CONTENT = """
 Extract a valid JSON object instance from to content using the following schema:
@@ -35,12 +50,23 @@ Extract a valid JSON object instance from to content using the following schema:
 {schema}
 """.strip()
 
+_JSON_MODE_CONTENTS: WeakKeyDictionary[type, str] = WeakKeyDictionary()
+
 
 def _json_mode_content(tool_type: Type[OpenAITool]) -> str:
-    """Returns the formatted `JSON_MODE_CONTENT` with the given tool type."""
-    return JSON_MODE_CONTENT.format(
-        schema=json.dumps(tool_type.model_json_schema(), indent=2)
-    )
+    """Returns the formatted `JSON_MODE_CONTENT` with the given tool type.
+
+    The schema is encoded compactly to save prompt tokens on every request, and the
+    content is cached per tool type.
+    """
+    try:
+        return _JSON_MODE_CONTENTS[tool_type]
+    except KeyError:
+        schema = json.dumps(tool_type.model_json_schema(), separators=(",", ":"))
+        content = _JSON_MODE_CONTENTS[tool_type] = JSON_MODE_CONTENT.format(
+            schema=schema
+        )
+        return content
 
 
 class OpenAICall(BaseCall[OpenAICallResponse, OpenAICallResponseChunk, OpenAITool]):
@@ -81,14 +107,16 @@ class OpenAICall(BaseCall[OpenAICallResponse, OpenAICallResponseChunk, OpenAIToo
         ]
 
     @retry
+    @cached
+    @rate_limited
     def call(
-        self, retries: Union[int, Retrying] = 0, **kwargs: Any
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
     ) -> OpenAICallResponse:
         """Makes a call to the model using this `OpenAICall` instance.
 
         Args:
             retries: An integer for the number of times to retry the call or
-                a `tenacity.Retrying` instance.
+                a `tenacity.Retrying` instance or `RetryPolicy`.
             **kwargs: Additional keyword arguments parameters to pass to the call. These
                 will override any existing arguments in `call_params`.
 
@@ -100,15 +128,7 @@ class OpenAICall(BaseCall[OpenAICallResponse, OpenAICallResponseChunk, OpenAIToo
                 https://platform.openai.com/docs/guides/error-codes/api-errors
         """
         kwargs, tool_types = self._setup_openai_kwargs(kwargs)
-        client = OpenAI(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.langfuse:  # pragma: no cover
-            from langfuse.openai import OpenAI as LangfuseOpenAI
-
-            client = LangfuseOpenAI(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.wrapper is not None:
-            client = self.call_params.wrapper(client)
-        if self.call_params.logfire:
-            self.call_params.logfire(client)  # pragma: no cover
+        client = self._client()
         create = client.chat.completions.create
         messages = self._update_messages_if_json(self.messages(), tool_types)
         start_time = datetime.datetime.now().timestamp() * 1000
@@ -127,14 +147,16 @@ class OpenAICall(BaseCall[OpenAICallResponse, OpenAICallResponseChunk, OpenAIToo
         )
 
     @retry
+    @cached
+    @rate_limited
     async def call_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> OpenAICallResponse:
         """Makes an asynchronous call to the model using this `OpenAICall`.
 
         Args:
             retries: An integer for the number of times to retry the call or
-                a `tenacity.AsyncRetrying` instance.
+                a `tenacity.AsyncRetrying` instance or `RetryPolicy`.
             **kwargs: Additional keyword arguments parameters to pass to the call. These
                 will override any existing arguments in `call_params`.
 
@@ -146,15 +168,7 @@ class OpenAICall(BaseCall[OpenAICallResponse, OpenAICallResponseChunk, OpenAIToo
                 https://platform.openai.com/docs/guides/error-codes/api-errors
         """
         kwargs, tool_types = self._setup_openai_kwargs(kwargs)
-        client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.langfuse:  # pragma: no cover
-            from langfuse.openai import AsyncOpenAI as LangfuseAsyncOpenAI
-
-            client = LangfuseAsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.wrapper_async is not None:
-            client = self.call_params.wrapper_async(client)
-        if self.call_params.logfire:
-            self.call_params.logfire(client)  # pragma: no cover
+        client = self._async_client()
         messages = self._update_messages_if_json(self.messages(), tool_types)
         start_time = datetime.datetime.now().timestamp() * 1000
         completion = await client.chat.completions.create(
@@ -172,14 +186,15 @@ class OpenAICall(BaseCall[OpenAICallResponse, OpenAICallResponseChunk, OpenAIToo
         )
 
     @retry
+    @rate_limited
     def stream(
-        self, retries: Union[int, Retrying] = 0, **kwargs: Any
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
     ) -> Generator[OpenAICallResponseChunk, None, None]:
         """Streams the response for a call using this `OpenAICall`.
 
         Args:
             retries: An integer for the number of times to retry the call or
-                a `tenacity.Retrying` instance.
+                a `tenacity.Retrying` instance or `RetryPolicy`.
             **kwargs: Additional keyword arguments parameters to pass to the call. These
                 will override any existing arguments in `call_params`.
 
@@ -191,15 +206,7 @@ class OpenAICall(BaseCall[OpenAICallResponse, OpenAICallResponseChunk, OpenAIToo
                 https://platform.openai.com/docs/guides/error-codes/api-errors
         """
         kwargs, tool_types = self._setup_openai_kwargs(kwargs)
-        client = OpenAI(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.langfuse:  # pragma: no cover
-            from langfuse.openai import OpenAI as LangfuseOpenAI
-
-            client = LangfuseOpenAI(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.wrapper is not None:
-            client = self.call_params.wrapper(client)
-        if self.call_params.logfire:
-            self.call_params.logfire(client)  # pragma: no cover
+        client = self._client()
         messages = self._update_messages_if_json(self.messages(), tool_types)
         stream = client.chat.completions.create(
             messages=messages,
@@ -215,14 +222,15 @@ class OpenAICall(BaseCall[OpenAICallResponse, OpenAICallResponseChunk, OpenAIToo
             )
 
     @retry
+    @rate_limited
     async def stream_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> AsyncGenerator[OpenAICallResponseChunk, None]:
         """Streams the response for an asynchronous call using this `OpenAICall`.
 
         Args:
             retries: An integer for the number of times to retry the call or
-                a `tenacity.AsyncRetrying` instance.
+                a `tenacity.AsyncRetrying` instance or `RetryPolicy`.
             **kwargs: Additional keyword arguments parameters to pass to the call. These
                 will override any existing arguments in `call_params`.
 
@@ -234,15 +242,7 @@ class OpenAICall(BaseCall[OpenAICallResponse, OpenAICallResponseChunk, OpenAIToo
                 https://platform.openai.com/docs/guides/error-codes/api-errors
         """
         kwargs, tool_types = self._setup_openai_kwargs(kwargs)
-        client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.langfuse:  # pragma: no cover
-            from langfuse.openai import AsyncOpenAI as LangfuseAsyncOpenAI
-
-            client = LangfuseAsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
-        if self.call_params.wrapper_async is not None:
-            client = self.call_params.wrapper_async(client)
-        if self.call_params.logfire:
-            self.call_params.logfire(client)  # pragma: no cover
+        client = self._async_client()
         messages = self._update_messages_if_json(self.messages(), tool_types)
         stream = await client.chat.completions.create(
             messages=messages,
@@ -259,6 +259,68 @@ class OpenAICall(BaseCall[OpenAICallResponse, OpenAICallResponseChunk, OpenAIToo
 
     ############################## PRIVATE METHODS ###################################
 
+    def _client(self) -> OpenAI:
+        """Returns a pooled `OpenAI` client for this call's configuration."""
+
+        def create() -> OpenAI:
+            client_type = OpenAI
+            if self.call_params.langfuse:  # pragma: no cover
+                from langfuse.openai import OpenAI as client_type  # type: ignore
+
+            client = client_type(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=pooled_http_client(),
+            )
+            if self.call_params.wrapper is not None:
+                client = self.call_params.wrapper(client)
+            if self.call_params.logfire:
+                self.call_params.logfire(client)  # pragma: no cover
+            return client
+
+        return get_client(
+            (
+                "openai",
+                self.api_key,
+                self.base_url,
+                self.call_params.wrapper,
+                self.call_params.langfuse,
+                self.call_params.logfire,
+            ),
+            create,
+        )
+
+    def _async_client(self) -> AsyncOpenAI:
+        """Returns a pooled `AsyncOpenAI` client for the running event loop."""
+
+        def create() -> AsyncOpenAI:
+            client_type = AsyncOpenAI
+            if self.call_params.langfuse:  # pragma: no cover
+                from langfuse.openai import AsyncOpenAI as client_type  # type: ignore
+
+            client = client_type(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=pooled_async_http_client(),
+            )
+            if self.call_params.wrapper_async is not None:
+                client = self.call_params.wrapper_async(client)
+            if self.call_params.logfire:
+                self.call_params.logfire(client)  # pragma: no cover
+            return client
+
+        return get_async_client(
+            (
+                "openai",
+                self.api_key,
+                self.base_url,
+                self.call_params.wrapper_async,
+                self.call_params.langfuse,
+                self.call_params.logfire,
+            ),
+            create,
+        )
+
     def _setup_openai_kwargs(
         self,
         kwargs: dict[str, Any],
@@ -266,13 +328,23 @@ class OpenAICall(BaseCall[OpenAICallResponse, OpenAICallResponseChunk, OpenAIToo
         dict[str, Any],
         Optional[list[Type[OpenAITool]]],
     ]:
-        """Overrides the `BaseCall._setup` for Anthropic specific setup."""
+        """Overrides the `BaseCall._setup` for OpenAI specific setup.
+
+        In JSON mode the tools are replaced by the response format: for `json_object`
+        the schema is sent in a message (see `_update_messages_if_json`), while for
+        `json_schema` the first tool's strict schema is sent as the response format.
+        """
         kwargs, tool_types = self._setup(kwargs, OpenAITool)
-        if (
-            self.call_params.response_format == ResponseFormat(type="json_object")
-            and tool_types
-        ):
+        if is_json_mode(self.call_params.response_format) and tool_types:
             kwargs.pop("tools")
+            response_format = kwargs.get("response_format") or {}
+            if (
+                response_format.get("type") == "json_schema"
+                and "json_schema" not in response_format
+            ):
+                kwargs["response_format"] = JSONSchemaResponseFormat(
+                    type="json_schema", json_schema=tool_types[0].json_schema()
+                )
         return kwargs, tool_types
 
     def _update_messages_if_json(
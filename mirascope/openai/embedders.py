@@ -2,16 +2,19 @@
 import asyncio
 import datetime
 from concurrent.futures import ThreadPoolExecutor
-from contextlib import suppress
 from typing import ClassVar, Optional
 
-with suppress(ImportError):
-    from langfuse.openai import AsyncOpenAI as LangfuseAsyncOpenAI
-    from langfuse.openai import OpenAI as LangfuseOpenAI
 from openai import AsyncOpenAI, OpenAI
 from openai.types import Embedding
 from openai.types.create_embedding_response import CreateEmbeddingResponse, Usage
 
+from ..base.clients import (
+    get_async_client,
+    get_client,
+    pooled_async_http_client,
+    pooled_http_client,
+)
+from ..base.rate_limiters import estimate_tokens
 from ..rag import BaseEmbedder
 from .types import OpenAIEmbeddingParams, OpenAIEmbeddingResponse
 
@@ -42,6 +45,95 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
 
     def embed(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
         """Call the embedder with multiple inputs"""
+        if self.embedding_params.cache is None:
+            return self._embed_batches(inputs)
+        misses, embeddings = self._cached_embeddings(inputs)
+        response = self._embed_batches(misses) if misses else None
+        return self._cached_response(
+            self._fill_embeddings(inputs, embeddings, misses, response), response
+        )
+
+    async def embed_async(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
+        """Asynchronously call the embedder with multiple inputs"""
+        if self.embedding_params.cache is None:
+            return await self._embed_batches_async(inputs)
+        misses, embeddings = self._cached_embeddings(inputs)
+        response = await self._embed_batches_async(misses) if misses else None
+        return self._cached_response(
+            self._fill_embeddings(inputs, embeddings, misses, response), response
+        )
+
+    def __call__(self, input: list[str]) -> list[list[float]]:
+        """Call the embedder with a input
+
+        Chroma expects parameter to be `input`.
+        """
+        embedding_response = self.embed(input)
+
+        return embedding_response.embeddings
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _client(self) -> OpenAI:
+        """Returns a pooled `OpenAI` client for this embedder's configuration."""
+
+        def create() -> OpenAI:
+            client_type = OpenAI
+            if self.embedding_params.langfuse:  # pragma: no cover
+                from langfuse.openai import OpenAI as client_type  # type: ignore
+
+            client = client_type(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=pooled_http_client(),
+            )
+            if self.embedding_params.logfire:
+                self.embedding_params.logfire(client)  # pragma: no cover
+            return client
+
+        return get_client(
+            (
+                "openai",
+                self.api_key,
+                self.base_url,
+                None,
+                self.embedding_params.langfuse,
+                self.embedding_params.logfire,
+            ),
+            create,
+        )
+
+    def _async_client(self) -> AsyncOpenAI:
+        """Returns a pooled `AsyncOpenAI` client for the running event loop."""
+
+        def create() -> AsyncOpenAI:
+            client_type = AsyncOpenAI
+            if self.embedding_params.langfuse:  # pragma: no cover
+                from langfuse.openai import AsyncOpenAI as client_type  # type: ignore
+
+            client = client_type(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=pooled_async_http_client(),
+            )
+            if self.embedding_params.logfire:
+                self.embedding_params.logfire(client)  # pragma: no cover
+            return client
+
+        return get_async_client(
+            (
+                "openai",
+                self.api_key,
+                self.base_url,
+                None,
+                self.embedding_params.langfuse,
+                self.embedding_params.logfire,
+            ),
+            create,
+        )
+
+    def _embed_batches(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
+        """Call the embedder with multiple inputs in parallel batches"""
         if self.embed_batch_size is None:
             return self._embed(inputs)
 
@@ -59,8 +151,8 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
         ]
         return self._merge_batch_embeddings(embedding_responses)
 
-    async def embed_async(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
-        """Asynchronously call the embedder with multiple inputs"""
+    async def _embed_batches_async(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
+        """Asynchronously call the embedder with multiple inputs in batches"""
         if self.embed_batch_size is None:
             return await self._embed_async(inputs)
 
@@ -73,29 +165,19 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
         )
         return self._merge_batch_embeddings(embedding_responses)
 
-    def __call__(self, input: list[str]) -> list[list[float]]:
-        """Call the embedder with a input
-
-        Chroma expects parameter to be `input`.
-        """
-        embedding_response = self.embed(input)
-
-        return embedding_response.embeddings
-
-    ############################## PRIVATE METHODS ###################################
-
     def _embed(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
         """Call the embedder with a single input"""
-        client = OpenAI(api_key=self.api_key, base_url=self.base_url)
-        if self.embedding_params.langfuse:  # pragma: no cover
-            client = LangfuseOpenAI(api_key=self.api_key, base_url=self.base_url)
-        if self.embedding_params.logfire:
-            self.embedding_params.logfire(client)  # pragma: no cover
+        client = self._client()
         kwargs = self.embedding_params.kwargs()
         if self.embedding_params.model != "text-embedding-ada-002":
             kwargs["dimensions"] = self.dimensions
+        limiter, tokens = self.embedding_params.rate_limiter, estimate_tokens(inputs)
+        if limiter is not None:
+            limiter.acquire(tokens)
         start_time = datetime.datetime.now().timestamp() * 1000
         embeddings = client.embeddings.create(input=inputs, **kwargs)
+        if limiter is not None:
+            limiter.reconcile(tokens, embeddings.usage.total_tokens)
         return OpenAIEmbeddingResponse(
             response=embeddings,
             start_time=start_time,
@@ -104,16 +186,17 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
 
     async def _embed_async(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
         """Asynchronously call the embedder with a single input"""
-        client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
-        if self.embedding_params.langfuse:  # pragma: no cover
-            client = LangfuseAsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
-        if self.embedding_params.logfire:
-            self.embedding_params.logfire(client)  # pragma: no cover
+        client = self._async_client()
         kwargs = self.embedding_params.kwargs()
         if self.embedding_params.model != "text-embedding-ada-002":
             kwargs["dimensions"] = self.dimensions
+        limiter, tokens = self.embedding_params.rate_limiter, estimate_tokens(inputs)
+        if limiter is not None:
+            await limiter.acquire_async(tokens)
         start_time = datetime.datetime.now().timestamp() * 1000
         embeddings = await client.embeddings.create(input=inputs, **kwargs)
+        if limiter is not None:
+            limiter.reconcile(tokens, embeddings.usage.total_tokens)
         return OpenAIEmbeddingResponse(
             response=embeddings,
             start_time=start_time,
@@ -152,3 +235,32 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
             start_time=start_time,
             end_time=end_time,
         )
+
+    def _cached_response(
+        self,
+        embeddings: list[list[float]],
+        response: Optional[OpenAIEmbeddingResponse],
+    ) -> OpenAIEmbeddingResponse:
+        """Returns a response with `embeddings`, the cached ones included.
+
+        The usage is that of `response`, which only embedded the cache misses.
+        """
+        data = [
+            Embedding(embedding=embedding, index=i, object="embedding")
+            for i, embedding in enumerate(embeddings)
+        ]
+        if response is None:
+            now = datetime.datetime.now().timestamp() * 1000
+            return OpenAIEmbeddingResponse(
+                response=CreateEmbeddingResponse(
+                    data=data,
+                    model=self.embedding_params.model,
+                    object="list",
+                    usage=Usage(prompt_tokens=0, total_tokens=0),
+                ),
+                start_time=now,
+                end_time=now,
+            )
+        return response.model_copy(
+            update={"response": response.response.model_copy(update={"data": data})}
+        )
@@ -2,11 +2,21 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, AsyncGenerator, ClassVar, Generator, Generic, TypeVar, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    ClassVar,
+    Generator,
+    Generic,
+    Sequence,
+    TypeVar,
+    Union,
+)
 
 from tenacity import AsyncRetrying, Retrying
 
 from ..base import BaseExtractor, ExtractedType
+from ..base.retries import RetryPolicy
 from .calls import OpenAICall
 from .tool_streams import OpenAIToolStream
 from .tools import OpenAITool
@@ -58,7 +68,9 @@ class OpenAIExtractor(
 
     call_params: ClassVar[OpenAICallParams] = OpenAICallParams()
 
-    def extract(self, retries: Union[int, Retrying] = 0, **kwargs: Any) -> T:
+    def extract(
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
+    ) -> T:
         """Extracts `extract_schema` from the OpenAI call response.
 
         The `extract_schema` is converted into an `OpenAITool`, complete with a
@@ -84,7 +96,7 @@ class OpenAIExtractor(
         return self._extract(OpenAICall, OpenAITool, retries, **kwargs)
 
     async def extract_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> T:
         """Asynchronously extracts `extract_schema` from the OpenAI call response.
 
@@ -110,8 +122,73 @@ class OpenAIExtractor(
         """
         return await self._extract_async(OpenAICall, OpenAITool, retries, **kwargs)
 
+    @classmethod
+    def extract_many(
+        cls,
+        extractors: Sequence[OpenAIExtractor[T]],
+        retries: Union[int, Retrying, RetryPolicy] = 0,
+        **kwargs: Any,
+    ) -> list[T]:
+        """Extracts `extract_schema` for many extractors in a single OpenAI call.
+
+        The rendered prompts of the extractors are packed as records into a single
+        prompt, amortizing the system prompt and schema tokens across all of them. Each
+        extracted item is validated on its own, and only the records whose item is
+        missing or invalid are re-asked on retries.
+
+        Args:
+            extractors: The extractors to extract from. They must share the same
+                `extract_schema` (a `BaseModel` or base type), call params and system
+                messages.
+            retries: The maximum number of times to retry the query on validation error.
+            **kwargs: Additional keyword arguments parameters to pass to the call. These
+                will override any existing arguments in `call_params`.
+
+        Returns:
+            The `extract_schema` instance extracted for each extractor, in order.
+
+        Raises:
+            ValueError: if the extractors' `extract_schema` isn't supported, or if any
+                records are missing or invalid.
+            OpenAIError: raises any OpenAI errors, see:
+                https://platform.openai.com/docs/guides/error-codes/api-errors
+        """
+        return cls._extract_many(OpenAICall, OpenAITool, extractors, retries, **kwargs)
+
+    @classmethod
+    async def extract_many_async(
+        cls,
+        extractors: Sequence[OpenAIExtractor[T]],
+        retries: Union[int, AsyncRetrying, RetryPolicy] = 0,
+        **kwargs: Any,
+    ) -> list[T]:
+        """Asynchronously extracts `extract_schema` for many extractors in one call.
+
+        See `extract_many` for details.
+
+        Args:
+            extractors: The extractors to extract from. They must share the same
+                `extract_schema` (a `BaseModel` or base type), call params and system
+                messages.
+            retries: The maximum number of times to retry the query on validation error.
+            **kwargs: Additional keyword arguments parameters to pass to the call. These
+                will override any existing arguments in `call_params`.
+
+        Returns:
+            The `extract_schema` instance extracted for each extractor, in order.
+
+        Raises:
+            ValueError: if the extractors' `extract_schema` isn't supported, or if any
+                records are missing or invalid.
+            OpenAIError: raises any OpenAI errors, see:
+                https://platform.openai.com/docs/guides/error-codes/api-errors
+        """
+        return await cls._extract_many_async(
+            OpenAICall, OpenAITool, extractors, retries, **kwargs
+        )
+
     def stream(
-        self, retries: Union[int, Retrying] = 0, **kwargs: Any
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
     ) -> Generator[T, None, None]:
         """Streams partial instances of `extract_schema` as the schema is streamed.
 
@@ -138,7 +215,7 @@ class OpenAIExtractor(
         )
 
     async def stream_async(
-        self, retries: Union[int, AsyncRetrying] = 0, **kwargs: Any
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
     ) -> AsyncGenerator[T, None]:
         """Asynchronously streams partial instances of `extract_schema` as streamed.
 
@@ -164,3 +241,59 @@ class OpenAIExtractor(
             OpenAICall, OpenAITool, OpenAIToolStream, retries, **kwargs
         ):
             yield partial_tool
+
+    def stream_items(
+        self, retries: Union[int, Retrying, RetryPolicy] = 0, **kwargs: Any
+    ) -> Generator[Any, None, None]:
+        """Streams each item of a `list[...]` `extract_schema` as soon as it's complete.
+
+        Each item is validated and yielded once the model starts generating the next
+        one, so items can be processed while the rest of the list is still streaming.
+
+        Args:
+            retries: The maximum number of times to retry the query on validation error.
+                Only failures before the first item is yielded are retried.
+            **kwargs: Additional keyword argument parameters to pass to the call. These
+                will override any existing arguments in `call_params`.
+
+        Yields:
+            Each validated item of the extracted list, in order.
+
+        Raises:
+            AttributeError: if there is no tool in the call creation.
+            ValueError: if `extract_schema` isn't a `list[...]` type.
+            ValidationError: if an item cannot be instantiated from the completion.
+            OpenAIError: raises any OpenAI errors, see:
+                https://platform.openai.com/docs/guides/error-codes/api-errors
+        """
+        yield from self._stream_items(
+            OpenAICall, OpenAITool, OpenAIToolStream, retries, **kwargs
+        )
+
+    async def stream_items_async(
+        self, retries: Union[int, AsyncRetrying, RetryPolicy] = 0, **kwargs: Any
+    ) -> AsyncGenerator[Any, None]:
+        """Asynchronously streams each item of a `list[...]` `extract_schema`.
+
+        See `stream_items` for details.
+
+        Args:
+            retries: The maximum number of times to retry the query on validation error.
+                Only failures before the first item is yielded are retried.
+            **kwargs: Additional keyword arguments parameters to pass to the call. These
+                will override any existing arguments in `call_params`.
+
+        Yields:
+            Each validated item of the extracted list, in order.
+
+        Raises:
+            AttributeError: if there is no tool in the call creation.
+            ValueError: if `extract_schema` isn't a `list[...]` type.
+            ValidationError: if an item cannot be instantiated from the completion.
+            OpenAIError: raises any OpenAI errors, see:
+                https://platform.openai.com/docs/guides/error-codes/api-errors
+        """
+        async for item in self._stream_items_async(
+            OpenAICall, OpenAITool, OpenAIToolStream, retries, **kwargs
+        ):
+            yield item
@@ -1,16 +1,32 @@
 """A module for convenience around streaming tools with OpenAI."""
+from copy import deepcopy
 from typing import AsyncGenerator, Generator, Literal, Optional, Type, overload
 
 from openai.types.chat.chat_completion_message_tool_call import (
     ChatCompletionMessageToolCall,
     Function,
 )
-from openai.types.chat.completion_create_params import ResponseFormat
 
+from ..base.partial_json import IncrementalJSONParser
 from ..base.tool_streams import BaseToolStream
 from ..partial import partial
 from .tools import OpenAITool
 from .types import OpenAICallResponseChunk
+from .utils import is_json_mode
+
+
+def _partial_tool(
+    tool_type: Type[OpenAITool],
+    tool_call: ChatCompletionMessageToolCall,
+    parser: IncrementalJSONParser,
+) -> OpenAITool:
+    """Returns the partial tool for the arguments parsed so far.
+
+    The parser updates its value in place, so the tool gets a deep copy that later
+    chunks don't change.
+    """
+    model_json = {**deepcopy(parser.value), "tool_call": tool_call.model_dump()}
+    return partial(tool_type).model_validate(model_json)
 
 
 def _handle_chunk(
@@ -18,24 +34,32 @@ def _handle_chunk(
     current_tool_call: ChatCompletionMessageToolCall,
     current_tool_type: Optional[Type[OpenAITool]],
     allow_partial: bool,
+    parser: IncrementalJSONParser,
 ) -> tuple[
     Optional[OpenAITool],
     ChatCompletionMessageToolCall,
     Optional[Type[OpenAITool]],
+    IncrementalJSONParser,
     bool,
 ]:
-    """Handles a chunk of the stream."""
+    """Handles a chunk of the stream.
+
+    The `parser` incrementally parses the current tool call's arguments so that each
+    partial tool only costs parsing the new chunk rather than all arguments so far.
+    """
     if not chunk.tool_types:
-        return None, current_tool_call, current_tool_type, False
+        return None, current_tool_call, current_tool_type, parser, False
 
-    if chunk.response_format == ResponseFormat(type="json_object"):
+    if is_json_mode(chunk.response_format):
         # Note: we only handle single tool calls in JSON mode.
         current_tool_type = chunk.tool_types[0]
         if chunk.content:
             current_tool_call.function.arguments += chunk.content
             if allow_partial:
+                parser.feed(chunk.content)
                 return (
-                    partial(current_tool_type).from_tool_call(
+                    _partial_tool(
+                        current_tool_type,
                         ChatCompletionMessageToolCall(
                             id="id",
                             function=Function(
@@ -44,16 +68,17 @@ def _handle_chunk(
                             ),
                             type="function",
                         ),
-                        allow_partial=allow_partial,
+                        parser,
                     ),
                     current_tool_call,
                     current_tool_type,
+                    parser,
                     False,
                 )
-        return None, current_tool_call, current_tool_type, False
+        return None, current_tool_call, current_tool_type, parser, False
 
     if not chunk.tool_calls:
-        return None, current_tool_call, current_tool_type, False
+        return None, current_tool_call, current_tool_type, parser, False
 
     tool_call = chunk.tool_calls[0]
     # Reset on new tool
@@ -69,6 +94,7 @@ def _handle_chunk(
             type="function",
         )
         current_tool_type = None
+        parser = IncrementalJSONParser()
         for tool_type in chunk.tool_types:
             if tool_type.__name__ == tool_call.function.name:
                 current_tool_type = tool_type
@@ -84,6 +110,7 @@ def _handle_chunk(
                 ),
                 current_tool_call,
                 current_tool_type,
+                parser,
                 True,
             )
 
@@ -92,16 +119,16 @@ def _handle_chunk(
         current_tool_call.function.arguments += tool_call.function.arguments
 
         if allow_partial and current_tool_type:
+            parser.feed(tool_call.function.arguments)
             return (
-                partial(current_tool_type).from_tool_call(
-                    current_tool_call, allow_partial=True
-                ),
+                _partial_tool(current_tool_type, current_tool_call, parser),
                 current_tool_call,
                 current_tool_type,
+                parser,
                 False,
             )
 
-    return None, current_tool_call, current_tool_type, False
+    return None, current_tool_call, current_tool_type, parser, False
 
 
 class OpenAIToolStream(BaseToolStream[OpenAICallResponseChunk, OpenAITool]):
@@ -150,9 +177,16 @@ class OpenAIToolStream(BaseToolStream[OpenAICallResponseChunk, OpenAITool]):
             id="", function=Function(arguments="", name=""), type="function"
         )
         current_tool_type = None
+        parser = IncrementalJSONParser()
         for chunk in stream:
-            tool, current_tool_call, current_tool_type, starting_new = _handle_chunk(
-                chunk, current_tool_call, current_tool_type, allow_partial
+            (
+                tool,
+                current_tool_call,
+                current_tool_type,
+                parser,
+                starting_new,
+            ) = _handle_chunk(
+                chunk, current_tool_call, current_tool_type, allow_partial, parser
             )
             if tool is not None:
                 yield tool
@@ -204,9 +238,16 @@ class OpenAIToolStream(BaseToolStream[OpenAICallResponseChunk, OpenAITool]):
             id="", function=Function(arguments="", name=""), type="function"
         )
         current_tool_type = None
+        parser = IncrementalJSONParser()
         async for chunk in async_stream:
-            tool, current_tool_call, current_tool_type, starting_new = _handle_chunk(
-                chunk, current_tool_call, current_tool_type, allow_partial
+            (
+                tool,
+                current_tool_call,
+                current_tool_type,
+                parser,
+                starting_new,
+            ) = _handle_chunk(
+                chunk, current_tool_call, current_tool_type, allow_partial, parser
             )
             if tool is not None:
                 yield tool
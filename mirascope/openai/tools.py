@@ -2,13 +2,13 @@
 from __future__ import annotations
 
 import json
-from typing import Callable, Type, cast
+from typing import Any, Callable, Type, cast
 
 from openai.types.chat import ChatCompletionMessageToolCall, ChatCompletionToolParam
 from pydantic import BaseModel
 from pydantic_core import from_json
 
-from ..base import BaseTool, BaseType
+from ..base import BaseTool, BaseType, cached_tool_schema
 from ..base.utils import (
     convert_base_model_to_tool,
     convert_base_type_to_tool,
@@ -16,6 +16,42 @@ from ..base.utils import (
 )
 
 
+def _strict_schema(schema: Any) -> Any:
+    """Returns a copy of a JSON schema that is valid for OpenAI's strict mode.
+
+    Strict mode requires every object to list all of its properties as required and to
+    forbid additional properties, and it doesn't support `default`s. Optional fields
+    remain nullable, so they can still be `None`.
+
+    Raises:
+        ValueError: if the schema has a free-form object (e.g. a `dict[str, int]` or
+            `dict` field, or a model that allows extra fields), which strict mode can't
+            represent.
+    """
+    if isinstance(schema, list):
+        return [_strict_schema(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    strict: dict[str, Any] = {}
+    for key, value in schema.items():
+        if key == "default":
+            continue
+        if key in ("properties", "$defs"):
+            strict[key] = {name: _strict_schema(item) for name, item in value.items()}
+        else:
+            strict[key] = _strict_schema(value)
+    if strict.get("type") == "object":
+        if strict.get("additionalProperties", "properties" not in strict) is not False:
+            raise ValueError(
+                "OpenAI's strict mode doesn't support objects with arbitrary keys, "
+                f"such as dictionaries, but got {json.dumps(schema)}. Use a model with "
+                "fixed fields instead."
+            )
+        strict["required"] = list(strict.get("properties", {}))
+        strict["additionalProperties"] = False
+    return strict
+
+
 class OpenAITool(BaseTool[ChatCompletionMessageToolCall]):
     '''A base class for easy use of tools with the OpenAI Chat client.
 
@@ -62,6 +98,7 @@ class OpenAITool(BaseTool[ChatCompletionMessageToolCall]):
     '''
 
     @classmethod
+    @cached_tool_schema
     def tool_schema(cls) -> ChatCompletionToolParam:
         """Constructs a tool schema for use with the OpenAI Chat client.
 
@@ -75,6 +112,27 @@ class OpenAITool(BaseTool[ChatCompletionMessageToolCall]):
         fn = super().tool_schema()
         return cast(ChatCompletionToolParam, {"type": "function", "function": fn})
 
+    @classmethod
+    @cached_tool_schema
+    def json_schema(cls) -> dict[str, Any]:
+        """Constructs the `json_schema` of a structured outputs `response_format`.
+
+        The tool's parameters are converted into a strict schema so that the model's
+        response is guaranteed to match it. The schema is cached per tool class and
+        must not be mutated.
+
+        Returns:
+            The `json_schema` of a `JSONSchemaResponseFormat`.
+        """
+        fn = cls.tool_schema()["function"]
+        parameters = fn.get("parameters", {"type": "object", "properties": {}})
+        return {
+            "name": fn["name"],
+            "description": fn["description"],
+            "schema": _strict_schema(parameters),
+            "strict": True,
+        }
+
     @classmethod
     def from_tool_call(
         cls,
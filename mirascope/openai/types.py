@@ -21,6 +21,7 @@ from openai.types.chat.completion_create_params import ResponseFormat
 from openai.types.completion_usage import CompletionUsage
 from openai.types.create_embedding_response import CreateEmbeddingResponse
 from pydantic import ConfigDict
+from typing_extensions import Required, TypedDict
 
 from ..base import (
     BaseCallParams,
@@ -29,6 +30,22 @@ from ..base import (
 )
 from ..rag import BaseEmbeddingParams, BaseEmbeddingResponse
 from .tools import OpenAITool
+from .utils import is_json_mode
+
+
+class JSONSchemaResponseFormat(TypedDict, total=False):
+    """The `response_format` for OpenAI's structured outputs.
+
+    When the call has tools, `json_schema` defaults to the strict schema of the first
+    tool (see `OpenAITool.json_schema`), so the response's content is that tool's
+    arguments and no tool call or schema message is needed.
+    """
+
+    type: Required[Literal["json_schema"]]
+    json_schema: dict[str, Any]
+
+
+OpenAIResponseFormat = Union[ResponseFormat, JSONSchemaResponseFormat]
 
 
 class OpenAICallParams(BaseCallParams[OpenAITool]):
@@ -41,7 +58,7 @@ class OpenAICallParams(BaseCallParams[OpenAITool]):
     max_tokens: Optional[int] = None
     n: Optional[int] = None
     presence_penalty: Optional[float] = None
-    response_format: Optional[ResponseFormat] = None
+    response_format: Optional[OpenAIResponseFormat] = None
     seed: Optional[int] = None
     stop: Union[Optional[str], list[str]] = None
     temperature: Optional[float] = None
@@ -66,11 +83,12 @@ class OpenAICallParams(BaseCallParams[OpenAITool]):
         self,
         tool_type: Optional[Type[OpenAITool]] = OpenAITool,
         exclude: Optional[set[str]] = None,
+        overrides: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
         """Returns the keyword argument call parameters."""
         extra_exclude = {"wrapper", "wrapper_async"}
         exclude = extra_exclude if exclude is None else exclude.union(extra_exclude)
-        return super().kwargs(tool_type, exclude)
+        return super().kwargs(tool_type, exclude, overrides)
 
 
 class OpenAICallResponse(BaseCallResponse[ChatCompletion, OpenAITool]):
@@ -108,7 +126,7 @@ class OpenAICallResponse(BaseCallResponse[ChatCompletion, OpenAITool]):
     ```
     """
 
-    response_format: Optional[ResponseFormat] = None
+    response_format: Optional[OpenAIResponseFormat] = None
 
     @property
     def choices(self) -> list[Choice]:
@@ -160,7 +178,7 @@ class OpenAICallResponse(BaseCallResponse[ChatCompletion, OpenAITool]):
                 )
             ]
 
-        if self.response_format != ResponseFormat(type="json_object"):
+        if not is_json_mode(self.response_format):
             if not self.tool_calls:
                 # Let's see if we got an assistant message back instead and try to
                 # reconstruct a tool call in this case. We'll assume if it starts with
@@ -264,7 +282,7 @@ class OpenAICallResponseChunk(BaseCallResponseChunk[ChatCompletionChunk, OpenAIT
     #  .
     """
 
-    response_format: Optional[ResponseFormat] = None
+    response_format: Optional[OpenAIResponseFormat] = None
 
     @property
     def choices(self) -> list[ChunkChoice]:
@@ -304,6 +322,17 @@ class OpenAICallResponseChunk(BaseCallResponseChunk[ChatCompletionChunk, OpenAIT
             return self.delta.tool_calls
         return None
 
+    ############################## PRIVATE METHODS ###################################
+
+    def _with_content(self, content: str) -> "OpenAICallResponseChunk":
+        """Returns a copy of the chunk whose 0th choice delta has `content`."""
+        choices = list(self.chunk.choices)
+        delta = choices[0].delta.model_copy(update={"content": content})
+        choices[0] = choices[0].model_copy(update={"delta": delta})
+        return self.model_copy(
+            update={"chunk": self.chunk.model_copy(update={"choices": choices})}
+        )
+
 
 class OpenAIEmbeddingResponse(BaseEmbeddingResponse[CreateEmbeddingResponse]):
     """A convenience wrapper around the OpenAI `CreateEmbeddingResponse` response."""
@@ -1,5 +1,5 @@
 """A module for utility functions for working with OpenAI."""
-from typing import Optional
+from typing import Any, Optional
 
 from openai.types.completion_usage import CompletionUsage
 
@@ -98,3 +98,14 @@ def openai_api_calculate_cost(
     total_cost = prompt_cost + completion_cost
 
     return total_cost
+
+
+def is_json_mode(response_format: Optional[Any]) -> bool:
+    """Returns whether the response content is JSON rather than text or tool calls.
+
+    This is the case for both the `json_object` and `json_schema` response formats.
+    """
+    return response_format is not None and response_format.get("type") in (
+        "json_object",
+        "json_schema",
+    )
@@ -15,6 +15,11 @@ from pydantic.fields import FieldInfo
 
 Model = TypeVar("Model", bound=BaseModel)
 
+# The partial model is stored on the wrapped class itself rather than in a weakly keyed
+# mapping since the partial model subclasses (and so strongly references) the wrapped
+# class, which would keep any mapping entry alive forever.
+_PARTIAL_ATTR = "__mirascope_partial__"
+
 
 def partial(wrapped_class: type[Model]) -> type[Model]:
     """Generate a new class with all attributes optionals.
@@ -32,7 +37,13 @@ def partial(wrapped_class: type[Model]) -> type[Model]:
 
     user = User(name="None")
     ```
+
+    The generated class is cached on `wrapped_class`, so repeated calls (e.g. for every
+    chunk of a stream) return the same class without rebuilding it.
     """
+    cached_partial = wrapped_class.__dict__.get(_PARTIAL_ATTR)
+    if cached_partial is not None:
+        return cached_partial
 
     def _make_field_optional(
         field: FieldInfo,
@@ -50,7 +61,7 @@ def partial(wrapped_class: type[Model]) -> type[Model]:
             tmp_field.default = None
         return tmp_field.annotation, tmp_field
 
-    return create_model(  # type: ignore[no-any-return, call-overload]
+    partial_model = create_model(  # type: ignore[call-overload]
         f"Partial{wrapped_class.__name__}",
         __base__=wrapped_class,
         __module__=wrapped_class.__module__,
@@ -60,3 +71,5 @@ def partial(wrapped_class: type[Model]) -> type[Model]:
             for field_name, field_info in wrapped_class.model_fields.items()
         },
     )
+    setattr(wrapped_class, _PARTIAL_ATTR, partial_model)
+    return partial_model
@@ -1,7 +1,7 @@
 """A module for calling Chroma's Client and Collection."""
 from contextlib import suppress
 from functools import cached_property
-from typing import Any, Callable, ClassVar, Optional, Union
+from typing import Any, Callable, ClassVar, Optional, Sequence, Union
 
 with suppress(ImportError):
     import weave
@@ -17,6 +17,9 @@ from .types import (
     PineconeSettings,
 )
 
+# The maximum number of ids Pinecone deletes per request
+_DELETE_BATCH_SIZE = 1000
+
 
 class PineconeVectorStore(BaseVectorStore):
     """A vectorstore for Pinecone.
@@ -103,9 +106,15 @@ class PineconeVectorStore(BaseVectorStore):
     def add(
         self,
         text: Union[str, list[Document]],
+        source: Optional[str] = None,
         **kwargs: Any,
     ) -> None:
-        """Takes unstructured data and upserts into vectorstore"""
+        """Takes unstructured data and upserts into vectorstore
+
+        If `source` is set, only the new or changed chunks of `source` are embedded and
+        upserted, and the chunks of a previous version of `source` that are gone are
+        deleted. Listing the chunks of `source` requires a serverless index.
+        """
         documents: list[Document]
         if isinstance(text, str):
             chunk = self.chunker.chunk
@@ -116,6 +125,13 @@ class PineconeVectorStore(BaseVectorStore):
             documents = chunk(text)
         else:
             documents = text
+        stale: list[str] = []
+        if source is not None:
+            documents, stale = self._diff(documents, source)
+        if not documents:
+            if stale:
+                self.delete(stale)
+            return
         inputs = [document.text for document in documents]
         embed = self.embedder.embed
         if self.vectorstore_params.weave is not None and not isinstance(
@@ -125,27 +141,48 @@ class PineconeVectorStore(BaseVectorStore):
                 self.embedder.embed
             )  # pragma: no cover
         embedding_repsonse: BaseEmbeddingResponse = embed(inputs)
-        if self.handle_add_text:
-            self.handle_add_text(documents)
         if embedding_repsonse.embeddings is None:
             raise ValueError("Embedding is None")
-        vectors = []
-        for i, embedding in enumerate(embedding_repsonse.embeddings):
-            if documents[i] is not None:
-                metadata = documents[i].metadata or {}
-                metadata_text = (
-                    {"text": documents[i].text}
-                    if documents[i].text and not self.handle_add_text
-                    else {}
-                )
-                vectors.append(
-                    {
-                        "id": documents[i].id,
-                        "values": embedding,
-                        "metadata": {**metadata, **metadata_text},
-                    }
-                )
-        return self._index.upsert(vectors, **kwargs)
+        self._upsert(documents, embedding_repsonse.embeddings, **kwargs)
+        if stale:
+            self.delete(stale)
+
+    def delete(self, ids: list[str]) -> None:
+        """Deletes the documents with the given ids from the vectorstore."""
+        for start in range(0, len(ids), _DELETE_BATCH_SIZE):
+            self._index.delete(ids=ids[start : start + _DELETE_BATCH_SIZE])
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _upsert(
+        self,
+        documents: list[Document],
+        embeddings: Sequence[Sequence[float]],
+        **kwargs: Any,
+    ) -> None:
+        """Upserts documents with precomputed embeddings into the vectorstore."""
+        if self.handle_add_text:
+            self.handle_add_text(documents)
+        vectors: list[dict[str, Any]] = []
+        for document, embedding in zip(documents, embeddings):
+            metadata = document.metadata or {}
+            metadata_text = (
+                {"text": document.text}
+                if document.text and not self.handle_add_text
+                else {}
+            )
+            vectors.append(
+                {
+                    "id": document.id,
+                    "values": embedding,
+                    "metadata": {**metadata, **metadata_text},
+                }
+            )
+        self._index.upsert(vectors, **kwargs)
+
+    def _source_ids(self, source: str) -> list[str]:
+        """Returns the ids of the documents added from `source`."""
+        return [id for ids in self._index.list(prefix=f"{source}#") for id in ids]
 
     ############################# PRIVATE PROPERTIES #################################
 
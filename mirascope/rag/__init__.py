@@ -1,6 +1,15 @@
 """A module for interacting with Mirascope RAG."""
-from .chunkers import BaseChunker, TextChunker
+from .chunkers import (
+    BaseChunker,
+    MarkdownChunker,
+    RecursiveChunker,
+    SentenceChunker,
+    TextChunker,
+    TokenChunker,
+    chunk_id,
+)
 from .embedders import BaseEmbedder
+from .pipelines import IngestionPipeline, IngestionProgress
 from .types import (
     BaseEmbeddingParams,
     BaseEmbeddingResponse,
@@ -12,11 +21,18 @@ from .vectorstores import BaseVectorStore
 
 __all__ = [
     "BaseChunker",
+    "MarkdownChunker",
+    "RecursiveChunker",
+    "SentenceChunker",
     "TextChunker",
+    "TokenChunker",
     "BaseEmbedder",
     "BaseEmbeddingParams",
     "BaseEmbeddingResponse",
     "BaseQueryResults",
     "BaseVectorStoreParams",
+    "chunk_id",
     "Document",
+    "IngestionPipeline",
+    "IngestionProgress",
 ]
@@ -1,2 +1,6 @@
+from .base_chunker import BaseChunker, chunk_id
+from .markdown_chunker import MarkdownChunker
+from .recursive_chunker import RecursiveChunker, word_tokenizer
+from .sentence_chunker import SentenceChunker
 from .text_chunker import TextChunker
-from .base_chunker import BaseChunker
+from .token_chunker import TokenChunker
@@ -1,5 +1,7 @@
 """Chunkers for the RAG module."""
+import hashlib
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, Union
 
 from pydantic import BaseModel
 
@@ -12,7 +14,7 @@ class BaseChunker(BaseModel, ABC):
     Example:
 
     ```python
-    from mirascope.rag import BaseChunker, Document
+    from mirascope.rag import BaseChunker, Document, chunk_id
 
 
     class TextChunker(BaseChunker):
@@ -24,7 +26,8 @@ class BaseChunker(BaseModel, ABC):
             start: int = 0
             while start < len(text):
                 end: int = min(start + self.chunk_size, len(text))
-                chunks.append(Document(text=text[start:end], id=str(uuid.uuid4())))
+                chunk = text[start:end]
+                chunks.append(Document(text=chunk, id=chunk_id(chunk, start)))
                 start += self.chunk_size - self.chunk_overlap
             return chunks
     ```
@@ -34,3 +37,20 @@ class BaseChunker(BaseModel, ABC):
     def chunk(self, text: str) -> list[Document]:
         """Returns a Document that contains an id, text, and optionally metadata."""
         ...  # pragma: no cover
+
+    def iter_chunks(self, source: Union[str, Iterable[str]]) -> Iterator[Document]:
+        """Yields the chunks of `source`, a text or a stream of text such as a file.
+
+        This implementation reads all of `source` and chunks it with `chunk`. Chunkers
+        that can chunk a stream with bounded memory override it.
+        """
+        yield from self.chunk(source if isinstance(source, str) else "".join(source))
+
+
+def chunk_id(text: str, offset: int) -> str:
+    """Returns a deterministic id for the chunk `text` starting at `offset`.
+
+    The id is the offset followed by a hash of the content, so chunking the same text
+    twice yields the same ids and upserting its chunks again doesn't duplicate them.
+    """
+    return f"{offset}-{hashlib.sha256(text.encode()).hexdigest()[:16]}"
@@ -0,0 +1,30 @@
+"""Markdown chunker for the RAG module"""
+from .recursive_chunker import RecursiveChunker
+
+
+class MarkdownChunker(RecursiveChunker):
+    """A chunker that splits a markdown text into chunks of sections.
+
+    The text is split before each heading, from top-level headings down to `######`,
+    then between paragraphs, sentences and words.
+
+    Example:
+
+    ```python
+    from mirascope.rag import MarkdownChunker
+
+    markdown_chunker = MarkdownChunker(chunk_size=512)
+    with open("README.md") as file:
+        for document in markdown_chunker.iter_chunks(file):
+            print(document.text)
+    ```
+    """
+
+    separators: list[str] = [
+        *(rf"\n(?=#{{{level}}} )" for level in range(1, 7)),
+        r"\n\s*\n",
+        r"\n",
+        r"(?<=[.!?])\s+",
+        r"\s+",
+        "",
+    ]
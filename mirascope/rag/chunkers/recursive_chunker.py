@@ -0,0 +1,153 @@
+"""Recursive chunker for the RAG module"""
+import re
+from collections import deque
+from typing import Callable, Iterable, Iterator, Union
+
+from ..types import Document
+from .base_chunker import BaseChunker, chunk_id
+
+word_tokenizer: Callable[[str], list[str]] = re.compile(r"\w+|[^\w\s]").findall
+"""Splits text into words and punctuation, the default tokenizer of chunkers."""
+
+
+class RecursiveChunker(BaseChunker):
+    """A chunker that splits a text on boundaries into chunks of at most a token count.
+
+    The text is split on the first separator, and each piece with more than
+    `chunk_size` tokens is recursively split on the next separator. The pieces are then
+    merged into chunks of up to `chunk_size` tokens, each starting with up to
+    `chunk_overlap` tokens of the end of the previous chunk. Separators are regular
+    expressions whose matches end the preceding piece, and the empty separator splits
+    a piece into windows of `chunk_size` characters.
+
+    Example:
+
+    ```python
+    import tiktoken
+    from mirascope.rag import RecursiveChunker
+
+    chunker = RecursiveChunker(
+        chunk_size=512,
+        chunk_overlap=64,
+        tokenizer=tiktoken.get_encoding("cl100k_base").encode,
+    )
+    with open(f"{PATH_TO_FILE}") as file:
+        for document in chunker.iter_chunks(file):
+            print(document.text)
+    ```
+
+    Attributes:
+        chunk_size: The maximum number of tokens in a chunk.
+        chunk_overlap: The maximum number of tokens a chunk repeats from the previous.
+        separators: The regular expressions to split on, in order of preference.
+        tokenizer: Splits a text into the tokens that are counted. Any function that
+            returns a list works, e.g. a `tiktoken` encoding's `encode`.
+        buffer_size: The number of characters `iter_chunks` reads before chunking. The
+            buffer is cut at the last match of the first separator in it, so chunks
+            only differ from `chunk`'s within a piece longer than this.
+    """
+
+    chunk_size: int
+    chunk_overlap: int = 0
+    separators: list[str] = [r"\n\s*\n", r"\n", r"(?<=[.!?])\s+", r"\s+", ""]
+    tokenizer: Callable[[str], list] = word_tokenizer
+    buffer_size: int = 1 << 20
+
+    def chunk(self, text: str) -> list[Document]:
+        return list(self.iter_chunks(text))
+
+    def iter_chunks(self, source: Union[str, Iterable[str]]) -> Iterator[Document]:
+        """Yields the chunks of `source`, keeping about `buffer_size` characters."""
+        for text, offset in self._merge(self._stream_pieces(source)):
+            stripped = text.lstrip()
+            offset += len(text) - len(stripped)
+            stripped = stripped.rstrip()
+            if stripped:
+                yield Document(text=stripped, id=chunk_id(stripped, offset))
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _stream_pieces(self, source: Union[str, Iterable[str]]) -> Iterator[str]:
+        """Yields the pieces of `source`, splitting it every `buffer_size` characters."""
+        buffer: list[str] = []
+        size = 0
+        for text in [source] if isinstance(source, str) else source:
+            buffer.append(text)
+            size += len(text)
+            if size >= self.buffer_size:
+                joined = "".join(buffer)
+                cut = self._last_cut(joined)
+                yield from self._pieces(joined[:cut])
+                buffer, size = [joined[cut:]], len(joined) - cut
+        yield from self._pieces("".join(buffer))
+
+    def _pieces(self, text: str) -> Iterator[str]:
+        """Yields the pieces of `text`, each split until it fits in a chunk."""
+        for piece in self._split(text, 0):
+            yield from self._fit(piece, 1)
+
+    def _fit(self, text: str, level: int) -> Iterator[str]:
+        """Yields `text` if it fits in a chunk, otherwise the pieces it splits into."""
+        if level == len(self.separators) or self._count(text) <= self.chunk_size:
+            yield text
+            return
+        for piece in self._split(text, level):
+            yield from self._fit(piece, level + 1)
+
+    def _split(self, text: str, level: int) -> list[str]:
+        """Returns `text` split after each match of the separator at `level`."""
+        if level >= len(self.separators):
+            return [text] if text else []
+        separator = self.separators[level]
+        if not separator:
+            return [
+                text[start : start + self.chunk_size]
+                for start in range(0, len(text), self.chunk_size)
+            ]
+        pieces, start = [], 0
+        for match in re.finditer(separator, text):
+            if start < match.end() < len(text):
+                pieces.append(text[start : match.end()])
+                start = match.end()
+        if start < len(text):
+            pieces.append(text[start:])
+        return pieces
+
+    def _last_cut(self, text: str) -> int:
+        """Returns where to cut a buffer so its start splits like the whole text.
+
+        Matches that end the buffer are skipped since more text may extend them.
+        """
+        for separator in self.separators:
+            if not separator:
+                break
+            ends = [
+                match.end()
+                for match in re.finditer(separator, text)
+                if 0 < match.end() < len(text)
+            ]
+            if ends:
+                return ends[-1]
+        return len(text)
+
+    def _merge(self, pieces: Iterable[str]) -> Iterator[tuple[str, int]]:
+        """Yields the text and offset of chunks of consecutive pieces that fit."""
+        window: deque[tuple[str, int, int]] = deque()
+        size = offset = 0
+        for piece in pieces:
+            tokens = self._count(piece)
+            if window and size + tokens > self.chunk_size:
+                yield "".join(text for text, _, _ in window), window[0][2]
+                while window and (
+                    size > self.chunk_overlap or size + tokens > self.chunk_size
+                ):
+                    size -= window.popleft()[1]
+            window.append((piece, tokens, offset))
+            size += tokens
+            offset += len(piece)
+        if window:
+            yield "".join(text for text, _, _ in window), window[0][2]
+
+    def _count(self, text: str) -> int:
+        """Returns the number of tokens in `text`."""
+        return len(self.tokenizer(text))
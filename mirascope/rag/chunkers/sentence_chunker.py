@@ -0,0 +1,21 @@
+"""Sentence chunker for the RAG module"""
+from .recursive_chunker import RecursiveChunker
+
+
+class SentenceChunker(RecursiveChunker):
+    """A chunker that splits a text into chunks of whole paragraphs or sentences.
+
+    Sentences are only split between words if a single sentence doesn't fit in a chunk.
+
+    Example:
+
+    ```python
+    from mirascope.rag import SentenceChunker
+
+    sentence_chunker = SentenceChunker(chunk_size=256, chunk_overlap=32)
+    chunks = sentence_chunker.chunk("This is a sentence. This is another sentence.")
+    print(chunks)
+    ```
+    """
+
+    separators: list[str] = [r"\n\s*\n", r"(?<=[.!?])\s+", r"\s+", ""]
@@ -1,8 +1,8 @@
 """Text chunker for the RAG module"""
-import uuid
+from typing import Iterable, Iterator, Union
 
 from ..types import Document
-from .base_chunker import BaseChunker
+from .base_chunker import BaseChunker, chunk_id
 
 
 class TextChunker(BaseChunker):
@@ -27,6 +27,30 @@ class TextChunker(BaseChunker):
         start: int = 0
         while start < len(text):
             end: int = min(start + self.chunk_size, len(text))
-            chunks.append(Document(text=text[start:end], id=str(uuid.uuid4())))
+            chunk = text[start:end]
+            chunks.append(Document(text=chunk, id=chunk_id(chunk, start)))
             start += self.chunk_size - self.chunk_overlap
         return chunks
+
+    def iter_chunks(self, source: Union[str, Iterable[str]]) -> Iterator[Document]:
+        """Yields the same chunks as `chunk`, only keeping a chunk's worth of text."""
+        step = self.chunk_size - self.chunk_overlap
+        buffer, start, offset = "", 0, 0
+        for text in [source] if isinstance(source, str) else source:
+            buffer, start, offset = buffer[start:] + text, 0, offset + start
+            while len(buffer) - start >= self.chunk_size:
+                yield self._document(
+                    buffer[start : start + self.chunk_size], offset + start
+                )
+                start += step
+        while start < len(buffer):
+            yield self._document(
+                buffer[start : start + self.chunk_size], offset + start
+            )
+            start += step
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _document(self, text: str, offset: int) -> Document:
+        """Returns the chunk `text` starting at `offset` as a document."""
+        return Document(text=text, id=chunk_id(text, offset))
@@ -0,0 +1,21 @@
+"""Token chunker for the RAG module"""
+from .recursive_chunker import RecursiveChunker
+
+
+class TokenChunker(RecursiveChunker):
+    """A chunker that splits a text into chunks of a number of tokens, ignoring layout.
+
+    Chunks are cut between words, or between characters for words longer than a chunk.
+
+    Example:
+
+    ```python
+    from mirascope.rag import TokenChunker
+
+    token_chunker = TokenChunker(chunk_size=256, chunk_overlap=32)
+    chunks = token_chunker.chunk("This is a long text that I want to split into chunks.")
+    print(chunks)
+    ```
+    """
+
+    separators: list[str] = [r"\s+", ""]
@@ -1,9 +1,11 @@
 """Embedders for the RAG module."""
+import json
 from abc import ABC, abstractmethod
-from typing import ClassVar, Generic, Optional, TypeVar
+from typing import Any, ClassVar, Generic, Optional, TypeVar
 
 from pydantic import BaseModel
 
+from ..base.caches import cache_key
 from .types import BaseEmbeddingParams, BaseEmbeddingResponse
 
 BaseEmbeddingT = TypeVar("BaseEmbeddingT", bound=BaseEmbeddingResponse)
@@ -28,3 +30,64 @@ class BaseEmbedder(BaseModel, Generic[BaseEmbeddingT], ABC):
     async def embed_async(self, input: list[str]) -> BaseEmbeddingT:
         """Asynchronously call the embedder with a single input"""
         ...  # pragma: no cover
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _cache_keys(self, inputs: list[str]) -> list[str]:
+        """Returns the cache key of each input.
+
+        Keys hash the text along with the base URL, dimensions and every parameter
+        sent to the provider (e.g. the model and Cohere's `input_type`), so changing
+        any of them never serves a stale embedding.
+        """
+        params = cache_key(
+            self.base_url, self.dimensions, self.embedding_params.kwargs()
+        )
+        return [cache_key(params, text) for text in inputs]
+
+    def _cached_embeddings(
+        self, inputs: list[str]
+    ) -> tuple[list[str], list[Optional[list[Any]]]]:
+        """Returns the unique inputs missing from the cache and each input's embedding.
+
+        The embeddings of inputs missing from the cache are `None`.
+        """
+        cache = self.embedding_params.cache
+        assert cache is not None
+        embeddings: list[Optional[list[Any]]] = []
+        for key in self._cache_keys(inputs):
+            value = cache.get(key)
+            embeddings.append(json.loads(value) if value is not None else None)
+        misses = list(
+            dict.fromkeys(
+                text for text, embedding in zip(inputs, embeddings) if embedding is None
+            )
+        )
+        return misses, embeddings
+
+    def _fill_embeddings(
+        self,
+        inputs: list[str],
+        embeddings: list[Optional[list[Any]]],
+        misses: list[str],
+        response: Optional[BaseEmbeddingT],
+    ) -> list[list[Any]]:
+        """Caches the embeddings of `misses` and returns every input's embedding.
+
+        Args:
+            inputs: The inputs to embed.
+            embeddings: The cached embedding of each input, `None` if missing.
+            misses: The unique inputs that were embedded by the provider.
+            response: The provider's response for `misses`, `None` if there were none.
+        """
+        if response is None or response.embeddings is None:
+            return embeddings  # type: ignore
+        cache = self.embedding_params.cache
+        assert cache is not None
+        computed: dict[str, list[Any]] = dict(zip(misses, response.embeddings))
+        for key, text in zip(self._cache_keys(misses), misses):
+            cache.set(key, json.dumps(computed[text]))
+        return [
+            computed[text] if embedding is None else embedding
+            for text, embedding in zip(inputs, embeddings)
+        ]
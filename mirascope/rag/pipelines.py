@@ -0,0 +1,277 @@
+"""Pipelines for ingesting large sources into vectorstores.
+
+An `IngestionPipeline` streams a source through the vectorstore's chunker, embedder and
+upserts in batches of `batch_size` documents. The embedding and upsert stages each run
+in their own pool of worker threads, and since both stages pull batches lazily (and
+buffer at most as many finished batches as they run), at most
+`2 * (embed_concurrency + upsert_concurrency)` batches are in memory at once no matter
+how large the source is.
+
+Example:
+
+```python
+from mirascope.rag import IngestionPipeline
+
+pipeline = IngestionPipeline(
+    vectorstore=MyStore(),
+    batch_size=256,
+    embed_concurrency=8,
+    checkpoint_path="ingest.checkpoint",
+    on_progress=lambda progress: print(progress.chunks),
+)
+with open(f"{PATH_TO_FILE}") as file:
+    pipeline.run(file, source="my-file")
+```
+"""
+import hashlib
+import json
+import os
+import tempfile
+from itertools import chain
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, Union
+
+from pydantic import BaseModel, ConfigDict
+
+from ..base.concurrency import run_many
+from .types import Document
+from .vectorstores import BaseVectorStore
+
+
+class IngestionProgress(BaseModel):
+    """The progress of an ingestion, reported after each batch.
+
+    Attributes:
+        chunks: The number of chunks read from the source, including those that were
+            skipped.
+        upserted: The number of documents that were embedded and upserted.
+        skipped: The number of documents that were skipped because they were already
+            ingested, either before the checkpoint or unchanged in the vectorstore.
+        deleted: The number of stale documents of the source that were deleted.
+        batches: The number of batches that were upserted.
+    """
+
+    chunks: int = 0
+    upserted: int = 0
+    skipped: int = 0
+    deleted: int = 0
+    batches: int = 0
+
+
+class _Batch(BaseModel):
+    """A batch of documents and the chunks read up to its last document.
+
+    Attributes:
+        documents: The documents to ingest.
+        chunks: The number of chunks read up to the last document.
+        ids: The hex digest of the ids of the chunks read up to the last document.
+    """
+
+    documents: list[Document]
+    chunks: int
+    ids: str
+
+
+class IngestionPipeline(BaseModel):
+    """A pipeline that chunks, embeds and upserts a source in concurrent batches.
+
+    Attributes:
+        vectorstore: The vectorstore whose chunker, embedder and index to use.
+        batch_size: The maximum number of documents embedded and upserted per request.
+        embed_concurrency: The maximum number of embedding requests in flight at once.
+        upsert_concurrency: The maximum number of upsert requests in flight at once.
+        on_progress: Called with the progress after each batch is upserted.
+        checkpoint_path: A file in which to record the number of chunks ingested every
+            `checkpoint_interval` batches, along with the source and a digest of their
+            ids. A run that finds the file skips that many chunks, so a failed
+            ingestion resumes where it left off, and raises a `ValueError` if the
+            source or the ids of the skipped chunks differ (e.g. because the data or
+            the chunker changed). The file is removed once a run completes.
+        checkpoint_interval: The number of batches between checkpoints. Each checkpoint
+            first flushes the vectorstore, which for stores that buffer upserts (e.g.
+            `LocalVectorStore`) rewrites the index, so raise this for large indexes.
+    """
+
+    vectorstore: BaseVectorStore
+    batch_size: int = 100
+    embed_concurrency: int = 4
+    upsert_concurrency: int = 2
+    on_progress: Optional[Callable[[IngestionProgress], None]] = None
+    checkpoint_path: Optional[str] = None
+    checkpoint_interval: int = 1
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def run(
+        self,
+        data: Union[str, Iterable[str], Iterable[Document]],
+        source: Optional[str] = None,
+    ) -> IngestionProgress:
+        """Ingests `data` into the vectorstore.
+
+        Args:
+            data: A text, a stream of text such as an open file, or documents.
+            source: The id of the source of `data`. If set, documents are ingested
+                incrementally as with `add(..., source=source)`: unchanged documents
+                are skipped and stale documents of `source` are deleted at the end.
+
+        Returns:
+            The final progress of the ingestion.
+
+        Raises:
+            ValueError: if the embedder returns no embeddings, or if the checkpoint
+                was recorded for a different source or different chunks.
+        """
+        progress = IngestionProgress()
+        existing: set[str] = set()
+        if source is not None:
+            existing = set(self.vectorstore._source_ids(source))
+        seen: set[str] = set()
+        checkpoint = self._load_checkpoint(source)
+
+        def documents() -> Iterator[tuple[Document, bool]]:
+            """Yields each document and whether it needs to be ingested."""
+            for document in self._documents(data):
+                if source is not None:
+                    document = self.vectorstore._with_source(document, source)
+                    seen.add(document.id)
+                yield document, document.id not in existing
+
+        embedded = run_many(
+            self._embed,
+            self._batches(documents(), progress, checkpoint),
+            self.embed_concurrency,
+        )
+        upserted = run_many(
+            self._upsert, (result for _, result in embedded), self.upsert_concurrency
+        )
+        for _, batch in upserted:
+            assert isinstance(batch, _Batch)
+            progress.upserted += len(batch.documents)
+            progress.batches += 1
+            if (
+                self.checkpoint_path is not None
+                and progress.batches % self.checkpoint_interval == 0
+            ):
+                self.vectorstore._flush()
+                self._save_checkpoint(source, batch)
+            self._report(progress)
+
+        stale = sorted(existing - seen)
+        if stale:
+            self.vectorstore.delete(stale)
+            progress.deleted = len(stale)
+            self._report(progress)
+        self.vectorstore._flush()
+        if self.checkpoint_path is not None and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        return progress
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _documents(
+        self, data: Union[str, Iterable[str], Iterable[Document]]
+    ) -> Iterator[Document]:
+        """Yields the documents of `data`, chunking text as it is read."""
+        iterator = iter([data] if isinstance(data, str) else data)
+        first = next(iterator, None)
+        if first is None:
+            return
+        items: Iterator[Any] = chain([first], iterator)
+        if isinstance(first, Document):
+            yield from items
+        else:
+            yield from self.vectorstore.chunker.iter_chunks(items)
+
+    def _batches(
+        self,
+        documents: Iterator[tuple[Document, bool]],
+        progress: IngestionProgress,
+        checkpoint: dict[str, Any],
+    ) -> Iterator[_Batch]:
+        """Groups the documents that need to be ingested into batches.
+
+        The first `checkpoint["chunks"]` documents are skipped once their ids are
+        verified against the checkpoint, before any of them is ingested.
+
+        Raises:
+            ValueError: if the ids of the skipped documents don't match the checkpoint.
+        """
+        skip = checkpoint.get("chunks", 0)
+        ids = hashlib.sha256()
+        batch: list[Document] = []
+        for document, ingest in documents:
+            progress.chunks += 1
+            ids.update(f"{document.id}\n".encode())
+            if progress.chunks == skip and ids.hexdigest() != checkpoint["ids"]:
+                raise ValueError(
+                    self._mismatch(f"the ids of the first {skip} chunks differ")
+                )
+            if progress.chunks <= skip or not ingest:
+                progress.skipped += 1
+                continue
+            batch.append(document)
+            if len(batch) == self.batch_size:
+                yield _Batch(
+                    documents=batch, chunks=progress.chunks, ids=ids.hexdigest()
+                )
+                batch = []
+        if progress.chunks < skip:
+            raise ValueError(self._mismatch(f"there are fewer than {skip} chunks"))
+        if batch:
+            yield _Batch(documents=batch, chunks=progress.chunks, ids=ids.hexdigest())
+
+    def _embed(self, batch: _Batch) -> tuple[_Batch, Sequence[Sequence[float]]]:
+        """Returns the batch along with the embeddings of its documents."""
+        response = self.vectorstore.embedder.embed(
+            [document.text for document in batch.documents]
+        )
+        if response.embeddings is None:
+            raise ValueError("Embedding is None")
+        return batch, response.embeddings
+
+    def _upsert(self, result: Any) -> _Batch:
+        """Upserts an embedded batch and returns it."""
+        batch, embeddings = result
+        self.vectorstore._upsert(batch.documents, embeddings)
+        return batch
+
+    def _report(self, progress: IngestionProgress) -> None:
+        """Calls `on_progress` with a copy of the progress, if set."""
+        if self.on_progress is not None:
+            self.on_progress(progress.model_copy())
+
+    def _load_checkpoint(self, source: Optional[str]) -> dict[str, Any]:
+        """Returns the checkpoint, or an empty one if there is none.
+
+        Raises:
+            ValueError: if the checkpoint was recorded for a different source.
+        """
+        if self.checkpoint_path is None or not os.path.exists(self.checkpoint_path):
+            return {}
+        with open(self.checkpoint_path) as file:
+            checkpoint = json.load(file)
+        if checkpoint.get("source") != source:
+            raise ValueError(
+                self._mismatch(
+                    f"it was recorded for source {checkpoint.get('source')!r}, not "
+                    f"{source!r}"
+                )
+            )
+        return checkpoint
+
+    def _save_checkpoint(self, source: Optional[str], batch: _Batch) -> None:
+        """Atomically records that the chunks up to the end of `batch` are ingested."""
+        path: str = self.checkpoint_path  # type: ignore
+        directory = os.path.dirname(os.path.abspath(path))
+        with tempfile.NamedTemporaryFile("w", dir=directory, delete=False) as file:
+            json.dump(
+                {"chunks": batch.chunks, "ids": batch.ids, "source": source}, file
+            )
+        os.replace(file.name, path)
+
+    def _mismatch(self, reason: str) -> str:
+        """Returns the error message for data that doesn't match the checkpoint."""
+        return (
+            f"The checkpoint at {self.checkpoint_path} doesn't match this run: "
+            f"{reason}. Remove it to ingest from the start."
+        )
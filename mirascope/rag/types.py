@@ -4,6 +4,9 @@ from typing import Any, Callable, Generic, Optional, TypeVar, Union
 
 from pydantic import BaseModel, ConfigDict
 
+from ..base.caches import BaseCache
+from ..base.rate_limiters import RateLimiter
+
 ResponseT = TypeVar("ResponseT", bound=Any)
 
 
@@ -58,18 +61,32 @@ class BaseVectorStoreParams(BaseModel):
 
 
 class BaseEmbeddingParams(BaseModel):
-    """The parameters with which to make an embedding."""
+    """The parameters with which to make an embedding.
+
+    Setting `cache` makes embedders look up each input in the cache before making a
+    request, so only inputs that haven't been embedded with the same model and
+    parameters before are sent to the provider.
+    """
 
     model: str
     logfire: Optional[Callable[..., Callable]] = None
     logfire_async: Optional[Callable[..., Callable]] = None
     langfuse: Optional[Callable[..., Callable]] = None
+    rate_limiter: Optional[RateLimiter] = None
+    cache: Optional[BaseCache] = None
 
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
     def kwargs(self) -> dict[str, Any]:
         """Returns all parameters for the embedder as a keyword arguments dictionary."""
-        exclude = {"weave", "logfire", "logfire_async", "langfuse"}
+        exclude = {
+            "weave",
+            "logfire",
+            "logfire_async",
+            "langfuse",
+            "rate_limiter",
+            "cache",
+        }
         kwargs = {
             key: value
             for key, value in self.model_dump(exclude=exclude).items()
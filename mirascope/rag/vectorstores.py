@@ -1,6 +1,6 @@
 """Vectorstores for the RAG module."""
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar, Generic, Optional, TypeVar, Union
+from typing import Any, ClassVar, Generic, Optional, Sequence, TypeVar, Union
 
 from pydantic import BaseModel
 
@@ -29,3 +29,55 @@ class BaseVectorStore(BaseModel, Generic[BaseQueryResultsT], ABC):
     def add(self, text: Union[str, list[Document]], **kwargs: Any) -> None:
         """Takes unstructured data and upserts into vectorstore"""
         ...  # pragma: no cover
+
+    def delete(self, ids: list[str]) -> None:
+        """Deletes the documents with the given ids from the vectorstore."""
+        raise NotImplementedError(f"{type(self).__name__} does not support deletes.")
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _upsert(
+        self,
+        documents: list[Document],
+        embeddings: Sequence[Sequence[float]],
+        **kwargs: Any,
+    ) -> None:
+        """Upserts documents with precomputed embeddings into the vectorstore."""
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support upserting embeddings."
+        )
+
+    def _flush(self) -> None:
+        """Persists the documents upserted with `_upsert`, if the store buffers them."""
+
+    def _source_ids(self, source: str) -> list[str]:
+        """Returns the ids of the documents added from `source`."""
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support incremental adds."
+        )
+
+    def _diff(
+        self, documents: list[Document], source: str
+    ) -> tuple[list[Document], list[str]]:
+        """Returns the documents of `source` to upsert and the stale ids to delete.
+
+        Documents get ids prefixed with `{source}#` and a `source` metadata. Since
+        chunkers derive ids from each chunk's offset and content, adding a new version
+        of `source` only upserts its new or changed chunks and deletes the chunks that
+        are no longer in it.
+        """
+        documents = [self._with_source(document, source) for document in documents]
+        existing = set(self._source_ids(source))
+        stale = existing.difference(document.id for document in documents)
+        return (
+            [document for document in documents if document.id not in existing],
+            sorted(stale),
+        )
+
+    def _with_source(self, document: Document, source: str) -> Document:
+        """Returns `document` with its id prefixed by and metadata tagged with `source`."""
+        return Document(
+            id=f"{source}#{document.id}",
+            text=document.text,
+            metadata={**(document.metadata or {}), "source": source},
+        )
@@ -248,3 +248,126 @@ async def test_anthropic_call_stream_async(
         max_tokens=fixture_anthropic_test_call.call_params.max_tokens,
         timeout=fixture_anthropic_test_call.call_params.timeout,
     )
+
+
+@patch(
+    "anthropic.resources.beta.tools.messages.Messages.create",
+    new_callable=MagicMock,
+)
+@patch("anthropic.resources.messages.Messages.create", new_callable=MagicMock)
+def test_anthropic_call_call_prompt_caching(
+    mock_create: MagicMock,
+    mock_tools_create: MagicMock,
+    fixture_anthropic_book_tool: Type[AnthropicTool],
+    fixture_anthropic_message: Message,
+    fixture_anthropic_message_with_tools: Message,
+) -> None:
+    """Tests that cache breakpoints are placed after the listed prompt sections."""
+    mock_create.return_value = fixture_anthropic_message
+    mock_tools_create.return_value = fixture_anthropic_message_with_tools
+
+    class QuestionAnswerer(AnthropicCall):
+        prompt_template = """
+        SYSTEM:
+        Answer questions about this document:
+        {document}
+        Be concise.
+        USER: {question}
+        """
+        api_key = "test"
+
+        document: str
+        question: str
+
+        call_params = AnthropicCallParams(
+            model="test",
+            tools=[fixture_anthropic_book_tool],
+            extra_headers={"x-test": "test"},
+            prompt_caching=["tools", "system", "document"],
+        )
+
+    ephemeral = {"type": "ephemeral"}
+    call = QuestionAnswerer(document="A long document.", question="Why?")
+    call.call()
+    kwargs = mock_tools_create.call_args.kwargs
+    assert kwargs["tools"][-1]["cache_control"] == ephemeral
+    assert "cache_control" not in fixture_anthropic_book_tool.tool_schema()
+    assert kwargs["system"] == [
+        {
+            "type": "text",
+            "text": "Answer questions about this document:\nA long document.",
+            "cache_control": ephemeral,
+        },
+        {"type": "text", "text": "\nBe concise.", "cache_control": ephemeral},
+    ]
+    assert kwargs["messages"] == [{"role": "user", "content": "Why?"}]
+    assert kwargs["extra_headers"] == {
+        "x-test": "test",
+        "anthropic-beta": "tools-2024-05-16,prompt-caching-2024-07-31",
+    }
+
+    class DocumentQuestion(QuestionAnswerer):
+        prompt_template = "{document}\n\n{question}"
+
+        call_params = AnthropicCallParams(model="test", prompt_caching=["document"])
+
+    DocumentQuestion(document="A long document.", question="Why?").call()
+    kwargs = mock_create.call_args.kwargs
+    assert "system" not in kwargs
+    assert kwargs["messages"] == [
+        {
+            "role": "user",
+            "content": [
+                {
+                    "type": "text",
+                    "text": "A long document.",
+                    "cache_control": ephemeral,
+                },
+                {"type": "text", "text": "\n\nWhy?"},
+            ],
+        }
+    ]
+    assert kwargs["extra_headers"] == {"anthropic-beta": "prompt-caching-2024-07-31"}
+
+
+@patch("anthropic.resources.messages.Messages.create", new_callable=MagicMock)
+def test_anthropic_call_call_prompt_caching_limits(
+    mock_create: MagicMock, fixture_anthropic_message: Message
+) -> None:
+    """Tests that betas are merged and only the last four breakpoints are kept."""
+    mock_create.return_value = fixture_anthropic_message
+
+    class Conversation(AnthropicCall):
+        prompt_template = """
+        SYSTEM: Refer to {a}.
+        USER: {a} then {b}.
+        ASSISTANT: Noted {b}.
+        USER: And {c}, {a}?
+        """
+        api_key = "test"
+
+        a: str = "alpha"
+        b: str = "beta"
+        c: str = "gamma"
+
+        call_params = AnthropicCallParams(
+            model="test",
+            extra_headers={"Anthropic-Beta": "max-tokens-3-5-sonnet-2024-07-15"},
+            prompt_caching=["system", "a", "b", "c"],
+        )
+
+    Conversation().call()
+    kwargs = mock_create.call_args.kwargs
+    assert kwargs["extra_headers"] == {
+        "Anthropic-Beta": "max-tokens-3-5-sonnet-2024-07-15,prompt-caching-2024-07-31"
+    }
+    blocks = kwargs["system"] + [
+        block for message in kwargs["messages"] for block in message["content"]
+    ]
+    assert [block["text"] for block in blocks if "cache_control" in block] == [
+        " then beta",
+        "Noted beta",
+        "And gamma",
+        ", alpha",
+    ]
+    assert [block["text"] for block in kwargs["system"]] == ["Refer to alpha", "."]
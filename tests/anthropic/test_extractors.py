@@ -5,7 +5,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from anthropic.types import Message
 
+from mirascope.anthropic.calls import AnthropicCall
 from mirascope.anthropic.extractors import AnthropicExtractor
+from mirascope.anthropic.tool_streams import AnthropicToolStream
 from mirascope.anthropic.tools import AnthropicTool
 from mirascope.anthropic.types import AnthropicCallParams, AnthropicCallResponseChunk
 
@@ -114,3 +116,57 @@ async def test_anthropic_extractor_stream_async_tool(
         "title": "The Name of the Wind",
         "author": "Patrick Rothfuss",
     }
+
+
+@patch(
+    "mirascope.base.extractors.BaseExtractor._extract_many_async",
+    new_callable=AsyncMock,
+)
+@patch("mirascope.base.extractors.BaseExtractor._extract_many", new_callable=MagicMock)
+@pytest.mark.asyncio
+async def test_anthropic_extractor_extract_many(
+    mock_extract_many: MagicMock, mock_extract_many_async: AsyncMock
+) -> None:
+    """Tests that `extract_many` packs the extractors into a single Anthropic call."""
+
+    class TempExtractor(AnthropicExtractor[str]):
+        extract_schema: Type[str] = str
+        prompt_template = "{text}"
+
+        text: str
+
+    extractors = [TempExtractor(text="a"), TempExtractor(text="b")]
+    mock_extract_many.return_value = mock_extract_many_async.return_value = ["a", "b"]
+    assert TempExtractor.extract_many(extractors, retries=2) == ["a", "b"]
+    mock_extract_many.assert_called_once_with(
+        AnthropicCall, AnthropicTool, extractors, 2
+    )
+    assert await TempExtractor.extract_many_async(extractors) == ["a", "b"]
+    mock_extract_many_async.assert_called_once_with(
+        AnthropicCall, AnthropicTool, extractors, 0
+    )
+
+
+@patch("mirascope.base.extractors.BaseExtractor._stream_items_async")
+@patch("mirascope.base.extractors.BaseExtractor._stream_items")
+@pytest.mark.asyncio
+async def test_anthropic_extractor_stream_items(
+    mock_stream_items: MagicMock, mock_stream_items_async: MagicMock
+) -> None:
+    """Tests that `stream_items` streams the items using Anthropic."""
+
+    class TempExtractor(AnthropicExtractor[list[str]]):
+        extract_schema: Type[list] = list[str]
+        prompt_template = "test"
+
+    mock_stream_items.return_value = iter(["a", "b"])
+    mock_stream_items_async.return_value.__aiter__.return_value = ["a", "b"]
+    assert list(TempExtractor().stream_items(retries=2)) == ["a", "b"]
+    mock_stream_items.assert_called_once_with(
+        AnthropicCall, AnthropicTool, AnthropicToolStream, 2
+    )
+    items = [item async for item in TempExtractor().stream_items_async()]
+    assert items == ["a", "b"]
+    mock_stream_items_async.assert_called_once_with(
+        AnthropicCall, AnthropicTool, AnthropicToolStream, 0
+    )
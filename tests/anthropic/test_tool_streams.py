@@ -71,6 +71,21 @@ def test_anthropic_tool_stream_missing_tool_name(
         list(AnthropicToolStream.from_stream(generator()))
 
 
+def test_anthropic_tool_stream_incomplete_tool(
+    fixture_anthropic_call_response_chunk_with_bad_tool: AnthropicCallResponseChunk,
+) -> None:
+    """Tests that a value error is thrown when a tool closes before its JSON does."""
+
+    def generator():
+        fixture_anthropic_call_response_chunk_with_bad_tool.chunk.delta.text = (
+            '"tool_name": "}'
+        )
+        yield fixture_anthropic_call_response_chunk_with_bad_tool
+
+    with pytest.raises(ValueError):
+        list(AnthropicToolStream.from_stream(generator()))
+
+
 def test_anthropic_tool_stream_not_json_mode(
     fixture_anthropic_call_response_chunk_with_bad_tool: AnthropicCallResponseChunk,
 ) -> None:
@@ -8,10 +8,12 @@ from anthropic.types import (
     ContentBlockStartEvent,
     ContentBlockStopEvent,
     Message,
+    Usage,
 )
 
 from mirascope.anthropic.tools import AnthropicTool
 from mirascope.anthropic.types import AnthropicCallResponse, AnthropicCallResponseChunk
+from mirascope.anthropic.utils import anthropic_api_calculate_cost
 
 
 def test_anthropic_call_response(fixture_anthropic_message: Message):
@@ -82,9 +84,39 @@ def test_anthropic_call_response_chunk(
     )
     assert chunk.content == "test_start"
     assert chunk.type == "content_block_start"
+    assert chunk.skip_content(5).content == "start"
+    assert chunk.content == "test_start"
+    delta = AnthropicCallResponseChunk(chunk=fixture_anthropic_message_chunk)
+    assert delta.skip_content(1).content == "est"
+    assert delta.content == "test"
 
     chunk = AnthropicCallResponseChunk(
         chunk=ContentBlockStopEvent(index=2, type="content_block_stop")
     )
     assert chunk.content == ""
     assert chunk.type == "content_block_stop"
+
+
+def test_anthropic_call_response_cache_tokens(fixture_anthropic_message: Message):
+    """Tests that prompt caching tokens are reported and included in the cost."""
+    response = AnthropicCallResponse(
+        response=fixture_anthropic_message, start_time=0, end_time=1
+    )
+    assert response.cache_creation_input_tokens is None
+    assert response.cache_read_input_tokens is None
+
+    usage = Usage.model_validate(
+        {
+            "input_tokens": 100,
+            "output_tokens": 10,
+            "cache_creation_input_tokens": 1000,
+            "cache_read_input_tokens": 2000,
+        }
+    )
+    fixture_anthropic_message.usage = usage
+    assert response.cache_creation_input_tokens == 1000
+    assert response.cache_read_input_tokens == 2000
+    cost = anthropic_api_calculate_cost(usage, "claude-3-opus-20240229")
+    assert cost == pytest.approx(
+        (100 + 1000 * 1.25 + 2000 * 0.1) * 0.000_015 + 10 * 0.000_075
+    )
@@ -0,0 +1,143 @@
+"""Tests for the response caches."""
+import time
+from pathlib import Path
+from typing import Any, Type
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from anthropic.types.beta.tools import ToolsBetaMessage
+from openai.types.chat import ChatCompletion
+
+from mirascope.anthropic import (
+    AnthropicCall,
+    AnthropicCallParams,
+    AnthropicCallResponse,
+    AnthropicTool,
+)
+from mirascope.base.caches import BaseCache, InMemoryCache, SQLiteCache, cache_key
+from mirascope.openai import OpenAICall, OpenAICallParams, OpenAICallResponse
+from mirascope.openai.tools import OpenAITool
+
+
+def _make_cache(
+    cache_type: Type[BaseCache], tmp_path: Path, **kwargs: Any
+) -> BaseCache:
+    """Returns a cache of the given type, stored in `tmp_path` if on disk."""
+    if cache_type is SQLiteCache:
+        kwargs["path"] = str(tmp_path / "cache.db")
+    return cache_type(**kwargs)
+
+
+@pytest.mark.parametrize("cache_type", [InMemoryCache, SQLiteCache])
+def test_cache_get_set_delete_clear(
+    cache_type: Type[BaseCache], tmp_path: Path
+) -> None:
+    """Tests the basic operations of the cache backends."""
+    cache = _make_cache(cache_type, tmp_path)
+    assert cache.get("a") is None
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("a", "3")
+    assert cache.get("a") == "3"
+    cache.delete("a")
+    assert cache.get("a") is None
+    cache.clear()
+    assert cache.get("b") is None
+
+
+@pytest.mark.parametrize("cache_type", [InMemoryCache, SQLiteCache])
+def test_cache_lru_eviction(cache_type: Type[BaseCache], tmp_path: Path) -> None:
+    """Tests that the least recently used entries are evicted first."""
+    cache = _make_cache(cache_type, tmp_path, max_size=2)
+    cache.set("a", "1")
+    time.sleep(0.001)
+    cache.set("b", "2")
+    time.sleep(0.001)
+    assert cache.get("a") == "1"
+    time.sleep(0.001)
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+@pytest.mark.parametrize("cache_type", [InMemoryCache, SQLiteCache])
+def test_cache_ttl(cache_type: Type[BaseCache], tmp_path: Path) -> None:
+    """Tests that entries expire after their ttl."""
+    cache = _make_cache(cache_type, tmp_path, ttl=-1)
+    cache.set("a", "1")
+    assert cache.get("a") is None
+
+
+def test_sqlite_cache_persists(tmp_path: Path) -> None:
+    """Tests that the `SQLiteCache` persists entries across instances."""
+    path = str(tmp_path / "cache.db")
+    SQLiteCache(path=path).set("a", "1")
+    assert SQLiteCache(path=path).get("a") == "1"
+
+
+def test_cache_key() -> None:
+    """Tests that cache keys are stable and sensitive to their inputs."""
+    assert cache_key("a", {"b": 1}) == cache_key("a", {"b": 1})
+    assert cache_key("a", {"b": 1}) != cache_key("a", {"b": 2})
+
+
+@patch("openai.resources.chat.completions.Completions.create", new_callable=MagicMock)
+def test_openai_call_cached(
+    mock_create: MagicMock,
+    fixture_chat_completion_with_tools: ChatCompletion,
+    fixture_my_openai_tool: Type[OpenAITool],
+) -> None:
+    """Tests that a cached `OpenAICall.call` rehydrates an `OpenAICallResponse`."""
+    mock_create.return_value = fixture_chat_completion_with_tools
+
+    class MyCall(OpenAICall):
+        prompt_template = "{text}"
+        api_key = "test"
+
+        text: str
+
+        call_params = OpenAICallParams(
+            tools=[fixture_my_openai_tool], cache=InMemoryCache()
+        )
+
+    response = MyCall(text="test").call()
+    cached_response = MyCall(text="test").call()
+    assert mock_create.call_count == 1
+    assert isinstance(cached_response, OpenAICallResponse)
+    assert cached_response.response == response.response
+    assert cached_response.tool == response.tool
+    MyCall(text="other").call()
+    MyCall(text="test").call(temperature=0.5)
+    MyCall(text="test").call(cache=None)
+    assert mock_create.call_count == 4
+
+
+@patch(
+    "anthropic.resources.beta.tools.messages.AsyncMessages.create",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_anthropic_call_async_cached(
+    mock_create: AsyncMock,
+    fixture_anthropic_message_with_tools: ToolsBetaMessage,
+    fixture_anthropic_book_tool: Type[AnthropicTool],
+) -> None:
+    """Tests that a cached `AnthropicCall.call_async` rehydrates its response."""
+    mock_create.return_value = fixture_anthropic_message_with_tools
+
+    class MyCall(AnthropicCall):
+        prompt_template = "test"
+        api_key = "test"
+
+        call_params = AnthropicCallParams(
+            tools=[fixture_anthropic_book_tool], cache=InMemoryCache()
+        )
+
+    response = await MyCall().call_async()
+    cached_response = await MyCall().call_async()
+    assert mock_create.call_count == 1
+    assert isinstance(cached_response, AnthropicCallResponse)
+    assert isinstance(cached_response.response, ToolsBetaMessage)
+    assert cached_response.tool == response.tool
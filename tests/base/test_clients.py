@@ -0,0 +1,114 @@
+"""Tests for the pooled provider client registry."""
+import asyncio
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from mirascope.base.clients import (
+    ClientPoolParams,
+    clear_clients,
+    configure_client_pool,
+    get_async_client,
+    get_client,
+    pooled_async_http_client,
+    pooled_http_client,
+)
+from mirascope.openai import OpenAICall
+
+
+def test_get_client_reuses_client() -> None:
+    """Tests that `get_client` only creates a client once per key."""
+    clear_clients()
+    create = MagicMock(side_effect=lambda: object())
+    client = get_client(("test", "key", None), create)
+    assert get_client(("test", "key", None), create) is client
+    assert get_client(("test", "other", None), create) is not client
+    assert create.call_count == 2
+    clear_clients()
+    assert get_client(("test", "key", None), create) is not client
+
+
+def test_get_async_client_per_event_loop() -> None:
+    """Tests that async clients are cached per running event loop."""
+    clear_clients()
+    create = MagicMock(side_effect=lambda: object())
+
+    async def get_twice() -> tuple[object, object]:
+        return get_async_client("key", create), get_async_client("key", create)
+
+    first, second = asyncio.run(get_twice())
+    assert first is second
+    third, _ = asyncio.run(get_twice())
+    assert third is not first
+    assert create.call_count == 2
+    get_async_client("key", create)  # no running loop, so not cached
+    assert create.call_count == 3
+
+
+def test_clear_clients_closes_clients() -> None:
+    """Tests that clients removed from the registry are closed."""
+    clear_clients()
+    client = get_client("key", MagicMock)
+    configure_client_pool()
+    client.close.assert_called_once()
+    assert get_client("key", MagicMock) is not client
+
+    closed: list[str] = []
+
+    class AsyncClient:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        async def close(self) -> None:
+            closed.append(self.name)
+
+    async def clear_running() -> None:
+        get_async_client("running", lambda: AsyncClient("running"))
+        clear_clients()
+        await asyncio.sleep(0)
+
+    asyncio.run(clear_running())
+    assert closed == ["running"]
+
+    loop = asyncio.new_event_loop()
+    try:
+
+        async def get() -> None:
+            get_async_client("stopped", lambda: AsyncClient("stopped"))
+
+        loop.run_until_complete(get())
+        clear_clients()
+        assert closed == ["running", "stopped"]
+        loop.run_until_complete(get())
+    finally:
+        loop.close()
+    clear_clients()
+    assert closed == ["running", "stopped"]
+
+
+def test_configure_client_pool() -> None:
+    """Tests that pool settings are applied to new http clients."""
+    try:
+        params = configure_client_pool(max_connections=7, keepalive_expiry=1.0)
+        assert isinstance(params, ClientPoolParams)
+        client = pooled_http_client()
+        assert isinstance(client, httpx.Client)
+        pool = client._transport._pool  # type: ignore
+        assert pool._max_connections == 7
+        assert pool._keepalive_expiry == 1.0
+        assert isinstance(pooled_async_http_client(), httpx.AsyncClient)
+    finally:
+        configure_client_pool(**ClientPoolParams().model_dump())
+
+
+@pytest.mark.asyncio
+async def test_openai_call_reuses_client() -> None:
+    """Tests that `OpenAICall` reuses its clients across calls."""
+
+    class MyCall(OpenAICall):
+        prompt_template = "test"
+        api_key = "test"
+
+    assert MyCall()._client() is MyCall()._client()
+    assert MyCall()._async_client() is MyCall()._async_client()
@@ -0,0 +1,228 @@
+"""Tests for the bounded concurrency fan-out helpers."""
+import asyncio
+import threading
+import time
+from typing import AsyncGenerator
+from unittest.mock import patch
+
+import pytest
+
+from mirascope.base.calls import BaseCall
+from mirascope.base.concurrency import map_async, run_many
+from mirascope.base.extractors import BaseExtractor
+
+
+class _Tracker:
+    """Tracks the maximum number of concurrently running items."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def __enter__(self) -> None:
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+
+    def __exit__(self, *args) -> None:
+        with self.lock:
+            self.running -= 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordered", [True, False])
+async def test_map_async(ordered: bool) -> None:
+    """Tests that results are paired with their items with bounded concurrency."""
+    tracker = _Tracker()
+
+    async def square(value: int) -> int:
+        with tracker:
+            await asyncio.sleep(0.001 * (10 - value))
+            return value * value
+
+    results = [
+        result async for result in map_async(square, range(10), 3, ordered=ordered)
+    ]
+    assert tracker.max_running == 3
+    if ordered:
+        assert results == [(value, value * value) for value in range(10)]
+    else:
+        assert sorted(results) == [(value, value * value) for value in range(10)]
+        assert results != sorted(results)
+
+
+@pytest.mark.asyncio
+async def test_map_async_lazy_async_input() -> None:
+    """Tests that async iterables are only consumed as slots and the buffer free up."""
+    pulled = []
+
+    async def items() -> AsyncGenerator[int, None]:
+        for value in range(5):
+            pulled.append(value)
+            yield value
+
+    async def identity(value: int) -> int:
+        return value
+
+    results = map_async(identity, items(), concurrency=2)
+    assert await results.__anext__() == (0, 0)
+    assert pulled == [0, 1, 2, 3]
+    assert [value async for value, _ in results] == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordered", [True, False])
+async def test_map_async_exceptions(ordered: bool) -> None:
+    """Tests that exceptions are raised or returned in place."""
+
+    async def fail_on_two(value: int) -> int:
+        if value == 2:
+            raise ValueError(value)
+        return value
+
+    results = [
+        result
+        async for _, result in map_async(
+            fail_on_two, range(4), ordered=ordered, return_exceptions=True
+        )
+    ]
+    assert len(results) == 4
+    assert sum(isinstance(result, ValueError) for result in results) == 1
+    with pytest.raises(ValueError):
+        async for _ in map_async(fail_on_two, range(4), ordered=ordered):
+            pass
+    with pytest.raises(ValueError):
+        async for _ in map_async(fail_on_two, range(4), concurrency=0):
+            pass  # pragma: no cover
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_run_many(ordered: bool) -> None:
+    """Tests that results are paired with their items with bounded concurrency."""
+    tracker = _Tracker()
+
+    def square(value: int) -> int:
+        with tracker:
+            time.sleep(0.005 * (10 - value))
+            return value * value
+
+    results = list(run_many(square, iter(range(10)), 3, ordered=ordered))
+    assert tracker.max_running <= 3
+    if ordered:
+        assert results == [(value, value * value) for value in range(10)]
+    else:
+        assert sorted(results) == [(value, value * value) for value in range(10)]
+
+
+def test_run_many_ordered_keeps_slots_busy() -> None:
+    """Tests that a slow head item doesn't stop new items from starting."""
+    release = threading.Event()
+    started: list[int] = []
+    lock = threading.Lock()
+
+    def wait_on_head(value: int) -> int:
+        with lock:
+            started.append(value)
+            if len(started) == 4:
+                release.set()
+        if value == 0:
+            assert release.wait(1)
+        return value
+
+    assert list(run_many(wait_on_head, range(10), 2)) == [
+        (value, value) for value in range(10)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_map_async_ordered_keeps_slots_busy() -> None:
+    """Tests that a slow head task doesn't stop new tasks from starting."""
+    release = asyncio.Event()
+    started: list[int] = []
+
+    async def wait_on_head(value: int) -> int:
+        started.append(value)
+        if value == 0:
+            await asyncio.wait_for(release.wait(), timeout=1)
+        elif len(started) == 4:
+            release.set()
+        return value
+
+    async def collect() -> list[int]:
+        return [value async for value, _ in map_async(wait_on_head, range(10), 2)]
+
+    results = await asyncio.wait_for(collect(), timeout=5)
+    assert results == list(range(10))
+    assert started[:4] == [0, 1, 2, 3]
+
+
+def test_run_many_exceptions() -> None:
+    """Tests that exceptions are raised or returned in place."""
+
+    def fail_on_two(value: int) -> int:
+        if value == 2:
+            raise ValueError(value)
+        return value
+
+    results = [
+        result for _, result in run_many(fail_on_two, range(4), return_exceptions=True)
+    ]
+    assert results[:2] == [0, 1] and isinstance(results[2], ValueError)
+    with pytest.raises(ValueError):
+        list(run_many(fail_on_two, range(4)))
+    with pytest.raises(ValueError):
+        list(run_many(fail_on_two, range(4), concurrency=0))
+
+
+@pytest.mark.asyncio
+@patch.multiple(BaseCall, __abstractmethods__=set())
+async def test_base_call_run_many_and_map_async() -> None:
+    """Tests running many calls through `BaseCall.run_many` and `map_async`."""
+
+    class Call(BaseCall):
+        prompt_template = "{value}"
+
+        value: int
+
+        def call(self, **kwargs):
+            return self.value * kwargs["factor"]
+
+        async def call_async(self, **kwargs):
+            return self.value * kwargs["factor"]
+
+    calls = [Call(value=value) for value in range(3)]  # type: ignore
+    assert [
+        response for _, response in Call.run_many(calls, concurrency=2, factor=2)
+    ] == [0, 2, 4]
+    assert [response async for _, response in Call.map_async(calls, factor=3)] == [
+        0,
+        3,
+        6,
+    ]
+
+
+@pytest.mark.asyncio
+@patch.multiple(BaseExtractor, __abstractmethods__=set())
+async def test_base_extractor_run_many_and_map_async() -> None:
+    """Tests running many extractions through `run_many` and `map_async`."""
+
+    class Extractor(BaseExtractor):
+        extract_schema: type = int
+        prompt_template = "{value}"
+
+        value: int
+
+        def extract(self, **kwargs):
+            return self.value * kwargs["factor"]
+
+        async def extract_async(self, **kwargs):
+            return self.value * kwargs["factor"]
+
+    extractors = [Extractor(value=value) for value in range(3)]  # type: ignore
+    assert [
+        extraction for _, extraction in Extractor.run_many(extractors, factor=2)
+    ] == [0, 2, 4]
+    assert [
+        extraction async for _, extraction in Extractor.map_async(extractors, factor=3)
+    ] == [0, 3, 6]
@@ -0,0 +1,232 @@
+"""Tests for provider fallback chains."""
+import asyncio
+import time
+from typing import Any, AsyncGenerator, ClassVar, Generator, Optional
+
+import pytest
+
+from mirascope.base.calls import BaseCall
+from mirascope.base.fallbacks import FallbackCall, ProviderHealth
+
+
+class _Provider(BaseCall):
+    """A fake provider that fails with `errors[name]` if set."""
+
+    prompt_template = "{text}"
+
+    text: str
+
+    errors: ClassVar[dict[str, Optional[Exception]]] = {}
+    calls: ClassVar[list[str]] = []
+
+    def _respond(self) -> str:
+        name = self.__class__.__name__
+        self.calls.append(name)
+        error = self.errors.get(name)
+        if error is not None:
+            raise error
+        return f"{name}: {self.text}"
+
+    def call(self, **kwargs: Any) -> Any:  # type: ignore
+        return self._respond()
+
+    async def call_async(self, **kwargs: Any) -> Any:  # type: ignore
+        await asyncio.sleep(0)
+        return self._respond()
+
+    def stream(self, **kwargs: Any) -> Generator[Any, None, None]:  # type: ignore
+        response = self._respond()
+        yield response[:3]
+        if kwargs.get("fail_midway"):
+            raise ConnectionError()
+        yield response[3:]
+
+    async def stream_async(  # type: ignore
+        self, **kwargs: Any
+    ) -> AsyncGenerator[Any, None]:
+        for chunk in self.stream(**kwargs):
+            yield chunk
+
+
+class Primary(_Provider):
+    pass
+
+
+class Backup(_Provider):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def fixture_reset_providers() -> Generator[None, None, None]:
+    """Resets the fake providers' errors and calls."""
+    yield
+    _Provider.errors.clear()
+    _Provider.calls.clear()
+
+
+def test_provider_health_circuit() -> None:
+    """Tests that the circuit opens, lets a single trial through and closes."""
+    health = ProviderHealth(min_requests=4, failure_threshold=0.5, cooldown=0.05)
+    for ok in (True, False, True):
+        assert health.acquire()
+        health.record(ok, 1.0)
+    assert health.state == "closed"
+    assert health.error_rate() == pytest.approx(1 / 3)
+    assert health.latency() == 1.0
+    health.record(False)
+    assert health.state == "open"
+    assert not health.acquire()
+
+    time.sleep(0.06)
+    assert health.state == "half_open"
+    assert health.acquire()
+    assert not health.acquire()
+    health.record(False)
+    assert health.state == "open"
+
+    time.sleep(0.06)
+    assert health.acquire()
+    health.release()
+    assert health.acquire()
+    health.record(True, 2.0)
+    assert health.state == "closed"
+    assert health.error_rate() == 0
+    assert health.latency() == 2.0
+
+
+def test_provider_health_window() -> None:
+    """Tests that events older than the window are dropped."""
+    health = ProviderHealth(window=0.05)
+    health.record(False)
+    assert health.error_rate() == 1
+    time.sleep(0.06)
+    assert health.error_rate() == 0
+
+
+def test_fallback_call() -> None:
+    """Tests falling back on transient errors and raising fatal ones."""
+    fallback = FallbackCall(call_types=[Primary, Backup])
+    assert fallback.call({"text": "hi"}) == "Primary: hi"
+
+    _Provider.errors["Primary"] = ConnectionError()
+    assert fallback.call(Primary(text="hi")) == "Backup: hi"
+    assert fallback.health[Primary].error_rate() == 0.5
+
+    _Provider.errors["Primary"] = ValueError("bad request")
+    fallback = FallbackCall(call_types=[Primary, Backup])
+    with pytest.raises(ValueError):
+        fallback.call({"text": "hi"})
+    assert _Provider.calls[-1] == "Primary"
+    assert fallback.health[Primary].error_rate() == 0
+
+    _Provider.errors["Primary"] = _Provider.errors["Backup"] = TimeoutError()
+    with pytest.raises(TimeoutError):
+        fallback.call({"text": "hi"})
+
+
+def test_fallback_call_health_per_call_type() -> None:
+    """Tests that call types with the same name have separate health."""
+    other = type("Primary", (_Provider,), {"__module__": "other"})
+    fallback = FallbackCall(call_types=[Primary, other])
+    fallback.health[Primary].record(False)
+    assert len(fallback.health) == 2
+    assert fallback.health[other].error_rate() == 0
+
+
+def test_fallback_call_circuit_breaker() -> None:
+    """Tests that providers with an open circuit are skipped."""
+    fallback = FallbackCall(
+        call_types=[Primary, Backup],
+        health={Primary: ProviderHealth(min_requests=2, cooldown=60)},
+    )
+    _Provider.errors["Primary"] = ConnectionError()
+    assert fallback.call({"text": "hi"}) == "Backup: hi"
+    fallback.health[Primary].record(False)
+    assert fallback.health[Primary].state == "open"
+    _Provider.calls.clear()
+    assert fallback.call({"text": "hi"}) == "Backup: hi"
+    assert _Provider.calls == ["Backup"]
+    assert fallback.route() == [Backup]
+
+    fallback.health[Backup] = ProviderHealth(min_requests=1, cooldown=60)
+    _Provider.errors["Backup"] = ConnectionError()
+    with pytest.raises(ConnectionError):
+        fallback.call({"text": "hi"})
+    with pytest.raises(RuntimeError):
+        fallback.call({"text": "hi"})
+
+
+def test_fallback_call_route() -> None:
+    """Tests that degraded and slow providers are routed after healthy ones."""
+    fallback = FallbackCall(call_types=[Primary, Backup], degraded_error_rate=0.2)
+    assert fallback.route() == [Primary, Backup]
+    fallback.health[Primary].record(False)
+    assert fallback.route() == [Backup, Primary]
+    fallback.health[Primary] = ProviderHealth()
+    fallback.health[Primary].record(True, 5.0)
+    assert fallback.route() == [Primary, Backup]
+    fallback.slow_latency = 1.0
+    assert fallback.route() == [Backup, Primary]
+
+
+@pytest.mark.asyncio
+async def test_fallback_call_async() -> None:
+    """Tests falling back asynchronously."""
+    fallback = FallbackCall(call_types=[Primary, Backup])
+    _Provider.errors["Primary"] = ConnectionError()
+    assert await fallback.call_async({"text": "hi"}) == "Backup: hi"
+    _Provider.errors["Backup"] = ConnectionError()
+    with pytest.raises(ConnectionError):
+        await fallback.call_async({"text": "hi"})
+
+
+def test_fallback_call_stream() -> None:
+    """Tests that streams only fall back before their first chunk."""
+    fallback = FallbackCall(call_types=[Primary, Backup])
+    _Provider.errors["Primary"] = ConnectionError()
+    assert "".join(fallback.stream({"text": "hi"})) == "Backup: hi"
+    assert fallback.health[Backup].latency() is not None
+
+    with pytest.raises(ConnectionError):
+        list(fallback.stream({"text": "hi"}, fail_midway=True))
+    assert fallback.health[Backup].error_rate() == 0.5
+
+    _Provider.errors["Backup"] = ConnectionError()
+    with pytest.raises(ConnectionError):
+        list(fallback.stream({"text": "hi"}))
+
+
+@pytest.mark.asyncio
+async def test_fallback_call_stream_async() -> None:
+    """Tests that asynchronous streams only fall back before their first chunk."""
+    fallback = FallbackCall(call_types=[Primary, Backup])
+    _Provider.errors["Primary"] = ConnectionError()
+    chunks = [chunk async for chunk in fallback.stream_async({"text": "hi"})]
+    assert "".join(chunks) == "Backup: hi"
+
+    with pytest.raises(ConnectionError):
+        _ = [
+            chunk
+            async for chunk in fallback.stream_async({"text": "hi"}, fail_midway=True)
+        ]
+
+    _Provider.errors["Backup"] = ConnectionError()
+    with pytest.raises(ConnectionError):
+        _ = [chunk async for chunk in fallback.stream_async({"text": "hi"})]
+
+
+def test_fallback_call_cancelled_trial() -> None:
+    """Tests that a trial request that is abandoned releases the circuit."""
+    fallback = FallbackCall(
+        call_types=[Primary],
+        health={Primary: ProviderHealth(min_requests=1, cooldown=0.01)},
+    )
+    _Provider.errors["Primary"] = ConnectionError()
+    with pytest.raises(ConnectionError):
+        fallback.call({"text": "hi"})
+    time.sleep(0.02)
+    _Provider.errors.clear()
+    stream = fallback.stream({"text": "hi"})
+    assert next(stream) == "Pri"
+    stream.close()
+    assert fallback.health[Primary].acquire()
@@ -0,0 +1,161 @@
+"""Tests for hedging calls across providers."""
+import asyncio
+import time
+from typing import Any, AsyncGenerator, Generator
+
+import pytest
+
+from mirascope.base.calls import BaseCall
+from mirascope.base.hedging import HedgedCall, LatencyTracker
+
+
+class SleepCall(BaseCall):
+    """A call that responds with `content` after sleeping for `delay` seconds."""
+
+    prompt_template = "{content}"
+
+    content: str
+    delay: float = 0.0
+    fail: bool = False
+    closed: bool = False
+
+    def call(self, **kwargs: Any) -> Any:  # type: ignore
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(self.content)
+        return self.content
+
+    async def call_async(self, **kwargs: Any) -> Any:  # type: ignore
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(self.content)
+        return self.content
+
+    def stream(self, **kwargs: Any) -> Generator[Any, None, None]:  # type: ignore
+        try:
+            time.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError(self.content)
+            yield from self.content
+        finally:
+            self.closed = True
+
+    async def stream_async(  # type: ignore
+        self, **kwargs: Any
+    ) -> AsyncGenerator[Any, None]:
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError(self.content)
+            for char in self.content:
+                yield char
+        finally:
+            self.closed = True
+
+
+def test_latency_tracker() -> None:
+    """Tests the percentiles of a sliding window of latencies."""
+    tracker = LatencyTracker(window=100)
+    assert tracker.percentile(95) is None
+    for latency in range(200):
+        tracker.record(latency)
+    assert len(tracker) == 100
+    assert tracker.percentile(0) == 100
+    assert tracker.percentile(50) == 150
+    assert tracker.percentile(100) == 199
+
+
+def test_hedged_call_deadline() -> None:
+    """Tests that the deadline uses the percentile once there are enough samples."""
+    hedged = HedgedCall(calls=[SleepCall(content="a")], delay=2, min_samples=10)
+    assert hedged.deadline() == 2
+    for latency in range(10):
+        hedged.latencies.record(latency / 10)
+    assert hedged.deadline() == pytest.approx(0.9)
+    hedged.percentile = None
+    assert hedged.deadline() == 2
+
+
+def test_hedged_call() -> None:
+    """Tests that the backup wins when the primary misses the deadline."""
+    primary = SleepCall(content="primary", delay=0.01)
+    backup = SleepCall(content="backup")
+    hedged = HedgedCall(calls=[primary, backup], delay=1)
+    assert hedged.call() == "primary"
+    assert len(hedged.latencies) == 1
+
+    primary.delay = 1
+    hedged.delay = 0.01
+    assert hedged.call() == "backup"
+    assert len(hedged.latencies) == 2
+
+    primary.fail = True
+    primary.delay = 0
+    hedged.delay = 10
+    assert hedged.call() == "backup"
+
+    backup.fail = True
+    with pytest.raises(RuntimeError, match="primary"):
+        hedged.call()
+
+
+@pytest.mark.asyncio
+async def test_hedged_call_async() -> None:
+    """Tests that the loser is cancelled when the backup wins."""
+    primary = SleepCall(content="primary", delay=10)
+    backup = SleepCall(content="backup")
+    hedged = HedgedCall(calls=[primary, backup], delay=0.01)
+    start = time.perf_counter()
+    assert await hedged.call_async() == "backup"
+    assert time.perf_counter() - start < 1
+
+    primary.delay = 0
+    assert await hedged.call_async() == "primary"
+
+    primary.fail = backup.fail = True
+    with pytest.raises(RuntimeError, match="primary"):
+        await hedged.call_async()
+
+
+def test_hedged_call_stream() -> None:
+    """Tests that streams are hedged on their first chunk."""
+    primary = SleepCall(content="slow", delay=0.5)
+    backup = SleepCall(content="fast")
+    hedged = HedgedCall(calls=[primary, backup], delay=0.01)
+    assert "".join(hedged.stream()) == "fast"
+    assert backup.closed
+    time.sleep(0.6)
+    assert primary.closed
+
+    primary.delay = 0
+    primary.content = ""
+    assert "".join(hedged.stream()) == ""
+
+
+@pytest.mark.asyncio
+async def test_hedged_call_stream_async() -> None:
+    """Tests that asynchronous streams are hedged on their first chunk."""
+    primary = SleepCall(content="slow", delay=10)
+    backup = SleepCall(content="fast")
+    hedged = HedgedCall(calls=[primary, backup], delay=0.01)
+    assert "".join([chunk async for chunk in hedged.stream_async()]) == "fast"
+    assert primary.closed and backup.closed
+
+    primary.delay = 0
+    primary.content = ""
+    assert [chunk async for chunk in hedged.stream_async()] == []
+
+    primary.fail = backup.fail = True
+    with pytest.raises(RuntimeError):
+        _ = [chunk async for chunk in hedged.stream_async()]
+
+
+@pytest.mark.asyncio
+async def test_hedged_call_simultaneous() -> None:
+    """Tests that a second successful stream finishing at once is closed."""
+    primary = SleepCall(content="primary", delay=0.05)
+    backup = SleepCall(content="backup", delay=0.0)
+    hedged = HedgedCall(calls=[primary, backup], delay=0.05)
+    chunks = [chunk async for chunk in hedged.stream_async()]
+    assert "".join(chunks) in ("primary", "backup")
+    assert primary.closed and backup.closed
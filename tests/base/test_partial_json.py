@@ -0,0 +1,76 @@
+"""Tests for the incremental JSON parser."""
+import json
+
+import pytest
+from pydantic_core import from_json
+
+from mirascope.base.partial_json import IncrementalJSONParser
+
+DOCUMENT = json.dumps(
+    {
+        "title": 'The "Name" of the Wind\n',
+        "author": {"first": "Patrick", "last": "Rothfuss", "born": 1973},
+        "rating": -4.5e-1,
+        "tags": ["fantasy", "☃", True, False, None, []],
+        "empty": {},
+    },
+    ensure_ascii=False,
+    indent=2,
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, len(DOCUMENT)])
+def test_incremental_json_parser_matches_from_json(chunk_size: int) -> None:
+    """Tests that every partial value matches `from_json(..., allow_partial=True)`."""
+    parser = IncrementalJSONParser()
+    for end in range(chunk_size, len(DOCUMENT) + chunk_size, chunk_size):
+        parser.feed(DOCUMENT[end - chunk_size : end])
+        assert parser.value == from_json(DOCUMENT[:end], allow_partial=True)
+    assert parser.done
+    assert parser.value == json.loads(DOCUMENT)
+
+
+@pytest.mark.parametrize(
+    "chunks,expected",
+    [
+        (['{"a": 1', "2"], {"a": 12}),
+        (['{"a": 1.', "5e", "3}"], {"a": 1500.0}),
+        (['["\\', "u26", '03"]'], ["☃"]),
+        (['{"a": tr', "ue}"], {"a": True}),
+        (["12"], 12),
+    ],
+)
+def test_incremental_json_parser_split_tokens(chunks: list[str], expected) -> None:
+    """Tests that tokens split across chunks are parsed correctly."""
+    parser = IncrementalJSONParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+    assert parser.value == expected
+
+
+def test_incremental_json_parser_no_value() -> None:
+    """Tests that accessing the value before one is started raises a `ValueError`."""
+    parser = IncrementalJSONParser()
+    parser.feed(" ")
+    assert not parser.done
+    with pytest.raises(ValueError):
+        parser.value  # noqa: B018
+
+
+@pytest.mark.parametrize(
+    "document",
+    ['{"a" 1}', '{"a": 1,}', "[1 2]", '{"a": "\\x"}', '{"a": tru }', "{]", '{"a": 1}}'],
+)
+def test_incremental_json_parser_invalid(document: str) -> None:
+    """Tests that invalid JSON raises a `ValueError`."""
+    with pytest.raises(ValueError):
+        IncrementalJSONParser().feed(document)
+
+
+def test_incremental_json_parser_invalid_number() -> None:
+    """Tests that an invalid number raises a `ValueError` once it's complete."""
+    parser = IncrementalJSONParser()
+    parser.feed("[01")
+    assert parser.value == []
+    with pytest.raises(ValueError):
+        parser.feed("]")
@@ -5,7 +5,7 @@ from typing import Any
 import pytest
 from pydantic import ConfigDict
 
-from mirascope.base.prompts import BasePrompt, tags
+from mirascope.base.prompts import BasePrompt, _compile_sections, tags
 from mirascope.base.types import Message
 
 
@@ -175,3 +175,28 @@ def test_messages_property_called_once() -> None:
     my_prompt = MyPrompt()
     my_prompt.messages()
     assert my_prompt.count == 1
+
+
+def test_compiled_template_is_reused() -> None:
+    """Tests that templates are compiled once and recompiled when they change."""
+
+    class MyPrompt(BasePrompt):
+        prompt_template = """
+        SYSTEM: You are a {role}.
+        USER: {question}
+        """
+
+        role: str
+        question: str
+
+    _compile_sections.cache_clear()
+    prompt = MyPrompt(role="librarian", question="What should I read?")
+    assert (
+        prompt.messages()
+        == MyPrompt(role="librarian", question="What should I read?").messages()
+    )
+    assert _compile_sections.cache_info().misses == 1
+    assert _compile_sections.cache_info().hits == 1
+
+    MyPrompt.prompt_template = "USER: {question}"
+    assert prompt.messages() == [{"role": "user", "content": "What should I read?"}]
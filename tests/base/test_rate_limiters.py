@@ -0,0 +1,104 @@
+"""Tests for client-side rate limiting."""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from openai.types.chat import ChatCompletion
+
+from mirascope.base.rate_limiters import RateLimiter, estimate_tokens
+from mirascope.openai import OpenAICall
+
+
+@patch("mirascope.base.rate_limiters.time.sleep")
+def test_rate_limiter_requests_per_minute(mock_sleep: MagicMock) -> None:
+    """Tests that requests beyond the budget wait for the bucket to refill."""
+    limiter = RateLimiter(requests_per_minute=2)
+    limiter.acquire()
+    limiter.acquire()
+    mock_sleep.assert_not_called()
+    limiter.acquire()
+    assert mock_sleep.call_args[0][0] == pytest.approx(30, abs=0.1)
+
+
+@patch("mirascope.base.rate_limiters.time.sleep")
+def test_rate_limiter_tokens_per_minute(mock_sleep: MagicMock) -> None:
+    """Tests that tokens are reserved up front and reconciled with actual usage."""
+    limiter = RateLimiter(tokens_per_minute=600)
+    limiter.acquire(500)
+    mock_sleep.assert_not_called()
+    limiter.reconcile(500, 700)
+    limiter.acquire(0)
+    assert mock_sleep.call_args[0][0] == pytest.approx(10, abs=0.1)
+    limiter.reconcile(0, -700)
+    mock_sleep.reset_mock()
+    limiter.acquire(100)
+    mock_sleep.assert_not_called()
+
+
+def test_rate_limiter_unlimited() -> None:
+    """Tests that a rate limiter without budgets never waits or fails."""
+    limiter = RateLimiter()
+    limiter.acquire(10**9)
+    limiter.reconcile(0, 10**9)
+
+
+@pytest.mark.asyncio
+@patch("mirascope.base.rate_limiters.asyncio.sleep", new_callable=AsyncMock)
+async def test_rate_limiter_acquire_async(mock_sleep: AsyncMock) -> None:
+    """Tests that waiting asynchronously uses `asyncio.sleep`."""
+    limiter = RateLimiter(requests_per_minute=1)
+    await limiter.acquire_async()
+    mock_sleep.assert_not_called()
+    await limiter.acquire_async()
+    assert mock_sleep.call_args[0][0] == pytest.approx(60, abs=0.1)
+
+
+def test_estimate_tokens() -> None:
+    """Tests the rough character based token estimate."""
+    assert estimate_tokens("a" * 38) == 10
+    assert estimate_tokens([{"role": "user", "content": "hi"}]) == 8
+    assert estimate_tokens(object()) > 0
+
+
+@patch(
+    "openai.resources.chat.completions.Completions.create",
+    new_callable=MagicMock,
+)
+def test_rate_limited_call(
+    mock_create: MagicMock,
+    fixture_openai_test_call: OpenAICall,
+    fixture_chat_completion: ChatCompletion,
+) -> None:
+    """Tests that calls reserve their estimate and reconcile with actual usage."""
+    mock_create.return_value = fixture_chat_completion
+    limiter = MagicMock(spec=RateLimiter)
+    fixture_openai_test_call.call_params.rate_limiter = limiter
+    fixture_openai_test_call.call_params.max_tokens = 100
+    fixture_openai_test_call.call()
+    tokens = estimate_tokens(fixture_openai_test_call.messages()) + 100
+    limiter.acquire.assert_called_once_with(tokens)
+    usage = fixture_chat_completion.usage
+    assert usage is not None
+    limiter.reconcile.assert_called_once_with(
+        tokens, usage.prompt_tokens + usage.completion_tokens
+    )
+    assert "rate_limiter" not in mock_create.call_args.kwargs
+
+
+@patch(
+    "openai.resources.chat.completions.AsyncCompletions.create",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_rate_limited_call_async(
+    mock_create: AsyncMock,
+    fixture_openai_test_call: OpenAICall,
+    fixture_chat_completion: ChatCompletion,
+) -> None:
+    """Tests that asynchronous calls use a rate limiter passed as a keyword argument."""
+    mock_create.return_value = fixture_chat_completion
+    limiter = MagicMock(spec=RateLimiter)
+    await fixture_openai_test_call.call_async(rate_limiter=limiter)
+    tokens = estimate_tokens(fixture_openai_test_call.messages())
+    limiter.acquire_async.assert_awaited_once_with(tokens)
+    limiter.reconcile.assert_called_once()
+    assert "rate_limiter" not in mock_create.call_args.kwargs
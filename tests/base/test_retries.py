@@ -0,0 +1,469 @@
+"""Tests for retry policies."""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from contextlib import nullcontext
+from typing import Any, AsyncGenerator, ContextManager, Generator, Optional, Type
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import anthropic
+import httpx
+import openai
+import pytest
+from anthropic.types import ContentBlockDeltaEvent, ContentBlockStopEvent, TextDelta
+from google.api_core import exceptions as google_exceptions
+from mistralai.exceptions import MistralAPIException, MistralConnectionException
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice
+from openai.types.chat.chat_completion_chunk import (
+    ChoiceDelta,
+    ChoiceDeltaToolCall,
+    ChoiceDeltaToolCallFunction,
+)
+from pydantic import BaseModel
+from tenacity import RetryCallState, RetryError
+
+from mirascope.base.retries import (
+    RetryBudget,
+    RetryPolicy,
+    is_transient_error,
+    retry_after,
+    status_code,
+)
+from mirascope.anthropic import AnthropicCall
+from mirascope.enums import MessageRole
+from mirascope.openai import OpenAICall, OpenAICallResponseChunk, OpenAIExtractor
+
+
+def _status_error(
+    status: int,
+    headers: Optional[dict[str, str]] = None,
+    body: Any = None,
+) -> openai.APIStatusError:
+    """Returns the OpenAI error for a response with the given status and headers."""
+    response = httpx.Response(
+        status,
+        headers=headers,
+        request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"),
+    )
+    error_types: dict[int, Type[openai.APIStatusError]] = {
+        400: openai.BadRequestError,
+        429: openai.RateLimitError,
+        500: openai.InternalServerError,
+    }
+    return error_types.get(status, openai.APIStatusError)(
+        "error", response=response, body=body
+    )
+
+
+_REQUEST = httpx.Request("POST", "https://api.openai.com")
+
+
+@pytest.mark.parametrize(
+    "error,expected",
+    [
+        (_status_error(429), True),
+        (_status_error(500), True),
+        (_status_error(408), True),
+        (_status_error(400), False),
+        (_status_error(429, body={"code": "insufficient_quota"}), False),
+        (openai.APIConnectionError(request=_REQUEST), True),
+        (openai.APITimeoutError(request=_REQUEST), True),
+        (httpx.ConnectError("error"), True),
+        (MistralAPIException("error", http_status=503), True),
+        (MistralAPIException("error", http_status=401), False),
+        (MistralConnectionException("error"), True),
+        (google_exceptions.ResourceExhausted("error"), True),
+        (google_exceptions.InvalidArgument("error"), False),
+        (google_exceptions.DeadlineExceeded("error"), True),
+        (ConnectionResetError(), True),
+        (TimeoutError(), True),
+        (ValueError(), False),
+    ],
+)
+def test_is_transient_error(error: BaseException, expected: bool) -> None:
+    """Tests that provider errors are classified as retryable or fatal."""
+    assert is_transient_error(error) == expected
+
+
+def test_status_code() -> None:
+    """Tests reading the status code of each provider's errors."""
+    assert status_code(_status_error(429)) == 429
+    assert status_code(MistralAPIException("error", http_status=503)) == 503
+    assert status_code(google_exceptions.ServiceUnavailable("error")) == 503
+    assert status_code(ValueError()) is None
+
+
+def test_retry_after() -> None:
+    """Tests parsing the `Retry-After` headers of provider errors."""
+    assert retry_after(_status_error(429, {"retry-after-ms": "1500"})) == 1.5
+    assert retry_after(_status_error(429, {"Retry-After": "3"})) == 3.0
+    date = datetime.now(timezone.utc) + timedelta(seconds=30)
+    header = {"retry-after": format_datetime(date, usegmt=True)}
+    assert retry_after(_status_error(429, header)) == pytest.approx(30, abs=2)
+    assert retry_after(_status_error(429, {"retry-after": "soon"})) is None
+    assert retry_after(_status_error(429)) is None
+    error = MistralAPIException("error", 429, headers={"retry-after": "2"})
+    assert retry_after(error) == 2.0
+    assert retry_after(ValueError()) is None
+
+
+def test_retry_budget() -> None:
+    """Tests that retries are only allowed while the budget has retries left."""
+    budget = RetryBudget(ratio=0.5, capacity=2)
+    assert budget.withdraw() and budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+    for _ in range(10):
+        budget.deposit()
+    assert budget.remaining == 2
+
+
+def test_retry_policy_backoff() -> None:
+    """Tests that the backoff grows exponentially up to `max_delay` with jitter."""
+    policy = RetryPolicy(initial_delay=1, multiplier=2, max_delay=5, jitter=False)
+    assert [policy.backoff(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+    policy = RetryPolicy(initial_delay=1, multiplier=2, max_delay=5)
+    assert all(0 <= policy.backoff(3) <= 4 for _ in range(100))
+
+
+def test_retry_policy_wait_honors_retry_after() -> None:
+    """Tests that the wait before a retry is at least the error's `Retry-After`."""
+    policy = RetryPolicy(initial_delay=1, jitter=False)
+    retrying = policy.retrying()
+    retry_state = RetryCallState(retrying, fn=None, args=(), kwargs={})
+    error = _status_error(429, {"retry-after": "10"})
+    retry_state.set_exception((type(error), error, None))
+    assert retrying.wait(retry_state) == 10  # type: ignore
+    retry_state = RetryCallState(retrying, fn=None, args=(), kwargs={})
+    retry_state.set_exception((ValueError, ValueError(), None))
+    assert retrying.wait(retry_state) == 1  # type: ignore
+
+
+def test_retry_policy_should_retry() -> None:
+    """Tests which errors a policy decides to retry."""
+    budget = RetryBudget(capacity=1)
+    policy = RetryPolicy(max_retry_after=5, budget=budget)
+    assert not policy.should_retry(_status_error(400))
+    assert not policy.should_retry(_status_error(429, {"retry-after": "60"}))
+    assert policy.should_retry(ValueError(), retryable=(ValueError,))
+    assert not policy.should_retry(_status_error(429))
+    policy = RetryPolicy(retry_on=lambda error: isinstance(error, KeyError))
+    assert policy.should_retry(KeyError())
+
+
+@patch(
+    "openai.resources.chat.completions.Completions.create",
+    new_callable=MagicMock,
+)
+def test_call_with_retry_policy(
+    mock_create: MagicMock,
+    fixture_openai_test_call: OpenAICall,
+    fixture_chat_completion: ChatCompletion,
+) -> None:
+    """Tests that calls retry transient errors and raise fatal errors immediately."""
+    policy = RetryPolicy(max_attempts=3, initial_delay=0)
+    mock_create.side_effect = [
+        _status_error(429),
+        _status_error(500),
+        fixture_chat_completion,
+    ]
+    response = fixture_openai_test_call.call(retries=policy)
+    assert response.response == fixture_chat_completion
+    assert mock_create.call_count == 3
+
+    mock_create.reset_mock()
+    mock_create.side_effect = [_status_error(400), fixture_chat_completion]
+    with pytest.raises(openai.BadRequestError):
+        fixture_openai_test_call.call(retries=policy)
+    assert mock_create.call_count == 1
+
+    mock_create.reset_mock()
+    mock_create.side_effect = [_status_error(500)] * 3
+    with pytest.raises(openai.InternalServerError):
+        fixture_openai_test_call.call(retries=policy)
+    assert mock_create.call_count == 3
+
+
+@patch(
+    "openai.resources.chat.completions.Completions.create",
+    new_callable=MagicMock,
+)
+def test_call_with_retry_budget(
+    mock_create: MagicMock,
+    fixture_openai_test_call: OpenAICall,
+) -> None:
+    """Tests that errors are raised without retrying once the budget is spent."""
+    budget = RetryBudget(ratio=0, capacity=2)
+    policy = RetryPolicy(max_attempts=5, initial_delay=0, budget=budget)
+    mock_create.side_effect = _status_error(500)
+    with pytest.raises(openai.InternalServerError):
+        fixture_openai_test_call.call(retries=policy)
+    assert mock_create.call_count == 3
+    with pytest.raises(openai.InternalServerError):
+        fixture_openai_test_call.call(retries=policy)
+    assert mock_create.call_count == 4
+
+
+@patch(
+    "openai.resources.chat.completions.AsyncCompletions.create",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_call_async_with_retry_policy(
+    mock_create: AsyncMock,
+    fixture_openai_test_call: OpenAICall,
+    fixture_chat_completion: ChatCompletion,
+) -> None:
+    """Tests that asynchronous calls retry with a policy."""
+    mock_create.side_effect = [
+        openai.APIConnectionError(request=_REQUEST),
+        fixture_chat_completion,
+    ]
+    policy = RetryPolicy(initial_delay=0)
+    response = await fixture_openai_test_call.call_async(retries=policy)
+    assert response.response == fixture_chat_completion
+    assert mock_create.call_count == 2
+
+
+@patch(
+    "openai.resources.chat.completions.Completions.create",
+    new_callable=MagicMock,
+)
+def test_extract_with_retry_policy(
+    mock_create: MagicMock,
+    fixture_my_openai_tool_schema: Type[BaseModel],
+    fixture_chat_completion: ChatCompletion,
+    fixture_chat_completion_with_tools: ChatCompletion,
+) -> None:
+    """Tests that extractions retry both transient and validation errors."""
+
+    class TempExtractor(OpenAIExtractor[BaseModel]):
+        prompt_template = "test"
+        api_key = "test"
+
+        extract_schema: Type[BaseModel] = fixture_my_openai_tool_schema
+
+    mock_create.side_effect = [
+        _status_error(429),
+        fixture_chat_completion,
+        fixture_chat_completion_with_tools,
+    ]
+    policy = RetryPolicy(initial_delay=0)
+    extraction = TempExtractor().extract(retries=policy)
+    assert isinstance(extraction, fixture_my_openai_tool_schema)
+    assert mock_create.call_count == 3
+
+    mock_create.reset_mock()
+    mock_create.side_effect = [_status_error(401)]
+    with pytest.raises(openai.APIStatusError):
+        TempExtractor().extract(retries=policy)
+    assert mock_create.call_count == 1
+
+    with pytest.raises(RetryError):
+        mock_create.side_effect = [fixture_chat_completion] * 2
+        TempExtractor().extract(retries=2)
+
+
+def _chunk(content: str) -> ChatCompletionChunk:
+    """Returns a chat completion chunk with the given content."""
+    return ChatCompletionChunk(
+        id="id",
+        choices=[ChunkChoice(index=0, delta=ChoiceDelta(content=content))],
+        created=0,
+        model="gpt-4",
+        object="chat.completion.chunk",
+    )
+
+
+def _stream(
+    contents: list[str], error: Optional[Exception] = None
+) -> Generator[ChatCompletionChunk, None, None]:
+    """Yields chunks with the given contents, then raises `error` if given."""
+    yield from _stream_of([_chunk(content) for content in contents], error)
+
+
+def _stream_of(
+    chunks: list[ChatCompletionChunk], error: Optional[Exception] = None
+) -> Generator[ChatCompletionChunk, None, None]:
+    """Yields the given chunks, then raises `error` if given."""
+    yield from chunks
+    if error is not None:
+        raise error
+
+
+def test_chunk_skip_content() -> None:
+    """Tests that a chunk's content can skip a prefix without modifying it."""
+    chunk = OpenAICallResponseChunk(chunk=_chunk("hello"))
+    skipped = chunk.skip_content(2)
+    assert skipped.content == "llo"
+    assert skipped.skip_content(1).content == "lo"
+    assert chunk.content == "hello"
+
+
+@patch(
+    "openai.resources.chat.completions.Completions.create",
+    new_callable=MagicMock,
+)
+def test_stream_resume_suppress(
+    mock_create: MagicMock, fixture_openai_test_call: OpenAICall
+) -> None:
+    """Tests that a regenerated stream skips the content that was already yielded."""
+    error = openai.APIConnectionError(request=_REQUEST)
+    mock_create.side_effect = [
+        _stream(["", "Hello", " w"], error),
+        _stream(["", "Hel", "lo wor", "ld", ""]),
+    ]
+    policy = RetryPolicy(initial_delay=0, resume_streams="suppress")
+    chunks = list(fixture_openai_test_call.stream(retries=policy))
+    assert [chunk.content for chunk in chunks] == ["", "Hello", " w", "or", "ld", ""]
+    assert mock_create.call_count == 2
+    assert mock_create.call_args_list[0] == mock_create.call_args_list[1]
+
+    mock_create.side_effect = [_stream(["Hello"], error), _stream(["Help"])]
+    with pytest.raises(RuntimeError):
+        list(fixture_openai_test_call.stream(retries=policy))
+
+    mock_create.side_effect = [_stream(["Hello"], error), _stream(["Hel"])]
+    with pytest.raises(RuntimeError):
+        list(fixture_openai_test_call.stream(retries=policy))
+
+
+def _anthropic_stream(
+    events: list[Any], error: Optional[Exception] = None
+) -> ContextManager[Generator[Any, None, None]]:
+    """Returns a message stream of the given events, then raises `error` if given."""
+
+    def stream() -> Generator[Any, None, None]:
+        yield from events
+        if error is not None:
+            raise error
+
+    return nullcontext(stream())
+
+
+def _text(text: str) -> ContentBlockDeltaEvent:
+    """Returns an Anthropic text delta event."""
+    return ContentBlockDeltaEvent(
+        delta=TextDelta(text=text, type="text_delta"),
+        index=0,
+        type="content_block_delta",
+    )
+
+
+class Greeting(AnthropicCall):
+    prompt_template = "Say hello."
+    api_key = "test"
+
+
+@patch("anthropic.resources.messages.Messages.stream", new_callable=MagicMock)
+def test_stream_resume_prefill(mock_stream: MagicMock) -> None:
+    """Tests that a stream continues from an assistant prefill of the yielded text."""
+    stop = ContentBlockStopEvent(index=0, type="content_block_stop")
+    error = anthropic.APIConnectionError(request=_REQUEST)
+    mock_stream.side_effect = [
+        _anthropic_stream([], error),
+        _anthropic_stream([_text("Hello"), _text(" ")], error),
+        _anthropic_stream([_text(" world"), _text("!"), stop]),
+    ]
+    policy = RetryPolicy(initial_delay=0, resume_streams="prefill")
+    chunks = list(Greeting().stream(retries=policy))
+    assert [chunk.content for chunk in chunks] == ["Hello", " ", "world", "!", ""]
+    assert chunks[-1].chunk == stop
+    assert mock_stream.call_count == 3
+    messages = mock_stream.call_args_list[2].kwargs["messages"]
+    assert messages[:-1] == Greeting().messages()
+    assert messages[-1] == {"role": "assistant", "content": "Hello"}
+
+    mock_stream.side_effect = [
+        _anthropic_stream([_text("Hi ")], error),
+        _anthropic_stream([_text("there")]),
+    ]
+    chunks = list(Greeting().stream(retries=policy))
+    assert "".join(chunk.content for chunk in chunks) == "Hi there"
+
+
+def test_stream_resume_prefill_unsupported(
+    fixture_openai_test_call: OpenAICall,
+) -> None:
+    """Tests that resuming with a prefill requires a provider that continues it."""
+    policy = RetryPolicy(initial_delay=0, resume_streams="prefill")
+    with pytest.raises(ValueError):
+        list(fixture_openai_test_call.stream(retries=policy))
+
+
+def _tool_chunk(arguments: str) -> ChatCompletionChunk:
+    """Returns a chat completion chunk with tool call arguments and no content."""
+    chunk = _chunk("")
+    chunk.choices[0].delta = ChoiceDelta(
+        tool_calls=[
+            ChoiceDeltaToolCall(
+                index=0, function=ChoiceDeltaToolCallFunction(arguments=arguments)
+            )
+        ]
+    )
+    return chunk
+
+
+@patch(
+    "openai.resources.chat.completions.Completions.create",
+    new_callable=MagicMock,
+)
+def test_stream_resume_keeps_new_chunks_without_content(
+    mock_create: MagicMock, fixture_openai_test_call: OpenAICall
+) -> None:
+    """Tests that only the chunks without content that were yielded are dropped."""
+    error = openai.APIConnectionError(request=_REQUEST)
+    mock_create.side_effect = [
+        _stream_of([_chunk("Hi"), _tool_chunk("{")], error),
+        _stream_of([_chunk("Hi"), _tool_chunk("{"), _tool_chunk("}")]),
+    ]
+    policy = RetryPolicy(initial_delay=0, resume_streams="suppress")
+    chunks = list(fixture_openai_test_call.stream(retries=policy))
+    assert [chunk.content for chunk in chunks] == ["Hi", "", ""]
+    assert (
+        [
+            chunk.tool_calls[0].function.arguments  # type: ignore
+            for chunk in chunks[1:]
+        ]
+        == ["{", "}"]
+    )
+
+
+@patch(
+    "openai.resources.chat.completions.AsyncCompletions.create",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_stream_async_resume(
+    mock_create: AsyncMock, fixture_openai_test_call: OpenAICall
+) -> None:
+    """Tests resuming an asynchronous stream."""
+
+    async def stream(
+        contents: list[str], error: Optional[Exception] = None
+    ) -> AsyncGenerator[ChatCompletionChunk, None]:
+        for chunk in _stream(contents, error):
+            yield chunk
+
+    mock_create.side_effect = [
+        stream(["Hello", " w"], _status_error(500)),
+        stream(["Hello world"]),
+    ]
+    policy = RetryPolicy(initial_delay=0, resume_streams="suppress")
+    chunks = [
+        chunk async for chunk in fixture_openai_test_call.stream_async(retries=policy)
+    ]
+    assert [chunk.content for chunk in chunks] == ["Hello", " w", "orld"]
+
+
+def test_prefill_unsupported(fixture_openai_test_call: OpenAICall) -> None:
+    """Tests that prefilling requires a provider that continues the prefill."""
+    call = Greeting()._with_prefill("Hi")
+    assert call.messages()[-1] == {"role": "assistant", "content": "Hi"}
+    with pytest.raises(ValueError):
+        call._parse_messages([MessageRole.USER])
+    with pytest.raises(ValueError):
+        fixture_openai_test_call._with_prefill("Hi")
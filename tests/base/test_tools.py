@@ -64,3 +64,19 @@ def test_extended_base_tool() -> None:
         "required": ["a", "ref"],
         "type": "object",
     }
+
+
+@patch.multiple(BaseTool, __abstractmethods__=set())
+def test_tool_schema_is_cached() -> None:
+    """Tests that the tool schema is generated once per tool class."""
+
+    class MyTool(BaseTool[str]):
+        """A test tool."""
+
+        param: str
+
+    with patch.object(
+        MyTool, "model_json_schema", wraps=MyTool.model_json_schema
+    ) as mock_model_json_schema:
+        assert MyTool.tool_schema() is MyTool.tool_schema()
+        mock_model_json_schema.assert_called_once()
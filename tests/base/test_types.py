@@ -28,3 +28,36 @@ def test_base_call_params_kwargs_with_tools() -> None:
     kwargs = call_params.kwargs(Tool)  # type: ignore
     for tool in kwargs["tools"]:
         assert issubclass(tool, Tool)
+
+
+def test_base_call_params_kwargs_overrides() -> None:
+    """Tests that overrides are merged as if set through `model_copy`."""
+    call_params = BaseCallParams[BaseTool[Any]](model="model", seed=1)
+    kwargs = call_params.kwargs(
+        BaseTool,  # type: ignore
+        overrides={"model": "other", "seed": None, "cache": None, "tools": []},
+    )
+    assert kwargs == {"model": "other"}
+    assert call_params.kwargs(BaseTool) == {"model": "model", "seed": 1}  # type: ignore
+
+
+def test_base_call_params_kwargs_snapshot() -> None:
+    """Tests that the kwargs snapshot is reused and refreshed on assignment."""
+    call_params = BaseCallParams[BaseTool[Any]](model="model")
+    with patch.object(
+        BaseCallParams,
+        "model_dump",
+        side_effect=BaseCallParams.model_dump,
+        autospec=True,
+    ) as mock_model_dump:
+        kwargs = call_params.kwargs()
+        kwargs["model"] = "mutated"
+        assert call_params.kwargs() == {"model": "model"}
+        assert mock_model_dump.call_count == 1
+
+        call_params.model = "other"
+        assert call_params.kwargs() == {"model": "other"}
+        copy = call_params.model_copy(update={"model": "copy"})
+        assert copy.kwargs() == {"model": "copy"}
+        assert call_params.kwargs() == {"model": "other"}
+        assert mock_model_dump.call_count == 3
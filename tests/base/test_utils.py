@@ -1,4 +1,6 @@
 """Tests for the base utility functions."""
+import gc
+import weakref
 from typing import Annotated, Callable, Union
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -15,6 +17,7 @@ from mirascope.base.utils import (
     tool_fn,
 )
 from mirascope.openai.calls import OpenAICall
+from mirascope.openai.tools import OpenAITool
 
 
 @patch.multiple(BaseTool, __abstractmethods__=set())
@@ -238,6 +241,59 @@ def test_convert_base_type_to_tool(type_, expected_tool: BaseTool) -> None:
     assert tool.model_json_schema() == expected_tool.model_json_schema()
 
 
+def test_tool_conversions_are_cached() -> None:
+    """Tests that converting the same source object returns the same tool type."""
+    fn_tool = convert_function_to_tool(simple_tool, BaseTool)  # type: ignore
+    assert convert_function_to_tool(simple_tool, BaseTool) is fn_tool  # type: ignore
+    assert convert_function_to_tool(simple_tool, OpenAITool) is not fn_tool
+    model_tool = convert_base_model_to_tool(AllDescriptions, OpenAITool)
+    assert convert_base_model_to_tool(AllDescriptions, OpenAITool) is model_tool
+    assert convert_base_type_to_tool(int, OpenAITool) is convert_base_type_to_tool(
+        int, OpenAITool
+    )
+    assert convert_base_type_to_tool(
+        list[int], OpenAITool
+    ) is convert_base_type_to_tool(list[int], OpenAITool)
+
+
+def test_tool_conversions_do_not_leak() -> None:
+    """Tests that cached tools don't keep their source functions alive."""
+
+    def make_tool(n: int) -> Callable:
+        def tool(value: int) -> int:
+            """Adds a constant."""
+            return value + n
+
+        return tool
+
+    refs = []
+    for n in range(5):
+        fn = make_tool(n)
+        assert convert_function_to_tool(fn, OpenAITool) is convert_function_to_tool(
+            fn, OpenAITool
+        )
+        refs.append(weakref.ref(fn))
+    del fn
+    gc.collect()
+    assert all(ref() is None for ref in refs)
+
+
+def test_tool_conversions_of_methods_are_bound() -> None:
+    """Tests that tools converted from bound methods call their own instance."""
+
+    class Adder:
+        def __init__(self, n: int) -> None:
+            self.n = n
+
+        def add(self, value: int) -> int:
+            """Adds a constant."""
+            return value + self.n
+
+    one, two = Adder(1), Adder(2)
+    assert convert_function_to_tool(one.add, OpenAITool).fn.fget(None)(1) == 2  # type: ignore
+    assert convert_function_to_tool(two.add, OpenAITool).fn.fget(None)(1) == 3  # type: ignore
+
+
 def test_retry_decorator() -> None:
     @retry
     def dummy(retries: Union[int, Retrying] = 0) -> None:
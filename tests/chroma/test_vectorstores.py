@@ -1,5 +1,4 @@
 """Tests for Mirascope ChromaVectorStore class"""
-import uuid
 from typing import Union
 from unittest.mock import MagicMock, patch
 
@@ -7,6 +6,7 @@ import pytest
 
 from mirascope.chroma import ChromaVectorStore
 from mirascope.chroma.types import ChromaQueryResult
+from mirascope.rag.chunkers import chunk_id
 from mirascope.rag.types import Document
 
 
@@ -22,19 +22,14 @@ def test_chroma_vectorstore_add_document(
 
 
 @patch("chromadb.api.models.Collection.Collection.upsert")
-@patch("uuid.uuid4")
 def test_chroma_vectorstore_add_text(
-    mock_uuid: MagicMock,
     mock_upsert: MagicMock,
     fixture_ephemeral_client: ChromaVectorStore,
 ):
     """Test the add method of the ChromaVectorStore class with string as argument"""
-    mock_uuid.return_value = uuid.UUID("12345678-1234-5678-1234-567812345678")
     mock_upsert.return_value = None
     fixture_ephemeral_client.add("foo")
-    mock_upsert.assert_called_once_with(
-        ids=["12345678-1234-5678-1234-567812345678"], documents=["foo"]
-    )
+    mock_upsert.assert_called_once_with(ids=[chunk_id("foo", 0)], documents=["foo"])
 
 
 @pytest.mark.parametrize(
@@ -81,3 +76,43 @@ def test_chroma_vectorstore_http_mode(
     """Test the _client property with mode=http of the ChromaVectorStore class."""
     fixture_http_client._client
     mock_chroma_client.assert_called_once()
+
+
+@patch("chromadb.api.models.Collection.Collection.delete")
+@patch("chromadb.api.models.Collection.Collection.upsert")
+@patch("chromadb.api.models.Collection.Collection.get")
+def test_chroma_vectorstore_add_source(
+    mock_get: MagicMock,
+    mock_upsert: MagicMock,
+    mock_delete: MagicMock,
+    fixture_ephemeral_client: ChromaVectorStore,
+):
+    """Test that adding a source only upserts new chunks and deletes stale ones."""
+    mock_get.return_value = {"ids": ["doc#1", "doc#2"]}
+    fixture_ephemeral_client.add(
+        [Document(id="2", text="bar"), Document(id="3", text="baz")], source="doc"
+    )
+    mock_get.assert_called_once_with(where={"source": "doc"}, include=[])
+    mock_upsert.assert_called_once_with(
+        ids=["doc#3"], documents=["baz"], metadatas=[{"source": "doc"}]
+    )
+    mock_delete.assert_called_once_with(ids=["doc#1"])
+
+    mock_upsert.reset_mock()
+    mock_get.return_value = {"ids": ["doc#2", "doc#3"]}
+    fixture_ephemeral_client.add(
+        [Document(id="2", text="bar"), Document(id="3", text="baz")], source="doc"
+    )
+    mock_upsert.assert_not_called()
+
+
+@patch("chromadb.api.models.Collection.Collection.upsert")
+def test_chroma_vectorstore_upsert_embeddings(
+    mock_upsert: MagicMock,
+    fixture_ephemeral_client: ChromaVectorStore,
+):
+    """Test that precomputed embeddings are passed through on upsert."""
+    fixture_ephemeral_client._upsert([Document(text="foo", id="1")], [(0.1, 0.2)])
+    mock_upsert.assert_called_once_with(
+        ids=["1"], documents=["foo"], embeddings=[[0.1, 0.2]]
+    )
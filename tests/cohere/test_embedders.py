@@ -3,11 +3,17 @@ from typing import Literal, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from cohere.types import EmbedResponse_EmbeddingsFloats
+from cohere.types import (
+    EmbedByTypeResponseEmbeddings,
+    EmbedResponse,
+    EmbedResponse_EmbeddingsByType,
+    EmbedResponse_EmbeddingsFloats,
+)
 from pytest import FixtureRequest
 
+from mirascope.base.caches import InMemoryCache
 from mirascope.cohere.embedders import CohereEmbedder
-from mirascope.cohere.types import CohereEmbeddingResponse
+from mirascope.cohere.types import CohereEmbeddingParams, CohereEmbeddingResponse
 
 
 @patch(
@@ -77,3 +83,72 @@ def test_cohere_embedder_call(
     )
     embedding = fixture_cohere_test_embedder([text])
     assert isinstance(embedding, instance)
+
+
+def _embed_texts(texts: list[str], **kwargs) -> EmbedResponse:
+    """Returns an embedding of each text's length, by type if requested."""
+    embeddings = [[float(len(text))] for text in texts]
+    if kwargs.get("embedding_types"):
+        return EmbedResponse_EmbeddingsByType(
+            id="test",
+            embeddings=EmbedByTypeResponseEmbeddings(float_=embeddings),  # type: ignore
+            texts=texts,
+        )
+    return EmbedResponse_EmbeddingsFloats(id="test", embeddings=embeddings, texts=texts)
+
+
+@pytest.mark.parametrize("embedding_types", [None, ["float"]])
+@patch("cohere.client.Client.embed", new_callable=MagicMock)
+def test_cohere_embedder_embed_cached(
+    mock_embed: MagicMock, embedding_types: Optional[list[Literal["float"]]]
+) -> None:
+    """Tests that only inputs missing from the cache are embedded."""
+    mock_embed.side_effect = _embed_texts
+
+    class TestEmbedder(CohereEmbedder):
+        api_key = "test"
+        embedding_params = CohereEmbeddingParams(
+            model="test_model", embedding_types=embedding_types, cache=InMemoryCache()
+        )
+
+    embedder = TestEmbedder()
+    assert embedder.embed(["a", "bb"]).embeddings == [[1.0], [2.0]]
+    response = embedder.embed(["ccc", "a"])
+    assert response.embeddings == [[3.0], [1.0]]
+    assert response.response.texts == ["ccc", "a"]
+    assert mock_embed.call_args.kwargs["texts"] == ["ccc"]
+    assert embedder(["bb", "a"]) == [[2.0], [1.0]]
+    assert mock_embed.call_count == 2
+
+    TestEmbedder.embedding_params = TestEmbedder.embedding_params.model_copy(
+        update={"input_type": "search_document"}
+    )
+    embedder.embed(["a"])
+    assert mock_embed.call_count == 3
+
+
+@patch("cohere.client.AsyncClient.embed", new_callable=AsyncMock)
+@pytest.mark.asyncio
+async def test_cohere_embedder_embed_async_cached(
+    mock_embed: AsyncMock,
+    fixture_cohere_embeddings_by_type_no_data: EmbedResponse_EmbeddingsByType,
+) -> None:
+    """Tests that only inputs missing from the cache are embedded asynchronously."""
+    mock_embed.side_effect = _embed_texts
+
+    class TestEmbedder(CohereEmbedder):
+        api_key = "test"
+        embedding_params = CohereEmbeddingParams(
+            model="test_model", cache=InMemoryCache()
+        )
+
+    embedder = TestEmbedder()
+    assert (await embedder.embed_async(["a"])).embeddings == [[1.0]]
+    assert (await embedder.embed_async(["a", "bb"])).embeddings == [[1.0], [2.0]]
+    assert (await embedder.embed_async(["bb"])).embeddings == [[2.0]]
+    assert mock_embed.call_count == 2
+
+    mock_embed.side_effect = None
+    mock_embed.return_value = fixture_cohere_embeddings_by_type_no_data
+    response = await embedder.embed_async(["ccc"])
+    assert response.response is fixture_cohere_embeddings_by_type_no_data
@@ -6,6 +6,7 @@ import pytest
 from cohere.types import NonStreamedChatResponse
 from pydantic import BaseModel
 
+from mirascope.cohere.calls import CohereCall
 from mirascope.cohere.extractors import CohereExtractor
 from mirascope.cohere.tools import CohereTool
 from mirascope.cohere.types import CohereCallParams, CohereCallResponse
@@ -76,3 +77,30 @@ def test_cohere_extractor_extract_with_no_tools(
 
     with pytest.raises(AttributeError):
         TempExtractor().extract()
+
+
+@patch(
+    "mirascope.base.extractors.BaseExtractor._extract_many_async",
+    new_callable=AsyncMock,
+)
+@patch("mirascope.base.extractors.BaseExtractor._extract_many", new_callable=MagicMock)
+@pytest.mark.asyncio
+async def test_cohere_extractor_extract_many(
+    mock_extract_many: MagicMock, mock_extract_many_async: AsyncMock
+) -> None:
+    """Tests that `extract_many` packs the extractors into a single Cohere call."""
+
+    class TempExtractor(CohereExtractor[str]):
+        extract_schema: Type[str] = str
+        prompt_template = "{text}"
+
+        text: str
+
+    extractors = [TempExtractor(text="a"), TempExtractor(text="b")]
+    mock_extract_many.return_value = mock_extract_many_async.return_value = ["a", "b"]
+    assert TempExtractor.extract_many(extractors, retries=2) == ["a", "b"]
+    mock_extract_many.assert_called_once_with(CohereCall, CohereTool, extractors, 2)
+    assert await TempExtractor.extract_many_async(extractors) == ["a", "b"]
+    mock_extract_many_async.assert_called_once_with(
+        CohereCall, CohereTool, extractors, 0
+    )
@@ -180,3 +180,12 @@ def test_cohere_call_response_chunk_properties(
     assert call_chunk.documents is None
     assert call_chunk.citations is None
     assert call_chunk.content == ""
+
+
+def test_cohere_call_response_chunk_skip_content():
+    """Tests that `skip_content` copies the chunk with a suffix of its content."""
+    chunk = CohereCallResponseChunk(
+        chunk=StreamedChatResponse_TextGeneration(text="hello")
+    )
+    assert chunk.skip_content(2).content == "llo"
+    assert chunk.content == "hello"
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from google.generativeai.types import GenerateContentResponse  # type: ignore
 
+from mirascope.gemini.calls import GeminiCall
 from mirascope.gemini.extractors import GeminiExtractor
 from mirascope.gemini.tools import GeminiTool
 
@@ -48,3 +49,30 @@ async def test_gemini_extractor_extract_async_tool(
     assert isinstance(tool, fixture_book_tool)
     assert tool.title == "The Name of the Wind"
     assert tool.author == "Patrick Rothfuss"
+
+
+@patch(
+    "mirascope.base.extractors.BaseExtractor._extract_many_async",
+    new_callable=AsyncMock,
+)
+@patch("mirascope.base.extractors.BaseExtractor._extract_many", new_callable=MagicMock)
+@pytest.mark.asyncio
+async def test_gemini_extractor_extract_many(
+    mock_extract_many: MagicMock, mock_extract_many_async: AsyncMock
+) -> None:
+    """Tests that `extract_many` packs the extractors into a single Gemini call."""
+
+    class TempExtractor(GeminiExtractor[str]):
+        extract_schema: Type[str] = str
+        prompt_template = "{text}"
+
+        text: str
+
+    extractors = [TempExtractor(text="a"), TempExtractor(text="b")]
+    mock_extract_many.return_value = mock_extract_many_async.return_value = ["a", "b"]
+    assert TempExtractor.extract_many(extractors, retries=2) == ["a", "b"]
+    mock_extract_many.assert_called_once_with(GeminiCall, GeminiTool, extractors, 2)
+    assert await TempExtractor.extract_many_async(extractors) == ["a", "b"]
+    mock_extract_many_async.assert_called_once_with(
+        GeminiCall, GeminiTool, extractors, 0
+    )
@@ -5,7 +5,7 @@ import pytest
 from google.generativeai.types import GenerateContentResponse  # type: ignore
 
 from mirascope.gemini.tools import GeminiTool
-from mirascope.gemini.types import GeminiCallResponse
+from mirascope.gemini.types import GeminiCallResponse, GeminiCallResponseChunk
 
 
 def test_gemini_call_response(
@@ -101,3 +101,12 @@ def test_gemini_call_response_with_no_tools(
 
     assert response.tools is None
     assert response.tool is None
+
+
+def test_gemini_call_response_chunk_skip_content(
+    fixture_generate_content_chunks: GenerateContentResponse,
+):
+    """Tests that `skip_content` copies the chunk with a suffix of its content."""
+    chunk = GeminiCallResponseChunk(chunk=next(iter(fixture_generate_content_chunks)))
+    assert chunk.skip_content(2).content == "rst"
+    assert chunk.content == "first"
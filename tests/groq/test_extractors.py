@@ -6,6 +6,7 @@ import pytest
 from groq.types.chat.chat_completion import ChatCompletion
 from pydantic import BaseModel
 
+from mirascope.groq.calls import GroqCall
 from mirascope.groq.extractors import GroqExtractor
 from mirascope.groq.tools import GroqTool
 from mirascope.groq.types import GroqCallParams, GroqCallResponse
@@ -78,3 +79,28 @@ def test_groq_extractor_extract_with_no_tools(
 
     with pytest.raises(AttributeError):
         TempExtractor().extract()
+
+
+@patch(
+    "mirascope.base.extractors.BaseExtractor._extract_many_async",
+    new_callable=AsyncMock,
+)
+@patch("mirascope.base.extractors.BaseExtractor._extract_many", new_callable=MagicMock)
+@pytest.mark.asyncio
+async def test_groq_extractor_extract_many(
+    mock_extract_many: MagicMock, mock_extract_many_async: AsyncMock
+) -> None:
+    """Tests that `extract_many` packs the extractors into a single Groq call."""
+
+    class TempExtractor(GroqExtractor[str]):
+        extract_schema: Type[str] = str
+        prompt_template = "{text}"
+
+        text: str
+
+    extractors = [TempExtractor(text="a"), TempExtractor(text="b")]
+    mock_extract_many.return_value = mock_extract_many_async.return_value = ["a", "b"]
+    assert TempExtractor.extract_many(extractors, retries=2) == ["a", "b"]
+    mock_extract_many.assert_called_once_with(GroqCall, GroqTool, extractors, 2)
+    assert await TempExtractor.extract_many_async(extractors) == ["a", "b"]
+    mock_extract_many_async.assert_called_once_with(GroqCall, GroqTool, extractors, 0)
@@ -0,0 +1 @@
+"""Tests for the Mirascope local module."""
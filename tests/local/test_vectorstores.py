@@ -0,0 +1,216 @@
+"""Tests for the local NumPy vectorstore."""
+from typing import ClassVar, Optional
+
+import numpy as np
+import pytest
+
+from mirascope.local import LocalParams, LocalSettings, LocalVectorStore, VectorIndex
+from mirascope.rag import BaseEmbedder, BaseEmbeddingResponse, Document
+
+_VECTORS = {
+    "apple": [1.0, 0.0, 0.0],
+    "banana": [0.8, 0.6, 0.0],
+    "carrot": [0.1, 0.0, 2.0],
+}
+
+
+class MyEmbeddingResponse(BaseEmbeddingResponse[Optional[list[list[float]]]]):
+    @property
+    def embeddings(self) -> Optional[list[list[float]]]:
+        return self.response
+
+
+class MyEmbedder(BaseEmbedder[MyEmbeddingResponse]):
+    missing: ClassVar[bool] = False
+
+    def embed(self, input: list[str]) -> MyEmbeddingResponse:
+        embeddings = None if self.missing else [_VECTORS[text] for text in input]
+        return MyEmbeddingResponse(response=embeddings, start_time=0, end_time=0)
+
+    async def embed_async(self, input: list[str]) -> MyEmbeddingResponse:
+        return self.embed(input)  # pragma: no cover
+
+
+class MyStore(LocalVectorStore):
+    embedder = MyEmbedder()
+
+
+def _documents(*texts: str) -> list[Document]:
+    return [Document(id=text, text=text, metadata={"n": len(text)}) for text in texts]
+
+
+def test_local_vectorstore_retrieve() -> None:
+    """Tests adding documents and retrieving a batch of queries by cosine."""
+    store = MyStore()
+    assert store.retrieve("apple").ids == [[]]
+    store.add(_documents("apple", "banana", "carrot"))
+    result = store.retrieve(["apple", "carrot"], top_k=2)
+    assert result.ids == [["apple", "banana"], ["carrot", "apple"]]
+    assert result.scores[0] == pytest.approx([1.0, 0.8])
+    assert result.documents[1] == ["carrot", "apple"]
+    assert result.metadatas[0] == [{"n": 5}, {"n": 6}]
+
+    result = store.retrieve(embeddings=[[0.0, 1.0, 0.0]], top_k=1)
+    assert result.ids == [["banana"]]
+    with pytest.raises(ValueError):
+        store.retrieve()
+    with pytest.raises(ValueError):
+        store.retrieve(embeddings=[[1.0, 0.0]])
+
+
+def test_local_vectorstore_dot_upsert() -> None:
+    """Tests searching by dot product and replacing documents with the same id."""
+
+    class DotStore(MyStore):
+        vectorstore_params = LocalParams(metric="dot")
+
+    store = DotStore()
+    store.add(_documents("apple", "carrot"))
+    assert store.retrieve("apple").ids == [["apple", "carrot"]]
+    assert store.retrieve("carrot").scores[0] == pytest.approx([4.01, 0.1])
+
+    store.add([Document(id="apple", text="carrot")])
+    assert len(store._index) == 2
+    assert store.retrieve("carrot").scores[0] == pytest.approx([4.01, 4.01])
+    assert store.retrieve("carrot").documents == [["carrot", "carrot"]]
+    with pytest.raises(ValueError):
+        store._index.upsert(_documents("apple"), [])
+    with pytest.raises(ValueError):
+        store._index.upsert(_documents("apple"), [[1.0]])
+
+
+def test_local_vectorstore_add_text() -> None:
+    """Tests chunking text before adding it and a missing embedding."""
+    store = MyStore()
+    store.add("banana")
+    assert store.retrieve("banana").documents == [["banana"]]
+    store.add([])
+    MyEmbedder.missing = True
+    try:
+        with pytest.raises(ValueError):
+            store.add("apple")
+    finally:
+        MyEmbedder.missing = False
+
+
+def test_vector_index_exact_search() -> None:
+    """Tests that exact search matches a brute force search."""
+    generator = np.random.default_rng(1)
+    vectors = generator.normal(size=(500, 16))
+    queries = generator.normal(size=(20, 16))
+    index = VectorIndex(LocalParams(metric="dot"))
+    index.upsert([Document(id=str(i), text="") for i in range(500)], vectors.tolist())
+    result = index.query(queries.tolist(), top_k=5)
+    expected = np.argsort(-(queries @ vectors.T), axis=1)[:, :5]
+    assert result.ids == [[str(row) for row in rows] for rows in expected]
+    assert index.query(queries.tolist(), top_k=0).ids == [[]] * 20
+
+
+def test_vector_index_ivf() -> None:
+    """Tests that an IVF index finds neighbors in clustered data."""
+    generator = np.random.default_rng(2)
+    centers = generator.normal(size=(8, 32))
+    vectors = np.repeat(centers, 100, axis=0) + 0.05 * generator.normal(size=(800, 32))
+    params = LocalParams(index="ivf", n_lists=8, n_probe=2, min_ivf_size=100)
+    index = VectorIndex(params)
+    documents = [Document(id=str(i), text="") for i in range(800)]
+    index.upsert(documents[:400], vectors[:400].tolist())
+    assert index.query(centers[:1].tolist(), top_k=1).ids[0][0] in {
+        str(i) for i in range(100)
+    }
+    index.upsert(documents[400:500], vectors[400:500].tolist())
+    assert index._trained_size == 400
+    assert len(index._assignments) == 500
+
+    index.upsert(documents[500:], vectors[500:].tolist())
+    result = index.query(centers.tolist(), top_k=10)
+    assert index._trained_size == 800
+    for cluster, ids in enumerate(result.ids):
+        assert {int(id) // 100 for id in ids} == {cluster}
+
+
+def test_local_vectorstore_persistence(tmp_path) -> None:
+    """Tests that an index is saved and memory-mapped when loaded."""
+
+    class PersistentStore(MyStore):
+        index_name = "test"
+        client_settings = LocalSettings(path=str(tmp_path))
+
+    PersistentStore().add(_documents("apple", "banana"))
+    assert sorted(path.name for path in (tmp_path / "test").iterdir()) == [
+        "records.json",
+        "vectors.npy",
+    ]
+
+    store = PersistentStore()
+    assert isinstance(store._index._buffer, np.memmap)
+    assert store.retrieve("banana").ids == [["banana", "apple"]]
+    store.add(_documents("carrot"))
+    assert not isinstance(store._index._buffer, np.memmap)
+    assert PersistentStore().retrieve("carrot", top_k=1).ids == [["carrot"]]
+
+    class DotStore(PersistentStore):
+        vectorstore_params = LocalParams(metric="dot")
+
+    with pytest.raises(ValueError):
+        DotStore().retrieve("apple")
+
+
+def test_vector_index_flush(tmp_path) -> None:
+    """Tests that upserts and deletes are only written to disk when flushed."""
+    index = VectorIndex(LocalParams(), str(tmp_path))
+    index.flush()
+    assert not tmp_path.exists() or not list(tmp_path.iterdir())
+    index.upsert(_documents("apple"), [_VECTORS["apple"]])
+    index.upsert(_documents("banana"), [_VECTORS["banana"]])
+    assert not list(tmp_path.iterdir())
+    index.flush()
+    assert VectorIndex(LocalParams(), str(tmp_path)).ids == ["apple", "banana"]
+
+    index.delete(["apple"])
+    assert VectorIndex(LocalParams(), str(tmp_path)).ids == ["apple", "banana"]
+    index.flush()
+    modified = (tmp_path / "records.json").stat().st_mtime_ns
+    index.flush()
+    assert (tmp_path / "records.json").stat().st_mtime_ns == modified
+    assert VectorIndex(LocalParams(), str(tmp_path)).ids == ["banana"]
+
+
+def test_local_vectorstore_add_source(tmp_path) -> None:
+    """Tests that re-adding a source only embeds new chunks and deletes stale ones."""
+
+    class PersistentStore(MyStore):
+        index_name = "test"
+        vectorstore_params = LocalParams(index="ivf", min_ivf_size=1, n_lists=2)
+        client_settings = LocalSettings(path=str(tmp_path))
+
+    store = PersistentStore()
+    store.add(_documents("apple", "banana"), source="fruit")
+    store.add(_documents("carrot"), source="vegetable")
+    assert store.retrieve("apple").ids[0][0] == "fruit#apple"
+    assert store.retrieve("apple").metadatas[0][0] == {"n": 5, "source": "fruit"}
+
+    embedded: list[str] = []
+    embed = MyEmbedder.embed
+
+    def spy(self, input: list[str]) -> MyEmbeddingResponse:
+        embedded.extend(input)
+        return embed(self, input)
+
+    MyEmbedder.embed = spy  # type: ignore
+    try:
+        store.add(_documents("banana", "carrot"), source="fruit")
+    finally:
+        MyEmbedder.embed = embed  # type: ignore
+    assert embedded == ["carrot"]
+    assert sorted(PersistentStore()._index.ids) == [
+        "fruit#banana",
+        "fruit#carrot",
+        "vegetable#carrot",
+    ]
+    assert len(store._index._assignments) == 3
+
+    store.add([], source="fruit")
+    assert store._index.ids == ["vegetable#carrot"]
+    store.delete(["missing"])
+    assert len(store._index) == 1
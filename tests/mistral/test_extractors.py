@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from mistralai.models.chat_completion import ChatCompletionResponse
 
+from mirascope.mistral.calls import MistralCall
 from mirascope.mistral.extractors import MistralExtractor
 from mirascope.mistral.tools import MistralTool
 
@@ -46,3 +47,30 @@ async def test_mistral_extractor_extract_async_tool(
     assert isinstance(tool, fixture_book_tool)
     assert tool.title == "The Name of the Wind"
     assert tool.author == "Patrick Rothfuss"
+
+
+@patch(
+    "mirascope.base.extractors.BaseExtractor._extract_many_async",
+    new_callable=AsyncMock,
+)
+@patch("mirascope.base.extractors.BaseExtractor._extract_many", new_callable=MagicMock)
+@pytest.mark.asyncio
+async def test_mistral_extractor_extract_many(
+    mock_extract_many: MagicMock, mock_extract_many_async: AsyncMock
+) -> None:
+    """Tests that `extract_many` packs the extractors into a single Mistral call."""
+
+    class TempExtractor(MistralExtractor[str]):
+        extract_schema: Type[str] = str
+        prompt_template = "{text}"
+
+        text: str
+
+    extractors = [TempExtractor(text="a"), TempExtractor(text="b")]
+    mock_extract_many.return_value = mock_extract_many_async.return_value = ["a", "b"]
+    assert TempExtractor.extract_many(extractors, retries=2) == ["a", "b"]
+    mock_extract_many.assert_called_once_with(MistralCall, MistralTool, extractors, 2)
+    assert await TempExtractor.extract_many_async(extractors) == ["a", "b"]
+    mock_extract_many_async.assert_called_once_with(
+        MistralCall, MistralTool, extractors, 0
+    )
@@ -136,3 +136,14 @@ def test_mistral_stream_response_with_tools(
         .choices[0]
         .delta.tool_calls
     )
+
+
+def test_mistral_stream_response_skip_content(
+    fixture_chat_completion_stream_response: list[ChatCompletionStreamResponse],
+):
+    """Tests that `skip_content` copies the chunk with a suffix of its content."""
+    chunk = MistralCallResponseChunk(chunk=fixture_chat_completion_stream_response[1])
+    skipped = chunk.skip_content(1)
+    assert skipped.content == chunk.content[1:]
+    assert skipped.delta.content == chunk.content[1:]
+    assert chunk.chunk == fixture_chat_completion_stream_response[1]
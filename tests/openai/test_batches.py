@@ -0,0 +1,346 @@
+"""Tests for running OpenAI calls and extractions with the Batch API."""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Generator, Type
+
+import httpx
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from mirascope.base.clients import clear_clients
+from mirascope.openai import (
+    OpenAIBatch,
+    OpenAICall,
+    OpenAICallParams,
+    OpenAICallResponse,
+    OpenAIExtractor,
+)
+
+
+def _completion(body: dict[str, Any]) -> dict[str, Any]:
+    """Returns a stub chat completion echoing the last message of `body`."""
+    content = body["messages"][-1]["content"]
+    message: dict[str, Any] = {"role": "assistant", "content": content}
+    finish_reason = "stop"
+    if "tools" in body:
+        finish_reason = "tool_calls"
+        message["content"] = None
+        message["tool_calls"] = [
+            {
+                "id": "call_id",
+                "type": "function",
+                "function": {
+                    "name": body["tools"][0]["function"]["name"],
+                    "arguments": json.dumps({"title": content, "pages": content}),
+                },
+            }
+        ]
+    return {
+        "id": "completion_id",
+        "object": "chat.completion",
+        "created": 0,
+        "model": body["model"],
+        "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 10, "total_tokens": 20},
+    }
+
+
+class StubBatchServer(ThreadingHTTPServer):
+    """A local stub of the OpenAI Files and Batch APIs.
+
+    Batches report `validating` when created, `in_progress` on the first retrieval and
+    `completed` afterwards. Requests whose last message contains "fail" error.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubBatchHandler)
+        self.files: dict[str, str] = {}
+        self.batches: dict[str, dict[str, Any]] = {}
+        self.retrievals: dict[str, int] = {}
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+    def create_batch(self, request: dict[str, Any]) -> dict[str, Any]:
+        batch_id = f"batch_{len(self.batches)}"
+        outputs, errors = [], []
+        for line in self.files[request["input_file_id"]].splitlines():
+            batch_request = json.loads(line)
+            custom_id, body = batch_request["custom_id"], batch_request["body"]
+            if "fail" in body["messages"][-1]["content"]:
+                errors.append(
+                    {
+                        "custom_id": custom_id,
+                        "response": {"status_code": 500, "body": {"error": "boom"}},
+                        "error": None,
+                    }
+                )
+                continue
+            outputs.append(
+                {
+                    "custom_id": custom_id,
+                    "response": {"status_code": 200, "body": _completion(body)},
+                    "error": None,
+                }
+            )
+        # Results are written in reverse to check that they're mapped back by id
+        self.files[f"{batch_id}_output"] = "\n".join(
+            json.dumps(output) for output in reversed(outputs)
+        )
+        self.files[f"{batch_id}_errors"] = "\n".join(map(json.dumps, errors))
+        self.batches[batch_id] = {
+            "id": batch_id,
+            "object": "batch",
+            "endpoint": request["endpoint"],
+            "input_file_id": request["input_file_id"],
+            "completion_window": request["completion_window"],
+            "metadata": request.get("metadata"),
+            "created_at": 1,
+            "status": "validating",
+        }
+        self.retrievals[batch_id] = 0
+        return self.batches[batch_id]
+
+    def retrieve_batch(self, batch_id: str) -> dict[str, Any]:
+        self.retrievals[batch_id] += 1
+        batch = self.batches[batch_id]
+        if self.retrievals[batch_id] == 1:
+            batch["status"] = "in_progress"
+        else:
+            batch.update(
+                status="completed",
+                completed_at=2,
+                output_file_id=f"{batch_id}_output",
+                error_file_id=f"{batch_id}_errors",
+            )
+        return batch
+
+
+class StubBatchHandler(BaseHTTPRequestHandler):
+    server: StubBatchServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silences request logging."""
+
+    def _send(self, payload: Any) -> None:
+        data = payload.encode() if isinstance(payload, str) else json.dumps(payload)
+        data = data.encode() if isinstance(data, str) else data
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+        if self.path == "/v1/files":
+            file_id = f"file_{len(self.server.files)}"
+            self.server.files[file_id] = "\n".join(
+                line for line in body.splitlines() if line.startswith('{"custom_id"')
+            )
+            self._send(
+                {
+                    "id": file_id,
+                    "object": "file",
+                    "bytes": len(body),
+                    "created_at": 0,
+                    "filename": "batch.jsonl",
+                    "purpose": "batch",
+                    "status": "uploaded",
+                }
+            )
+        else:
+            self._send(self.server.create_batch(json.loads(body)))
+
+    def do_GET(self) -> None:
+        if self.path.startswith("/v1/batches/"):
+            self._send(self.server.retrieve_batch(self.path.split("/")[-1]))
+        else:
+            self._send(self.server.files[self.path.split("/")[-2]])
+
+
+@pytest.fixture()
+def fixture_stub_batch_server() -> Generator[StubBatchServer, None, None]:
+    """Yields a running stub batch server."""
+    server = StubBatchServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    clear_clients()
+
+
+class Book(BaseModel):
+    title: str
+    pages: int
+
+
+@pytest.fixture()
+def fixture_batch_types(
+    fixture_stub_batch_server: StubBatchServer,
+) -> tuple[Type[OpenAICall], Type[OpenAIExtractor]]:
+    """Returns a call and extractor type pointed at the stub batch server."""
+    base_url = fixture_stub_batch_server.base_url
+
+    class Echo(OpenAICall):
+        prompt_template = "{text}"
+
+        text: str
+
+        api_key = "test"
+        call_params = OpenAICallParams(model="gpt-4o")
+
+    class BookExtractor(OpenAIExtractor[Book]):
+        extract_schema: Type[Book] = Book
+        prompt_template = "{text}"
+
+        text: str
+
+        api_key = "test"
+        call_params = OpenAICallParams(model="gpt-4o")
+
+    Echo.base_url = base_url
+    BookExtractor.base_url = base_url
+    return Echo, BookExtractor
+
+
+def test_openai_batch_to_jsonl(
+    fixture_batch_types: tuple[Type[OpenAICall], Type[OpenAIExtractor]],
+) -> None:
+    """Tests that items are serialized into the batch input file format."""
+    echo_type, extractor_type = fixture_batch_types
+    batch = OpenAIBatch(items=[echo_type(text="a"), extractor_type(text="b")])
+    lines = [json.loads(line) for line in batch.to_jsonl().splitlines()]
+    assert lines[0] == {
+        "custom_id": "0",
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "messages": [{"role": "user", "content": "a"}],
+            "model": "gpt-4o",
+        },
+    }
+    assert lines[1]["custom_id"] == "1"
+    assert lines[1]["body"]["tools"][0]["function"]["name"] == "Book"
+
+
+def test_openai_batch_to_jsonl_client_options(
+    fixture_batch_types: tuple[Type[OpenAICall], Type[OpenAIExtractor]],
+) -> None:
+    """Tests that HTTP-only options are dropped and `extra_body` is merged."""
+    echo_type, _ = fixture_batch_types
+
+    class Options(echo_type):  # type: ignore
+        call_params = echo_type.call_params.model_copy(
+            update={
+                "extra_headers": {"X-Test": "1"},
+                "extra_query": {"q": "1"},
+                "extra_body": {"store": True},
+                "timeout": httpx.Timeout(10),
+            }
+        )
+
+    line = json.loads(OpenAIBatch(items=[Options(text="a")]).to_jsonl())
+    assert line["body"] == {
+        "messages": [{"role": "user", "content": "a"}],
+        "model": "gpt-4o",
+        "store": True,
+    }
+
+
+def test_openai_batch_run(
+    fixture_stub_batch_server: StubBatchServer,
+    fixture_batch_types: tuple[Type[OpenAICall], Type[OpenAIExtractor]],
+) -> None:
+    """Tests that results are mapped back to responses and schemas in order."""
+    echo_type, extractor_type = fixture_batch_types
+    batch = OpenAIBatch(
+        items=[echo_type(text="a"), extractor_type(text="7"), echo_type(text="c")],
+        metadata={"job": "nightly"},
+        poll_interval=0,
+    )
+    results = batch.run()
+    assert isinstance(results[0], OpenAICallResponse)
+    assert results[0].content == "a"
+    assert results[0].cost == pytest.approx(0.000_2 * 0.5)
+    assert results[1] == Book(title="7", pages=7)
+    assert results[2].content == "c"
+    assert batch.batch is not None and batch.batch.status == "completed"
+    assert fixture_stub_batch_server.batches["batch_0"]["metadata"] == {
+        "job": "nightly"
+    }
+
+
+def test_openai_batch_failures(
+    fixture_batch_types: tuple[Type[OpenAICall], Type[OpenAIExtractor]],
+) -> None:
+    """Tests that failed items are raised or returned in place."""
+    echo_type, extractor_type = fixture_batch_types
+    batch = OpenAIBatch(
+        items=[echo_type(text="a"), echo_type(text="fail"), extractor_type(text="x")],
+        poll_interval=0,
+    )
+    batch.submit()
+    batch.wait()
+    with pytest.raises(RuntimeError):
+        batch.results()
+    results = batch.results(return_exceptions=True)
+    assert results[0].content == "a"
+    assert isinstance(results[1], RuntimeError)
+    assert isinstance(results[2], ValidationError)
+
+
+def test_openai_batch_errors(
+    fixture_batch_types: tuple[Type[OpenAICall], Type[OpenAIExtractor]],
+) -> None:
+    """Tests the errors raised for invalid batches and batch states."""
+    echo_type, _ = fixture_batch_types
+    with pytest.raises(ValueError):
+        OpenAIBatch(items=[]).to_jsonl()
+
+    class OtherEcho(echo_type):  # type: ignore
+        api_key = "other"
+
+    with pytest.raises(ValueError):
+        OpenAIBatch(items=[echo_type(text="a"), OtherEcho(text="b")]).to_jsonl()
+
+    batch = OpenAIBatch(items=[echo_type(text="a")], poll_interval=0)
+    with pytest.raises(RuntimeError):
+        batch.wait()
+    batch.submit()
+    with pytest.raises(RuntimeError):
+        batch.results()
+    with pytest.raises(TimeoutError):
+        batch.wait(timeout=0)
+    assert batch.batch is not None
+    batch.batch.status = "failed"
+    with pytest.raises(RuntimeError):
+        batch.results()
+    batch.batch.status = "expired"
+    batch.batch.output_file_id = batch.batch.error_file_id = None
+    with pytest.raises(RuntimeError):
+        batch.results()
+
+
+@pytest.mark.asyncio
+async def test_openai_batch_run_async(
+    fixture_batch_types: tuple[Type[OpenAICall], Type[OpenAIExtractor]],
+) -> None:
+    """Tests running a batch asynchronously."""
+    echo_type, extractor_type = fixture_batch_types
+    batch = OpenAIBatch(
+        items=[echo_type(text="a"), extractor_type(text="7")], poll_interval=0
+    )
+    results = await batch.run_async()
+    assert results[0].content == "a"
+    assert results[1] == Book(title="7", pages=7)
+    with pytest.raises(TimeoutError):
+        await OpenAIBatch(
+            items=[echo_type(text="a")],
+            batch=batch.batch.model_copy(  # type: ignore
+                update={"status": "in_progress"}
+            ),
+        ).wait_async(timeout=0)
@@ -11,9 +11,11 @@ from openai.types.chat import (
 )
 from openai.types.chat.completion_create_params import ResponseFormat
 
+from mirascope.base.rate_limiters import RateLimiter
 from mirascope.openai.calls import OpenAICall, _json_mode_content
 from mirascope.openai.tools import OpenAITool
 from mirascope.openai.types import (
+    JSONSchemaResponseFormat,
     OpenAICallParams,
     OpenAICallResponse,
     OpenAICallResponseChunk,
@@ -111,6 +113,59 @@ def test_openai_call_call_with_tools_json_mode(
     assert tool.model_dump() == fixture_my_openai_tool_instance.model_dump()
 
 
+@patch("openai.resources.chat.completions.Completions.create", new_callable=MagicMock)
+def test_openai_call_call_with_tools_json_schema(
+    mock_create: MagicMock,
+    fixture_my_openai_tool: Type[OpenAITool],
+    fixture_my_openai_tool_instance: OpenAITool,
+    fixture_chat_completion_with_tools_json_mode: ChatCompletion,
+) -> None:
+    """Tests that the first tool's strict schema is sent as the response format."""
+    mock_create.return_value = fixture_chat_completion_with_tools_json_mode
+
+    class CallWithTools(OpenAICall):
+        prompt_template = "test"
+
+        api_key = "test"
+        call_params = OpenAICallParams(
+            model="gpt-4",
+            tools=[fixture_my_openai_tool],
+            response_format=JSONSchemaResponseFormat(type="json_schema"),
+        )
+
+    call_with_tools = CallWithTools()
+    response = call_with_tools.call()
+    mock_create.assert_called_once_with(
+        model="gpt-4",
+        messages=call_with_tools.messages(),
+        response_format={
+            "type": "json_schema",
+            "json_schema": fixture_my_openai_tool.json_schema(),
+        },
+        stream=False,
+    )
+    tool = response.tool
+    assert tool is not None
+    assert tool.model_dump() == fixture_my_openai_tool_instance.model_dump()
+
+    json_schema = {"name": "Custom", "schema": {"type": "object"}}
+    call_with_tools.call(
+        response_format={"type": "json_schema", "json_schema": json_schema}
+    )
+    assert mock_create.call_args.kwargs["response_format"]["json_schema"] is (
+        json_schema
+    )
+
+
+def test_openai_call_json_mode_content(
+    fixture_my_openai_tool: Type[OpenAITool],
+) -> None:
+    """Tests that the JSON mode schema is compact and cached per tool type."""
+    content = _json_mode_content(tool_type=fixture_my_openai_tool)
+    assert '"properties":{"param":' in content
+    assert _json_mode_content(tool_type=fixture_my_openai_tool) is content
+
+
 @patch(
     "openai.resources.chat.completions.Completions.create",
     new_callable=MagicMock,
@@ -271,3 +326,75 @@ async def test_openai_call_stream_async_with_wrapper(
     async for _ in stream:
         pass
     wrapper.assert_called_once()
+
+
+@patch(
+    "openai.resources.chat.completions.Completions.create",
+    new_callable=MagicMock,
+)
+def test_rate_limited_stream(
+    mock_create: MagicMock,
+    fixture_openai_test_call: OpenAICall,
+    fixture_chat_completion_chunks: list[ChatCompletionChunk],
+) -> None:
+    """Tests that streams are paced with the estimate only."""
+    mock_create.return_value = fixture_chat_completion_chunks
+    limiter = MagicMock(spec=RateLimiter)
+    fixture_openai_test_call.call_params.rate_limiter = limiter
+    chunks = list(fixture_openai_test_call.stream())
+    assert len(chunks) == len(fixture_chat_completion_chunks)
+    limiter.acquire.assert_called_once()
+    limiter.reconcile.assert_not_called()
+
+
+@patch(
+    "openai.resources.chat.completions.AsyncCompletions.create",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_rate_limited_stream_async(
+    mock_create: AsyncMock,
+    fixture_openai_test_call: OpenAICall,
+    fixture_chat_completion_chunks: list[ChatCompletionChunk],
+) -> None:
+    """Tests that asynchronous streams are paced with the estimate only."""
+
+    async def generator():
+        for chunk in fixture_chat_completion_chunks:
+            yield chunk
+
+    mock_create.return_value = generator()
+    limiter = MagicMock(spec=RateLimiter)
+    fixture_openai_test_call.call_params.rate_limiter = limiter
+    chunks = [chunk async for chunk in fixture_openai_test_call.stream_async()]
+    assert len(chunks) == len(fixture_chat_completion_chunks)
+    limiter.acquire_async.assert_awaited_once()
+
+
+@patch(
+    "openai.resources.chat.completions.Completions.create",
+    new_callable=MagicMock,
+)
+def test_openai_call_reuses_kwargs_snapshot(
+    mock_create: MagicMock,
+    fixture_openai_test_call: OpenAICall,
+    fixture_chat_completion: ChatCompletion,
+) -> None:
+    """Tests that repeated calls dump the call params once and apply overrides."""
+    mock_create.return_value = fixture_chat_completion
+    call_params = fixture_openai_test_call.call_params.model_copy(
+        update={"temperature": 0.5}
+    )
+    with patch.object(
+        type(fixture_openai_test_call), "call_params", call_params
+    ), patch.object(
+        OpenAICallParams,
+        "model_dump",
+        autospec=True,
+        side_effect=OpenAICallParams.model_dump,
+    ) as mock_dump:
+        for seed in range(3):
+            fixture_openai_test_call.call(seed=seed)
+    assert mock_dump.call_count == 1
+    assert [call.kwargs["seed"] for call in mock_create.call_args_list] == [0, 1, 2]
+    assert all(call.kwargs["temperature"] == 0.5 for call in mock_create.call_args_list)
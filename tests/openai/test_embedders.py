@@ -2,11 +2,14 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from openai.types.create_embedding_response import CreateEmbeddingResponse
+from openai.types import Embedding
+from openai.types.create_embedding_response import CreateEmbeddingResponse, Usage
 from pytest import FixtureRequest
 
+from mirascope.base.caches import InMemoryCache
+from mirascope.base.rate_limiters import RateLimiter, estimate_tokens
 from mirascope.openai import OpenAIEmbedder
-from mirascope.openai.types import OpenAIEmbeddingResponse
+from mirascope.openai.types import OpenAIEmbeddingParams, OpenAIEmbeddingResponse
 
 
 @patch(
@@ -76,3 +79,90 @@ def test_openai_embedder_call(
     text = "This is a test sentence."
     embedding = fixture_openai_test_embedder([text])
     assert isinstance(embedding, list)
+
+
+@patch(
+    "openai.resources.embeddings.Embeddings.create",
+    new_callable=MagicMock,
+)
+def test_rate_limited_openai_embedder(
+    mock_create: MagicMock, fixture_embeddings: CreateEmbeddingResponse
+) -> None:
+    """Tests that embedders are paced and reconciled with the reported usage."""
+    mock_create.return_value = fixture_embeddings
+    limiter = MagicMock(spec=RateLimiter)
+
+    class Embedder(OpenAIEmbedder):
+        api_key = "test"
+        embedding_params = OpenAIEmbeddingParams(
+            model="test_model", rate_limiter=limiter
+        )
+
+    Embedder().embed(["a" * 40])
+    limiter.acquire.assert_called_once_with(estimate_tokens(["a" * 40]))
+    limiter.reconcile.assert_called_once_with(estimate_tokens(["a" * 40]), 1)
+    assert "rate_limiter" not in mock_create.call_args.kwargs
+
+
+def _create_embeddings(input: list[str], **kwargs) -> CreateEmbeddingResponse:
+    """Returns an embedding of each input's length."""
+    return CreateEmbeddingResponse(
+        data=[
+            Embedding(embedding=[float(len(text))], index=i, object="embedding")
+            for i, text in enumerate(input)
+        ],
+        model="test_model",
+        object="list",
+        usage=Usage(prompt_tokens=len(input), total_tokens=len(input)),
+    )
+
+
+@patch("openai.resources.embeddings.Embeddings.create", new_callable=MagicMock)
+def test_openai_embedder_embed_cached(mock_create: MagicMock) -> None:
+    """Tests that only inputs missing from the cache are embedded."""
+    mock_create.side_effect = _create_embeddings
+
+    class TestEmbedder(OpenAIEmbedder):
+        api_key = "test"
+        embedding_params = OpenAIEmbeddingParams(
+            model="test_model", cache=InMemoryCache()
+        )
+
+    embedder = TestEmbedder(embed_batch_size=None)
+    response = embedder.embed(["a", "bb", "a"])
+    assert response.embeddings == [[1.0], [2.0], [1.0]]
+    assert mock_create.call_args.kwargs["input"] == ["a", "bb"]
+
+    response = embedder.embed(["ccc", "bb"])
+    assert response.embeddings == [[3.0], [2.0]]
+    assert [embedding.index for embedding in response.response.data] == [0, 1]
+    assert response.response.usage.total_tokens == 1
+    assert mock_create.call_args.kwargs["input"] == ["ccc"]
+
+    response = embedder.embed(["bb", "a"])
+    assert response.embeddings == [[2.0], [1.0]]
+    assert response.response.usage.total_tokens == 0
+    assert mock_create.call_count == 2
+
+    embedder = TestEmbedder(embed_batch_size=None, dimensions=2)
+    embedder.embed(["a"])
+    assert mock_create.call_count == 3
+
+
+@patch("openai.resources.embeddings.AsyncEmbeddings.create", new_callable=AsyncMock)
+@pytest.mark.asyncio
+async def test_openai_embedder_embed_async_cached(mock_create: AsyncMock) -> None:
+    """Tests that only inputs missing from the cache are embedded asynchronously."""
+    mock_create.side_effect = _create_embeddings
+
+    class TestEmbedder(OpenAIEmbedder):
+        api_key = "test"
+        embedding_params = OpenAIEmbeddingParams(
+            model="test_model", cache=InMemoryCache()
+        )
+
+    embedder = TestEmbedder()
+    assert (await embedder.embed_async(["a"])).embeddings == [[1.0]]
+    assert (await embedder.embed_async(["a", "bb"])).embeddings == [[1.0], [2.0]]
+    assert (await embedder.embed_async(["bb"])).embeddings == [[2.0]]
+    assert mock_create.call_count == 2
@@ -1,15 +1,24 @@
 """Tests for the `OpenAIExtractor` class."""
-from typing import Callable, Type
+import json
+from typing import Any, Callable, Literal, Type
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
+from openai.types.chat.chat_completion_chunk import (
+    Choice,
+    ChoiceDelta,
+    ChoiceDeltaToolCall,
+    ChoiceDeltaToolCallFunction,
+)
 from pydantic import BaseModel, ValidationError
 from tenacity import RetryError
 
+from mirascope.openai.calls import OpenAICall
 from mirascope.openai.extractors import OpenAIExtractor
 from mirascope.openai.tools import OpenAITool
 from mirascope.openai.types import (
+    JSONSchemaResponseFormat,
     OpenAICallParams,
     OpenAICallResponse,
     OpenAICallResponseChunk,
@@ -653,3 +662,346 @@ async def test_openai_extractor_stream_async_only_first_tool(
 
     partial_schemas = list([p async for p in TempExtractor().stream_async()])
     assert len(partial_schemas) == 3
+
+
+def test_openai_extractor_temp_call_cached(
+    fixture_my_openai_tool_schema: Type[BaseModel],
+) -> None:
+    """Tests that `TempCall` classes are reused and delegate to their extractor."""
+
+    class TempExtractor(OpenAIExtractor[BaseModel]):
+        prompt_template = "{upper_topic}"
+        api_key = "test"
+
+        extract_schema: Type[BaseModel] = fixture_my_openai_tool_schema
+        topic: str
+
+        call_params = OpenAICallParams(model="gpt-4")
+
+        @property
+        def upper_topic(self) -> str:
+            return self.topic.upper()
+
+    first = TempExtractor(topic="a")._temp_call(OpenAICall, {})
+    second = TempExtractor(topic="b")._temp_call(OpenAICall, {})
+    assert type(first) is type(second)
+    assert first.messages() == [{"role": "user", "content": "A"}]
+    assert second.messages() == [{"role": "user", "content": "B"}]
+
+    extractor = TempExtractor(topic="c")
+    retry = extractor._temp_call(OpenAICall, {"bad output": None})
+    assert type(retry) is not type(first)
+    assert retry.messages()[0]["content"].startswith("C\nErrors found:")
+    assert type(extractor._temp_call(OpenAICall, {"bad output": None})) is type(retry)
+
+    for index in range(40):
+        extractor._temp_call(OpenAICall, {str(index): None})
+    assert type(extractor._temp_call(OpenAICall, {})) is not type(first)
+
+    TempExtractor.call_params = OpenAICallParams(model="gpt-4o")
+    temp_call = extractor._temp_call(OpenAICall, {"39": None})
+    assert temp_call.call_params.model == "gpt-4o"
+
+
+def _items_completion(
+    fixture: ChatCompletion, name: str, items: list
+) -> ChatCompletion:
+    """Returns a copy of `fixture` whose tool call returns `items`."""
+    completion = fixture.model_copy(deep=True)
+    tool_call = completion.choices[0].message.tool_calls[0]  # type: ignore
+    tool_call.function.arguments = json.dumps({"items": items})
+    tool_call.function.name = name
+    return completion
+
+
+class Sentiment(BaseModel):
+    label: Literal["positive", "negative"]
+
+
+class SentimentExtractor(OpenAIExtractor[Sentiment]):
+    extract_schema: Type[Sentiment] = Sentiment
+    prompt_template = """
+    SYSTEM: Classify the sentiment of the review.
+    USER: {review}
+    """
+    api_key = "test"
+
+    review: str
+
+    call_params = OpenAICallParams(model="gpt-4")
+
+
+@patch("openai.resources.chat.completions.Completions.create", new_callable=MagicMock)
+def test_openai_extractor_extract_many(
+    mock_create: MagicMock, fixture_chat_completion_with_tools: ChatCompletion
+) -> None:
+    """Tests that records are packed into one call and only failures are re-asked."""
+    mock_create.side_effect = [
+        _items_completion(
+            fixture_chat_completion_with_tools,
+            "SentimentList",
+            [
+                {"record_id": 0, "label": "positive"},
+                {"record_id": 1, "label": "meh"},
+                {"record_id": 7, "label": "negative"},
+            ],
+        ),
+        _items_completion(
+            fixture_chat_completion_with_tools,
+            "SentimentList",
+            [{"record_id": 1, "label": "negative"}, {"record_id": 2}],
+        ),
+        _items_completion(
+            fixture_chat_completion_with_tools,
+            "SentimentList",
+            [{"record_id": 2, "label": "positive"}],
+        ),
+    ]
+    extractors = [
+        SentimentExtractor(review=review) for review in ("Great!", "Awful.", "Fine.")
+    ]
+    sentiments = SentimentExtractor.extract_many(extractors, retries=3)
+    assert [sentiment.label for sentiment in sentiments] == [
+        "positive",
+        "negative",
+        "positive",
+    ]
+    assert sentiments[0]._response is not None
+
+    first, second, third = (call.kwargs for call in mock_create.call_args_list)
+    assert first["tools"][0]["function"]["name"] == "SentimentList"
+    system, user = first["messages"]
+    assert system == {
+        "role": "system",
+        "content": "Classify the sentiment of the review.",
+    }
+    assert '<record id="0">\nGreat!\n</record>' in user["content"]
+    assert '<record id="2">\nFine.\n</record>' in user["content"]
+    assert "Great!" not in second["messages"][1]["content"]
+    assert (
+        "Your previous item for this record had errors"
+        in (second["messages"][1]["content"])
+    )
+    assert '<record id="2">' in third["messages"][1]["content"]
+    assert '<record id="1">' not in third["messages"][1]["content"]
+
+
+@patch("openai.resources.chat.completions.Completions.create", new_callable=MagicMock)
+def test_openai_extractor_extract_many_failed(
+    mock_create: MagicMock, fixture_chat_completion_with_tools: ChatCompletion
+) -> None:
+    """Tests that records that are still missing or invalid raise an error."""
+    mock_create.return_value = _items_completion(
+        fixture_chat_completion_with_tools,
+        "SentimentList",
+        [{"record_id": 0, "label": "meh"}, "invalid"],
+    )
+    extractors = [SentimentExtractor(review="Great!"), SentimentExtractor(review="")]
+    with pytest.raises(ValueError, match=r"Failed to extract records \[0, 1\]"):
+        SentimentExtractor.extract_many(extractors)
+    with pytest.raises(RetryError):
+        SentimentExtractor.extract_many(extractors, retries=2)
+    assert mock_create.call_count == 3
+    assert SentimentExtractor.extract_many([]) == []
+
+
+@patch(
+    "openai.resources.chat.completions.AsyncCompletions.create",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_openai_extractor_extract_many_async(
+    mock_create: AsyncMock, fixture_chat_completion_with_tools: ChatCompletion
+) -> None:
+    """Tests extracting base types for many extractors asynchronously."""
+    mock_create.side_effect = [
+        _items_completion(
+            fixture_chat_completion_with_tools,
+            "ValueList",
+            [{"record_id": 1, "value": 2}, {"record_id": 0, "value": "one"}],
+        ),
+        _items_completion(
+            fixture_chat_completion_with_tools,
+            "ValueList",
+            [{"record_id": 0, "value": 1}],
+        ),
+    ]
+
+    class CountExtractor(OpenAIExtractor[int]):
+        extract_schema: Type[int] = int
+        prompt_template = "{text}"
+        api_key = "test"
+
+        text: str
+
+        call_params = OpenAICallParams(model="gpt-4")
+
+    extractors = [CountExtractor(text="one"), CountExtractor(text="two")]
+    assert await CountExtractor.extract_many_async(extractors, retries=2) == [1, 2]
+    assert await CountExtractor.extract_many_async([]) == []
+
+    mock_create.side_effect = None
+    mock_create.return_value = fixture_chat_completion_with_tools
+    with pytest.raises(ValueError):
+        await CountExtractor.extract_many_async(extractors)
+    with pytest.raises(RetryError):
+        await CountExtractor.extract_many_async(extractors, retries=2)
+
+
+def test_openai_extractor_extract_many_unsupported() -> None:
+    """Tests that unsupported or mixed schemas raise a `ValueError`."""
+
+    class FnExtractor(OpenAIExtractor[Callable]):
+        extract_schema: Callable = lambda x: x  # noqa: E731
+        prompt_template = "test"
+
+    class ToolExtractor(OpenAIExtractor[OpenAITool]):
+        extract_schema: Type[OpenAITool] = OpenAITool
+        prompt_template = "test"
+
+    with pytest.raises(ValueError, match="function"):
+        FnExtractor.extract_many([FnExtractor()])
+    with pytest.raises(ValueError, match="tool"):
+        ToolExtractor.extract_many([ToolExtractor()])
+
+    class OtherSentiment(Sentiment):
+        pass
+
+    with pytest.raises(ValueError, match="same"):
+        SentimentExtractor.extract_many(
+            [
+                SentimentExtractor(review="a"),
+                SentimentExtractor(review="b", extract_schema=OtherSentiment),
+            ]
+        )
+
+
+def _items_chunks(items: list) -> list[ChatCompletionChunk]:
+    """Returns the chunks of a tool call streaming `items` 8 characters at a time."""
+    arguments = json.dumps({"value": items})
+    return [
+        ChatCompletionChunk(
+            id="test",
+            choices=[
+                Choice(
+                    index=0,
+                    delta=ChoiceDelta(
+                        tool_calls=[
+                            ChoiceDeltaToolCall(
+                                index=0,
+                                id="id" if start == 0 else None,
+                                function=ChoiceDeltaToolCallFunction(
+                                    name="List" if start == 0 else None,
+                                    arguments=arguments[start : start + 8],
+                                ),
+                                type="function",
+                            )
+                        ]
+                    ),
+                )
+            ],
+            created=0,
+            model="gpt-4",
+            object="chat.completion.chunk",
+        )
+        for start in range(0, len(arguments), 8)
+    ]
+
+
+class Book(BaseModel):
+    title: str
+    author: str
+
+
+class BooksExtractor(OpenAIExtractor[list[Book]]):
+    extract_schema: Type[list] = list[Book]
+    prompt_template = "Recommend some books."
+    api_key = "test"
+
+    call_params = OpenAICallParams(model="gpt-4")
+
+
+def test_openai_extractor_stream_items() -> None:
+    """Tests that each item is yielded as soon as the next one starts streaming."""
+    books = [{"title": f"Book {i}", "author": f"Author {i}"} for i in range(3)]
+    chunks = _items_chunks(books)
+    streamed: list[ChatCompletionChunk] = []
+
+    def stream(self: OpenAICall, **kwargs: Any) -> Any:
+        for chunk in chunks:
+            streamed.append(chunk)
+            yield OpenAICallResponseChunk(chunk=chunk, tool_types=kwargs["tools"])
+
+    with patch.object(OpenAICall, "stream", new=stream):
+        items = BooksExtractor().stream_items()
+        first = next(items)
+        assert first == Book(title="Book 0", author="Author 0")
+        assert len(streamed) < len(chunks) / 2
+        assert list(items) == [Book(**book) for book in books[1:]]
+
+        chunks = _items_chunks([books[0], {"title": "Book 1"}])
+        items = BooksExtractor().stream_items(retries=3)
+        assert next(items) == first
+        with pytest.raises(ValidationError):
+            next(items)
+
+        chunks = []
+        with pytest.raises(AttributeError):
+            list(BooksExtractor().stream_items())
+
+
+@pytest.mark.asyncio
+async def test_openai_extractor_stream_items_async() -> None:
+    """Tests that failures before the first item is yielded are retried."""
+    responses = [
+        _items_chunks([{"title": "Book 0"}]),
+        _items_chunks([{"title": "Book 0", "author": "Author 0"}, "Book 1"]),
+    ]
+
+    async def stream_async(self: OpenAICall, **kwargs: Any) -> Any:
+        for chunk in responses.pop(0):
+            yield OpenAICallResponseChunk(chunk=chunk, tool_types=kwargs["tools"])
+
+    with patch.object(OpenAICall, "stream_async", new=stream_async):
+        items = BooksExtractor().stream_items_async(retries=2)
+        assert await items.__anext__() == Book(title="Book 0", author="Author 0")
+        with pytest.raises(ValidationError):
+            await items.__anext__()
+        assert not responses
+
+        responses.append(_items_chunks([]))
+        assert [item async for item in BooksExtractor().stream_items_async()] == []
+
+
+def test_openai_extractor_stream_items_unsupported() -> None:
+    """Tests that streaming items requires a `list[...]` schema."""
+    with pytest.raises(ValueError, match="list"):
+        next(SentimentExtractor(review="Great!").stream_items())
+
+
+@patch("openai.resources.chat.completions.Completions.create", new_callable=MagicMock)
+def test_openai_extractor_extract_json_schema(
+    mock_create: MagicMock,
+    fixture_my_openai_tool_schema: Type[BaseModel],
+    fixture_chat_completion_with_tools_json_mode: ChatCompletion,
+) -> None:
+    """Tests extracting with structured outputs instead of a tool call."""
+    mock_create.return_value = fixture_chat_completion_with_tools_json_mode
+
+    class TempExtractor(OpenAIExtractor[BaseModel]):
+        prompt_template = "test"
+        api_key = "test"
+
+        extract_schema: Type[BaseModel] = fixture_my_openai_tool_schema
+
+        call_params = OpenAICallParams(
+            model="gpt-4", response_format=JSONSchemaResponseFormat(type="json_schema")
+        )
+
+    model = TempExtractor().extract()
+    assert model.model_dump() == {"param": "param", "optional": 0}
+    kwargs = mock_create.call_args.kwargs
+    assert "tools" not in kwargs
+    assert kwargs["messages"] == [{"role": "user", "content": "test"}]
+    json_schema = kwargs["response_format"]["json_schema"]
+    assert json_schema["strict"] and json_schema["name"] == "MyOpenAITool"
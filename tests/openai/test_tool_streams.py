@@ -141,6 +141,34 @@ def test_openai_tool_stream_json_mode_partial(
     assert tools[2] is not None and tools[2].args == {"param": "param", "optional": 0}
 
 
+def test_openai_tool_stream_partial_tools_are_snapshots(
+    fixture_chat_completion_chunk_with_tools: ChatCompletionChunk,
+) -> None:
+    """Tests that yielded partial tools don't change as more chunks are parsed."""
+
+    class Tagged(OpenAITool):
+        """A tool with nested arguments."""
+
+        meta: dict
+
+    def generator() -> Generator[OpenAICallResponseChunk, None, None]:
+        for content in ['{"meta": {"tags": ["a"', ', "b"]}}']:
+            chunk_copy = fixture_chat_completion_chunk_with_tools.model_copy(deep=True)
+            chunk_copy.choices[0].delta.content = content
+            yield OpenAICallResponseChunk(
+                chunk=chunk_copy,
+                tool_types=[Tagged],
+                response_format=ResponseFormat(type="json_object"),
+            )
+
+    tools = list(OpenAIToolStream.from_stream(generator(), allow_partial=True))
+    assert [tool.meta for tool in tools if tool is not None] == [
+        {"tags": ["a"]},
+        {"tags": ["a", "b"]},
+        {"tags": ["a", "b"]},
+    ]
+
+
 def test_openai_tool_stream_no_tool_types(
     fixture_chat_completion_chunk_with_tools: ChatCompletionChunk,
 ) -> None:
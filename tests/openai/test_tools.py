@@ -1,12 +1,12 @@
 """Tests for the `OpenAITool` class."""
-from typing import Any, Type
+from typing import Any, Optional, Type
 
 import pytest
 from openai.types.chat.chat_completion_message_tool_call import (
     ChatCompletionMessageToolCall,
     Function,
 )
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, create_model
 from pytest import FixtureRequest
 
 from mirascope.base.tools import DEFAULT_TOOL_DOCSTRING
@@ -139,3 +139,86 @@ def test_openai_tool_from_base_type() -> None:
     tool_type = OpenAITool.from_base_type(float)
     assert issubclass(tool_type, OpenAITool)
     assert tool_type.model_json_schema() == Float.model_json_schema()
+
+
+def test_openai_tool_json_schema(
+    fixture_my_openai_tool: Type[OpenAITool],
+    fixture_empty_openai_tool: Type[OpenAITool],
+) -> None:
+    """Tests that `OpenAITool.json_schema` returns a cached strict schema."""
+
+    class Author(BaseModel):
+        name: str
+        default: str = "unknown"
+
+    class Book(OpenAITool):
+        """A book."""
+
+        title: str = Field(..., description="The title.")
+        authors: list[Author] = []
+
+    assert Book.json_schema() == {
+        "name": "Book",
+        "description": "A book.",
+        "schema": {
+            "$defs": {
+                "Author": {
+                    "properties": {
+                        "name": {"title": "Name", "type": "string"},
+                        "default": {"title": "Default", "type": "string"},
+                    },
+                    "required": ["name", "default"],
+                    "title": "Author",
+                    "type": "object",
+                    "additionalProperties": False,
+                }
+            },
+            "properties": {
+                "title": {
+                    "description": "The title.",
+                    "title": "Title",
+                    "type": "string",
+                },
+                "authors": {
+                    "items": {"$ref": "#/$defs/Author"},
+                    "title": "Authors",
+                    "type": "array",
+                },
+            },
+            "required": ["title", "authors"],
+            "type": "object",
+            "additionalProperties": False,
+        },
+        "strict": True,
+    }
+    assert Book.json_schema() is Book.json_schema()
+    assert fixture_my_openai_tool.json_schema()["schema"]["required"] == [
+        "param",
+        "optional",
+    ]
+    assert fixture_empty_openai_tool.json_schema()["schema"] == {
+        "type": "object",
+        "properties": {},
+        "required": [],
+        "additionalProperties": False,
+    }
+
+
+@pytest.mark.parametrize(
+    "annotation", [dict, dict[str, int], Optional[dict[str, list[str]]]]
+)
+def test_openai_tool_json_schema_free_form_object(annotation: Any) -> None:
+    """Tests that strict schemas reject objects with arbitrary keys."""
+    tool = create_model("Tool", __base__=OpenAITool, value=(annotation, ...))
+    with pytest.raises(ValueError):
+        tool.json_schema()
+
+    class Extra(OpenAITool):
+        """A tool that allows extra fields."""
+
+        model_config = ConfigDict(extra="allow")
+
+        value: int
+
+    with pytest.raises(ValueError):
+        Extra.json_schema()
@@ -1,11 +1,11 @@
 """Tests for Mirascope PineconeVectorStore class"""
-import uuid
 from unittest.mock import MagicMock, patch
 
 import pytest
 from pinecone import QueryResponse, ScoredVector
 
 from mirascope.pinecone import PineconeVectorStore
+from mirascope.rag.chunkers import chunk_id
 from mirascope.rag.types import Document
 
 
@@ -48,14 +48,11 @@ def test_pinecone_vectorstore_add_no_embedding(
 
 
 @patch("mirascope.pinecone.vectorstores.Pinecone", new_callable=MagicMock)
-@patch("uuid.uuid4")
 def test_pinecone_vectorstore_add_text(
-    mock_uuid: MagicMock,
     mock_pinecone: MagicMock,
     fixture_pinecone_with_openai: PineconeVectorStore,
 ):
     """Test the add method of the PineconeVectorStore class with string as argument"""
-    mock_uuid.return_value = uuid.UUID("12345678-1234-5678-1234-567812345678")
     mock_upsert = MagicMock()
     mock_index = MagicMock()
     mock_index.return_value.upsert = mock_upsert
@@ -64,7 +61,7 @@ def test_pinecone_vectorstore_add_text(
     mock_upsert.assert_called_once_with(
         [
             {
-                "id": "12345678-1234-5678-1234-567812345678",
+                "id": chunk_id("foo", 0),
                 "values": [0.1],
                 "metadata": {"text": "foo"},
             }
@@ -161,3 +158,33 @@ def test_pinecone_vectorstore_retrieve_with_handler(
     mock_query.assert_called_once_with(
         vector=[0.1], include_values=True, include_metadata=True, top_k=8
     )
+
+
+@patch("mirascope.pinecone.vectorstores.Pinecone", new_callable=MagicMock)
+def test_pinecone_vectorstore_add_source(
+    mock_pinecone: MagicMock,
+    fixture_pinecone_with_openai: PineconeVectorStore,
+):
+    """Test that adding a source only upserts new chunks and deletes stale ones."""
+    mock_index = mock_pinecone.return_value.Index.return_value
+    mock_index.list.return_value = iter([["doc#1"], ["doc#2"]])
+    fixture_pinecone_with_openai.add(
+        [Document(id="2", text="foo"), Document(id="3", text="foo")], source="doc"
+    )
+    mock_index.list.assert_called_once_with(prefix="doc#")
+    mock_index.upsert.assert_called_once_with(
+        [
+            {
+                "id": "doc#3",
+                "values": [0.1],
+                "metadata": {"source": "doc", "text": "foo"},
+            }
+        ]
+    )
+    mock_index.delete.assert_called_once_with(ids=["doc#1"])
+
+    mock_index.reset_mock()
+    mock_index.list.return_value = iter([["doc#2", "doc#3"]])
+    fixture_pinecone_with_openai.add([Document(id="2", text="foo")], source="doc")
+    mock_index.upsert.assert_not_called()
+    mock_index.delete.assert_called_once_with(ids=["doc#3"])
@@ -1,7 +1,7 @@
 """Tests for the `BaseChunker` class."""
 from unittest.mock import patch
 
-from mirascope.rag.chunkers import BaseChunker
+from mirascope.rag.chunkers import BaseChunker, chunk_id
 from mirascope.rag.types import Document
 
 
@@ -21,3 +21,26 @@ def test_base_chunker() -> None:
     for document in documents:
         assert isinstance(document, Document)
     assert isinstance(my_chunker, BaseChunker)
+
+
+@patch.multiple(BaseChunker, __abstractmethods__=set())
+def test_base_chunker_iter_chunks() -> None:
+    """Tests that `iter_chunks` chunks a stream of text with `chunk` by default."""
+
+    class MyChunker(BaseChunker):
+        def chunk(self, text: str) -> list[Document]:
+            return [
+                Document(id=str(i), text=line) for i, line in enumerate(text.split())
+            ]
+
+    chunks = MyChunker().iter_chunks(iter(["a b", "c"]))
+    assert [chunk.text for chunk in chunks] == ["a", "bc"]
+    assert [chunk.text for chunk in MyChunker().iter_chunks("a b")] == ["a", "b"]
+
+
+def test_chunk_id() -> None:
+    """Tests that chunk ids are derived from the offset and content."""
+    assert chunk_id("foo", 3) == chunk_id("foo", 3)
+    assert chunk_id("foo", 3).startswith("3-")
+    assert chunk_id("foo", 3) != chunk_id("foo", 4)
+    assert chunk_id("foo", 3) != chunk_id("bar", 3)
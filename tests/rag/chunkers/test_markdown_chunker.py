@@ -0,0 +1,17 @@
+"""Tests for the `MarkdownChunker` class."""
+from mirascope.rag.chunkers.markdown_chunker import MarkdownChunker
+
+
+def test_markdown_chunker_chunk() -> None:
+    """Tests that sections are split before headings of decreasing level."""
+    text = (
+        "# Title\nIntro.\n## Usage\nRun it now.\n### Options\nSet the flags.\n"
+        "# Other\nMore text."
+    )
+    chunker = MarkdownChunker(chunk_size=8)
+    assert [chunk.text for chunk in chunker.chunk(text)] == [
+        "# Title\nIntro.",
+        "## Usage\nRun it now.",
+        "### Options\nSet the flags.",
+        "# Other\nMore text.",
+    ]
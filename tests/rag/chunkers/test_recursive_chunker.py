@@ -0,0 +1,62 @@
+"""Tests for the `RecursiveChunker` class."""
+import io
+
+from mirascope.rag.chunkers.recursive_chunker import RecursiveChunker, word_tokenizer
+
+TEXT = (
+    "Intro paragraph. It has two sentences.\n\n"
+    "A much longer paragraph follows here, with many words in it. And another "
+    "sentence! Plus a question?\n"
+) * 30
+
+
+def test_word_tokenizer() -> None:
+    """Tests that the default tokenizer splits words and punctuation."""
+    assert word_tokenizer("Hello, world!") == ["Hello", ",", "world", "!"]
+
+
+def test_recursive_chunker_chunk() -> None:
+    """Tests splitting on paragraphs, then sentences and words, with overlaps."""
+    chunker = RecursiveChunker(chunk_size=12, chunk_overlap=3)
+    chunks = chunker.chunk(TEXT)
+    assert [chunk.text for chunk in chunks[:4]] == [
+        "Intro paragraph. It has two sentences.\n\nA much longer paragraph",
+        "much longer paragraph follows here, with many words in it.",
+        "in it. And another sentence! Plus a question?",
+        "Intro paragraph. It has two sentences.\n\nA much longer paragraph",
+    ]
+    assert all(len(word_tokenizer(chunk.text)) <= 12 for chunk in chunks)
+    assert len({chunk.id for chunk in chunks}) == len(chunks)
+    assert [chunk.id for chunk in chunker.chunk(TEXT)] == [chunk.id for chunk in chunks]
+    offset = int(chunks[1].id.split("-")[0])
+    assert TEXT[offset:].startswith(chunks[1].text)
+
+    chunker = RecursiveChunker(chunk_size=2, separators=[r"\s+", ""], tokenizer=list)
+    assert [chunk.text for chunk in chunker.chunk("a bcdef")] == ["a", "bc", "de", "f"]
+    chunker = RecursiveChunker(chunk_size=2, separators=[r"\s+"])
+    assert [chunk.text for chunk in chunker.chunk("a b, c")] == ["a", "b,", "c"]
+    assert chunker.chunk(" ") == []
+
+
+def test_recursive_chunker_tokenizer() -> None:
+    """Tests counting tokens with a custom tokenizer."""
+    chunker = RecursiveChunker(chunk_size=10, tokenizer=list)
+    assert [chunk.text for chunk in chunker.chunk("aaaa bbbb cccc")] == [
+        "aaaa bbbb",
+        "cccc",
+    ]
+
+
+def test_recursive_chunker_iter_chunks() -> None:
+    """Tests that streaming a file with a small buffer yields the same chunks."""
+    chunker = RecursiveChunker(chunk_size=12, chunk_overlap=3)
+    expected = [chunk.text for chunk in chunker.chunk(TEXT)]
+    streaming = RecursiveChunker(chunk_size=12, chunk_overlap=3, buffer_size=200)
+    chunks = streaming.iter_chunks(io.StringIO(TEXT))
+    assert [chunk.text for chunk in chunks] == expected
+
+    streaming = RecursiveChunker(
+        chunk_size=3, buffer_size=4, separators=["\n", ""], tokenizer=list
+    )
+    chunks = streaming.iter_chunks(["abcdefg", "h"])
+    assert [chunk.text for chunk in chunks] == ["abc", "def", "gh"]
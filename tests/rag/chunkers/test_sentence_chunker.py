@@ -0,0 +1,13 @@
+"""Tests for the `SentenceChunker` class."""
+from mirascope.rag.chunkers.sentence_chunker import SentenceChunker
+
+
+def test_sentence_chunker_chunk() -> None:
+    """Tests that chunks end at sentence boundaries when sentences fit."""
+    text = "One two three. Four five! Six seven eight nine? Ten.\nEleven twelve."
+    chunker = SentenceChunker(chunk_size=7)
+    assert [chunk.text for chunk in chunker.chunk(text)] == [
+        "One two three. Four five!",
+        "Six seven eight nine? Ten.",
+        "Eleven twelve.",
+    ]
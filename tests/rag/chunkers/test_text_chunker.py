@@ -19,5 +19,20 @@ def test_text_chunker_chunk():
     assert chunks[0].text == text[:100]
     assert chunks[1].text == text[80:180]
 
-    # Check that chunk IDs are unique
+    # Check that chunk IDs are unique and deterministic
     assert len(set(chunk.id for chunk in chunks)) == len(chunks)
+    assert [chunk.id for chunk in chunker.chunk(text)] == [chunk.id for chunk in chunks]
+
+
+def test_text_chunker_iter_chunks():
+    """Test that the TextChunker iter_chunks function streams the same chunks."""
+    text = "This is a test text. " * 100
+    chunker = TextChunker(chunk_size=100, chunk_overlap=20)
+
+    expected = [chunk.text for chunk in chunker.chunk(text)]
+    stream = (text[i : i + 7] for i in range(0, len(text), 7))
+    chunks = list(chunker.iter_chunks(stream))
+    assert [chunk.text for chunk in chunks] == expected
+    assert [chunk.id for chunk in chunks] == [chunk.id for chunk in chunker.chunk(text)]
+    assert [chunk.text for chunk in chunker.iter_chunks(text)] == expected
+    assert list(chunker.iter_chunks([])) == []
@@ -0,0 +1,12 @@
+"""Tests for the `TokenChunker` class."""
+from mirascope.rag.chunkers.token_chunker import TokenChunker
+
+
+def test_token_chunker_chunk() -> None:
+    """Tests that chunks have a number of tokens regardless of the layout."""
+    chunker = TokenChunker(chunk_size=4, chunk_overlap=1)
+    assert [chunk.text for chunk in chunker.chunk("a b\n\nc d e. f g")] == [
+        "a b\n\nc d",
+        "d e. f",
+        "f g",
+    ]
@@ -0,0 +1,249 @@
+"""Tests for the `IngestionPipeline` class."""
+import json
+import threading
+import time
+from typing import Any, ClassVar, Optional, Sequence
+
+import pytest
+
+from mirascope.rag import (
+    BaseEmbedder,
+    BaseEmbeddingResponse,
+    BaseQueryResults,
+    BaseVectorStore,
+    Document,
+    IngestionPipeline,
+    IngestionProgress,
+    TextChunker,
+)
+
+
+class MyEmbeddingResponse(BaseEmbeddingResponse[Optional[list[list[float]]]]):
+    @property
+    def embeddings(self) -> Optional[list[list[float]]]:
+        return self.response
+
+
+class MyEmbedder(BaseEmbedder[MyEmbeddingResponse]):
+    missing: ClassVar[bool] = False
+    calls: ClassVar[list[list[str]]] = []
+
+    def embed(self, input: list[str]) -> MyEmbeddingResponse:
+        self.calls.append(input)
+        embeddings = None if self.missing else [[float(len(text))] for text in input]
+        return MyEmbeddingResponse(response=embeddings, start_time=0, end_time=0)
+
+    async def embed_async(self, input: list[str]) -> MyEmbeddingResponse:
+        return self.embed(input)  # pragma: no cover
+
+
+class MyStore(BaseVectorStore):
+    embedder = MyEmbedder()
+    chunker = TextChunker(chunk_size=2, chunk_overlap=0)
+    fail_after: ClassVar[Optional[int]] = None
+
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**data)
+        self._documents: dict[str, Document] = {}
+        self._embeddings: dict[str, Sequence[float]] = {}
+        self._upserts = 0
+
+    def retrieve(self, text: str, **kwargs: Any) -> BaseQueryResults:
+        return BaseQueryResults()  # pragma: no cover
+
+    def add(self, text: Any, **kwargs: Any) -> None:
+        ...  # pragma: no cover
+
+    def delete(self, ids: list[str]) -> None:
+        for id in ids:
+            del self._documents[id]
+
+    def _upsert(
+        self,
+        documents: list[Document],
+        embeddings: Sequence[Sequence[float]],
+        **kwargs: Any,
+    ) -> None:
+        if self.fail_after is not None and self._upserts == self.fail_after:
+            raise RuntimeError("upsert failed")
+        self._upserts += 1
+        for document, embedding in zip(documents, embeddings):
+            self._documents[document.id] = document
+            self._embeddings[document.id] = embedding
+
+    def _source_ids(self, source: str) -> list[str]:
+        return [id for id in self._documents if id.startswith(f"{source}#")]
+
+
+@pytest.fixture(autouse=True)
+def reset_embedder():
+    MyEmbedder.calls = []
+    MyEmbedder.missing = False
+    yield
+
+
+def test_ingestion_pipeline_batches() -> None:
+    """Tests that text is chunked, embedded and upserted in batches."""
+    store = MyStore()
+    progress: list[IngestionProgress] = []
+    pipeline = IngestionPipeline(
+        vectorstore=store, batch_size=2, on_progress=progress.append
+    )
+    result = pipeline.run(["abcde", "fg"])
+    assert MyEmbedder.calls == [["ab", "cd"], ["ef", "g"]]
+    assert [document.text for document in store._documents.values()] == [
+        "ab",
+        "cd",
+        "ef",
+        "g",
+    ]
+    assert store._embeddings[next(iter(store._documents))] == [2.0]
+    assert result == IngestionProgress(chunks=4, upserted=4, batches=2)
+    assert [p.upserted for p in progress] == [2, 4]
+    assert pipeline.run("") == IngestionProgress()
+
+
+def test_ingestion_pipeline_documents() -> None:
+    """Tests ingesting documents, which are not chunked."""
+    store = MyStore()
+    documents = [Document(id=str(i), text="x" * i) for i in range(1, 4)]
+    result = IngestionPipeline(vectorstore=store, batch_size=10).run(documents)
+    assert result == IngestionProgress(chunks=3, upserted=3, batches=1)
+    assert list(store._documents.values()) == documents
+
+
+def test_ingestion_pipeline_concurrency() -> None:
+    """Tests that batches are embedded concurrently up to `embed_concurrency`."""
+    active = peak = 0
+    lock = threading.Lock()
+
+    class SlowEmbedder(MyEmbedder):
+        def embed(self, input: list[str]) -> MyEmbeddingResponse:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return super().embed(input)
+
+    class SlowStore(MyStore):
+        embedder = SlowEmbedder()
+
+    store = SlowStore()
+    result = IngestionPipeline(
+        vectorstore=store, batch_size=1, embed_concurrency=3
+    ).run("abcdefghijkl")
+    assert result.batches == 6
+    assert 1 < peak <= 3
+
+
+def test_ingestion_pipeline_checkpoint(tmp_path) -> None:
+    """Tests that a failed ingestion resumes from its checkpoint."""
+    checkpoint = tmp_path / "ingest.checkpoint"
+    store = MyStore()
+    pipeline = IngestionPipeline(
+        vectorstore=store,
+        batch_size=2,
+        embed_concurrency=1,
+        upsert_concurrency=1,
+        checkpoint_path=str(checkpoint),
+    )
+    MyStore.fail_after = 1
+    try:
+        with pytest.raises(RuntimeError):
+            pipeline.run("abcdefgh")
+    finally:
+        MyStore.fail_after = None
+    recorded = json.loads(checkpoint.read_text())
+    assert recorded["chunks"] == 2 and recorded["source"] is None
+
+    MyEmbedder.calls = []
+    result = pipeline.run("abcdefgh")
+    assert MyEmbedder.calls == [["ef", "gh"]]
+    assert result == IngestionProgress(chunks=4, upserted=2, skipped=2, batches=1)
+    assert len(store._documents) == 4
+    assert not checkpoint.exists()
+
+
+@pytest.mark.parametrize(
+    "data,source,chunk_size",
+    [
+        ("abcdefgh", "other", 2),
+        ("abXYefgh", None, 2),
+        ("a", None, 2),
+        ("abcdefgh", None, 3),
+    ],
+)
+def test_ingestion_pipeline_checkpoint_mismatch(
+    tmp_path, data: str, source: Optional[str], chunk_size: int
+) -> None:
+    """Tests that a checkpoint of different data raises before anything is ingested."""
+    checkpoint = tmp_path / "ingest.checkpoint"
+    pipeline = IngestionPipeline(
+        vectorstore=MyStore(),
+        batch_size=2,
+        embed_concurrency=1,
+        upsert_concurrency=1,
+        checkpoint_path=str(checkpoint),
+    )
+    MyStore.fail_after = 1
+    try:
+        with pytest.raises(RuntimeError):
+            pipeline.run("abcdefgh")
+    finally:
+        MyStore.fail_after = None
+
+    class Store(MyStore):
+        chunker = TextChunker(chunk_size=chunk_size, chunk_overlap=0)
+
+    pipeline.vectorstore = Store()
+    MyEmbedder.calls = []
+    with pytest.raises(ValueError):
+        pipeline.run(data, source=source)
+    assert MyEmbedder.calls == []
+    assert checkpoint.exists()
+
+
+def test_ingestion_pipeline_source() -> None:
+    """Tests that ingesting a source skips unchanged chunks and deletes stale ones."""
+    store = MyStore()
+    pipeline = IngestionPipeline(vectorstore=store, batch_size=10)
+    documents = [Document(id="1", text="a"), Document(id="2", text="b")]
+    pipeline.run(documents, source="doc")
+    assert set(store._documents) == {"doc#1", "doc#2"}
+    assert store._documents["doc#1"].metadata == {"source": "doc"}
+
+    MyEmbedder.calls = []
+    result = pipeline.run(
+        [Document(id="2", text="b"), Document(id="3", text="c")], source="doc"
+    )
+    assert MyEmbedder.calls == [["c"]]
+    assert result == IngestionProgress(
+        chunks=2, upserted=1, skipped=1, deleted=1, batches=1
+    )
+    assert set(store._documents) == {"doc#2", "doc#3"}
+
+
+def test_ingestion_pipeline_no_embeddings() -> None:
+    """Tests that a `ValueError` is raised when the embedder returns no embeddings."""
+    MyEmbedder.missing = True
+    with pytest.raises(ValueError):
+        IngestionPipeline(vectorstore=MyStore()).run("abc")
+
+
+def test_ingestion_pipeline_flushes(tmp_path) -> None:
+    """Tests that the vectorstore is flushed at each checkpoint and at the end."""
+    store = MyStore()
+    flushes: list[int] = []
+    store._flush = lambda: flushes.append(len(store._documents))  # type: ignore
+    IngestionPipeline(
+        vectorstore=store,
+        batch_size=1,
+        embed_concurrency=1,
+        upsert_concurrency=1,
+        checkpoint_path=str(tmp_path / "ingest.checkpoint"),
+        checkpoint_interval=2,
+    ).run("abcdefgh")
+    assert flushes == [2, 4, 4]
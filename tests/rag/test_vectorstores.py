@@ -2,9 +2,10 @@
 from typing import ClassVar
 from unittest.mock import patch
 
+import pytest
 from pydantic import BaseModel
 
-from mirascope.rag.types import BaseVectorStoreParams
+from mirascope.rag.types import BaseVectorStoreParams, Document
 from mirascope.rag.vectorstores import BaseVectorStore
 
 
@@ -39,3 +40,31 @@ def test_extending_vectorstore() -> None:
 
     my_vectorstore = MyVectorStore()  # type: ignore
     assert my_vectorstore.vectorstore_params.get_or_create is True
+
+
+@patch.multiple(BaseVectorStore, __abstractmethods__=set())
+def test_base_vectorstore_diff() -> None:
+    """Tests diffing the documents of a source against those in the vectorstore."""
+
+    class VectorStore(BaseVectorStore):
+        def _source_ids(self, source: str) -> list[str]:
+            return [f"{source}#1", f"{source}#2"]
+
+    documents, stale = VectorStore()._diff(  # type: ignore
+        [
+            Document(id="2", text="b"),
+            Document(id="3", text="c", metadata={"page": 1}),
+        ],
+        "doc",
+    )
+    assert documents == [
+        Document(id="doc#3", text="c", metadata={"page": 1, "source": "doc"})
+    ]
+    assert stale == ["doc#1"]
+
+    with pytest.raises(NotImplementedError):
+        BaseVectorStore()._diff([], "doc")  # type: ignore
+    with pytest.raises(NotImplementedError):
+        BaseVectorStore().delete(["1"])  # type: ignore
+    with pytest.raises(NotImplementedError):
+        BaseVectorStore()._upsert([], [])  # type: ignore
@@ -0,0 +1,53 @@
+"""Tests for the lazily imported `mirascope` package."""
+import subprocess
+import sys
+
+import pytest
+
+import mirascope
+
+_HEAVY_MODULES = [
+    "anthropic",
+    "chromadb",
+    "cohere",
+    "google.generativeai",
+    "groq",
+    "httpx",
+    "langfuse",
+    "mistralai",
+    "numpy",
+    "openai",
+    "pinecone",
+    "wandb",
+    "weave",
+]
+
+
+def _run(code: str) -> str:
+    """Runs `code` in a fresh interpreter and returns its output."""
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+
+def test_import_is_lazy() -> None:
+    """Tests that importing mirascope doesn't import any integration or its SDK."""
+    output = _run(
+        "import sys, mirascope; "
+        f"print([name for name in {_HEAVY_MODULES!r} if name in sys.modules]); "
+        "print([name for name in sys.modules if name.startswith('mirascope.')"
+        " and name.split('.')[1] not in ('base', 'enums', 'partial', 'rag', 'types')])"
+    )
+    assert output.splitlines() == ["[]", "[]"]
+
+
+def test_lazy_attributes() -> None:
+    """Tests that subpackages and the version are imported on first access."""
+    from mirascope import openai
+
+    assert mirascope.openai is openai
+    assert "OpenAICall" in dir(openai)
+    assert isinstance(mirascope.__version__, str)
+    assert {"openai", "wandb", "__version__"} <= set(dir(mirascope))
+    with pytest.raises(AttributeError):
+        _ = mirascope.missing  # type: ignore
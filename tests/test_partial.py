@@ -72,3 +72,20 @@ def test_deepest_partial():
         partial(DeepestModel).model_json_schema()
         == PartialDeepestModel.model_json_schema()
     )
+
+
+def test_partial_is_cached():
+    """Tests that `partial` builds the partial model once per wrapped class."""
+    assert partial(DeeperModel) is partial(DeeperModel)
+    assert (
+        partial(DeeperModel).model_fields["shallow"].annotation
+        == Optional[partial(ShallowModel)]
+    )
+
+    class SubModel(DeeperModel):
+        """A subclass of a model with a cached partial."""
+
+        extra: str
+
+    assert "extra" in partial(SubModel).model_fields
+    assert partial(SubModel) is not partial(DeeperModel)